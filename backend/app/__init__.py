@@ -29,6 +29,7 @@ from .routes.invitations import invitations_bp
 from .routes.time_proposal import time_proposal_bp
 from .routes.calendar_accounts import calendar_accounts_bp
 from .utils.supabase_client import init_supabase
+from .utils.token_verifier import init_token_verifier
 
 def create_app(config_name="development"):
     """
@@ -77,6 +78,9 @@ def create_app(config_name="development"):
     
     # Initialize Supabase client
     init_supabase(config_name)
+
+    # Load access-token signing keys so require_auth can verify locally
+    init_token_verifier()
     
     # Register blueprints
     app.register_blueprint(user_bp)
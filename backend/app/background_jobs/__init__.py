@@ -1,24 +1,37 @@
 """Background jobs initialization."""
 
-import atexit
 import logging
 
-from apscheduler.schedulers.background import BackgroundScheduler
-
+from ..config import Config
 from .calendar_sync import sync_user_calendar_job
+from .job_queue import debounce_proposal_regeneration, enqueue_calendar_sync, enqueue_proposal_regeneration
+from .scheduler import JobRunner, LeaderLock
 
-scheduler = BackgroundScheduler()
+_runner = None
 
 
 def init_background_jobs(app):
-    """Initialize APScheduler for background jobs."""
-    if scheduler.running:
-        return
-
-    scheduler.start()
-    app.scheduler = scheduler
-    logging.info("[SCHEDULER] Background job scheduler started")
-    atexit.register(scheduler.shutdown)
-
-
-__all__ = ["init_background_jobs", "sync_user_calendar_job"]
+    """Attach the process's job runner; see scheduler.py for the leader/worker model."""
+    global _runner
+
+    if _runner is None:
+        mode = Config.BACKGROUND_JOBS_MODE
+        _runner = JobRunner(mode, LeaderLock(Config.SCHEDULER_LOCK_PATH))
+        if mode == "embedded":
+            _runner.start_embedded()
+        elif mode == "worker":
+            logging.info("[SCHEDULER] Jobs are enqueued here and run by worker.py")
+        else:
+            logging.info("[SCHEDULER] Background jobs disabled")
+
+    app.job_runner = _runner
+    app.scheduler = _runner.scheduler
+
+
+__all__ = [
+    "debounce_proposal_regeneration",
+    "enqueue_calendar_sync",
+    "enqueue_proposal_regeneration",
+    "init_background_jobs",
+    "sync_user_calendar_job",
+]
@@ -1,23 +1,19 @@
 """Calendar sync background job."""
 
 import logging
-import os
 from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
 
-from supabase import create_client
-
+from ..services import google_calendar, microsoft_calendar
 from ..services.busy_slots import BusySlotService
+from ..utils.supabase_client import get_service_role_client
 
 SYNC_WINDOW_DAYS = 90
 
 
 def _get_service_role_client():
-    """Get a Supabase client with service-role privileges."""
-    supabase_url = os.getenv("SUPABASE_URL")
-    service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-    if supabase_url and service_role_key:
-        return create_client(supabase_url, service_role_key)
-    return None
+    """Get the shared Supabase client with service-role privileges."""
+    return get_service_role_client()
 
 
 def _get_earliest_active_event_date(user_id: str) -> datetime:
@@ -69,26 +65,51 @@ def _get_earliest_active_event_date(user_id: str) -> datetime:
         return now
 
 
-def sync_user_calendar_job(user_id: str) -> None:
+def _sync_failures(label: str, result: Any) -> List[str]:
+    """Describe what failed in one provider's sync result (False, or per-source errors)."""
+    if isinstance(result, dict):
+        return [
+            f"{label} source '{src.get('calendar_name')}': {src.get('error')}"
+            for src in result.get("sources", [])
+            if src.get("status") == "error"
+        ]
+    return [] if result else [f"{label} sync failed"]
+
+
+def sync_user_calendar_job(user_id: str) -> List[str]:
     """Sync Google and Microsoft calendars over a 90-day window.
 
     The sync window starts from the earliest active (non-finalized) event
     the user participates in, ensuring busy slot coverage for all relevant
-    scheduling windows.
+    scheduling windows. Only connected providers are synced; returns a
+    description of each provider or source that failed.
     """
     logging.info(f"[SYNC] Starting calendar sync for user {user_id}")
 
+    connected = {
+        "Google": bool(google_calendar.get_stored_credentials(user_id)),
+        "Microsoft": bool(microsoft_calendar.get_stored_credentials(user_id)),
+    }
+    if not any(connected.values()):
+        logging.info(f"[SYNC] No calendar connected for user {user_id}, nothing to sync")
+        return []
+
     start_date = _get_earliest_active_event_date(user_id)
     end_date = datetime.now(timezone.utc) + timedelta(days=SYNC_WINDOW_DAYS)
 
     logging.info(f"[SYNC] Syncing from {start_date.date()} to {end_date.date()}")
 
     busy_slot_service = BusySlotService()
-
-    google_result = busy_slot_service.sync_user_google_calendar(user_id, start_date, end_date)
-    microsoft_result = busy_slot_service.sync_user_microsoft_calendar(user_id, start_date, end_date)
-
-    for label, result in [("Google", google_result), ("Microsoft", microsoft_result)]:
+    sync_provider = {
+        "Google": busy_slot_service.sync_user_google_calendar,
+        "Microsoft": busy_slot_service.sync_user_microsoft_calendar,
+    }
+
+    failures = []
+    for label, sync in sync_provider.items():
+        if not connected[label]:
+            continue
+        result = sync(user_id, start_date, end_date)
         if isinstance(result, dict):
             for src in result.get("sources", []):
                 logging.info(
@@ -96,9 +117,17 @@ def sync_user_calendar_job(user_id: str) -> None:
                     f"status={src.get('status')}, added={src.get('added')}, "
                     f"deleted={src.get('deleted')}, error={src.get('error')}"
                 )
+        failures.extend(_sync_failures(label, result))
 
-    any_ok = bool(google_result) or bool(microsoft_result)
-    if any_ok:
-        logging.info(f"[SYNC] Successfully synced calendar for user {user_id}")
+    if failures:
+        logging.warning(f"[SYNC] Calendar sync for user {user_id} had failures: {'; '.join(failures)}")
     else:
-        logging.warning(f"[SYNC] Failed to sync any calendars for user {user_id}")
+        logging.info(f"[SYNC] Successfully synced calendar for user {user_id}")
+    return failures
+
+
+def run_calendar_sync_job(payload: Dict[str, Any]) -> None:
+    """Job queue handler for ``calendar_sync`` jobs. Raises so the queue retries."""
+    failures = sync_user_calendar_job(payload["user_id"])
+    if failures:
+        raise Exception(f"Calendar sync failed: {'; '.join(failures)}")
@@ -0,0 +1,253 @@
+"""
+Durable Postgres job queue (migration 015).
+
+Producers enqueue jobs with a dedup key so repeated requests collapse into
+one pending job (one calendar sync per user, one regeneration per event).
+Workers lease jobs through ``claim_jobs`` (FOR UPDATE SKIP LOCKED), so any
+number of worker processes can drain the queue without double work. Failed
+jobs are retried with exponential backoff and dead-lettered after
+``max_attempts``; a worker that dies mid-job loses its lease and the job is
+claimed again.
+"""
+
+from ..config import Config
+from ..utils.supabase_client import get_service_role_client
+
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+LOG_PREFIX = "[JOB_QUEUE]"
+
+CALENDAR_SYNC = "calendar_sync"
+PROPOSAL_REGENERATION = "proposal_regeneration"
+
+# Lower runs first
+PRIORITY_INTERACTIVE = 10
+PRIORITY_DEFAULT = 100
+
+
+def worker_id() -> str:
+    """Identifies this process as a lease holder."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    """Exponential backoff after the given number of attempts, capped."""
+    delay = Config.JOB_QUEUE_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return int(min(delay, Config.JOB_QUEUE_RETRY_MAX_SECONDS))
+
+
+class JobQueue:
+    """Thin client over the job_queue RPCs."""
+
+    def __init__(self, client=None):
+        self.client = client or get_service_role_client()
+        if self.client is None:
+            raise Exception("Job queue requires SUPABASE_SERVICE_ROLE_KEY")
+        self.worker_id = worker_id()
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        dedup_key: Optional[str] = None,
+        priority: int = PRIORITY_DEFAULT,
+        run_at: Optional[datetime] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Optional[dict]:
+        """Add a job, merging it into the pending job with the same dedup key."""
+        result = self.client.rpc("enqueue_job", {
+            "p_kind": kind,
+            "p_payload": payload,
+            "p_dedup_key": dedup_key,
+            "p_priority": priority,
+            "p_run_at": (run_at or datetime.now(timezone.utc)).isoformat(),
+            "p_max_attempts": max_attempts or Config.JOB_QUEUE_MAX_ATTEMPTS,
+        }).execute()
+        return result.data
+
+    def debounce(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        dedup_key: str,
+        quiet_seconds: int,
+        max_delay_seconds: int,
+        priority: int = PRIORITY_DEFAULT,
+    ) -> Optional[dict]:
+        """
+        Coalesce repeated requests into one job that runs once they have been quiet
+        for ``quiet_seconds``, and at most ``max_delay_seconds`` after the first.
+        """
+        result = self.client.rpc("debounce_job", {
+            "p_kind": kind,
+            "p_payload": payload,
+            "p_dedup_key": dedup_key,
+            "p_quiet_seconds": quiet_seconds,
+            "p_max_delay_seconds": max_delay_seconds,
+            "p_priority": priority,
+            "p_max_attempts": Config.JOB_QUEUE_MAX_ATTEMPTS,
+        }).execute()
+        return result.data
+
+    def claim(self, kinds: List[str], limit: int) -> List[dict]:
+        """Lease up to ``limit`` due jobs of the given kinds, most urgent first."""
+        result = self.client.rpc("claim_jobs", {
+            "p_worker": self.worker_id,
+            "p_kinds": kinds,
+            "p_limit": limit,
+            "p_lease_seconds": Config.JOB_QUEUE_LEASE_SECONDS,
+        }).execute()
+        return result.data or []
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Backlog metrics per kind: pending, due, running, dead and the age of the oldest due job."""
+        result = self.client.rpc("job_queue_stats", {}).execute()
+        return {row["kind"]: {k: v for k, v in row.items() if k != "kind"} for row in result.data or []}
+
+    def complete(self, job: dict) -> None:
+        self.client.rpc("complete_job", {"p_job_id": job["id"], "p_worker": self.worker_id}).execute()
+
+    def fail(self, job: dict, error: str) -> bool:
+        """Reschedule with backoff, or dead-letter once attempts are used up. Returns True if retried."""
+        retry = job.get("attempts", 1) < job.get("max_attempts", Config.JOB_QUEUE_MAX_ATTEMPTS)
+        self.client.rpc("fail_job", {
+            "p_job_id": job["id"],
+            "p_worker": self.worker_id,
+            "p_error": error[:2000],
+            "p_retry_in_seconds": retry_delay_seconds(job.get("attempts", 1)) if retry else None,
+        }).execute()
+        return retry
+
+
+def _job_handlers() -> Dict[str, Callable[[Dict[str, Any]], None]]:
+    from .calendar_sync import run_calendar_sync_job
+    from .proposal_regeneration import run_proposal_regeneration_job
+
+    return {
+        CALENDAR_SYNC: run_calendar_sync_job,
+        PROPOSAL_REGENERATION: run_proposal_regeneration_job,
+    }
+
+
+def run_claimed_job(queue: JobQueue, job: dict, handlers: Dict[str, Callable]) -> bool:
+    """Execute one leased job and record the outcome. Returns True on success."""
+    label = f"{job['kind']} job {job['id']} (attempt {job.get('attempts')}/{job.get('max_attempts')})"
+
+    if job.get("attempts", 1) > job.get("max_attempts", Config.JOB_QUEUE_MAX_ATTEMPTS):
+        # Lease expired on its last attempt (worker crashed): dead-letter it
+        queue.fail(job, "Lease expired after the final attempt")
+        logging.error(f"{LOG_PREFIX} Dead-lettered {label}: lease expired")
+        return False
+
+    handler = handlers.get(job["kind"])
+    try:
+        if handler is None:
+            raise Exception(f"No handler for job kind '{job['kind']}'")
+        handler(job.get("payload") or {})
+    except Exception as e:
+        retried = queue.fail(job, str(e))
+        outcome = "will retry" if retried else "dead-lettered"
+        logging.error(f"{LOG_PREFIX} {label} failed, {outcome}: {e}")
+        return False
+
+    queue.complete(job)
+    logging.info(f"{LOG_PREFIX} Completed {label}")
+    return True
+
+
+def process_job_queue(kinds: Optional[List[str]] = None, limit: Optional[int] = None) -> Dict[str, int]:
+    """Claim a batch of due jobs and run them. Returns success/error counts."""
+    handlers = _job_handlers()
+    kinds = kinds or list(handlers)
+    counts = {"succeeded": 0, "failed": 0}
+
+    try:
+        queue = JobQueue()
+        jobs = queue.claim(kinds, limit or Config.JOB_QUEUE_BATCH_SIZE)
+    except Exception as e:
+        logging.error(f"{LOG_PREFIX} Could not claim jobs: {e}")
+        return counts
+
+    for job in jobs:
+        key = "succeeded" if run_claimed_job(queue, job, handlers) else "failed"
+        counts[key] += 1
+
+    if jobs:
+        logging.info(f"{LOG_PREFIX} Processed {len(jobs)} job(s): {counts}")
+    return counts
+
+
+class QueueConsumer:
+    """
+    Background threads that keep draining the queue for the given job kinds.
+
+    Each of the ``concurrency`` threads claims ``batch_size`` jobs at a time,
+    so up to ``concurrency`` jobs are in flight per process.
+    """
+
+    def __init__(self, kinds: List[str], poll_seconds: float, concurrency: int = 1, batch_size: Optional[int] = None):
+        self.kinds = kinds
+        self.poll_seconds = poll_seconds
+        self.concurrency = max(1, concurrency)
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"job-queue-{self.kinds[0]}-{idx}", daemon=True)
+            for idx in range(self.concurrency)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            counts = process_job_queue(self.kinds, limit=self.batch_size)
+            # Keep going while there is a backlog; otherwise wait for the next poll
+            if not any(counts.values()):
+                self._stop.wait(self.poll_seconds)
+
+
+def enqueue_calendar_sync(user_id: str, priority: int = PRIORITY_INTERACTIVE) -> Optional[dict]:
+    return JobQueue().enqueue(
+        CALENDAR_SYNC, {"user_id": user_id}, dedup_key=f"{CALENDAR_SYNC}:{user_id}", priority=priority
+    )
+
+
+def enqueue_proposal_regeneration(event_id: str, priority: int = PRIORITY_DEFAULT, queue: Optional[JobQueue] = None) -> Optional[dict]:
+    return (queue or JobQueue()).enqueue(
+        PROPOSAL_REGENERATION,
+        {"event_id": event_id},
+        dedup_key=f"{PROPOSAL_REGENERATION}:{event_id}",
+        priority=priority,
+    )
+
+
+def debounce_proposal_regeneration(event_id: str, queue: Optional[JobQueue] = None) -> Optional[dict]:
+    """Schedule one regeneration for a burst of invalidations of the same event."""
+    return (queue or JobQueue()).debounce(
+        PROPOSAL_REGENERATION,
+        {"event_id": event_id},
+        dedup_key=f"{PROPOSAL_REGENERATION}:{event_id}",
+        quiet_seconds=Config.PROPOSAL_INVALIDATION_QUIET_SECONDS,
+        max_delay_seconds=Config.PROPOSAL_INVALIDATION_MAX_DELAY_SECONDS,
+    )
@@ -2,29 +2,28 @@
 
 import logging
 import os
-import time
-
-from supabase import create_client
+from typing import Any, Dict
 
+from ..config import Config
 from ..services.time_proposal import TimeProposalService
+from ..utils.rate_limiter import get_gemini_rate_limiter
+from ..utils.supabase_client import get_service_role_client
+from .job_queue import JobQueue, debounce_proposal_regeneration
 
 LOG_PREFIX = "[PROPOSAL_REGEN_JOB]"
-DEFAULT_MAX_EVENTS = 4
-DEFAULT_DELAY_SECONDS = 15
 DEFAULT_NUM_SUGGESTIONS = 5
 DEFAULT_INTERVAL_MINUTES = 10
+# Flagged events queued per run; the queue's dedup key absorbs repeats
+ENQUEUE_SCAN_LIMIT = 500
+ACTIVE_STATUSES = ["planning", "pending"]
 
 
 def _get_supabase_client():
-    """Create and return a Supabase client with service role credentials."""
-    supabase_url = os.getenv("SUPABASE_URL")
-    service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not service_role_key:
+    """Return the shared Supabase client with service role credentials."""
+    client = get_service_role_client()
+    if client is None:
         logging.error(f"{LOG_PREFIX} Missing Supabase credentials")
-        return None
-
-    return create_client(supabase_url, service_role_key)
+    return client
 
 
 def _process_event(
@@ -53,78 +52,104 @@ def _process_event(
         ).eq("id", event_id).execute()
         return True
 
-    proposals = time_proposal_service.propose_times(
-        event_id, num_suggestions=DEFAULT_NUM_SUGGESTIONS
+    # Skips the Gemini call when the availability fingerprint is unchanged
+    proposals = time_proposal_service.regenerate_proposals_immediately(
+        event_id, num_suggestions=DEFAULT_NUM_SUGGESTIONS, force=False
     )
-    time_proposal_service.save_proposals_to_cache(event_id, proposals)
 
     logging.info(
-        f"{LOG_PREFIX} Successfully regenerated {len(proposals)} proposals for event {event_uid}"
+        f"{LOG_PREFIX} Refreshed {len(proposals)} proposals for event {event_uid}"
     )
     return True
 
 
-def regenerate_stale_proposals() -> None:
-    """
-    Find all events with proposals_needs_regeneration=TRUE and regenerate their proposals.
-
-    Rate limiting is applied to respect Gemini API limits.
-    Configuration via environment variables:
-    - PROPOSAL_REGEN_MAX_EVENTS_PER_RUN (default: 4)
-    - PROPOSAL_REGEN_DELAY_SECONDS (default: 15)
-    """
-    logging.info(f"{LOG_PREFIX} Starting stale proposal regeneration job")
-
-    max_events = int(os.getenv("PROPOSAL_REGEN_MAX_EVENTS_PER_RUN", DEFAULT_MAX_EVENTS))
-    delay_seconds = int(os.getenv("PROPOSAL_REGEN_DELAY_SECONDS", DEFAULT_DELAY_SECONDS))
-
-    logging.info(
-        f"{LOG_PREFIX} Rate limits: max {max_events} events per run, {delay_seconds}s delay"
-    )
-
+def run_proposal_regeneration_job(payload: Dict[str, Any]) -> None:
+    """Job queue handler for ``proposal_regeneration`` jobs. Raises so the queue retries."""
     supabase = _get_supabase_client()
     if not supabase:
-        return
+        raise Exception("Missing Supabase credentials")
 
     response = (
         supabase.table("events")
         .select("id, uid, name, status")
-        .eq("proposals_needs_regeneration", True)
-        .in_("status", ["planning", "pending"])
-        .limit(max_events)
+        .eq("id", payload["event_id"])
+        .limit(1)
         .execute()
     )
+    event = response.data[0] if response.data else None
 
-    if not response.data:
-        logging.info(f"{LOG_PREFIX} No stale proposals found")
+    # Deleted or no longer being scheduled. Up-to-date events are cheap: unchanged inputs skip Gemini
+    if not event or event.get("status") not in ACTIVE_STATUSES:
+        logging.info(f"{LOG_PREFIX} Skipping event {payload['event_id']} - nothing to regenerate")
         return
 
-    events = response.data
-    total = len(events)
-    logging.info(f"{LOG_PREFIX} Found {total} events to process (limited to {max_events})")
-
+    logging.info(f"{LOG_PREFIX} Processing event {event.get('uid', 'unknown')} ({event.get('name', 'Untitled')})")
     time_proposal_service = TimeProposalService(access_token=None)
-    success_count = 0
-    error_count = 0
+    # Paced by the shared Gemini rate limiter; nobody is waiting on this response
+    time_proposal_service.rate_limit_max_wait = Config.PROPOSAL_REGEN_MAX_WAIT_SECONDS
+    _process_event(event, supabase, time_proposal_service)
+
 
-    for idx, event in enumerate(events, 1):
-        event_uid = event.get("uid", "unknown")
-        event_name = event.get("name", "Untitled")
+def enqueue_stale_proposals(supabase) -> int:
+    """Queue one regeneration job per flagged event. Returns the number of flagged events seen."""
+    response = (
+        supabase.table("events")
+        .select("id")
+        .eq("proposals_needs_regeneration", True)
+        .in_("status", ACTIVE_STATUSES)
+        .limit(ENQUEUE_SCAN_LIMIT)
+        .execute()
+    )
+
+    queue = JobQueue(supabase)
+    for event in response.data or []:
+        # Same path as live invalidations, so an event mid-burst keeps its quiet period
+        debounce_proposal_regeneration(event["id"], queue=queue)
+    return len(response.data or [])
+
+
+def log_backlog_metrics(queue: JobQueue) -> None:
+    """Log job queue backlog and Gemini rate limiter metrics."""
+    try:
+        for kind, stats in sorted(queue.stats().items()):
+            logging.info(
+                f"{LOG_PREFIX} Backlog {kind}: pending={stats.get('pending')}, due={stats.get('due')}, "
+                f"running={stats.get('running')}, dead={stats.get('dead')}, "
+                f"oldest_due={float(stats.get('oldest_due_seconds') or 0):.0f}s"
+            )
+    except Exception as e:
+        logging.warning(f"{LOG_PREFIX} Could not read job queue backlog: {e}")
+
+    limiter_stats = get_gemini_rate_limiter().stats
+    logging.info(
+        f"{LOG_PREFIX} Gemini rate limiter (this process): acquired={limiter_stats['acquired']}, "
+        f"waits={limiter_stats['waits']}, waited={limiter_stats['wait_seconds']:.0f}s, "
+        f"rejected={limiter_stats['rejected']}"
+    )
 
-        logging.info(f"{LOG_PREFIX} Processing event {idx}/{total}: {event_uid} ({event_name})")
 
-        try:
-            if _process_event(event, supabase, time_proposal_service):
-                success_count += 1
-        except Exception as e:
-            logging.error(f"{LOG_PREFIX} Failed to regenerate proposals for event {event_uid}: {e}")
-            error_count += 1
+def regenerate_stale_proposals() -> None:
+    """
+    Queue a regeneration job for every event with proposals_needs_regeneration=TRUE.
+
+    The jobs are executed in parallel by the job queue consumers
+    (PROPOSAL_REGEN_CONCURRENCY per worker process), paced by the shared
+    Gemini rate limiter (GEMINI_RPM / GEMINI_TPM).
+    """
+    logging.info(f"{LOG_PREFIX} Starting stale proposal sweep")
+
+    supabase = _get_supabase_client()
+    if not supabase:
+        return
 
-        if idx < total:
-            logging.info(f"{LOG_PREFIX} Waiting {delay_seconds}s before next API call...")
-            time.sleep(delay_seconds)
+    queue = JobQueue(supabase)
+    try:
+        flagged = enqueue_stale_proposals(supabase)
+        logging.info(f"{LOG_PREFIX} Queued {flagged} flagged events")
+    except Exception as e:
+        logging.error(f"{LOG_PREFIX} Failed to queue stale proposals: {e}")
 
-    logging.info(f"{LOG_PREFIX} Job completed. Success: {success_count}, Errors: {error_count}")
+    log_backlog_metrics(queue)
 
 
 def schedule_proposal_regeneration() -> int:
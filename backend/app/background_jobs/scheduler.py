@@ -0,0 +1,221 @@
+"""
+Background job scheduler process model.
+
+One-off work (calendar syncs, proposal regeneration) lives in the Postgres
+job queue (job_queue.py); the scheduler only drives recurring jobs, and
+exactly one process per deployment runs them:
+
+- BACKGROUND_JOBS_MODE=worker: web processes never execute jobs. Every
+  ``python worker.py`` process drains the job queue; the one that
+  holds SCHEDULER_LOCK_PATH also runs the recurring jobs.
+- BACKGROUND_JOBS_MODE=embedded (default): gunicorn workers race for the
+  lock. The holder runs the scheduler and drains the queue, the others only
+  enqueue and take over when the leader exits.
+- BACKGROUND_JOBS_MODE=off: nothing is scheduled.
+
+SCHEDULER_JOBSTORE_URL (an SQLAlchemy database URL) optionally persists the
+recurring jobs' schedule across restarts.
+"""
+
+from ..config import Config
+from .calendar_sync import sync_user_calendar_job
+from .job_queue import CALENDAR_SYNC, PROPOSAL_REGENERATION, QueueConsumer
+from .proposal_regeneration import regenerate_stale_proposals, schedule_proposal_regeneration
+
+import atexit
+import logging
+import os
+import threading
+from datetime import timezone
+from typing import Any, Dict, List, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.schedulers.blocking import BlockingScheduler
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX development machines
+    fcntl = None
+
+LOG_PREFIX = "[SCHEDULER]"
+PROPOSAL_REGEN_JOB_ID = "proposal_regeneration"
+
+JOB_DEFAULTS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 300}
+
+
+class LeaderLock:
+    """Exclusive, process-lifetime file lock used for scheduler leader election."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = False) -> bool:
+        """Try to become leader. The OS releases the lock if the process dies."""
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            self._fd = -1
+            return True
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        if self._fd >= 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd = None
+
+
+def _job_stores() -> Dict[str, Any]:
+    """Durable SQLAlchemy job store for recurring jobs when configured, otherwise APScheduler's memory store."""
+    url = Config.SCHEDULER_JOBSTORE_URL
+    if not url:
+        return {}
+
+    try:
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    except ImportError:
+        logging.warning(f"{LOG_PREFIX} SQLAlchemy not installed, SCHEDULER_JOBSTORE_URL ignored")
+        return {}
+
+    return {"default": SQLAlchemyJobStore(url=url, tablename="apscheduler_jobs")}
+
+
+def build_scheduler(blocking: bool = False) -> BaseScheduler:
+    scheduler_class = BlockingScheduler if blocking else BackgroundScheduler
+    return scheduler_class(jobstores=_job_stores(), job_defaults=JOB_DEFAULTS, timezone=timezone.utc)
+
+
+def build_queue_consumers() -> List[QueueConsumer]:
+    """
+    Queue consumers run by every job-executing process. Regenerations get
+    their own threads (paced by the Gemini rate limiter) so a quota wait
+    never delays calendar syncs.
+    """
+    return [
+        QueueConsumer([CALENDAR_SYNC], poll_seconds=Config.SCHEDULER_POLL_SECONDS),
+        QueueConsumer(
+            [PROPOSAL_REGENERATION],
+            poll_seconds=Config.SCHEDULER_POLL_SECONDS,
+            concurrency=Config.PROPOSAL_REGEN_CONCURRENCY,
+            batch_size=1,
+        ),
+    ]
+
+
+def register_recurring_jobs(scheduler: BaseScheduler) -> None:
+    """Register leader-only periodic jobs. Idempotent across restarts."""
+    scheduler.add_job(
+        regenerate_stale_proposals,
+        trigger="interval",
+        minutes=schedule_proposal_regeneration(),
+        id=PROPOSAL_REGEN_JOB_ID,
+        replace_existing=True,
+    )
+
+
+class JobRunner:
+    """Owns this process's scheduler, queue consumers and leadership state."""
+
+    def __init__(self, mode: str, lock: LeaderLock):
+        self.mode = mode
+        self.lock = lock
+        self.scheduler: Optional[BaseScheduler] = None
+        self.consumers: List[QueueConsumer] = []
+        self._standby: Optional[threading.Thread] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self.lock.held
+
+    def start_embedded(self) -> None:
+        """Run jobs in this web process if it wins the leader lock, otherwise stand by."""
+        self.scheduler = build_scheduler()
+        self.consumers = build_queue_consumers()
+
+        if self.lock.acquire():
+            self._lead()
+            logging.info(f"{LOG_PREFIX} Process {os.getpid()} is the scheduler leader")
+        else:
+            self._standby = threading.Thread(
+                target=self._await_leadership, name="scheduler-standby", daemon=True
+            )
+            self._standby.start()
+            logging.info(f"{LOG_PREFIX} Process {os.getpid()} enqueues only")
+
+        atexit.register(self.shutdown)
+
+    def _lead(self) -> None:
+        register_recurring_jobs(self.scheduler)
+        self.scheduler.start()
+        for consumer in self.consumers:
+            consumer.start()
+
+    def _await_leadership(self) -> None:
+        """Block until the current leader exits, then take over."""
+        self.lock.acquire(blocking=True)
+        self._lead()
+        logging.info(f"{LOG_PREFIX} Process {os.getpid()} took over as scheduler leader")
+
+    def shutdown(self) -> None:
+        for consumer in self.consumers:
+            consumer.stop(timeout=5)
+        if self.scheduler is not None and self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        self.lock.release()
+
+
+def run_worker() -> None:
+    """
+    Entry point of the dedicated worker process (``python worker.py``).
+    Every worker drains the job queue; SKIP LOCKED claims keep them from
+    running the same job. Only the lock holder also runs the recurring jobs,
+    the others wait on the lock as hot standbys.
+    """
+    consumers = build_queue_consumers()
+    for consumer in consumers:
+        consumer.start()
+
+    lock = LeaderLock(Config.SCHEDULER_LOCK_PATH)
+    logging.info(f"{LOG_PREFIX} Worker {os.getpid()} draining the job queue, waiting for scheduler leadership")
+    lock.acquire(blocking=True)
+
+    # Added before start(): the blocking scheduler runs its loop in this thread
+    scheduler = build_scheduler(blocking=True)
+    register_recurring_jobs(scheduler)
+    logging.info(f"{LOG_PREFIX} Worker {os.getpid()} is the scheduler leader")
+    try:
+        scheduler.start()
+    finally:
+        for consumer in consumers:
+            consumer.stop(timeout=5)
+        lock.release()
+
+
+__all__ = [
+    "JobRunner",
+    "LeaderLock",
+    "build_queue_consumers",
+    "build_scheduler",
+    "register_recurring_jobs",
+    "run_worker",
+    "sync_user_calendar_job",
+]
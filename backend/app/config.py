@@ -30,6 +30,31 @@ class Config:
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
     _max_retries = os.getenv("GEMINI_MAX_RETRIES", "3")
     GEMINI_MAX_RETRIES = int(_max_retries) if str(_max_retries).isdigit() else 3
+    PROPOSAL_AI_ENRICHMENT = os.getenv("PROPOSAL_AI_ENRICHMENT", "true").lower() != "false"
+    # Gemini quota, enforced across all processes ("postgres") or per process ("local")
+    GEMINI_RPM = float(os.getenv("GEMINI_RPM", "10"))
+    GEMINI_TPM = float(os.getenv("GEMINI_TPM", "250000"))
+    GEMINI_RATE_LIMIT_BACKEND = os.getenv("GEMINI_RATE_LIMIT_BACKEND", "postgres").lower()
+    # Longest an interactive request waits for a Gemini slot before falling back to local proposals
+    GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS", "10"))
+    # Output tokens reserved per call until the response reports actual usage
+    GEMINI_OUTPUT_TOKENS_ESTIMATE = int(os.getenv("GEMINI_OUTPUT_TOKENS_ESTIMATE", "2048"))
+    # Token budget for the prompt's availability section; slots are coarsened to fit the whole window
+    GEMINI_PROMPT_AVAILABILITY_TOKENS = int(os.getenv("GEMINI_PROMPT_AVAILABILITY_TOKENS", "1500"))
+    # Deadline for one Gemini call including retries (quota waits excluded), and the latency
+    # percentile after which a second, hedged request is sent (0 disables hedging)
+    GEMINI_DEADLINE_SECONDS = float(os.getenv("GEMINI_DEADLINE_SECONDS", "30"))
+    GEMINI_HEDGE_PERCENTILE = float(os.getenv("GEMINI_HEDGE_PERCENTILE", "95"))
+    GEMINI_HEDGE_MIN_SAMPLES = int(os.getenv("GEMINI_HEDGE_MIN_SAMPLES", "20"))
+    GEMINI_HEDGE_WINDOW = int(os.getenv("GEMINI_HEDGE_WINDOW", "200"))
+
+    # Background proposal regeneration: concurrent generations per worker process and their wait budget
+    PROPOSAL_REGEN_CONCURRENCY = int(os.getenv("PROPOSAL_REGEN_CONCURRENCY", "4"))
+    PROPOSAL_REGEN_MAX_WAIT_SECONDS = float(os.getenv("PROPOSAL_REGEN_MAX_WAIT_SECONDS", "300"))
+    # Invalidations of one event are coalesced into a single regeneration once they stop for
+    # the quiet period; a steady stream of changes is regenerated at least every max delay
+    PROPOSAL_INVALIDATION_QUIET_SECONDS = int(os.getenv("PROPOSAL_INVALIDATION_QUIET_SECONDS", "10"))
+    PROPOSAL_INVALIDATION_MAX_DELAY_SECONDS = int(os.getenv("PROPOSAL_INVALIDATION_MAX_DELAY_SECONDS", "60"))
 
     # Microsoft/Outlook Calendar API settings
     MICROSOFT_CLIENT_ID = os.getenv("MICROSOFT_CLIENT_ID")
@@ -37,9 +62,47 @@ class Config:
     MICROSOFT_TENANT_ID = os.getenv("MICROSOFT_TENANT_ID", "common")
     MICROSOFT_REDIRECT_URI = os.getenv("MICROSOFT_REDIRECT_URI")
 
+    # Calendar sync concurrency: pool size per fan-out and concurrent requests per provider
+    CALENDAR_SYNC_MAX_WORKERS = int(os.getenv("CALENDAR_SYNC_MAX_WORKERS", "8"))
+    CALENDAR_SYNC_GOOGLE_CONCURRENCY = int(os.getenv("CALENDAR_SYNC_GOOGLE_CONCURRENCY", "4"))
+    CALENDAR_SYNC_MICROSOFT_CONCURRENCY = int(os.getenv("CALENDAR_SYNC_MICROSOFT_CONCURRENCY", "4"))
+    # Google calendars of one account listed per batch HTTP request (Google recommends at most 50)
+    CALENDAR_SYNC_GOOGLE_BATCH_SIZE = int(os.getenv("CALENDAR_SYNC_GOOGLE_BATCH_SIZE", "50"))
+    # Rows per busy slot upsert/delete request during sync, and attempts per failed batch
+    CALENDAR_SYNC_BATCH_SIZE = int(os.getenv("CALENDAR_SYNC_BATCH_SIZE", "500"))
+    CALENDAR_SYNC_BATCH_RETRIES = int(os.getenv("CALENDAR_SYNC_BATCH_RETRIES", "3"))
+    # Full listings end on a grid of this many days, so the stored sync token keeps
+    # covering the forward-moving window of later runs until the grid line is passed
+    CALENDAR_SYNC_WINDOW_STEP_DAYS = int(os.getenv("CALENDAR_SYNC_WINDOW_STEP_DAYS", "7"))
+
+    # Background jobs: "embedded" (one gunicorn worker elected leader), "worker" (python worker.py) or "off"
+    BACKGROUND_JOBS_MODE = os.getenv("BACKGROUND_JOBS_MODE", "embedded").lower()
+    SCHEDULER_LOCK_PATH = os.getenv("SCHEDULER_LOCK_PATH", "/tmp/when-scheduler.lock")
+    # SQLAlchemy URL of the shared job store (e.g. the Supabase Postgres connection string)
+    SCHEDULER_JOBSTORE_URL = os.getenv("SCHEDULER_JOBSTORE_URL")
+    SCHEDULER_POLL_SECONDS = int(os.getenv("SCHEDULER_POLL_SECONDS", "5"))
+    # Postgres job queue (migration 015): jobs claimed per poll, lease length, retry backoff
+    JOB_QUEUE_BATCH_SIZE = int(os.getenv("JOB_QUEUE_BATCH_SIZE", "5"))
+    JOB_QUEUE_LEASE_SECONDS = int(os.getenv("JOB_QUEUE_LEASE_SECONDS", "600"))
+    JOB_QUEUE_MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "5"))
+    JOB_QUEUE_RETRY_BASE_SECONDS = int(os.getenv("JOB_QUEUE_RETRY_BASE_SECONDS", "30"))
+    JOB_QUEUE_RETRY_MAX_SECONDS = int(os.getenv("JOB_QUEUE_RETRY_MAX_SECONDS", "3600"))
+
     # Supabase settings
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_ANON_KEY")
+    # Shared HTTP connection pool used by every Supabase client in the process
+    SUPABASE_POOL_MAX_CONNECTIONS = int(os.getenv("SUPABASE_POOL_MAX_CONNECTIONS", "20"))
+    SUPABASE_POOL_MAX_KEEPALIVE = int(os.getenv("SUPABASE_POOL_MAX_KEEPALIVE", "10"))
+    SUPABASE_POOL_KEEPALIVE_EXPIRY = float(os.getenv("SUPABASE_POOL_KEEPALIVE_EXPIRY", "30"))
+    SUPABASE_HTTP_TIMEOUT = float(os.getenv("SUPABASE_HTTP_TIMEOUT", "120"))
+
+    # Local access-token verification for require_auth (HS256 secret and/or JWKS)
+    SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
+    SUPABASE_JWKS_URL = os.getenv("SUPABASE_JWKS_URL")
+    SUPABASE_JWT_AUDIENCE = os.getenv("SUPABASE_JWT_AUDIENCE", "authenticated")
+    AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "2048"))
+    AUTH_TOKEN_CACHE_TTL_SECONDS = int(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", "300"))
 
     @classmethod
     def init_app(cls, app):
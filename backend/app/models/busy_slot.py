@@ -1,4 +1,5 @@
 """Busy slot model for managing user busy times from calendar providers."""
+import hashlib
 import re
 import uuid
 from datetime import datetime
@@ -20,6 +21,7 @@ class BusySlot(BaseModel):
     end_time_utc: datetime = Field(...)
     provider_event_id: Optional[str] = Field(default=None)
     calendar_source_id: Optional[str] = Field(default=None) # The calendar source ID from the calendar_sources table
+    content_hash: Optional[str] = Field(default=None) # Hash of start, end and provider availability (see compute_content_hash)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     last_synced_at: datetime = Field(default_factory=datetime.utcnow)
@@ -54,6 +56,7 @@ class BusySlot(BaseModel):
             "end_time_utc": self.end_time_utc.isoformat(),
             "provider_event_id": self.provider_event_id,
             "calendar_source_id": self.calendar_source_id,
+            "content_hash": self.content_hash,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "last_synced_at": self.last_synced_at.isoformat(),
@@ -71,6 +74,16 @@ class BusySlot(BaseModel):
             return self.end_time_utc
         return datetime.fromisoformat(str(self.end_time_utc).replace("Z", "+00:00"))
 
+    @staticmethod
+    def compute_content_hash(start: datetime, end: datetime, availability: str) -> str:
+        """
+        Hash the fields that decide a slot's availability. Sync compares it with
+        the stored hash to tell changed events from unchanged ones.
+        ``availability`` is Google's transparency or Microsoft's showAs.
+        """
+        content = "|".join((start.isoformat(), end.isoformat(), availability.lower()))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
     @classmethod
     def from_google_event(
         cls,
@@ -93,6 +106,7 @@ class BusySlot(BaseModel):
             end_time_utc=end_dt,
             provider_event_id=google_event.get('id'),
             calendar_source_id=google_event.get('calendar_source_id'),
+            content_hash=cls.compute_content_hash(start_dt, end_dt, google_event.get('transparency', 'opaque')),
         )
 
     @classmethod
@@ -123,4 +137,5 @@ class BusySlot(BaseModel):
             end_time_utc=end_dt,
             provider_event_id=event.get('id'),
             calendar_source_id=event.get('calendar_source_id'),
+            content_hash=cls.compute_content_hash(start_dt, end_dt, event.get('showAs', 'busy')),
         )
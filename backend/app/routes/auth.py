@@ -5,7 +5,6 @@ import base64
 import json
 import logging
 import time as _time
-from datetime import datetime, timezone
 
 from flask import Blueprint, request, jsonify, redirect, current_app
 
@@ -161,17 +160,11 @@ def _sync_microsoft_calendar_sources(user_id: str, credentials: dict, microsoft_
 
 
 def _schedule_calendar_sync(user_id: str) -> None:
-    """Schedule background calendar sync job."""
+    """Queue a background calendar sync; repeated calls collapse into one pending job."""
     try:
-        from ..background_jobs.calendar_sync import sync_user_calendar_job
-
-        current_app.scheduler.add_job(
-            id=f'sync_calendar_{user_id}_{int(datetime.now(timezone.utc).timestamp())}',
-            func=sync_user_calendar_job,
-            args=[user_id],
-            trigger='date',
-            run_date=datetime.now(timezone.utc)
-        )
+        from ..background_jobs import enqueue_calendar_sync
+
+        enqueue_calendar_sync(user_id)
         logging.info(f"[AUTH] Calendar sync job scheduled for user {user_id}")
 
     except Exception as e:
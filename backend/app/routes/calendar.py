@@ -14,7 +14,8 @@ from ..services import microsoft_calendar
 from ..services.google_calendar import get_stored_credentials, get_calendar_service
 from ..services.users import UsersService
 from ..utils.decorators import require_auth
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
+from ..utils.sync_pool import run_bounded
 
 calendar_bp = Blueprint("calendar", __name__, url_prefix="/api/calendar")
 users_service = UsersService()
@@ -271,15 +272,7 @@ def sync_event_participants(event_uid, user_id):
 
 def _get_service_role_client():
     """Get Supabase client with service role key."""
-    import os
-    from supabase import create_client
-
-    supabase_url = os.getenv('SUPABASE_URL')
-    supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-    if supabase_url and supabase_service_key:
-        return create_client(supabase_url, supabase_service_key)
-    return get_supabase()
+    return get_service_role_client() or get_supabase()
 
 
 def _get_event_sync_window(event: dict) -> tuple[datetime, datetime]:
@@ -306,34 +299,25 @@ def _sync_participants_calendars(
     start_date: datetime,
     end_date: datetime
 ) -> dict:
-    """Sync calendars for all participants (Google and Microsoft) and return results."""
+    """
+    Sync calendars for all participants (Google and Microsoft) and return results.
+    Participants are synced concurrently on a bounded pool; details keep participant order.
+    """
     busy_slot_service = BusySlotService()
-    sync_results = {
-        'total_participants': len(participant_ids),
-        'synced': 0,
-        'failed': 0,
-        'skipped': 0,
-        'details': []
-    }
 
-    for participant_id in participant_ids:
+    def sync_participant(participant_id: str) -> dict:
         profile = profiles_map.get(participant_id, {})
-        participant_name = profile.get("full_name", "Unknown")
-        participant_email = profile.get("email_address", "unknown@email.com")
+        detail = {
+            'user_id': participant_id,
+            'name': profile.get("full_name", "Unknown"),
+            'email': profile.get("email_address", "unknown@email.com"),
+        }
 
         google_creds = get_stored_credentials(participant_id)
         microsoft_creds = microsoft_calendar.get_stored_credentials(participant_id)
 
         if not google_creds and not microsoft_creds:
-            sync_results['skipped'] += 1
-            sync_results['details'].append({
-                'user_id': participant_id,
-                'name': participant_name,
-                'email': participant_email,
-                'status': 'skipped',
-                'reason': 'No calendar connected'
-            })
-            continue
+            return {**detail, 'status': 'skipped', 'reason': 'No calendar connected'}
 
         any_success = False
 
@@ -354,24 +338,19 @@ def _sync_participants_calendars(
                 logging.warning(f"[SYNC] Microsoft sync failed for participant {participant_id}: {e}")
 
         if any_success:
-            sync_results['synced'] += 1
-            sync_results['details'].append({
-                'user_id': participant_id,
-                'name': participant_name,
-                'email': participant_email,
-                'status': 'success'
-            })
-        else:
-            sync_results['failed'] += 1
-            sync_results['details'].append({
-                'user_id': participant_id,
-                'name': participant_name,
-                'email': participant_email,
-                'status': 'failed',
-                'reason': 'Calendar sync failed - user may need to reconnect'
-            })
-
-    return sync_results
+            return {**detail, 'status': 'success'}
+
+        return {**detail, 'status': 'failed', 'reason': 'Calendar sync failed - user may need to reconnect'}
+
+    details = run_bounded(sync_participant, participant_ids)
+
+    return {
+        'total_participants': len(participant_ids),
+        'synced': sum(1 for d in details if d['status'] == 'success'),
+        'failed': sum(1 for d in details if d['status'] == 'failed'),
+        'skipped': sum(1 for d in details if d['status'] == 'skipped'),
+        'details': details
+    }
 
 
 def _mark_event_proposals_stale(event_id: str, sync_results: dict) -> None:
@@ -5,11 +5,14 @@ import logging
 from flask import Blueprint, request, jsonify
 
 from ..services import google_calendar, microsoft_calendar
-from ..services.calendar_accounts import CalendarAccountsService
+from ..services.calendar_accounts import SYNC_MODES, CalendarAccountsService
 from ..utils.decorators import require_auth
 
 calendar_accounts_bp = Blueprint("calendar_accounts", __name__, url_prefix="/api/calendar-accounts")
 
+# Server-side incremental sync state on calendar_sources rows; never returned to clients
+SOURCE_SYNC_STATE_FIELDS = ("sync_token", "sync_window_start", "sync_window_end")
+
 
 def _get_account_or_error(service: CalendarAccountsService, account_id: str, user_id: str):
     """Get account and verify ownership. Returns (account, error_response, status_code)."""
@@ -24,10 +27,19 @@ def _get_account_or_error(service: CalendarAccountsService, account_id: str, use
     return account, None, None
 
 
+def _remove_sync_state(source: dict) -> dict:
+    """Remove incremental sync state from a calendar source dict."""
+    for field in SOURCE_SYNC_STATE_FIELDS:
+        source.pop(field, None)
+    return source
+
+
 def _remove_credentials(account: dict) -> dict:
-    """Remove sensitive credentials from account dict."""
+    """Remove sensitive credentials and source sync state from account dict."""
     if "credentials" in account:
         del account["credentials"]
+    for source in account.get("calendar_sources") or []:
+        _remove_sync_state(source)
     return account
 
 
@@ -132,7 +144,7 @@ def sync_account_calendars(user_id, account_id):
         if error:
             return jsonify(error), status
 
-        synced_sources = service.sync_calendars_from_provider(account_id)
+        synced_sources = [_remove_sync_state(source) for source in service.sync_calendars_from_provider(account_id)]
 
         return jsonify({
             "message": "Calendars synced successfully",
@@ -145,6 +157,35 @@ def sync_account_calendars(user_id, account_id):
         return jsonify({"error": "Failed to sync calendars", "message": str(e)}), 500
 
 
+@calendar_accounts_bp.route("/<account_id>/sync-mode", methods=["PUT"])
+@require_auth
+def update_sync_mode(user_id, account_id):
+    """Choose whether an account syncs full events or provider free/busy blocks."""
+    try:
+        data = request.get_json() or {}
+        sync_mode = data.get("sync_mode")
+        if sync_mode not in SYNC_MODES:
+            return jsonify({
+                "error": "Invalid sync mode",
+                "message": f"sync_mode must be one of: {', '.join(SYNC_MODES)}"
+            }), 400
+
+        service = CalendarAccountsService()
+        account, error, status = _get_account_or_error(service, account_id, user_id)
+        if error:
+            return jsonify(error), status
+
+        updated = service.update_account_sync_mode(account_id, sync_mode)
+        if not updated:
+            return jsonify({"error": "Update failed", "message": "Failed to update sync mode"}), 500
+
+        return jsonify(_remove_credentials(updated)), 200
+
+    except Exception as e:
+        logging.error(f"Error updating sync mode for account {account_id}: {e}")
+        return jsonify({"error": "Failed to update sync mode", "message": str(e)}), 500
+
+
 @calendar_accounts_bp.route("/sources/<source_id>", methods=["PUT"])
 @require_auth
 def update_source(user_id, source_id):
@@ -179,7 +220,7 @@ def update_source(user_id, source_id):
         if "calendar_accounts" in updated_source:
             del updated_source["calendar_accounts"]
 
-        return jsonify(updated_source), 200
+        return jsonify(_remove_sync_state(updated_source)), 200
 
     except Exception as e:
         logging.error(f"Error updating calendar source {source_id}: {e}")
@@ -194,8 +235,9 @@ def get_write_calendar(user_id):
         service = CalendarAccountsService()
         write_calendars = service.get_all_write_calendars(user_id)
 
-        # Remove credentials from response
+        # Remove credentials and sync state from response
         for cal in write_calendars:
+            _remove_sync_state(cal)
             if "account" in cal and "credentials" in cal["account"]:
                 del cal["account"]["credentials"]
 
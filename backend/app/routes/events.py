@@ -4,18 +4,16 @@ Event routes for managing events and event participants.
 from __future__ import annotations
 
 import logging
-import os
 import random
 import string
 from datetime import datetime
 
 from flask import Blueprint, request, jsonify
-from supabase import create_client
 
 from ..services.events import EventsService
 from ..services.notifications import NotificationsService
 from ..utils.decorators import require_auth
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 event_bp = Blueprint("events", __name__, url_prefix="/api/events")
 
@@ -38,15 +36,13 @@ def _parse_utc_datetime(datetime_str: str | None) -> datetime | None:
 
 def _get_service_role_client():
     """Get or create the service role client for bypassing RLS."""
-    supabase_url = os.getenv('SUPABASE_URL')
-    supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-    if not supabase_url or not supabase_service_key:
+    client = get_service_role_client()
+    if client is None:
         raise ValueError(
             "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment variables"
         )
 
-    return create_client(supabase_url, supabase_service_key)
+    return client
 
 
 def _get_events_service() -> EventsService:
@@ -60,14 +56,14 @@ def _generate_event_uid() -> str:
 
 
 def _trigger_proposal_regeneration(event_id: str, access_token, action: str) -> None:
-    """Trigger proposal regeneration after participant changes."""
+    """Schedule a coalesced background proposal regeneration after participant changes."""
     try:
         from ..services.time_proposal import TimeProposalService
         time_proposal_service = TimeProposalService(access_token)
-        time_proposal_service.regenerate_proposals_immediately(event_id)
-        logging.info(f"[EVENTS] Triggered proposal regeneration for event {event_id} after {action}")
+        time_proposal_service.mark_proposals_stale(event_id)
+        logging.info(f"[EVENTS] Scheduled proposal regeneration for event {event_id} after {action}")
     except Exception as e:
-        logging.warning(f"[EVENTS] Failed to regenerate proposals after {action}: {e}")
+        logging.warning(f"[EVENTS] Failed to schedule proposal regeneration after {action}: {e}")
 
 
 # Initialize service role client at module level
@@ -4,16 +4,15 @@ Routes for event invitation management.
 from __future__ import annotations
 
 import logging
-import os
 from datetime import datetime, timezone
 
 from flask import Blueprint, request, jsonify
-from supabase import create_client
 
 from ..services.invitations import InvitationsService
 from ..services.notifications import NotificationsService
 from ..utils.decorators import require_auth
 from ..utils.email_utils import get_email_variants
+from ..utils.supabase_client import get_service_role_client
 
 invitations_bp = Blueprint("invitations", __name__)
 invitations_service = InvitationsService()
@@ -21,11 +20,7 @@ invitations_service = InvitationsService()
 
 def _get_service_role_client():
     """Get service role client for bypassing RLS."""
-    supabase_url = os.getenv('SUPABASE_URL')
-    supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-    if supabase_url and supabase_service_key:
-        return create_client(supabase_url, supabase_service_key)
-    return None
+    return get_service_role_client()
 
 
 service_role_client = _get_service_role_client()
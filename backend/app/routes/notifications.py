@@ -4,26 +4,21 @@ Routes for notification management.
 from __future__ import annotations
 
 import logging
-import os
 
 from flask import Blueprint, request, jsonify
-from supabase import create_client
 
 from ..services.events import EventsService
 from ..services.invitations import InvitationsService
 from ..services.notifications import NotificationsService
 from ..utils.decorators import require_auth
+from ..utils.supabase_client import get_service_role_client
 
 notifications_bp = Blueprint("notifications", __name__)
 
 
 def _get_service_role_client():
     """Get service role client for bypassing RLS."""
-    supabase_url = os.getenv('SUPABASE_URL')
-    supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-    if supabase_url and supabase_service_key:
-        return create_client(supabase_url, supabase_service_key)
-    return None
+    return get_service_role_client()
 
 
 service_role_client = _get_service_role_client()
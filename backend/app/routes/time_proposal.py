@@ -3,9 +3,10 @@ Routes for AI-powered time proposal generation.
 """
 from __future__ import annotations
 
+import json
 import logging
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
 from ..services.events import EventsService
 from ..services.time_proposal import TimeProposalService
@@ -74,50 +75,73 @@ def _handle_service_error(error_message: str) -> tuple[dict, int]:
 
     return {"error": "Failed to generate proposals", "message": error_message}, 500
 
-@time_proposal_bp.route("/api/events/<event_uid>/propose-times", methods=["POST"])
-@require_auth
-def propose_times(event_uid, user_id):
-    """Get time proposals for an event (cached or generate)."""
+def _load_proposal_request(event_uid: str, user_id: str) -> tuple[dict | None, tuple | None]:
+    """
+    Validate a propose-times request and the caller's access to the event.
+
+    Returns (params, None) with the event, num_suggestions and force_refresh,
+    or (None, error_response) when the request must be rejected.
+    """
     data = request.get_json() or {}
     num_suggestions = data.get("num_suggestions", 5)
     force_refresh = data.get("force_refresh", False)
 
     if not isinstance(num_suggestions, int) or num_suggestions < 1 or num_suggestions > 20:
-        return jsonify({
+        return None, (jsonify({
             "error": "Invalid parameter",
             "message": "num_suggestions must be an integer between 1 and 20"
-        }), 400
+        }), 400)
 
     events_service = EventsService()
     event = events_service.get_event_by_uid(event_uid)
 
     if not event:
-        return jsonify({
+        return None, (jsonify({
             "error": "Event not found",
             "message": f"Event with UID '{event_uid}' not found"
-        }), 404
+        }), 404)
 
     db_event_id = event["id"]
     is_coordinator = event.get("coordinator_id") == user_id
     is_participant = events_service.is_user_participant(db_event_id, user_id)
 
     if not is_coordinator and not is_participant:
-        return jsonify({
+        return None, (jsonify({
             "error": "Access denied",
             "message": "You must be a participant or coordinator to view time proposals"
-        }), 403
+        }), 403)
 
     if force_refresh and not is_coordinator:
-        return jsonify({
+        return None, (jsonify({
             "error": "Access denied",
             "message": "Only coordinators can force refresh proposals"
-        }), 403
+        }), 403)
 
     if event.get("status") == "finalized":
-        return jsonify({
+        return None, (jsonify({
             "error": "Event finalized",
             "message": "This event has already been finalized"
-        }), 400
+        }), 400)
+
+    return {"event": event, "num_suggestions": num_suggestions, "force_refresh": force_refresh}, None
+
+
+def _sse(event: str, payload: dict) -> str:
+    """Encode one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+@time_proposal_bp.route("/api/events/<event_uid>/propose-times", methods=["POST"])
+@require_auth
+def propose_times(event_uid, user_id):
+    """Get time proposals for an event (cached or generate)."""
+    params, error = _load_proposal_request(event_uid, user_id)
+    if error:
+        return error
+
+    db_event_id = params["event"]["id"]
+    num_suggestions = params["num_suggestions"]
+    force_refresh = params["force_refresh"]
 
     time_proposal_service = TimeProposalService(_get_access_token())
 
@@ -144,6 +168,9 @@ def propose_times(event_uid, user_id):
             time_proposal_service.save_proposals_to_cache(db_event_id, proposals)
             return jsonify(_build_proposal_response(proposals, False, None, False, False)), 200
 
+        # Stale from here on: regenerate this event ahead of the background backlog
+        time_proposal_service.prioritize_regeneration(db_event_id)
+
         # All cached proposals are expired
         if regen_status.get("all_expired"):
             return jsonify(_build_proposal_response([], True, generated_at, True, True, expired_message)), 200
@@ -171,6 +198,74 @@ def propose_times(event_uid, user_id):
         return jsonify(response), status_code
 
 
+@time_proposal_bp.route("/api/events/<event_uid>/propose-times/stream", methods=["POST"])
+@require_auth
+def stream_propose_times(event_uid, user_id):
+    """
+    Stream time proposals as Server-Sent Events.
+
+    Events, in order:
+    - cached: the cached proposals (when there are any), sent immediately
+    - local: free windows and locally ranked proposals (~100ms)
+    - ai: validated Gemini proposals (only when AI enrichment runs)
+    - done: the final proposals, already saved to cache
+    - error: replaces the remaining events if generation fails; carries ``status``
+
+    Cached proposals are sent before any participant data is aggregated;
+    their freshness comes from the event row's stale flag. Fresh ones are
+    followed directly by ``done``. Stale ones are regenerated in the stream,
+    which aggregates the inputs once and skips Gemini when they are unchanged.
+    """
+    params, error = _load_proposal_request(event_uid, user_id)
+    if error:
+        return error
+
+    event = params["event"]
+    db_event_id = event["id"]
+    num_suggestions = params["num_suggestions"]
+    force_refresh = params["force_refresh"]
+    generated_at = event.get("proposals_last_generated_at")
+    time_proposal_service = TimeProposalService(_get_access_token())
+
+    def generate():
+        try:
+            cached = None
+            if not force_refresh:
+                # Past proposals are filtered out, so an all-expired cache comes back empty
+                cached = time_proposal_service.get_cached_proposals(db_event_id).get("proposals")
+                if cached:
+                    stale = event.get("proposals_needs_regeneration", True)
+                    response = _build_proposal_response(cached, True, generated_at, stale, False)
+                    yield _sse("cached", response)
+                    if not stale:
+                        yield _sse("done", response)
+                        return
+
+            stages = time_proposal_service.stream_regenerated_proposals(
+                db_event_id, num_suggestions, force=force_refresh or not cached, cached=cached
+            )
+            for stage, payload in stages:
+                if stage == "final":
+                    from_cache = payload.get("cached", False)
+                    yield _sse("done", _build_proposal_response(
+                        payload["proposals"], from_cache, generated_at if from_cache else None, False, False
+                    ))
+                else:
+                    yield _sse(stage, payload)
+
+        except Exception as service_error:
+            error_message = str(service_error)
+            logging.error(f"[TIME_PROPOSAL] Stream error: {error_message}")
+            response, status_code = _handle_service_error(error_message)
+            yield _sse("error", {**response, "status": status_code})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @time_proposal_bp.route("/api/events/<event_uid>/propose-times/test", methods=["GET"])
 @require_auth
 def test_proposal_endpoint(event_uid, user_id):
@@ -3,7 +3,7 @@ import json
 import time
 from typing import Any, Dict, Optional, Tuple
 
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_supabase, new_supabase_client
 from . import google_calendar as gc
 
 
@@ -63,17 +63,17 @@ class AuthService:
         return self.get_user_from_token(token) is not None
 
     def refresh_session(self, refresh_token: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-        """Refresh a session given a refresh token."""
+        """Refresh a session given a refresh token (on an unshared client, since it stores the session)."""
         try:
-            res = self.supabase.auth.refresh_session({"refresh_token": refresh_token})
+            res = new_supabase_client().auth.refresh_session({"refresh_token": refresh_token})
             return res, None
         except Exception as e:
             return None, f"Session refresh failed: {str(e)}"
 
     def logout(self, access_token: str) -> Tuple[bool, Optional[str]]:
-        """Sign out using an access token."""
+        """Sign out using an access token (on an unshared client, since it clears the session)."""
         try:
-            self.supabase.auth.sign_out(access_token)
+            new_supabase_client().auth.sign_out(access_token)
             return True, None
         except Exception as e:
             return False, f"Logout failed: {str(e)}"
@@ -0,0 +1,121 @@
+"""
+Compact availability encoding for Gemini prompts.
+
+Each day of the event window becomes one line of run-length encoded slot
+counts instead of one English sentence per busy segment:
+
+    2025-12-22 09:00 0*6 2*2 1/3*4 0*4
+
+reads "from 09:00 UTC: 6 slots with nobody busy, 2 slots with 2 participants
+busy, 4 slots with 1 busy and 3 preferring, then 4 free slots". Runs of
+identical days collapse into a date range. When the encoding exceeds its
+token budget the slots are coarsened (30 -> 60 -> 120 minutes ...), so the
+whole window always fits instead of being truncated.
+"""
+
+from ..config import Config
+from ..utils.intervals import parse_utc
+from ..utils.rate_limiter import CHARS_PER_TOKEN
+from .availability_matrix import AvailabilityMatrix
+
+import math
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# Coarsest granularity the planner falls back to: one slot per day window
+MAX_SLOT_MINUTES = 24 * 60
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of prompt text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def encode_runs(busy: Sequence[int], preferred: Sequence[int]) -> str:
+    """Run-length encode per-slot (busy, preferred) counts as ``busy[/preferred]*length``."""
+    runs: List[str] = []
+    previous, length = None, 0
+    for value in zip(busy, preferred):
+        if value == previous:
+            length += 1
+            continue
+        if previous is not None:
+            runs.append(_format_run(previous, length))
+        previous, length = value, 1
+    if previous is not None:
+        runs.append(_format_run(previous, length))
+    return " ".join(runs)
+
+
+def _format_run(value: Tuple[int, int], length: int) -> str:
+    busy, preferred = value
+    token = f"{busy}/{preferred}" if preferred else str(busy)
+    return f"{token}*{length}" if length > 1 else token
+
+
+def _day_rows(
+    matrix: AvailabilityMatrix,
+    day_windows: Iterable[Tuple[datetime, datetime]],
+    slot_minutes: int,
+    not_before: Optional[datetime],
+) -> List[Tuple[date, str, str]]:
+    """(day, first slot start "HH:MM", runs) for every day window with at least one slot."""
+    slot = timedelta(minutes=slot_minutes)
+    rows = []
+    for start, end in day_windows:
+        start, end = parse_utc(start), parse_utc(end)
+        if not_before is not None and start < not_before:
+            # Skip whole slots that start before the earliest allowed time, keeping the day's grid
+            start += slot * math.ceil((not_before - start) / slot)
+        slot_count = math.ceil((end - start) / slot)
+        if slot_count <= 0:
+            continue
+        busy, preferred = matrix.slot_counts(start, slot_minutes, slot_count, end_time=end)
+        rows.append((start.date(), start.strftime("%H:%M"), encode_runs(busy.tolist(), preferred.tolist())))
+    return rows
+
+
+def _collapse_days(rows: List[Tuple[date, str, str]]) -> List[str]:
+    """Join consecutive days with identical rows into ``first..last`` ranges."""
+    lines = []
+    i = 0
+    while i < len(rows):
+        first_day, first_slot, runs = rows[i]
+        j = i
+        while (
+            j + 1 < len(rows)
+            and rows[j + 1][1:] == (first_slot, runs)
+            and rows[j + 1][0] == rows[j][0] + timedelta(days=1)
+        ):
+            j += 1
+        label = first_day.isoformat() if j == i else f"{first_day.isoformat()}..{rows[j][0].isoformat()}"
+        lines.append(f"{label} {first_slot} {runs}")
+        i = j + 1
+    return lines
+
+
+def encode_availability(
+    matrix: AvailabilityMatrix,
+    day_windows: Sequence[Tuple[datetime, datetime]],
+    slot_minutes: int,
+    token_budget: Optional[int] = None,
+    not_before: Optional[datetime] = None,
+) -> Tuple[str, int]:
+    """
+    Encode every day window within ``token_budget`` tokens (default
+    GEMINI_PROMPT_AVAILABILITY_TOKENS).
+
+    Starts at ``slot_minutes`` and doubles the slot length until the encoding
+    fits (or reaches MAX_SLOT_MINUTES). Returns the encoded lines and the slot
+    length used. A participant counts in a slot if they are busy (or prefer)
+    any part of it, matching how proposal conflicts are counted.
+    """
+    if token_budget is None:
+        token_budget = Config.GEMINI_PROMPT_AVAILABILITY_TOKENS
+
+    minutes = slot_minutes
+    while True:
+        text = "\n".join(_collapse_days(_day_rows(matrix, day_windows, minutes, not_before)))
+        if estimate_tokens(text) <= token_budget or minutes >= MAX_SLOT_MINUTES:
+            return text, minutes
+        minutes = min(minutes * 2, MAX_SLOT_MINUTES)
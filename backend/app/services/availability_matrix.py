@@ -0,0 +1,180 @@
+"""
+Availability matrix for time proposal scoring.
+
+Converts an event's busy and preferred slots into int64 epoch-minute arrays
+once per proposal request. Each slot kind is stored as a participants x
+buckets coverage matrix, where buckets are the elementary intervals between
+consecutive slot boundaries. Conflict and preference counts are then
+answered with vectorized NumPy operations instead of re-parsing every slot
+per query.
+"""
+
+from ..utils.intervals import parse_utc, slot_interval
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_SECONDS_PER_MINUTE = 60
+
+
+def to_epoch_minute(value: datetime, round_up: bool = False) -> int:
+    """Convert an aware datetime to whole minutes since the epoch."""
+    seconds = value.timestamp()
+    minutes = int(seconds // _SECONDS_PER_MINUTE)
+    if round_up and seconds % _SECONDS_PER_MINUTE:
+        minutes += 1
+    return minutes
+
+
+def from_epoch_minute(minute: int) -> datetime:
+    """Convert minutes since the epoch back to a UTC datetime."""
+    return datetime.fromtimestamp(int(minute) * _SECONDS_PER_MINUTE, tz=timezone.utc)
+
+
+class _SlotCoverage:
+    """Reference-counted coverage of one slot kind (busy or preferred)."""
+
+    def __init__(self, user_rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, row_count: int):
+        valid = ends > starts
+        user_rows, starts, ends = user_rows[valid], starts[valid], ends[valid]
+
+        self.boundaries = np.unique(np.concatenate([starts, ends])).astype(np.int64)
+        bucket_count = max(len(self.boundaries) - 1, 0)
+
+        delta = np.zeros((row_count, bucket_count + 1), dtype=np.int64)
+        np.add.at(delta, (user_rows, np.searchsorted(self.boundaries, starts)), 1)
+        np.add.at(delta, (user_rows, np.searchsorted(self.boundaries, ends)), -1)
+        self.counts = np.cumsum(delta, axis=1)[:, :bucket_count]
+
+    def users_overlapping(self, start_minute: int, end_minute: int) -> int:
+        """Count participants with at least one slot overlapping [start, end)."""
+        if self.counts.shape[1] == 0 or end_minute <= start_minute:
+            return 0
+
+        first = max(int(np.searchsorted(self.boundaries, start_minute, side="right")) - 1, 0)
+        last = min(int(np.searchsorted(self.boundaries, end_minute, side="left")), self.counts.shape[1])
+        if first >= last:
+            return 0
+
+        return int(np.count_nonzero(self.counts[:, first:last].any(axis=1)))
+
+    def participant_counts(self) -> np.ndarray:
+        """Number of participants covered in each bucket."""
+        return np.count_nonzero(self.counts > 0, axis=0)
+
+    def users_overlapping_grid(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Vectorized users_overlapping for many [start, end) minute intervals at once."""
+        result = np.zeros(len(starts), dtype=np.int64)
+        bucket_count = self.counts.shape[1]
+        if bucket_count == 0 or len(starts) == 0:
+            return result
+
+        first = np.maximum(np.searchsorted(self.boundaries, starts, side="right") - 1, 0)
+        last = np.minimum(np.searchsorted(self.boundaries, ends, side="left"), bucket_count)
+        valid = (first < last) & (ends > starts)
+
+        # Covered buckets per participant as prefix sums: any coverage in [first, last) <=> difference > 0
+        covered = np.zeros((self.counts.shape[0], bucket_count + 1), dtype=np.int64)
+        np.cumsum(self.counts > 0, axis=1, out=covered[:, 1:])
+        overlapping = (covered[:, last] - covered[:, first]) > 0
+        result[valid] = np.count_nonzero(overlapping[:, valid], axis=0)
+        return result
+
+
+class AvailabilityMatrix:
+    """Parsed busy/preferred availability for all participants of an event."""
+
+    def __init__(
+        self,
+        busy_slots: Iterable[Any],
+        preferred_slots: Iterable[Any],
+        participant_ids: Iterable[str] = (),
+    ):
+        self.user_index: Dict[str, int] = {}
+        for user_id in participant_ids:
+            self.user_index.setdefault(user_id, len(self.user_index))
+
+        busy_arrays = self._to_arrays(busy_slots)
+        preferred_arrays = self._to_arrays(preferred_slots)
+
+        row_count = len(self.user_index)
+        self.busy = _SlotCoverage(*busy_arrays, row_count)
+        self.preferred = _SlotCoverage(*preferred_arrays, row_count)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "AvailabilityMatrix":
+        """Build the matrix from TimeProposalService aggregated data."""
+        return cls(
+            busy_slots=data.get("all_busy_slots", []),
+            preferred_slots=data.get("all_preferred_slots", []),
+            participant_ids=[p.get("user_id") for p in data.get("participants", [])],
+        )
+
+    def _to_arrays(self, slots: Iterable[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parse slots once into (user_row, start_minute, end_minute) int64 arrays."""
+        rows, starts, ends = [], [], []
+        for slot in slots:
+            start, end = slot_interval(slot)
+            user_id = slot.get("user_id") if isinstance(slot, dict) else getattr(slot, "user_id", None)
+            rows.append(self.user_index.setdefault(user_id, len(self.user_index)))
+            starts.append(to_epoch_minute(start))
+            ends.append(to_epoch_minute(end, round_up=True))
+
+        return (
+            np.asarray(rows, dtype=np.int64),
+            np.asarray(starts, dtype=np.int64),
+            np.asarray(ends, dtype=np.int64),
+        )
+
+    def conflicts_for_interval(self, start_time: datetime, end_time: datetime) -> int:
+        """Count unique participants with a busy slot overlapping the interval."""
+        return self.busy.users_overlapping(
+            to_epoch_minute(parse_utc(start_time)),
+            to_epoch_minute(parse_utc(end_time), round_up=True),
+        )
+
+    def preferred_count_for_interval(self, start_time: datetime, end_time: datetime) -> int:
+        """Count unique participants with a preferred slot overlapping the interval."""
+        return self.preferred.users_overlapping(
+            to_epoch_minute(parse_utc(start_time)),
+            to_epoch_minute(parse_utc(end_time), round_up=True),
+        )
+
+    def slot_counts(
+        self,
+        start_time: datetime,
+        slot_minutes: int,
+        slot_count: int,
+        end_time: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Busy and preferred participant counts for consecutive slots from ``start_time``.
+
+        A participant counts for a slot if any of their slots overlaps it, the
+        same rule as conflicts_for_interval. Slots are clipped to ``end_time``
+        when given, so a final partial slot only covers time before it.
+        """
+        starts = to_epoch_minute(parse_utc(start_time)) + slot_minutes * np.arange(slot_count, dtype=np.int64)
+        ends = starts + slot_minutes
+        if end_time is not None:
+            ends = np.minimum(ends, to_epoch_minute(parse_utc(end_time)))
+        return self.busy.users_overlapping_grid(starts, ends), self.preferred.users_overlapping_grid(starts, ends)
+
+    def busy_timeline(self) -> List[Tuple[datetime, datetime]]:
+        """Union of all busy time as sorted, non-overlapping (start, end) intervals."""
+        busy_buckets = self.busy.participant_counts() > 0
+        if not busy_buckets.any():
+            return []
+
+        # Run boundaries of the busy mask: +1 where a run starts, -1 after it ends
+        edges = np.diff(np.concatenate([[0], busy_buckets.astype(np.int8), [0]]))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+        boundaries = self.busy.boundaries
+
+        return [
+            (from_epoch_minute(boundaries[s]), from_epoch_minute(boundaries[e]))
+            for s, e in zip(run_starts, run_ends)
+        ]
@@ -3,20 +3,124 @@ Busy slots service.
 
 Key behaviors:
 - All times are treated as UTC ISO strings when stored/fetched from Supabase.
-- Calendar sync (Google and Microsoft) skips all-day events and upserts by
-  (user_id, provider_event_id).
+- Calendar sync (Google and Microsoft) skips all-day events, classifies events
+  as added / changed / unchanged / deleted by content hash, and writes only the
+  added and changed ones with chunked bulk upserts on (user_id,
+  provider_event_id, calendar_source_id), plus one chunked delete of stale rows.
+- Accounts in "freebusy" sync mode read merged busy blocks of all their
+  enabled calendars in one provider call (freebusy.query / getSchedule).
 - Merged-busy computation prefers a Supabase RPC; falls back to Python if RPC fails.
 """
 
 import logging
-import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
-
-from supabase import create_client
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from ..config import Config
 from ..models.busy_slot import BusySlot
-from ..utils.supabase_client import get_supabase
+from ..utils.intervals import format_utc, parse_utc, sweep_participant_counts
+from ..utils.supabase_client import get_service_role_client, get_supabase
+from ..utils.sync_pool import provider_slot, run_bounded
+from .calendar_accounts import SYNC_MODE_FREEBUSY
+
+# Columns needed to score availability; avoids shipping sync bookkeeping fields
+BUSY_SLOT_WINDOW_COLUMNS = "id, user_id, start_time_utc, end_time_utc, calendar_source_id"
+# Unique constraint (migration 006) that bulk upserts resolve conflicts on
+BUSY_SLOT_CONFLICT_COLUMNS = "user_id,provider_event_id,calendar_source_id"
+# Columns left to the database on upsert, so an update keeps the row's id and created_at
+BUSY_SLOT_UPSERT_EXCLUDED_COLUMNS = ("id", "created_at")
+# First delay before retrying a failed batch; doubles per attempt
+BUSY_SLOT_BATCH_RETRY_BASE_SECONDS = 0.5
+
+# Sync classification of a provider event against its stored row
+SLOT_ADDED = "added"
+SLOT_CHANGED = "changed"
+SLOT_UNCHANGED = "unchanged"
+
+# Origin of the grid that full sync windows end on
+SYNC_WINDOW_GRID_ORIGIN = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def fetch_busy_slots_in_window(
+    client,
+    user_ids: List[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    columns: str = BUSY_SLOT_WINDOW_COLUMNS,
+) -> List[dict]:
+    """
+    Fetch busy slots of the given users that overlap [start_date, end_date).
+
+    The user_id IN + time range filters are served by idx_busy_slots_user_time,
+    so only slots inside an event window are read and sent over the wire.
+    A missing bound leaves that side of the range open.
+    """
+    if not user_ids:
+        return []
+
+    query = client.table("busy_slots").select(columns).in_("user_id", user_ids)
+    if end_date is not None:
+        query = query.lt("start_time_utc", end_date.isoformat())
+    if start_date is not None:
+        query = query.gt("end_time_utc", start_date.isoformat())
+
+    result = query.order("start_time_utc").execute()
+    return result.data or []
+
+
+def _classify_slot(stored_hashes: Dict[str, Optional[str]], event_id: str, slot: dict) -> str:
+    """Classify a provider slot as added, changed or unchanged by its stored content hash."""
+    if event_id not in stored_hashes:
+        return SLOT_ADDED
+    # Rows stored without a hash (synced before migration 018) are rewritten once
+    content_hash = slot.get("content_hash")
+    if content_hash is not None and stored_hashes[event_id] == content_hash:
+        return SLOT_UNCHANGED
+    return SLOT_CHANGED
+
+
+def _free_busy_block_id(start: str, end: str) -> str:
+    """Stable provider_event_id for a free/busy block, which has no provider id of its own."""
+    return f"freebusy:{format_utc(start)}/{format_utc(end)}"
+
+
+def _source_result(source: dict, added: int, deleted: int, error: Optional[Any] = None) -> dict:
+    """One source's entry in the multi-calendar sync result."""
+    return {
+        "source_id": source.get("id"),
+        "calendar_name": source.get("calendar_name", source.get("calendar_id", "unknown")),
+        "status": "error" if error is not None else "success",
+        "added": added,
+        "deleted": deleted,
+        "error": str(error) if error is not None else None,
+    }
+
+
+def _full_sync_window(start_date: datetime, end_date: datetime) -> Tuple[datetime, datetime]:
+    """
+    Window of a full listing: the start floored to midnight UTC and the end rounded
+    up onto a CALENDAR_SYNC_WINDOW_STEP_DAYS grid. Scheduled syncs request
+    ``now + SYNC_WINDOW_DAYS``, so an exact window would never cover the next run's
+    and every run would relist; the padded one keeps the stored token usable until
+    the requested end crosses the next grid line.
+    """
+    step = timedelta(days=max(1, Config.CALENDAR_SYNC_WINDOW_STEP_DAYS))
+    start = parse_utc(start_date).astimezone(timezone.utc)
+    end = parse_utc(end_date).astimezone(timezone.utc)
+    steps = -((SYNC_WINDOW_GRID_ORIGIN - end) // step)
+    return (
+        start.replace(hour=0, minute=0, second=0, microsecond=0),
+        SYNC_WINDOW_GRID_ORIGIN + steps * step,
+    )
+
+
+def _is_sync_token_expired(error: Exception) -> bool:
+    """Google (HttpError.resp) and Graph (requests response) answer 410 Gone for an expired sync token."""
+    status = getattr(getattr(error, "resp", None), "status", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return str(status) == "410"
 
 
 class BusySlotService:
@@ -25,12 +129,8 @@ class BusySlotService:
     def __init__(self):
         self.supabase = get_supabase()
 
-        supabase_url = os.getenv("SUPABASE_URL")
-        service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-        if supabase_url and service_role_key:
-            self.service_role_client = create_client(supabase_url, service_role_key)
-        else:
+        self.service_role_client = get_service_role_client()
+        if self.service_role_client is None:
             logging.warning("SUPABASE_SERVICE_ROLE_KEY not found, falling back to anon client")
             self.service_role_client = self.supabase
 
@@ -83,16 +183,25 @@ class BusySlotService:
     def upsert_busy_slot(self, busy_slot: BusySlot) -> Optional[dict]:
         """Upsert a busy slot (update if exists, insert if new)."""
         try:
+            if busy_slot.provider_event_id and busy_slot.calendar_source_id:
+                # One round trip on the unique constraint
+                busy_slot.updated_at = datetime.utcnow()
+                result = (
+                    self.service_role_client.table("busy_slots")
+                    .upsert(_upsert_row(busy_slot.to_dict()), on_conflict=BUSY_SLOT_CONFLICT_COLUMNS)
+                    .execute()
+                )
+                return result.data[0] if result.data else None
+
             if busy_slot.provider_event_id:
-                query = (
+                # NULL sources never conflict on the constraint, so look the row up first
+                existing = (
                     self.service_role_client.table("busy_slots")
                     .select("*")
                     .eq("user_id", busy_slot.user_id)
                     .eq("provider_event_id", busy_slot.provider_event_id)
+                    .execute()
                 )
-                if busy_slot.calendar_source_id:
-                    query = query.eq("calendar_source_id", busy_slot.calendar_source_id)
-                existing = query.execute()
 
                 if existing.data:
                     busy_slot.updated_at = datetime.utcnow()
@@ -210,7 +319,8 @@ class BusySlotService:
             if enabled_sources:
                 return self._sync_multi_calendar(user_id, start_date, end_date, enabled_sources)
 
-            return self._sync_legacy_primary_calendar(user_id, start_date, end_date)
+            with provider_slot("google"):
+                return self._sync_legacy_primary_calendar(user_id, start_date, end_date)
 
         except Exception as e:
             logging.error(f"Error syncing Google Calendar for user {user_id}: {e}")
@@ -227,21 +337,13 @@ class BusySlotService:
 
         service = google_calendar.get_calendar_service(credentials=credentials, user_id=user_id)
 
-        events_result = service.events().list(
+        google_events = google_calendar.EventStream(
+            service,
             calendarId='primary',
             timeMin=start_date.isoformat(),
             timeMax=end_date.isoformat(),
             singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-
-        google_events = events_result.get('items', [])
-
-        google_event_map = {
-            event.get('id'): event
-            for event in google_events
-            if event.get('id')
-        }
+        )
 
         db_slots_result = (
             self.service_role_client.table("busy_slots")
@@ -253,76 +355,89 @@ class BusySlotService:
             .not_.is_("provider_event_id", "null")
             .execute()
         )
-        db_slots = db_slots_result.data or []
-        db_event_ids = {slot["provider_event_id"] for slot in db_slots}
+        db_event_ids = {slot["provider_event_id"] for slot in db_slots_result.data or []}
 
-        google_ids = set(google_event_map.keys())
-        ids_to_add = google_ids - db_event_ids
+        added_count, google_ids = self._insert_new_slots(
+            self._iter_provider_slots(user_id, None, google_events, BusySlot.from_google_event),
+            db_event_ids,
+        )
         ids_to_delete = db_event_ids - google_ids
 
-        logging.info(f"[SYNC] User {user_id} (legacy): Adding {len(ids_to_add)}, Deleting {len(ids_to_delete)}")
-
         if ids_to_delete:
             self.service_role_client.table("busy_slots").delete().eq(
                 "user_id", user_id
             ).eq("calendar_source_id", "primary").in_("provider_event_id", list(ids_to_delete)).execute()
 
-        slots_to_add = []
-        for event_id in ids_to_add:
-            event = google_event_map[event_id]
-            try:
-                busy_slot = BusySlot.from_google_event(user_id, event)
-                slots_to_add.append(busy_slot.to_dict())
-            except ValueError as e:
-                logging.debug(f"[SYNC] Skipping Google event {event_id}: {e}")
-                continue
-
-        if slots_to_add:
-            self.service_role_client.table("busy_slots").insert(slots_to_add).execute()
-
+        logging.info(f"[SYNC] User {user_id} (legacy): Added {added_count}, Deleted {len(ids_to_delete)}")
         return True
 
     def _sync_multi_calendar(
         self, user_id: str, start_date: datetime, end_date: datetime, enabled_sources: List[dict]
     ) -> dict:
-        """Multi-calendar sync: sync from all enabled calendar sources. Returns per-source details."""
-        total_added = 0
-        total_deleted = 0
-        sources_results = []
-
-        for source in enabled_sources:
-            source_id = source.get("id")
-            calendar_name = source.get("calendar_name", source.get("calendar_id", "unknown"))
+        """
+        Multi-calendar sync: sync from all enabled calendar sources. Returns per-source details.
+        The sources of each "freebusy" account share one task, as do the event-mode
+        sources of each Google account (listed in batch requests); other sources get
+        one task each. Tasks run concurrently on a bounded pool and results keep
+        source order.
+        """
+
+        def sync_source(source: dict) -> dict:
             try:
                 provider = source.get("account", {}).get("provider", "google")
-                if provider == "microsoft":
-                    added, deleted = self._sync_single_microsoft_source(
-                        user_id, start_date, end_date, source
-                    )
-                else:
-                    added, deleted = self._sync_single_source(
-                        user_id, start_date, end_date, source
-                    )
-                total_added += added
-                total_deleted += deleted
-                sources_results.append({
-                    "source_id": source_id,
-                    "calendar_name": calendar_name,
-                    "status": "success",
-                    "added": added,
-                    "deleted": deleted,
-                    "error": None,
-                })
+                with provider_slot(provider):
+                    if provider == "microsoft":
+                        added, deleted = self._sync_single_microsoft_source(
+                            user_id, start_date, end_date, source
+                        )
+                    else:
+                        added, deleted = self._sync_single_source(
+                            user_id, start_date, end_date, source
+                        )
+                return _source_result(source, added, deleted)
+            except Exception as e:
+                logging.error(f"[SYNC] Error syncing source {source.get('id')}: {e}")
+                return _source_result(source, 0, 0, error=e)
+
+        def sync_task(task: Tuple[str, List[dict]]) -> List[dict]:
+            kind, sources = task
+            if kind == "source":
+                return [sync_source(sources[0])]
+            try:
+                if kind == SYNC_MODE_FREEBUSY:
+                    return self._sync_free_busy_account(user_id, start_date, end_date, sources)
+                with provider_slot("google"):
+                    return self._sync_google_account_batch(user_id, start_date, end_date, sources)
             except Exception as e:
-                logging.error(f"[SYNC] Error syncing source {source_id}: {e}")
-                sources_results.append({
-                    "source_id": source_id,
-                    "calendar_name": calendar_name,
-                    "status": "error",
-                    "added": 0,
-                    "deleted": 0,
-                    "error": str(e),
-                })
+                logging.error(f"[SYNC] Error syncing account {sources[0]['account'].get('id')}: {e}")
+                return [_source_result(source, 0, 0, error=e) for source in sources]
+
+        account_tasks: Dict[Tuple[str, str], List[dict]] = {}
+        tasks: List[Tuple[str, List[dict]]] = []
+        for source in enabled_sources:
+            account = source.get("account", {})
+            if account.get("sync_mode") == SYNC_MODE_FREEBUSY:
+                kind = SYNC_MODE_FREEBUSY
+            elif account.get("provider", "google") == "google" and account.get("id"):
+                kind = "batch"
+            else:
+                tasks.append(("source", [source]))
+                continue
+            key = (kind, account.get("id"))
+            if key not in account_tasks:
+                account_tasks[key] = []
+                tasks.append((kind, account_tasks[key]))
+            account_tasks[key].append(source)
+        # A batch of one calendar is a plain listing
+        tasks = [("source", sources) if kind == "batch" and len(sources) == 1 else (kind, sources) for kind, sources in tasks]
+
+        order = {source.get("id"): i for i, source in enumerate(enabled_sources)}
+        sources_results = sorted(
+            (result for results in run_bounded(sync_task, tasks) for result in results),
+            key=lambda result: order.get(result["source_id"], len(order)),
+        )
+        total_added = sum(s["added"] for s in sources_results)
+        total_deleted = sum(s["deleted"] for s in sources_results)
 
         logging.info(f"[SYNC] User {user_id} multi-calendar total: Added {total_added}, Deleted {total_deleted}")
         return {
@@ -332,96 +447,156 @@ class BusySlotService:
             "sources": sources_results,
         }
 
-    def _sync_single_source(
-        self, user_id: str, start_date: datetime, end_date: datetime, source: dict
-    ) -> Tuple[int, int]:
-        """Sync a single calendar source. Returns (added_count, deleted_count)."""
-        from googleapiclient.discovery import build
-
+    def _sync_free_busy_account(
+        self, user_id: str, start_date: datetime, end_date: datetime, sources: List[dict]
+    ) -> List[dict]:
+        """Sync every enabled source of one "freebusy" account with a single provider call."""
+        provider = sources[0].get("account", {}).get("provider", "google")
+        with provider_slot(provider):
+            if provider == "microsoft":
+                return self._sync_microsoft_free_busy(user_id, start_date, end_date, sources)
+            return self._sync_google_free_busy(user_id, start_date, end_date, sources)
+
+    def _sync_google_free_busy(
+        self, user_id: str, start_date: datetime, end_date: datetime, sources: List[dict]
+    ) -> List[dict]:
+        """
+        Read busy blocks of all the account's sources from one freebusy.query
+        (chunked per 50 calendars) and reconcile each source's blocks.
+        """
         from . import google_calendar
+        from .calendar_accounts import CalendarAccountsService
 
-        source_id = source["id"]
-        calendar_id = source["calendar_id"]
-        account = source.get("account", {})
+        account = sources[0].get("account", {})
         creds_dict = account.get("credentials")
-
         if not creds_dict:
-            logging.warning(f"[SYNC] No credentials for source {source_id}")
-            return 0, 0
+            logging.warning(f"[SYNC] No credentials for account {account.get('id')}")
+            return [_source_result(source, 0, 0) for source in sources]
 
         credentials = google_calendar.get_credentials_from_dict(creds_dict)
         credentials = google_calendar.refresh_credentials_if_needed(credentials)
+        service = google_calendar.build_calendar_service(credentials)
+        calendar_accounts_service = CalendarAccountsService()
 
-        service = build("calendar", "v3", credentials=credentials)
-
-        events_result = service.events().list(
-            calendarId=calendar_id,
-            timeMin=start_date.isoformat(),
-            timeMax=end_date.isoformat(),
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-
-        google_events = events_result.get('items', [])
+        calendars = google_calendar.query_free_busy(
+            service, [source["calendar_id"] for source in sources], start_date, end_date
+        )
 
-        google_event_map = {
-            f"{calendar_id}:{event.get('id')}": event
-            for event in google_events
-            if event.get('id')
-        }
+        results = []
+        for source in sources:
+            calendar = calendars.get(source["calendar_id"], {})
+            if calendar.get("errors"):
+                reasons = ", ".join(error.get("reason", "unknown") for error in calendar["errors"])
+                logging.error(f"[SYNC] Free/busy unavailable for source {source['id']}: {reasons}")
+                results.append(_source_result(source, 0, 0, error=f"Free/busy unavailable: {reasons}"))
+                continue
+            blocks = [
+                {"id": _free_busy_block_id(block["start"], block["end"]),
+                 "start": {"dateTime": block["start"]}, "end": {"dateTime": block["end"]}}
+                for block in calendar.get("busy", [])
+            ]
+            added, deleted = self._store_free_busy_blocks(
+                user_id, source, blocks, BusySlot.from_google_event, start_date, end_date, calendar_accounts_service
+            )
+            results.append(_source_result(source, added, deleted))
 
-        db_slots_result = (
-            self.service_role_client.table("busy_slots")
-            .select("id, provider_event_id")
-            .eq("user_id", user_id)
-            .eq("calendar_source_id", source_id)
-            .gte("start_time_utc", start_date.isoformat())
-            .lte("end_time_utc", end_date.isoformat())
-            .not_.is_("provider_event_id", "null")
-            .execute()
+        logging.info(
+            f"[SYNC] User {user_id}, Google account {account.get('id')} (free/busy): {len(sources)} calendar(s)"
         )
-        db_slots = db_slots_result.data or []
-        db_event_keys = {
-            f"{calendar_id}:{slot['provider_event_id']}"
-            for slot in db_slots
-        }
+        self._store_refreshed_google_credentials(calendar_accounts_service, account, creds_dict, credentials)
+        return results
 
-        google_keys = set(google_event_map.keys())
-        keys_to_add = google_keys - db_event_keys
-        keys_to_delete = db_event_keys - google_keys
+    def _sync_microsoft_free_busy(
+        self, user_id: str, start_date: datetime, end_date: datetime, sources: List[dict]
+    ) -> List[dict]:
+        """
+        Read the account mailbox's busy blocks with getSchedule (one request per
+        GET_SCHEDULE_MAX_DAYS of the window).
+
+        getSchedule reports a mailbox, not individual calendars, so the blocks
+        are stored for the account's write calendar (its default calendar unless
+        changed). The account's other enabled calendars are synced from events.
+        """
+        from . import microsoft_calendar
+        from .calendar_accounts import CalendarAccountsService
 
-        logging.info(f"[SYNC] User {user_id}, Calendar {calendar_id}: Adding {len(keys_to_add)}, Deleting {len(keys_to_delete)}")
+        account = sources[0].get("account", {})
+        creds_dict = account.get("credentials")
+        schedule_source = next((source for source in sources if source.get("is_write_calendar")), None)
+        if not creds_dict or schedule_source is None or not account.get("provider_email"):
+            logging.info(f"[SYNC] Free/busy not available for Microsoft account {account.get('id')}, syncing events")
+            return [self._sync_microsoft_source_result(user_id, start_date, end_date, source) for source in sources]
 
-        deleted_count = 0
-        if keys_to_delete:
-            event_ids_to_delete = [k.split(":", 1)[1] for k in keys_to_delete]
-            self.service_role_client.table("busy_slots").delete().eq(
-                "user_id", user_id
-            ).eq("calendar_source_id", source_id).in_(
-                "provider_event_id", event_ids_to_delete
-            ).execute()
-            deleted_count = len(keys_to_delete)
+        credentials = microsoft_calendar.refresh_credentials_if_needed(creds_dict)
+        service = microsoft_calendar.get_calendar_service(credentials, user_id)
+        calendar_accounts_service = CalendarAccountsService()
 
-        slots_to_add = []
-        for composite_key in keys_to_add:
-            event = google_event_map[composite_key]
-            try:
-                busy_slot = BusySlot.from_google_event(user_id, event)
-                busy_slot.calendar_source_id = source_id
-                slot_dict = busy_slot.to_dict()
-                slots_to_add.append(slot_dict)
-            except ValueError as e:
-                logging.debug(f"[SYNC] Skipping Google event {composite_key}: {e}")
-                continue
+        results = []
+        schedules = microsoft_calendar.get_schedule(
+            service["graph_request"], [account["provider_email"]], start_date, end_date
+        )
+        schedule = schedules[0] if schedules else {"error": {"message": "no schedule returned"}}
+        if schedule.get("error"):
+            message = schedule["error"].get("message", "unknown error")
+            logging.error(f"[SYNC] Free/busy unavailable for Microsoft account {account.get('id')}: {message}")
+            results.append(_source_result(schedule_source, 0, 0, error=f"Free/busy unavailable: {message}"))
+        else:
+            blocks = [
+                {"id": _free_busy_block_id(item["start"]["dateTime"], item["end"]["dateTime"]),
+                 "start": item["start"], "end": item["end"], "showAs": item.get("status", "busy")}
+                for item in schedule.get("scheduleItems", [])
+                if item.get("status") not in microsoft_calendar.FREE_SCHEDULE_STATUSES
+            ]
+            added, deleted = self._store_free_busy_blocks(
+                user_id, schedule_source, blocks, BusySlot.from_microsoft_event, start_date, end_date,
+                calendar_accounts_service,
+            )
+            results.append(_source_result(schedule_source, added, deleted))
 
-        added_count = 0
-        if slots_to_add:
-            self.service_role_client.table("busy_slots").insert(slots_to_add).execute()
-            added_count = len(slots_to_add)
+        if credentials.get("access_token") != creds_dict.get("access_token"):
+            calendar_accounts_service.update_account_credentials(account["id"], credentials)
+
+        results.extend(
+            self._sync_microsoft_source_result(user_id, start_date, end_date, source)
+            for source in sources if source is not schedule_source
+        )
+        return results
 
+    def _sync_microsoft_source_result(
+        self, user_id: str, start_date: datetime, end_date: datetime, source: dict
+    ) -> dict:
+        try:
+            added, deleted = self._sync_single_microsoft_source(user_id, start_date, end_date, source)
+            return _source_result(source, added, deleted)
+        except Exception as e:
+            logging.error(f"[SYNC] Error syncing source {source.get('id')}: {e}")
+            return _source_result(source, 0, 0, error=e)
+
+    def _store_free_busy_blocks(
+        self,
+        user_id: str,
+        source: dict,
+        blocks: List[dict],
+        to_busy_slot,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_accounts_service,
+    ) -> Tuple[int, int]:
+        """
+        Reconcile a source's stored rows with provider busy blocks. Its stored
+        sync token is cleared: the rows no longer match an event listing, so
+        switching back to events mode must start with a full sync.
+        """
+        slots = self._iter_provider_slots(user_id, source["id"], blocks, to_busy_slot)
+        added, deleted = self._reconcile_source_window(user_id, source["id"], slots, start_date, end_date)
+        if source.get("sync_token"):
+            calendar_accounts_service.update_source_sync_state(source["id"], None)
+        return added, deleted
+
+    @staticmethod
+    def _store_refreshed_google_credentials(calendar_accounts_service, account: dict, creds_dict: dict, credentials) -> None:
+        """Persist Google credentials on the account if refreshing changed the token."""
         if credentials.token != creds_dict.get("token"):
-            from .calendar_accounts import CalendarAccountsService
-            calendar_accounts_service = CalendarAccountsService()
             calendar_accounts_service.update_account_credentials(
                 account["id"],
                 {
@@ -434,97 +609,529 @@ class BusySlotService:
                 }
             )
 
-        return added_count, deleted_count
-
-    def _sync_single_microsoft_source(
+    def _sync_single_source(
         self, user_id: str, start_date: datetime, end_date: datetime, source: dict
     ) -> Tuple[int, int]:
-        """Sync a single Microsoft calendar source. Returns (added_count, deleted_count)."""
-        from . import microsoft_calendar
+        """
+        Sync a single calendar source. Returns (added_count, deleted_count).
+
+        Uses the source's stored Google syncToken to fetch only changed events
+        when it covers the requested window; otherwise (or when Google answers
+        410 Gone) lists the padded window (see _full_sync_window), diffs it
+        against the DB and stores the new token with that window.
+        """
+        from . import google_calendar
+        from .calendar_accounts import CalendarAccountsService
 
-        source_id = source["id"]
-        calendar_id = source["calendar_id"]
         account = source.get("account", {})
         creds_dict = account.get("credentials")
 
         if not creds_dict:
-            logging.warning(f"[SYNC] No credentials for Microsoft source {source_id}")
+            logging.warning(f"[SYNC] No credentials for source {source['id']}")
             return 0, 0
 
-        credentials = microsoft_calendar.refresh_credentials_if_needed(creds_dict)
-        service = microsoft_calendar.get_calendar_service(credentials, user_id)
-        graph_request = service["graph_request"]
+        credentials = google_calendar.get_credentials_from_dict(creds_dict)
+        credentials = google_calendar.refresh_credentials_if_needed(credentials)
+
+        service = google_calendar.build_calendar_service(credentials)
+        calendar_accounts_service = CalendarAccountsService()
+
+        counts = self._sync_google_source(service, calendar_accounts_service, user_id, start_date, end_date, source)
+
+        self._store_refreshed_google_credentials(calendar_accounts_service, account, creds_dict, credentials)
+
+        return counts
+
+    def _sync_google_account_batch(
+        self, user_id: str, start_date: datetime, end_date: datetime, sources: List[dict]
+    ) -> List[dict]:
+        """
+        Sync the event-mode sources of one Google account with one service and
+        credential refresh. The first events.list page of every source is fetched
+        in batch HTTP requests (CALENDAR_SYNC_GOOGLE_BATCH_SIZE calls each); each
+        source then continues on its own, and a failed sub-request only fails
+        (or, for an expired token, fully resyncs) its own source.
+        """
+        from . import google_calendar
+        from .calendar_accounts import CalendarAccountsService
+
+        account = sources[0].get("account", {})
+        creds_dict = account.get("credentials")
+        if not creds_dict:
+            logging.warning(f"[SYNC] No credentials for account {account.get('id')}")
+            return [_source_result(source, 0, 0) for source in sources]
 
-        response = graph_request(
-            "GET",
-            f"/me/calendars/{calendar_id}/calendarView",
-            params={
-                "startDateTime": start_date.isoformat(),
-                "endDateTime": end_date.isoformat(),
-                "$top": 500,
-            },
+        credentials = google_calendar.get_credentials_from_dict(creds_dict)
+        credentials = google_calendar.refresh_credentials_if_needed(credentials)
+        service = google_calendar.build_calendar_service(credentials)
+        calendar_accounts_service = CalendarAccountsService()
+
+        requests = {
+            source["id"]: google_calendar.EventStream(
+                service, **self._google_listing_params(source, start_date, end_date)
+            ).request()
+            for source in sources
+        }
+        try:
+            first_pages = google_calendar.execute_batch(service, requests)
+        except Exception as e:
+            logging.warning(f"[SYNC] Batch listing failed for account {account.get('id')}, listing per calendar: {e}")
+            first_pages = {}
+        logging.info(
+            f"[SYNC] User {user_id}, Google account {account.get('id')}: {len(sources)} calendar(s) listed in batch"
         )
-        response.raise_for_status()
-        ms_events = response.json().get("value", [])
 
-        ms_event_map = {
-            f"{calendar_id}:{event.get('id')}": event
-            for event in ms_events
-            if event.get("id")
+        results = []
+        for source in sources:
+            first_page, error = first_pages.get(source["id"], (None, None))
+            try:
+                added, deleted = self._sync_google_source(
+                    service, calendar_accounts_service, user_id, start_date, end_date, source,
+                    first_page=first_page, first_page_error=error,
+                )
+                results.append(_source_result(source, added, deleted))
+            except Exception as e:
+                logging.error(f"[SYNC] Error syncing source {source['id']}: {e}")
+                results.append(_source_result(source, 0, 0, error=e))
+
+        self._store_refreshed_google_credentials(calendar_accounts_service, account, creds_dict, credentials)
+        return results
+
+    def _sync_google_source(
+        self,
+        service,
+        calendar_accounts_service,
+        user_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        source: dict,
+        first_page: Optional[dict] = None,
+        first_page_error: Optional[Exception] = None,
+    ) -> Tuple[int, int]:
+        """
+        Incremental or full sync of one Google source with an existing service,
+        storing the next sync token. ``first_page`` / ``first_page_error`` are the
+        batched result of the listing _google_listing_params planned.
+        """
+        source_id = source["id"]
+        result = None
+        sync_window = self._stored_sync_window(source, start_date, end_date)
+        if sync_window:
+            try:
+                if first_page_error is not None:
+                    raise first_page_error
+                result = self._sync_google_source_incremental(
+                    service, user_id, source, source["sync_token"], *sync_window, first_page=first_page
+                )
+            except Exception as e:
+                if not _is_sync_token_expired(e):
+                    raise
+                logging.info(f"[SYNC] Sync token expired for source {source_id}, running full resync")
+                first_page = first_page_error = None
+
+        if result is None:
+            if first_page_error is not None:
+                raise first_page_error
+            sync_window = _full_sync_window(start_date, end_date)
+            result = self._sync_google_source_full(
+                service, user_id, source, *sync_window, first_page=first_page
+            )
+
+        added_count, deleted_count, next_sync_token = result
+        if next_sync_token != source.get("sync_token"):
+            calendar_accounts_service.update_source_sync_state(source_id, next_sync_token, *sync_window)
+
+        return added_count, deleted_count
+
+    @classmethod
+    def _google_listing_params(cls, source: dict, start_date: datetime, end_date: datetime) -> dict:
+        """events.list parameters of a source's next sync: its sync token if it covers the window."""
+        if cls._stored_sync_window(source, start_date, end_date):
+            return {"calendarId": source["calendar_id"], "syncToken": source["sync_token"], "singleEvents": True}
+        window_start, window_end = _full_sync_window(start_date, end_date)
+        return {
+            "calendarId": source["calendar_id"],
+            "timeMin": window_start.isoformat(),
+            "timeMax": window_end.isoformat(),
+            "singleEvents": True,
         }
 
+    @staticmethod
+    def _stored_sync_window(
+        source: dict, start_date: datetime, end_date: datetime
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """Return the stored token's window if it covers [start_date, end_date]."""
+        if not source.get("sync_token"):
+            return None
+
+        try:
+            window_start = parse_utc(source["sync_window_start"])
+            window_end = parse_utc(source["sync_window_end"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if window_start <= parse_utc(start_date) and parse_utc(end_date) <= window_end:
+            return window_start, window_end
+        return None
+
+    def _sync_google_source_full(
+        self,
+        service,
+        user_id: str,
+        source: dict,
+        start_date: datetime,
+        end_date: datetime,
+        first_page: Optional[dict] = None,
+    ) -> Tuple[int, int, Optional[str]]:
+        """Stream the whole window page by page and diff it against stored busy slots."""
+        from . import google_calendar
+
+        google_events = google_calendar.EventStream(
+            service,
+            first_page=first_page,
+            calendarId=source["calendar_id"],
+            timeMin=start_date.isoformat(),
+            timeMax=end_date.isoformat(),
+            singleEvents=True,
+        )
+
+        slots = self._iter_provider_slots(
+            user_id, source["id"], google_events, BusySlot.from_google_event
+        )
+        added_count, deleted_count = self._reconcile_source_window(
+            user_id, source["id"], slots, start_date, end_date
+        )
+
+        logging.info(
+            f"[SYNC] User {user_id}, Calendar {source['calendar_id']}: {google_events.pages} page(s), "
+            f"Added {added_count}, Deleted {deleted_count}"
+        )
+        return added_count, deleted_count, google_events.next_sync_token
+
+    def _sync_google_source_incremental(
+        self,
+        service,
+        user_id: str,
+        source: dict,
+        sync_token: str,
+        window_start: datetime,
+        window_end: datetime,
+        first_page: Optional[dict] = None,
+    ) -> Tuple[int, int, Optional[str]]:
+        """Apply only the events changed since ``sync_token``."""
+        from . import google_calendar
+
+        stream = google_calendar.EventStream(
+            service,
+            first_page=first_page,
+            calendarId=source["calendar_id"],
+            syncToken=sync_token,
+            singleEvents=True,
+        )
+        changed_events = list(stream)
+        next_sync_token = stream.next_sync_token
+
+        added_count, deleted_count = self._apply_changed_events(
+            user_id, source["id"], changed_events, BusySlot.from_google_event, window_start, window_end
+        )
+
+        logging.info(
+            f"[SYNC] User {user_id}, Calendar {source['calendar_id']} (incremental): {len(changed_events)} changed, "
+            f"Added {added_count}, Deleted {deleted_count}"
+        )
+        return added_count, deleted_count, next_sync_token
+
+    @staticmethod
+    def _iter_provider_slots(
+        user_id: str,
+        source_id: Optional[str],
+        events: Iterable[dict],
+        to_busy_slot,
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None,
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Lazily convert live provider events into (provider event id, busy slot row).
+        Cancelled/removed events, all-day events and events outside the window are skipped.
+        """
+        for event in events:
+            event_id = event.get("id")
+            if not event_id or event.get("status") == "cancelled" or "@removed" in event:
+                continue
+            try:
+                busy_slot = to_busy_slot(user_id, event)
+            except ValueError as e:
+                logging.debug(f"[SYNC] Skipping provider event {event_id}: {e}")
+                continue
+            if window_end is not None and parse_utc(busy_slot.start_time_utc) >= window_end:
+                continue
+            if window_start is not None and parse_utc(busy_slot.end_time_utc) <= window_start:
+                continue
+            busy_slot.calendar_source_id = source_id
+            yield event_id, busy_slot.to_dict()
+
+    def _execute_batch(self, build_query, description: str):
+        """
+        Execute one batch query, retrying failures with exponential backoff up to
+        CALENDAR_SYNC_BATCH_RETRIES attempts. Batches are upserts or deletes by
+        key, so a retried batch that partly landed has no extra effect.
+        """
+        attempts = max(1, Config.CALENDAR_SYNC_BATCH_RETRIES)
+        for attempt in range(attempts):
+            try:
+                return build_query().execute()
+            except Exception as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = BUSY_SLOT_BATCH_RETRY_BASE_SECONDS * 2 ** attempt
+                logging.warning(
+                    f"[SYNC] {description} failed (attempt {attempt + 1}/{attempts}), retrying in {delay:g}s: {e}"
+                )
+                time.sleep(delay)
+
+    def _insert_new_slots(
+        self, slots: Iterable[Tuple[str, dict]], db_event_ids: Set[str]
+    ) -> Tuple[int, Set[str]]:
+        """
+        Insert streamed slots whose provider event id is not stored yet, in
+        batches. Returns (inserted_count, every provider event id seen) so the
+        caller can delete stored rows that no longer exist upstream.
+
+        Only used for legacy rows without a calendar source, which the unique
+        constraint cannot match (NULLs never conflict).
+        """
+        seen_ids: Set[str] = set()
+        batch: List[dict] = []
+        added_count = 0
+
+        for event_id, slot in slots:
+            if event_id in seen_ids:
+                continue
+            seen_ids.add(event_id)
+            if event_id in db_event_ids:
+                continue
+            batch.append(slot)
+            if len(batch) >= Config.CALENDAR_SYNC_BATCH_SIZE:
+                self.service_role_client.table("busy_slots").insert(batch).execute()
+                added_count += len(batch)
+                batch = []
+
+        if batch:
+            self.service_role_client.table("busy_slots").insert(batch).execute()
+            added_count += len(batch)
+
+        return added_count, seen_ids
+
+    def _upsert_slots(self, slots: Iterable[dict]) -> int:
+        """
+        Stream rows into busy_slots as chunked ``ON CONFLICT`` upserts on
+        (user_id, provider_event_id, calendar_source_id). Existing rows get the
+        new times; returns the number of rows sent.
+        """
+        batch: List[dict] = []
+        sent = 0
+
+        def flush():
+            self._execute_batch(
+                lambda: self.service_role_client.table("busy_slots").upsert(
+                    batch, on_conflict=BUSY_SLOT_CONFLICT_COLUMNS
+                ),
+                f"Upsert of {len(batch)} busy slots",
+            )
+
+        for slot in slots:
+            batch.append(_upsert_row(slot))
+            if len(batch) >= Config.CALENDAR_SYNC_BATCH_SIZE:
+                flush()
+                sent += len(batch)
+                batch = []
+
+        if batch:
+            flush()
+            sent += len(batch)
+
+        return sent
+
+    def _delete_provider_events(self, user_id: str, source_id: str, event_ids: List[str]) -> List[dict]:
+        """Delete a source's rows for ``event_ids`` in chunked ``in`` filters; returns the deleted rows."""
+        deleted: List[dict] = []
+        batch_size = Config.CALENDAR_SYNC_BATCH_SIZE
+        for i in range(0, len(event_ids), batch_size):
+            chunk = event_ids[i:i + batch_size]
+            result = self._execute_batch(
+                lambda: self.service_role_client.table("busy_slots").delete().eq(
+                    "user_id", user_id
+                ).eq("calendar_source_id", source_id).in_("provider_event_id", chunk),
+                f"Delete of {len(chunk)} busy slots",
+            )
+            deleted.extend(result.data or [])
+        return deleted
+
+    def _stored_content_hashes(self, user_id: str, source_id: str, event_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Content hash of each of ``event_ids`` already stored for the source, looked up in chunks."""
+        stored: Dict[str, Optional[str]] = {}
+        batch_size = Config.CALENDAR_SYNC_BATCH_SIZE
+        for i in range(0, len(event_ids), batch_size):
+            result = (
+                self.service_role_client.table("busy_slots")
+                .select("provider_event_id, content_hash")
+                .eq("user_id", user_id)
+                .eq("calendar_source_id", source_id)
+                .in_("provider_event_id", event_ids[i:i + batch_size])
+                .execute()
+            )
+            stored.update((row["provider_event_id"], row.get("content_hash")) for row in result.data or [])
+        return stored
+
+    def _reconcile_source_window(
+        self,
+        user_id: str,
+        source_id: str,
+        slots: Iterable[Tuple[str, dict]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Tuple[int, int]:
+        """
+        Diff a full provider listing of a window against the source's stored rows.
+        Events are classified by content hash: added and changed ones are
+        upserted, unchanged ones are not written, and stored events missing from
+        the listing are deleted. ``slots`` is consumed as a stream, so only
+        stored hashes and the seen-id set stay in memory.
+        """
         db_slots_result = (
             self.service_role_client.table("busy_slots")
-            .select("id, provider_event_id")
+            .select("id, provider_event_id, content_hash")
             .eq("user_id", user_id)
             .eq("calendar_source_id", source_id)
-            .gte("start_time_utc", start_date.isoformat())
-            .lte("end_time_utc", end_date.isoformat())
+            .lt("start_time_utc", end_date.isoformat())
+            .gt("end_time_utc", start_date.isoformat())
             .not_.is_("provider_event_id", "null")
             .execute()
         )
-        db_slots = db_slots_result.data or []
-        db_event_keys = {
-            f"{calendar_id}:{slot['provider_event_id']}"
-            for slot in db_slots
-        }
+        stored_hashes = {row["provider_event_id"]: row.get("content_hash") for row in db_slots_result.data or []}
+
+        seen_ids: Set[str] = set()
+        counts = {SLOT_ADDED: 0, SLOT_CHANGED: 0, SLOT_UNCHANGED: 0}
+
+        def slots_to_write() -> Iterator[dict]:
+            for event_id, slot in slots:
+                if event_id in seen_ids:
+                    continue
+                seen_ids.add(event_id)
+                status = _classify_slot(stored_hashes, event_id, slot)
+                counts[status] += 1
+                if status != SLOT_UNCHANGED:
+                    yield slot
+
+        self._upsert_slots(slots_to_write())
+        ids_to_delete = [event_id for event_id in stored_hashes if event_id not in seen_ids]
+        if ids_to_delete:
+            self._delete_provider_events(user_id, source_id, ids_to_delete)
 
-        ms_keys = set(ms_event_map.keys())
-        keys_to_add = ms_keys - db_event_keys
-        keys_to_delete = db_event_keys - ms_keys
+        logging.info(
+            f"[SYNC] User {user_id}, source {source_id}: Changed {counts[SLOT_CHANGED]}, "
+            f"Unchanged {counts[SLOT_UNCHANGED]}"
+        )
+        return counts[SLOT_ADDED], len(ids_to_delete)
+
+    def _apply_changed_events(
+        self,
+        user_id: str,
+        source_id: str,
+        changed_events: List[dict],
+        to_busy_slot,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> Tuple[int, int]:
+        """
+        Apply an incremental change set: live events whose content hash differs
+        from the stored row are upserted, and cancelled, all-day and moved-out
+        events are deleted. Events reported for fields that do not affect
+        availability (title, attendees ...) are not written.
+        """
+        slots_to_add = dict(self._iter_provider_slots(
+            user_id, source_id, changed_events, to_busy_slot, window_start, window_end
+        ))
+        ids_to_delete = list(dict.fromkeys(
+            event["id"] for event in changed_events if event.get("id") and event["id"] not in slots_to_add
+        ))
+
+        stored_hashes: Dict[str, Optional[str]] = {}
+        if slots_to_add:
+            stored_hashes = self._stored_content_hashes(user_id, source_id, list(slots_to_add))
+            self._upsert_slots(
+                slot for event_id, slot in slots_to_add.items()
+                if _classify_slot(stored_hashes, event_id, slot) != SLOT_UNCHANGED
+            )
 
-        logging.info(f"[SYNC] User {user_id}, Microsoft Calendar {calendar_id}: Adding {len(keys_to_add)}, Deleting {len(keys_to_delete)}")
+        removed_count = 0
+        if ids_to_delete:
+            removed_count = len(self._delete_provider_events(user_id, source_id, ids_to_delete))
 
-        deleted_count = 0
-        if keys_to_delete:
-            event_ids_to_delete = [k.split(":", 1)[1] for k in keys_to_delete]
-            self.service_role_client.table("busy_slots").delete().eq(
-                "user_id", user_id
-            ).eq("calendar_source_id", source_id).in_(
-                "provider_event_id", event_ids_to_delete
-            ).execute()
-            deleted_count = len(keys_to_delete)
+        return len(set(slots_to_add) - set(stored_hashes)), removed_count
 
-        slots_to_add = []
-        for composite_key in keys_to_add:
-            event = ms_event_map[composite_key]
+    def _sync_single_microsoft_source(
+        self, user_id: str, start_date: datetime, end_date: datetime, source: dict
+    ) -> Tuple[int, int]:
+        """
+        Sync a single Microsoft calendar source. Returns (added_count, deleted_count).
+
+        Uses calendarView delta queries: the stored deltaLink fetches only
+        changes when it covers the requested window; otherwise (or when Graph
+        answers 410 Gone) a fresh delta round lists the padded window (see
+        _full_sync_window), is diffed against the DB and its deltaLink is stored.
+        """
+        from . import microsoft_calendar
+        from .calendar_accounts import CalendarAccountsService
+
+        source_id = source["id"]
+        calendar_id = source["calendar_id"]
+        account = source.get("account", {})
+        creds_dict = account.get("credentials")
+
+        if not creds_dict:
+            logging.warning(f"[SYNC] No credentials for Microsoft source {source_id}")
+            return 0, 0
+
+        credentials = microsoft_calendar.refresh_credentials_if_needed(creds_dict)
+        service = microsoft_calendar.get_calendar_service(credentials, user_id)
+        graph_request = service["graph_request"]
+        calendar_accounts_service = CalendarAccountsService()
+
+        counts = None
+        delta_link = None
+        sync_window = self._stored_sync_window(source, start_date, end_date)
+        if sync_window:
             try:
-                busy_slot = BusySlot.from_microsoft_event(user_id, event)
-                busy_slot.calendar_source_id = source_id
-                slot_dict = busy_slot.to_dict()
-                slots_to_add.append(slot_dict)
-            except ValueError as e:
-                logging.debug(f"[SYNC] Skipping Microsoft event {composite_key}: {e}")
-                continue
+                changed_events, delta_link = microsoft_calendar.get_calendar_view_delta(
+                    graph_request, calendar_id, *sync_window, delta_link=source["sync_token"]
+                )
+                counts = self._apply_changed_events(
+                    user_id, source_id, changed_events, BusySlot.from_microsoft_event, *sync_window
+                )
+                logging.info(f"[SYNC] User {user_id}, Microsoft Calendar {calendar_id} (incremental): {len(changed_events)} changed")
+            except Exception as e:
+                if not _is_sync_token_expired(e):
+                    raise
+                logging.info(f"[SYNC] Delta link expired for Microsoft source {source_id}, running full resync")
+
+        if counts is None:
+            sync_window = _full_sync_window(start_date, end_date)
+            ms_events, delta_link = microsoft_calendar.get_calendar_view_delta(
+                graph_request, calendar_id, *sync_window
+            )
+            slots = self._iter_provider_slots(
+                user_id, source_id, ms_events, BusySlot.from_microsoft_event
+            )
+            counts = self._reconcile_source_window(user_id, source_id, slots, *sync_window)
 
-        added_count = 0
-        if slots_to_add:
-            self.service_role_client.table("busy_slots").insert(slots_to_add).execute()
-            added_count = len(slots_to_add)
+        added_count, deleted_count = counts
+        logging.info(f"[SYNC] User {user_id}, Microsoft Calendar {calendar_id}: Added {added_count}, Deleted {deleted_count}")
+
+        if delta_link != source.get("sync_token"):
+            calendar_accounts_service.update_source_sync_state(source_id, delta_link, *sync_window)
 
         if credentials.get("access_token") != creds_dict.get("access_token"):
-            from .calendar_accounts import CalendarAccountsService
-            calendar_accounts_service = CalendarAccountsService()
             calendar_accounts_service.update_account_credentials(account["id"], credentials)
 
         return added_count, deleted_count
@@ -549,7 +1156,8 @@ class BusySlotService:
             if enabled_sources:
                 return self._sync_multi_calendar(user_id, start_date, end_date, enabled_sources)
 
-            return self._sync_legacy_microsoft_calendar(user_id, start_date, end_date)
+            with provider_slot("microsoft"):
+                return self._sync_legacy_microsoft_calendar(user_id, start_date, end_date)
 
         except Exception as e:
             logging.error(f"Error syncing Microsoft Calendar for user {user_id}: {e}")
@@ -567,17 +1175,9 @@ class BusySlotService:
         service = microsoft_calendar.get_calendar_service(credentials, user_id)
         graph_request = service["graph_request"]
 
-        response = graph_request(
-            "GET",
-            "/me/calendarView",
-            params={
-                "startDateTime": start_date.isoformat(),
-                "endDateTime": end_date.isoformat(),
-                "$top": 500,
-            },
+        ms_events = microsoft_calendar.list_calendar_view(
+            graph_request, "/me/calendarView", start_date, end_date
         )
-        response.raise_for_status()
-        ms_events = response.json().get("value", [])
 
         ms_event_map = {
             event.get("id"): event
@@ -679,14 +1279,12 @@ class BusySlotService:
 
             participant_ids = [p["user_id"] for p in participants_result.data]
 
-            busy_slots_result = (
-                self.service_role_client.table("busy_slots")
-                .select("start_time_utc, end_time_utc, user_id")
-                .in_("user_id", participant_ids)
-                .lte("start_time_utc", end_date.isoformat())
-                .gte("end_time_utc", start_date.isoformat())
-                .order("start_time_utc")
-                .execute()
+            window_slots = fetch_busy_slots_in_window(
+                self.service_role_client,
+                participant_ids,
+                start_date,
+                end_date,
+                columns="start_time_utc, end_time_utc, user_id",
             )
 
             busy_slots = [
@@ -695,7 +1293,7 @@ class BusySlotService:
                     "end_time_utc": datetime.fromisoformat(slot["end_time_utc"].replace('Z', '+00:00')),
                     "user_id": slot["user_id"]
                 }
-                for slot in busy_slots_result.data
+                for slot in window_slots
             ]
 
             return self._merge_overlapping_slots_python(busy_slots)
@@ -706,46 +1304,19 @@ class BusySlotService:
 
     def _merge_overlapping_slots_python(self, busy_slots: List[dict]) -> List[dict]:
         """Merge overlapping busy slots and count participants."""
-        if not busy_slots:
-            return []
-
-        events = []
-        for slot in busy_slots:
-            events.append({
-                "event_time": slot["start_time_utc"],
-                "event_type": 1,
-                "user_id": slot["user_id"]
-            })
-            events.append({
-                "event_time": slot["end_time_utc"],
-                "event_type": -1,
-                "user_id": slot["user_id"]
-            })
-
-        events.sort(key=lambda x: (x["event_time"], x["event_type"]))
-
-        merged_slots = []
-        active_users = set()
-        prev_time = None
-
-        for event in events:
-            current_time = event["event_time"]
-
-            if prev_time is not None and prev_time < current_time and active_users:
-                merged_slots.append({
-                    "start_time": prev_time.isoformat(),
-                    "end_time": current_time.isoformat(),
-                    "busy_participants_count": len(active_users)
-                })
-
-            if event["event_type"] == 1:
-                active_users.add(event["user_id"])
-            else:
-                active_users.discard(event["user_id"])
-
-            prev_time = current_time
+        segments = sweep_participant_counts(
+            (slot["start_time_utc"], slot["end_time_utc"], slot["user_id"])
+            for slot in busy_slots
+        )
 
-        return merged_slots
+        return [
+            {
+                "start_time": start.isoformat(),
+                "end_time": end.isoformat(),
+                "busy_participants_count": count
+            }
+            for start, end, count in segments
+        ]
 
     def validate_busy_slot_data(self, slot_data: dict) -> bool:
         """Validate busy slot data has required fields and valid times."""
@@ -841,3 +1412,6 @@ class BusySlotService:
             return 0
 
 
+def _upsert_row(slot: dict) -> dict:
+    """A busy slot row without the columns an upsert must not overwrite."""
+    return {key: value for key, value in slot.items() if key not in BUSY_SLOT_UPSERT_EXCLUDED_COLUMNS}
@@ -1,13 +1,15 @@
 """Calendar accounts service for managing multi-calendar support."""
 
 import logging
-import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from supabase import create_client
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
-from ..utils.supabase_client import get_supabase
+# Account sync modes (migration 019): full event listings or provider free/busy blocks
+SYNC_MODE_EVENTS = "events"
+SYNC_MODE_FREEBUSY = "freebusy"
+SYNC_MODES = (SYNC_MODE_EVENTS, SYNC_MODE_FREEBUSY)
 
 
 class CalendarAccountsService:
@@ -16,12 +18,8 @@ class CalendarAccountsService:
     def __init__(self):
         self.supabase = get_supabase()
 
-        supabase_url = os.getenv("SUPABASE_URL")
-        service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-        if supabase_url and service_role_key:
-            self.service_role_client = create_client(supabase_url, service_role_key)
-        else:
+        self.service_role_client = get_service_role_client()
+        if self.service_role_client is None:
             logging.warning("[CalendarAccountsService] SUPABASE_SERVICE_ROLE_KEY not found")
             self.service_role_client = self.supabase
 
@@ -116,6 +114,22 @@ class CalendarAccountsService:
             logging.error(f"Error updating account credentials {account_id}: {e}")
             return None
 
+    def update_account_sync_mode(self, account_id: str, sync_mode: str) -> Optional[Dict[str, Any]]:
+        """Choose how an account's calendars are synced (one of SYNC_MODES)."""
+        if sync_mode not in SYNC_MODES:
+            raise ValueError(f"sync_mode must be one of: {', '.join(SYNC_MODES)}")
+        try:
+            result = (
+                self.service_role_client.table("calendar_accounts")
+                .update({"sync_mode": sync_mode})
+                .eq("id", account_id)
+                .execute()
+            )
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logging.error(f"Error updating sync mode for account {account_id}: {e}")
+            return None
+
     def delete_account(self, account_id: str) -> bool:
         """Delete a calendar account (cascade deletes sources)."""
         try:
@@ -155,6 +169,7 @@ class CalendarAccountsService:
                             "provider": account["provider"],
                             "provider_email": account["provider_email"],
                             "credentials": account["credentials"],
+                            "sync_mode": account.get("sync_mode") or SYNC_MODE_EVENTS,
                         }
                         enabled_sources.append(source)
 
@@ -177,6 +192,7 @@ class CalendarAccountsService:
                             "provider": account["provider"],
                             "provider_email": account["provider_email"],
                             "credentials": account["credentials"],
+                            "sync_mode": account.get("sync_mode") or SYNC_MODE_EVENTS,
                         }
                         write_calendars.append(source)
 
@@ -201,6 +217,7 @@ class CalendarAccountsService:
                             "provider": account["provider"],
                             "provider_email": account["provider_email"],
                             "credentials": account["credentials"],
+                            "sync_mode": account.get("sync_mode") or SYNC_MODE_EVENTS,
                         }
                         return source
 
@@ -231,6 +248,23 @@ class CalendarAccountsService:
             logging.error(f"Error updating calendar source {source_id}: {e}")
             return None
 
+    def update_source_sync_state(
+        self,
+        source_id: str,
+        sync_token: Optional[str],
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None,
+    ) -> None:
+        """Persist a source's incremental sync token and the window it covers (None clears it)."""
+        try:
+            self.service_role_client.table("calendar_sources").update({
+                "sync_token": sync_token,
+                "sync_window_start": window_start.isoformat() if window_start else None,
+                "sync_window_end": window_end.isoformat() if window_end else None,
+            }).eq("id", source_id).execute()
+        except Exception as e:
+            logging.error(f"Error updating sync state for calendar source {source_id}: {e}")
+
     def set_write_calendar(self, user_id: str, source_id: str) -> bool:
         """Set a calendar source as the write calendar for its provider (unsets others of same provider)."""
         try:
@@ -305,15 +339,13 @@ class CalendarAccountsService:
 
     def _sync_google_calendars(self, account_id: str, account: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Sync calendars from Google Calendar API."""
-        from googleapiclient.discovery import build
-
         from . import google_calendar
 
         creds_dict = account["credentials"]
         credentials = google_calendar.get_credentials_from_dict(creds_dict)
         credentials = google_calendar.refresh_credentials_if_needed(credentials)
 
-        service = build("calendar", "v3", credentials=credentials)
+        service = google_calendar.build_calendar_service(credentials)
 
         calendars = []
         page_token = None
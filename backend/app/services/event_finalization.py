@@ -6,16 +6,13 @@ with retry logic, sending invitations, and updating event status.
 """
 
 import logging
-import os
 import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from supabase import create_client
-
 from ..services import microsoft_calendar
 from ..services.google_calendar import get_credentials_from_dict, get_calendar_service, get_stored_credentials
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 
 class EventFinalizationService:
@@ -23,14 +20,7 @@ class EventFinalizationService:
 
     def __init__(self, access_token: Optional[str] = None):
         self.supabase = get_supabase(access_token)
-
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-        if supabase_url and supabase_service_key:
-            self.service_role_client = create_client(supabase_url, supabase_service_key)
-        else:
-            self.service_role_client = self.supabase
+        self.service_role_client = get_service_role_client() or self.supabase
     
     def finalize_event(
         self,
@@ -1,12 +1,9 @@
-import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, Literal
 
-from supabase import create_client
-
 from ..models.event import Event
 from ..models.event_participant import EventParticipant
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 
 class EventsService:
@@ -20,14 +17,7 @@ class EventsService:
 
     def __init__(self, access_token: Optional[str] = None):
         self.supabase = get_supabase(access_token)
-
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-        if supabase_url and supabase_service_key:
-            self.service_role_client = create_client(supabase_url, supabase_service_key)
-        else:
-            self.service_role_client = self.supabase
+        self.service_role_client = get_service_role_client() or self.supabase
     
     def create_event(self, event_data: dict) -> Optional[dict]:
         """Create an event."""
@@ -0,0 +1,246 @@
+"""
+Asynchronous Gemini invocation with deadlines and request hedging.
+
+Every call gets one deadline (GEMINI_DEADLINE_SECONDS) covering its retries
+and backoff, enforced by cancelling the in-flight request. When a request
+is slower than the GEMINI_HEDGE_PERCENTILE of recent latencies, a second
+identical request is sent if the rate limiter has a free slot; whichever
+response parses first wins and the other is cancelled.
+
+Coroutines run on one background event loop per process, so the SDK's
+async (grpc.aio) client stays bound to a single loop. Synchronous callers go
+through ``GeminiClient.generate_sync``.
+"""
+
+from ..config import Config
+from ..utils.rate_limiter import RateLimiter, RateLimitExceeded, estimate_gemini_tokens, get_gemini_rate_limiter
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LOG_PREFIX = "[GEMINI]"
+
+
+class GeminiTimeout(Exception):
+    """Raised when a call does not complete within its deadline."""
+
+
+class LatencyTracker:
+    """Sliding window of recent successful request latencies."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """The ``pct`` percentile latency, or None until enough samples are collected."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class _LoopThread:
+    """A daemon thread running the process's Gemini event loop."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked worker must not reuse its parent's (non-running) loop
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                threading.Thread(target=self._loop.run_forever, name="gemini-loop", daemon=True).start()
+            return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        loop = self.loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("generate_sync cannot be called from the Gemini event loop; await generate()")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+_loop_thread = _LoopThread()
+
+
+def _in_thread(func: Callable[..., T], *args, **kwargs) -> "asyncio.Future[T]":
+    """Run a blocking rate limiter call on a thread of its own.
+
+    Quota waits can last minutes for background callers, so they must neither block the
+    loop nor hold threads of a shared, bounded executor that interactive calls queue on.
+    """
+    future: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="gemini-rate-limit", daemon=True).start()
+    return asyncio.wrap_future(future)
+
+_latency = LatencyTracker(
+    window=Config.GEMINI_HEDGE_WINDOW,
+    min_samples=Config.GEMINI_HEDGE_MIN_SAMPLES,
+)
+
+
+def _is_rate_limit_error(error: BaseException) -> bool:
+    message = str(error).lower()
+    return "quota" in message or "rate limit" in message
+
+
+class GeminiClient:
+    """Deadline-bound, hedged Gemini calls for one GenerativeModel."""
+
+    def __init__(
+        self,
+        model,
+        max_retries: int = 3,
+        deadline_seconds: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        rate_limit_max_wait: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        latency: Optional[LatencyTracker] = None,
+    ):
+        self.model = model
+        self.max_retries = max(1, max_retries)
+        self.deadline_seconds = deadline_seconds if deadline_seconds is not None else Config.GEMINI_DEADLINE_SECONDS
+        self.hedge_percentile = hedge_percentile if hedge_percentile is not None else Config.GEMINI_HEDGE_PERCENTILE
+        self.rate_limit_max_wait = rate_limit_max_wait
+        self.rate_limiter = rate_limiter or get_gemini_rate_limiter()
+        self.latency = latency or _latency
+
+    def generate_sync(self, prompt: str, parse: Optional[Callable[[str], T]] = None) -> T:
+        """Blocking wrapper around ``generate`` for synchronous callers."""
+        return _loop_thread.run(self.generate(prompt, parse))
+
+    async def generate(self, prompt: str, parse: Optional[Callable[[str], T]] = None) -> T:
+        """
+        Return ``parse(response_text)`` (or the text) for the first successful response.
+
+        Time spent waiting for the rate limiter is budgeted by rate_limit_max_wait,
+        not the deadline. Raises GeminiTimeout when the deadline passes, and the
+        same rate limit / API errors as the previous synchronous client otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline_seconds
+        tokens = estimate_gemini_tokens(prompt)
+
+        for attempt in range(self.max_retries):
+            deadline += await self._reserve(tokens)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            logger.info(f"{LOG_PREFIX} Calling Gemini API (attempt {attempt + 1}/{self.max_retries})")
+            try:
+                return await asyncio.wait_for(self._hedged(prompt, parse, tokens), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            except Exception as e:
+                last_attempt = attempt == self.max_retries - 1
+                if _is_rate_limit_error(e):
+                    if last_attempt:
+                        raise Exception("Gemini API rate limit exceeded. Please try again later.")
+                    logger.warning(f"{LOG_PREFIX} Rate limited, waiting {2 ** attempt}s...")
+                elif last_attempt:
+                    raise Exception(f"Gemini API error: {str(e)}")
+
+                backoff = min(2 ** attempt, deadline - loop.time())
+                if backoff <= 0:
+                    break
+                await _backoff(backoff)
+
+        raise GeminiTimeout(f"Gemini API did not respond within {self.deadline_seconds:g}s")
+
+    async def _reserve(self, tokens: int) -> float:
+        """Wait off the loop for a rate limit slot; returns the seconds waited."""
+        waited = await _in_thread(self.rate_limiter.acquire, tokens, max_wait_seconds=self.rate_limit_max_wait)
+        if waited:
+            logger.info(f"{LOG_PREFIX} Waited {waited:.1f}s for Gemini rate limit")
+        return waited or 0.0
+
+    async def _reserve_hedge(self, tokens: int) -> bool:
+        """Take a slot for a hedged request only if one is free right now."""
+        try:
+            await _in_thread(self.rate_limiter.acquire, tokens, max_wait_seconds=0)
+            return True
+        except RateLimitExceeded:
+            return False
+
+    async def _hedged(self, prompt: str, parse: Optional[Callable[[str], T]], tokens: int) -> T:
+        tasks = {asyncio.ensure_future(self._request(prompt, parse, tokens))}
+
+        hedge_after = self.latency.percentile(self.hedge_percentile) if self.hedge_percentile else None
+        if hedge_after is not None:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done and await self._reserve_hedge(tokens):
+                logger.info(f"{LOG_PREFIX} No response after p{self.hedge_percentile:g} ({hedge_after:.1f}s), hedging")
+                tasks.add(asyncio.ensure_future(self._request(prompt, parse, tokens)))
+
+        last_error: Optional[BaseException] = None
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _request(self, prompt: str, parse: Optional[Callable[[str], T]], tokens: int) -> T:
+        started = time.monotonic()
+        response = await self._generate_content(prompt)
+
+        usage = getattr(response, "usage_metadata", None)
+        await _in_thread(self.rate_limiter.record_usage, tokens, getattr(usage, "total_token_count", None))
+
+        if not response or not response.text:
+            raise Exception("Empty response from Gemini API")
+
+        result = parse(response.text) if parse else response.text
+        self.latency.record(time.monotonic() - started)
+        return result
+
+    async def _generate_content(self, prompt: str) -> Any:
+        generate_async = getattr(self.model, "generate_content_async", None)
+        if asyncio.iscoroutinefunction(generate_async):
+            return await generate_async(prompt)
+        # Models without an async API run in the loop's executor; a cancelled call finishes unobserved
+        return await asyncio.get_running_loop().run_in_executor(None, self.model.generate_content, prompt)
+
+
+async def _backoff(seconds: float) -> None:
+    await asyncio.sleep(seconds)
@@ -6,13 +6,20 @@ Notes:
 - `get_calendar_service` refreshes tokens when expired and persists the fresh token.
 """
 
-from typing import Optional
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from flask import current_app
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import build_http
+
+from ..config import Config
 
 SCOPES = [
     'https://www.googleapis.com/auth/calendar',
@@ -23,6 +30,18 @@ SCOPES = [
     'openid'
 ]
 
+# events.list maximum page size
+EVENTS_PAGE_SIZE = 2500
+# Only the fields BusySlot.from_google_event (including its content hash) and the sync diff read
+BUSY_EVENT_FIELDS = "items(id,status,transparency,start(date,dateTime),end(date,dateTime)),nextPageToken,nextSyncToken"
+# freebusy.query maximum calendars per request
+FREEBUSY_MAX_CALENDARS = 50
+
+# Parsed Calendar v3 discovery document shared by every service in the process
+_discovery_document: Optional[dict] = None
+_discovery_document_loaded = False
+_discovery_document_lock = threading.Lock()
+
 
 def create_flow() -> Flow:
     """Create a Google OAuth2 flow instance."""
@@ -88,20 +107,11 @@ def store_credentials(user_id: str, credentials: Credentials, provider_email: st
     for backwards compatibility during migration.
     """
     import logging
-    import os
     from datetime import datetime
 
-    from supabase import create_client
-
-    from ..utils.supabase_client import get_supabase
-
-    supabase_url = os.getenv('SUPABASE_URL')
-    supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+    from ..utils.supabase_client import get_service_role_client, get_supabase
 
-    if supabase_url and supabase_service_key:
-        supabase = create_client(supabase_url, supabase_service_key)
-    else:
-        supabase = get_supabase()
+    supabase = get_service_role_client() or get_supabase()
 
     if isinstance(credentials, dict):
         creds_dict = credentials
@@ -169,19 +179,10 @@ def get_stored_credentials(user_id: str) -> Optional[Credentials]:
     then falls back to profiles.google_auth_token (legacy).
     """
     import logging
-    import os
-
-    from supabase import create_client
 
-    from ..utils.supabase_client import get_supabase
-
-    supabase_url = os.getenv('SUPABASE_URL')
-    supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+    from ..utils.supabase_client import get_service_role_client, get_supabase
 
-    if supabase_url and supabase_service_key:
-        supabase = create_client(supabase_url, supabase_service_key)
-    else:
-        supabase = get_supabase()
+    supabase = get_service_role_client() or get_supabase()
 
     creds_dict = None
 
@@ -243,11 +244,137 @@ def validate_credentials(credentials: Credentials) -> bool:
     return False
 
 
+def _load_resources(resource, description: dict) -> None:
+    """Create every (nested) resource of a service once."""
+    for name, nested in description.get("resources", {}).items():
+        _load_resources(getattr(resource, name)(), nested)
+
+
+def _calendar_discovery_document() -> Optional[dict]:
+    """
+    The Calendar v3 discovery document bundled with google-api-python-client,
+    parsed once per process.
+
+    The client library fixes up method descriptions in place the first time a
+    resource is created, so the document is warmed by creating every resource
+    once under the lock before it is shared between threads. Returns None if
+    the installed library does not bundle the document.
+    """
+    global _discovery_document, _discovery_document_loaded
+    if _discovery_document_loaded:
+        return _discovery_document
+    with _discovery_document_lock:
+        if not _discovery_document_loaded:
+            content = get_static_doc("calendar", "v3")
+            document = json.loads(content) if content else None
+            if document is not None:
+                _load_resources(build_from_document(document, http=build_http()), document)
+            _discovery_document = document
+            _discovery_document_loaded = True
+    return _discovery_document
+
+
+def build_calendar_service(credentials: Credentials):
+    """
+    Create a Calendar API service for ``credentials`` from the cached discovery
+    document, without reading and parsing it again.
+
+    Services are not shared: each one owns an authorized httplib2 connection,
+    which is not thread-safe.
+    """
+    document = _calendar_discovery_document()
+    if document is None:
+        return build("calendar", "v3", credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+
 def get_calendar_service(credentials: Credentials, user_id: str):
     """Create a Google Calendar API service instance."""
     credentials = refresh_credentials_if_needed(credentials)
     store_credentials(user_id, credentials)
-    return build("calendar", "v3", credentials=credentials)
+    return build_calendar_service(credentials)
+
+
+class EventStream:
+    """
+    Iterate events.list results page by page.
+
+    Pages are requested lazily with the busy-slot field mask and the maximum
+    page size, so only one page of trimmed events is held at a time.
+    ``first_page`` is an already fetched response for ``request()`` (e.g. from
+    a batch). ``next_sync_token`` is set once the last page has been read.
+    """
+
+    def __init__(self, service, fields: str = BUSY_EVENT_FIELDS, first_page: Optional[dict] = None, **params):
+        self.service = service
+        self.params = {"maxResults": EVENTS_PAGE_SIZE, "fields": fields, **params}
+        self.first_page = first_page
+        self.next_sync_token: Optional[str] = None
+        self.pages = 0
+
+    def request(self, page_token: Optional[str] = None):
+        """The (unexecuted) events.list request for one page."""
+        return self.service.events().list(pageToken=page_token, **self.params)
+
+    def __iter__(self) -> Iterator[dict]:
+        page_token = None
+        response = self.first_page
+        while True:
+            if response is None:
+                response = self.request(page_token).execute()
+            self.pages += 1
+            yield from response.get("items", [])
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                self.next_sync_token = response.get("nextSyncToken")
+                return
+            response = None
+
+
+def execute_batch(
+    service, requests: Dict[str, Any], batch_size: Optional[int] = None
+) -> Dict[str, Tuple[Optional[dict], Optional[Exception]]]:
+    """
+    Execute requests as multiplexed batch HTTP calls of ``batch_size``
+    (default CALENDAR_SYNC_GOOGLE_BATCH_SIZE) requests each.
+
+    Returns {request_id: (response, None) or (None, error)}; a failing
+    sub-request does not affect the others. Raises if a batch call itself fails.
+    """
+    batch_size = batch_size or Config.CALENDAR_SYNC_GOOGLE_BATCH_SIZE
+    results: Dict[str, Tuple[Optional[dict], Optional[Exception]]] = {}
+
+    def collect(request_id, response, exception):
+        results[request_id] = (None, exception) if exception is not None else (response, None)
+
+    items = list(requests.items())
+    for i in range(0, len(items), batch_size):
+        batch = service.new_batch_http_request(callback=collect)
+        for request_id, request in items[i:i + batch_size]:
+            batch.add(request, request_id=request_id)
+        batch.execute()
+    return results
+
+
+def query_free_busy(
+    service, calendar_ids: List[str], start_date: datetime, end_date: datetime
+) -> Dict[str, dict]:
+    """
+    Merged busy blocks of many calendars via freebusy.query, one request per
+    FREEBUSY_MAX_CALENDARS calendars.
+
+    Returns {calendar_id: {"busy": [{"start", "end"}], "errors": [...]}} as
+    reported by Google; a calendar without free/busy access has only errors.
+    """
+    calendars: Dict[str, dict] = {}
+    for i in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS):
+        response = service.freebusy().query(body={
+            "timeMin": start_date.isoformat(),
+            "timeMax": end_date.isoformat(),
+            "items": [{"id": calendar_id} for calendar_id in calendar_ids[i:i + FREEBUSY_MAX_CALENDARS]],
+        }).execute()
+        calendars.update(response.get("calendars", {}))
+    return calendars
 
 
 def revoke_credentials(user_id: str) -> None:
@@ -277,7 +404,7 @@ def get_user_calendars(user_id: str) -> list:
     if not validate_credentials(credentials):
         raise Exception("Invalid Google credentials")
 
-    service = build("calendar", "v3", credentials=credentials)
+    service = build_calendar_service(credentials)
     calendars = []
     page_token = None
 
@@ -299,7 +426,7 @@ def get_user_calendars_list(credentials: Credentials) -> list:
     if not validate_credentials(credentials):
         raise Exception("Invalid Google credentials")
 
-    service = build("calendar", "v3", credentials=credentials)
+    service = build_calendar_service(credentials)
     calendars = []
     page_token = None
 
@@ -1,12 +1,9 @@
 """Service for managing event invitations."""
 
-import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from supabase import create_client
-
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 
 class InvitationsService:
@@ -14,14 +11,7 @@ class InvitationsService:
 
     def __init__(self):
         self.supabase = get_supabase()
-
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-        if supabase_url and supabase_service_key:
-            self.service_role_client = create_client(supabase_url, supabase_service_key)
-        else:
-            self.service_role_client = self.supabase
+        self.service_role_client = get_service_role_client() or self.supabase
 
     def get_invitation(self, event_id: str, invitee_id: str) -> Optional[Dict[str, Any]]:
         """Get invitation for a specific event and invitee."""
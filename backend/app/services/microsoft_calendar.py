@@ -10,30 +10,29 @@ Notes:
 from __future__ import annotations
 
 import logging
-import os
 import time
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 
 import requests
 from flask import current_app
 from msal import ConfidentialClientApplication
-from supabase import create_client
 
-from ..utils.supabase_client import get_supabase
+from ..utils.intervals import format_utc
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 SCOPES = ["Calendars.ReadWrite", "User.Read"]
 GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
+GRAPH_PAGE_SIZE = 500
+# getSchedule statuses that do not block time
+FREE_SCHEDULE_STATUSES = {"free", "workingElsewhere"}
+# Longest window getSchedule accepts in one request
+GET_SCHEDULE_MAX_DAYS = 62
 
 
 def _get_service_role_client():
     """Get a Supabase client with service-role privileges, falling back to anon."""
-    supabase_url = os.getenv("SUPABASE_URL")
-    service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if supabase_url and service_role_key:
-        return create_client(supabase_url, service_role_key)
-    return get_supabase()
+    return get_service_role_client() or get_supabase()
 
 
 def create_flow() -> ConfidentialClientApplication:
@@ -247,7 +246,8 @@ def get_calendar_service(credentials: dict, user_id: str) -> dict:
         headers = kwargs.pop("headers", {})
         headers["Authorization"] = f"Bearer {credentials['access_token']}"
         headers.setdefault("Content-Type", "application/json")
-        url = f"{GRAPH_API_BASE}{endpoint}"
+        # Pagination and delta links are absolute URLs
+        url = endpoint if endpoint.startswith("https://") else f"{GRAPH_API_BASE}{endpoint}"
         return requests.request(method, url, headers=headers, **kwargs)
 
     return {
@@ -256,6 +256,117 @@ def get_calendar_service(credentials: dict, user_id: str) -> dict:
     }
 
 
+def list_graph_pages(
+    graph_request,
+    endpoint: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    GET a Graph collection and follow every @odata.nextLink.
+
+    Returns (items, deltaLink); deltaLink is only set for delta queries.
+    """
+    items: List[dict] = []
+    url, page_params = endpoint, params
+
+    while True:
+        response = graph_request("GET", url, params=page_params, headers=dict(headers or {}))
+        response.raise_for_status()
+        data = response.json()
+        items.extend(data.get("value", []))
+
+        next_link = data.get("@odata.nextLink")
+        if not next_link:
+            return items, data.get("@odata.deltaLink")
+        # nextLink already carries the original query
+        url, page_params = next_link, None
+
+
+def list_calendar_view(graph_request, endpoint: str, start_date: datetime, end_date: datetime) -> List[dict]:
+    """List all events of a calendarView endpoint in a window, across pages."""
+    items, _ = list_graph_pages(
+        graph_request,
+        endpoint,
+        params={
+            "startDateTime": start_date.isoformat(),
+            "endDateTime": end_date.isoformat(),
+            "$top": GRAPH_PAGE_SIZE,
+        },
+    )
+    return items
+
+
+def get_calendar_view_delta(
+    graph_request,
+    calendar_id: str,
+    start_date: datetime,
+    end_date: datetime,
+    delta_link: Optional[str] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Run a calendarView delta round for one calendar.
+
+    Without ``delta_link`` this lists every event in the window; with it only
+    events changed since that round are returned, removed ones carrying an
+    "@removed" marker. Returns (events, next deltaLink).
+    """
+    headers = {"Prefer": f"odata.maxpagesize={GRAPH_PAGE_SIZE}"}
+
+    if delta_link:
+        return list_graph_pages(graph_request, delta_link, headers=headers)
+
+    return list_graph_pages(
+        graph_request,
+        f"/me/calendars/{calendar_id}/calendarView/delta",
+        params={
+            "startDateTime": start_date.isoformat(),
+            "endDateTime": end_date.isoformat(),
+        },
+        headers=headers,
+    )
+
+
+def get_schedule(
+    graph_request, schedules: List[str], start_date: datetime, end_date: datetime
+) -> List[dict]:
+    """
+    Free/busy of mailboxes via getSchedule, one request per GET_SCHEDULE_MAX_DAYS
+    of the window (the longest range Graph accepts).
+
+    Returns one scheduleInformation per address in request order with the
+    scheduleItems of every request concatenated; items carry status (busy,
+    tentative, oof, free ...) and UTC start/end. A mailbox that failed in any
+    request carries an "error" instead.
+    """
+    merged: List[dict] = []
+    chunk_start = start_date
+    while chunk_start < end_date:
+        chunk_end = min(chunk_start + timedelta(days=GET_SCHEDULE_MAX_DAYS), end_date)
+        response = graph_request(
+            "POST",
+            "/me/calendar/getSchedule",
+            json={
+                "schedules": schedules,
+                "startTime": {"dateTime": format_utc(chunk_start).rstrip("Z"), "timeZone": "UTC"},
+                "endTime": {"dateTime": format_utc(chunk_end).rstrip("Z"), "timeZone": "UTC"},
+            },
+            headers={"Prefer": 'outlook.timezone="UTC"'},
+        )
+        response.raise_for_status()
+
+        for i, schedule in enumerate(response.json().get("value", [])):
+            if i == len(merged):
+                merged.append({**schedule, "scheduleItems": list(schedule.get("scheduleItems", []))})
+            elif schedule.get("error"):
+                merged[i]["error"] = schedule["error"]
+            else:
+                merged[i]["scheduleItems"].extend(schedule.get("scheduleItems", []))
+        chunk_start = chunk_end
+
+    return merged
+
+
 def revoke_credentials(user_id: str) -> None:
     """Remove stored Microsoft OAuth credentials (no remote revocation endpoint)."""
     supabase = _get_service_role_client()
@@ -1,13 +1,10 @@
 """Notifications service for managing user notifications."""
 
-import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from supabase import create_client
-
 from ..models.notification import Notification
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 
 class NotificationsService:
@@ -15,14 +12,7 @@ class NotificationsService:
 
     def __init__(self, access_token: Optional[str] = None):
         self.supabase = get_supabase(access_token)
-
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-        if supabase_url and supabase_service_key:
-            self.service_role_client = create_client(supabase_url, supabase_service_key)
-        else:
-            self.service_role_client = self.supabase
+        self.service_role_client = get_service_role_client() or self.supabase
     
     def create_notification(
         self,
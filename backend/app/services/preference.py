@@ -1,9 +1,6 @@
-import os
 from typing import Any, Dict, List, Optional
 
-from supabase import create_client
-
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 
 class PreferencesService:
@@ -13,14 +10,7 @@ class PreferencesService:
 
     def __init__(self):
         self.supabase = get_supabase()
-
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-        if supabase_url and supabase_service_key:
-            self.service_role_client = create_client(supabase_url, supabase_service_key)
-        else:
-            self.service_role_client = self.supabase
+        self.service_role_client = get_service_role_client() or self.supabase
 
     def validate_preference_data(self, data: Dict[str, Any]) -> bool:
         """Validate that all required fields are present and non-empty."""
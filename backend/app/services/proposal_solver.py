@@ -0,0 +1,129 @@
+"""
+Deterministic local scheduling solver.
+
+Ranks every candidate slot in an event window using the availability matrix
+and participants' profile timezones, so proposals can be produced in
+milliseconds without waiting on Gemini. Ranking order:
+
+1. Fewest participant conflicts
+2. Most participants who marked the time as preferred
+3. Fewest suggestions already picked on the same day (day spread)
+4. Most participants inside local business hours
+5. Earliest start time
+"""
+
+from .availability_matrix import AvailabilityMatrix
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+BUSINESS_HOURS_START = 9
+BUSINESS_HOURS_END = 18
+
+
+def _load_zone(name: str):
+    """Resolve a profile timezone name, falling back to UTC for unknown names."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
+
+
+def _to_utc_string(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ProposalSolver:
+    """Scores candidate slots locally and returns the top-N proposals."""
+
+    def __init__(self, availability: AvailabilityMatrix, participants: List[Dict[str, Any]]):
+        self.availability = availability
+        self.participant_count = len(participants)
+        self.timezone_counts = Counter(p.get("timezone") or "UTC" for p in participants)
+        self.zones = {name: _load_zone(name) for name in self.timezone_counts}
+
+    def rank(
+        self,
+        candidates: Iterable[Tuple[datetime, datetime]],
+        num_suggestions: int,
+        min_start: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return up to ``num_suggestions`` non-overlapping proposals, best first."""
+        remaining = [
+            self._score(start, end)
+            for start, end in candidates
+            if min_start is None or start >= min_start
+        ]
+
+        picks: List[Dict[str, Any]] = []
+        day_counts: Counter = Counter()
+
+        while remaining and len(picks) < num_suggestions:
+            best = min(
+                remaining,
+                key=lambda c: (
+                    c["conflicts"],
+                    -c["preferred"],
+                    day_counts[c["day"]],
+                    -c["business_hours"],
+                    c["start"],
+                ),
+            )
+            picks.append(best)
+            day_counts[best["day"]] += 1
+            remaining = [
+                c for c in remaining
+                if c["end"] <= best["start"] or c["start"] >= best["end"]
+            ]
+
+        return [self._to_proposal(candidate) for candidate in picks]
+
+    def _score(self, start: datetime, end: datetime) -> Dict[str, Any]:
+        return {
+            "start": start,
+            "end": end,
+            "day": start.astimezone(timezone.utc).date(),
+            "conflicts": min(
+                self.availability.conflicts_for_interval(start, end), self.participant_count
+            ),
+            "preferred": self.availability.preferred_count_for_interval(start, end),
+            "business_hours": self._business_hours_count(start, end),
+        }
+
+    def _business_hours_count(self, start: datetime, end: datetime) -> int:
+        """Count participants for whom the slot falls inside their local business hours."""
+        count = 0
+        for name, participants in self.timezone_counts.items():
+            local_start = start.astimezone(self.zones[name])
+            local_end = end.astimezone(self.zones[name])
+            end_hour = local_end.hour + local_end.minute / 60
+            if (
+                local_start.date() == local_end.date()
+                and local_start.hour >= BUSINESS_HOURS_START
+                and end_hour <= BUSINESS_HOURS_END
+            ):
+                count += participants
+        return count
+
+    def _to_proposal(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        total = self.participant_count
+        conflicts = candidate["conflicts"]
+
+        if conflicts == 0:
+            reasoning = f"All {total} participants are available"
+        else:
+            conflict_text = "conflict" if conflicts == 1 else "conflicts"
+            reasoning = f"{total - conflicts}/{total} participants are available ({conflicts} {conflict_text})"
+        if candidate["preferred"]:
+            reasoning += f"; {candidate['preferred']} marked this time as preferred"
+        reasoning += f"; within business hours for {candidate['business_hours']}/{total} participants."
+
+        return {
+            "start_time_utc": _to_utc_string(candidate["start"]),
+            "end_time_utc": _to_utc_string(candidate["end"]),
+            "conflicts": conflicts,
+            "reasoning": reasoning,
+            "source": "local",
+        }
@@ -1,20 +1,27 @@
 """
-Time proposal service using Gemini AI.
+Time proposal service.
 
-Aggregates participant availability data and uses Google's Gemini AI
-to suggest optimal meeting times.
+Aggregates participant availability data, ranks candidate times with a
+deterministic local solver and optionally enriches them with suggestions
+from Google's Gemini AI.
 """
 
 from ..config import Config
-from ..utils.supabase_client import get_supabase
-
+from ..utils.intervals import format_utc, iter_free_windows, parse_utc
+from .availability_encoding import encode_availability
+from .availability_matrix import AvailabilityMatrix
+from .busy_slots import fetch_busy_slots_in_window
+from .gemini_client import GeminiClient
+from .proposal_solver import ProposalSolver
+from ..utils.rate_limiter import get_gemini_rate_limiter
+from ..utils.supabase_client import get_service_role_client, get_supabase
+
+import hashlib
 import json
-import os
-import time
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone as tz
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from supabase import create_client
 
 try:
     import google.generativeai as genai
@@ -25,46 +32,81 @@ except ImportError:
 
 
 class TimeProposalService:
-    """Service for generating AI-powered time proposals using Gemini."""
+    """Service for generating time proposals, optionally enriched by Gemini."""
 
     MIN_BUFFER_MINUTES = 45
+    # Spacing of candidate start times, also the finest slot of the prompt's availability encoding
+    CANDIDATE_STEP_MINUTES = 30
 
     def __init__(self, access_token: Optional[str] = None):
         self.supabase = get_supabase(access_token)
-
-        supabase_url = os.getenv("SUPABASE_URL")
-        service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-        if supabase_url and service_role_key:
-            self.service_role_client = create_client(supabase_url, service_role_key)
-        else:
-            self.service_role_client = self.supabase
+        self.service_role_client = get_service_role_client() or self.supabase
 
         self.gemini_api_key = Config.GEMINI_API_KEY
         self.gemini_model = Config.GEMINI_MODEL
         self.max_retries = Config.GEMINI_MAX_RETRIES
+        # Background jobs may wait longer for a rate limit slot than requests
+        self.rate_limit_max_wait = Config.GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS
 
         if GENAI_AVAILABLE and self.gemini_api_key:
             genai.configure(api_key=self.gemini_api_key)
             self.model = genai.GenerativeModel(self.gemini_model)
         else:
             self.model = None
-    
-    def propose_times(self, event_id: str, num_suggestions: int = 5) -> List[Dict[str, Any]]:
-        """Generate AI-powered time proposals for an event."""
-        print(f"[TIME_PROPOSAL] Generating {num_suggestions} proposals for event {event_id}")
 
-        if not GENAI_AVAILABLE:
-            raise Exception("Gemini AI library not installed. Please install google-generativeai.")
+        # Input fingerprints of proposals generated by this instance, keyed by event id
+        self._generated_fingerprints: Dict[str, str] = {}
+    
+    def propose_times(
+        self,
+        event_id: str,
+        num_suggestions: int = 5,
+        use_ai: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate time proposals for an event.
 
-        if not self.model:
-            raise Exception("Gemini API not configured. Please set GEMINI_API_KEY environment variable.")
+        Proposals are ranked locally first; Gemini is an optional enrichment
+        stage whose validated suggestions are merged on top. If Gemini is not
+        configured, disabled or fails, the local ranking is returned as-is.
+        """
+        print(f"[TIME_PROPOSAL] Generating {num_suggestions} proposals for event {event_id}")
 
         data = self._aggregate_participant_data(event_id)
 
         if not data:
             raise Exception("Failed to aggregate event data")
 
+        return self._propose_from_data(data, num_suggestions, use_ai)
+
+    def _propose_from_data(
+        self,
+        data: Dict[str, Any],
+        num_suggestions: int,
+        use_ai: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Generate proposals from already aggregated participant data."""
+        for stage, payload in self._iter_proposal_stages(data, num_suggestions, use_ai):
+            if stage == "final":
+                return payload["proposals"]
+        return []
+
+    def _iter_proposal_stages(
+        self,
+        data: Dict[str, Any],
+        num_suggestions: int,
+        use_ai: bool = True,
+        fingerprint: Optional[str] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (stage, payload) as each generation stage completes.
+
+        Stages: "local" (free windows and locally ranked proposals, available
+        within milliseconds), "ai" (validated Gemini proposals; only when AI
+        enrichment runs) and "final" (the merged proposals to cache).
+        ``fingerprint`` is the input fingerprint of ``data`` if the caller
+        already computed it.
+        """
         if data["participant_count"] == 0:
             raise Exception("Event has no participants")
 
@@ -76,214 +118,322 @@ class TimeProposalService:
             if latest_datetime < min_allowed_time:
                 raise Exception("Event date range has passed. Please update the event's date range to include future dates.")
 
+        self._generated_fingerprints[event["id"]] = fingerprint or self.compute_input_fingerprint(data)
+        data["availability"] = AvailabilityMatrix.from_data(data)
+
         free_windows = self._calculate_free_windows(data)
         print(f"[TIME_PROPOSAL] Found {len(free_windows)} free time windows")
 
         data["free_windows"] = free_windows
         data["has_conflict_free_slots"] = len(free_windows) > 0
 
-        prompt = self._format_gemini_prompt(data, num_suggestions)
-        response_text = self._call_gemini_api(prompt)
-        proposals = self._parse_gemini_response(response_text)
-        validated_proposals = self._validate_proposed_times(proposals, data)
-        formatted_proposals = self._format_for_frontend(validated_proposals, data)
+        local_proposals = self._solve_locally(data, num_suggestions)
+        print(f"[TIME_PROPOSAL] Local solver ranked {len(local_proposals)} proposals")
+
+        yield "local", {
+            "free_windows": [
+                {"start_time_utc": format_utc(start), "end_time_utc": format_utc(end)}
+                for start, end in free_windows
+            ],
+            "proposals": self._format_for_frontend(local_proposals, data),
+        }
+
+        proposals = local_proposals
+        if use_ai and self.ai_enrichment_enabled:
+            ai_proposals = self._enrich_with_ai(data, num_suggestions)
+            yield "ai", {"proposals": self._format_for_frontend(ai_proposals, data)}
+            proposals = self._merge_proposals(ai_proposals, local_proposals, num_suggestions)
+
+        formatted_proposals = self._format_for_frontend(proposals, data)
 
         print(f"[TIME_PROPOSAL] Successfully generated {len(formatted_proposals)} proposals")
 
-        return formatted_proposals
-    
-    def _aggregate_participant_data(self, event_id: str) -> Optional[Dict[str, Any]]:
-        """Aggregate all data needed for time proposals."""
-        try:
-            event_result = (
-                self.service_role_client.table("events")
-                .select("*")
-                .eq("id", event_id)
-                .execute()
+        yield "final", {"proposals": formatted_proposals}
+
+    def compute_input_fingerprint(self, data: Dict[str, Any]) -> str:
+        """
+        Return a stable SHA-256 fingerprint of everything proposals depend on.
+
+        Covers the event window and duration, the participant set with their
+        timezones, busy slots intersecting the event window and the event's
+        preferred slots. Row order, ids and sync timestamps do not affect it.
+        """
+        event = data["event"]
+        window_start = event.get("earliest_datetime_utc")
+        window_end = event.get("latest_datetime_utc")
+        window_start = parse_utc(window_start) if window_start else None
+        window_end = parse_utc(window_end) if window_end else None
+
+        def slot_key(slot: Dict[str, Any]) -> Tuple[str, str, str]:
+            return (
+                str(slot.get("user_id")),
+                parse_utc(slot["start_time_utc"]).isoformat(),
+                parse_utc(slot["end_time_utc"]).isoformat(),
             )
 
-            if not event_result.data:
-                print(f"[ERROR] Event {event_id} not found")
-                return None
+        busy_slots = [
+            slot for slot in data.get("all_busy_slots", [])
+            if (window_end is None or parse_utc(slot["start_time_utc"]) < window_end)
+            and (window_start is None or parse_utc(slot["end_time_utc"]) > window_start)
+        ]
+
+        payload = {
+            "event": [
+                event.get("id"),
+                window_start.isoformat() if window_start else None,
+                window_end.isoformat() if window_end else None,
+                event.get("duration_minutes"),
+            ],
+            "participants": sorted(
+                [p["user_id"], p.get("timezone") or "UTC"] for p in data.get("participants", [])
+            ),
+            # Identical slots from different calendars collapse to one entry
+            "busy": sorted({slot_key(slot) for slot in busy_slots}),
+            "preferred": sorted({slot_key(slot) for slot in data.get("all_preferred_slots", [])}),
+        }
 
-            event = event_result.data[0]
+        encoded = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
-            participants_result = (
-                self.service_role_client.table("event_participants")
-                .select("user_id")
-                .eq("event_id", event_id)
-                .execute()
-            )
+    @property
+    def ai_enrichment_enabled(self) -> bool:
+        """Whether Gemini is installed, configured and enabled for proposals."""
+        return GENAI_AVAILABLE and self.model is not None and Config.PROPOSAL_AI_ENRICHMENT
 
-            participant_ids = [p["user_id"] for p in participants_result.data]
+    def _solve_locally(self, data: Dict[str, Any], num_suggestions: int) -> List[Dict[str, Any]]:
+        """Rank candidate slots with the deterministic local solver."""
+        solver = ProposalSolver(self._get_availability(data), data["participants"])
+        min_start_time = datetime.now(tz.utc) + timedelta(minutes=self.MIN_BUFFER_MINUTES)
 
-            if not participant_ids:
-                print(f"[ERROR] No participants found for event {event_id}")
-                return None
+        return solver.rank(
+            self._iter_candidate_windows(data["event"]),
+            num_suggestions,
+            min_start=min_start_time
+        )
 
-            profiles_result = (
-                self.service_role_client.table("profiles")
-                .select("id, full_name, email_address, timezone")
-                .in_("id", participant_ids)
-                .execute()
-            )
+    def _enrich_with_ai(self, data: Dict[str, Any], num_suggestions: int) -> List[Dict[str, Any]]:
+        """Ask Gemini for proposals with reasoning; returns [] if the model is slow or unavailable."""
+        try:
+            prompt = self._format_gemini_prompt(data, num_suggestions)
+            proposals = self._call_gemini_api(prompt, parse=self._parse_gemini_response)
+            validated = self._validate_proposed_times(proposals, data)
+            for proposal in validated:
+                proposal["source"] = "ai"
+            return validated
+        except Exception as e:
+            print(f"[TIME_PROPOSAL] Gemini enrichment failed, using local proposals: {str(e)}")
+            return []
 
-            profiles_map = {p["id"]: p for p in profiles_result.data}
+    def _merge_proposals(
+        self,
+        ai_proposals: List[Dict[str, Any]],
+        local_proposals: List[Dict[str, Any]],
+        num_suggestions: int
+    ) -> List[Dict[str, Any]]:
+        """Keep AI proposals first and top up with non-overlapping local proposals."""
+        merged = list(ai_proposals[:num_suggestions])
+        taken = [
+            (parse_utc(p["start_time_utc"]), parse_utc(p["end_time_utc"]))
+            for p in merged
+        ]
+
+        for proposal in local_proposals:
+            if len(merged) >= num_suggestions:
+                break
+            start = parse_utc(proposal["start_time_utc"])
+            end = parse_utc(proposal["end_time_utc"])
+            if any(start < taken_end and end > taken_start for taken_start, taken_end in taken):
+                continue
+            merged.append(proposal)
+            taken.append((start, end))
+
+        return merged
+    
+    def _aggregate_participant_data(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Aggregate all data needed for time proposals.
 
-            busy_slots_result = (
-                self.service_role_client.table("busy_slots")
-                .select("*")
-                .in_("user_id", participant_ids)
-                .execute()
-            )
+        Uses the get_event_proposal_data RPC (one round trip, busy slots
+        bounded to the event window) and falls back to per-table queries when
+        the function is not installed.
+        """
+        try:
+            try:
+                payload = self._fetch_proposal_data_rpc(event_id)
+            except Exception as e:
+                print(f"[TIME_PROPOSAL] get_event_proposal_data RPC unavailable, using table queries: {str(e)}")
+                payload = self._fetch_proposal_data_tables(event_id)
 
-            preferred_slots_result = (
-                self.service_role_client.table("preferred_slots")
-                .select("*")
-                .eq("event_id", event_id)
-                .execute()
-            )
+            if not payload or not payload.get("event"):
+                print(f"[ERROR] Event {event_id} not found")
+                return None
 
-            participants_data = []
-            for user_id in participant_ids:
-                profile = profiles_map.get(user_id, {})
-                user_busy = [s for s in busy_slots_result.data if s["user_id"] == user_id]
-                user_preferred = [s for s in preferred_slots_result.data if s["user_id"] == user_id]
-
-                participants_data.append({
-                    "user_id": user_id,
-                    "name": profile.get("full_name", "Unknown"),
-                    "email": profile.get("email_address", ""),
-                    "timezone": profile.get("timezone", "UTC"),
-                    "busy_slots": user_busy,
-                    "preferred_slots": user_preferred
-                })
+            if not payload["participants"]:
+                print(f"[ERROR] No participants found for event {event_id}")
+                return None
 
-            return {
-                "event": event,
-                "participants": participants_data,
-                "participant_count": len(participants_data),
-                "all_busy_slots": busy_slots_result.data,
-                "all_preferred_slots": preferred_slots_result.data
-            }
+            return self._group_participant_data(payload)
 
         except Exception as e:
             print(f"[ERROR] Failed to aggregate data: {str(e)}")
             return None
+
+    def _fetch_proposal_data_rpc(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch event, participants, busy and preferred slots in one RPC call."""
+        result = self.service_role_client.rpc(
+            "get_event_proposal_data",
+            {"event_uuid": event_id}
+        ).execute()
+
+        payload = result.data
+        if payload is not None and not isinstance(payload, dict):
+            raise ValueError(f"Unexpected RPC payload type {type(payload).__name__}")
+        return payload
+
+    def _fetch_proposal_data_tables(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch the RPC payload shape with individual PostgREST queries."""
+        event_result = (
+            self.service_role_client.table("events")
+            .select("*")
+            .eq("id", event_id)
+            .execute()
+        )
+
+        if not event_result.data:
+            return None
+
+        participants_result = (
+            self.service_role_client.table("event_participants")
+            .select("user_id")
+            .eq("event_id", event_id)
+            .execute()
+        )
+
+        participant_ids = [p["user_id"] for p in participants_result.data]
+
+        if not participant_ids:
+            return {"event": event_result.data[0], "participants": []}
+
+        profiles_result = (
+            self.service_role_client.table("profiles")
+            .select("id, full_name, email_address, timezone")
+            .in_("id", participant_ids)
+            .execute()
+        )
+
+        profiles_map = {p["id"]: p for p in profiles_result.data}
+
+        event = event_result.data[0]
+        window_start = event.get("earliest_datetime_utc")
+        window_end = event.get("latest_datetime_utc")
+        busy_slots = fetch_busy_slots_in_window(
+            self.service_role_client,
+            participant_ids,
+            parse_utc(window_start) if window_start else None,
+            parse_utc(window_end) if window_end else None
+        )
+
+        preferred_slots_result = (
+            self.service_role_client.table("preferred_slots")
+            .select("id, user_id, event_id, start_time_utc, end_time_utc")
+            .eq("event_id", event_id)
+            .execute()
+        )
+
+        return {
+            "event": event,
+            "participants": [
+                {"user_id": user_id, **{k: v for k, v in profiles_map.get(user_id, {}).items() if k != "id"}}
+                for user_id in participant_ids
+            ],
+            "busy_slots": busy_slots,
+            "preferred_slots": preferred_slots_result.data
+        }
+
+    def _group_participant_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach each participant's busy and preferred slots in a single pass over each list."""
+        busy_slots = payload.get("busy_slots") or []
+        preferred_slots = payload.get("preferred_slots") or []
+
+        busy_by_user: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for slot in busy_slots:
+            busy_by_user[slot["user_id"]].append(slot)
+
+        preferred_by_user: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for slot in preferred_slots:
+            preferred_by_user[slot["user_id"]].append(slot)
+
+        participants_data = []
+        for participant in payload["participants"]:
+            user_id = participant["user_id"]
+            participants_data.append({
+                "user_id": user_id,
+                "name": participant.get("full_name") or "Unknown",
+                "email": participant.get("email_address") or "",
+                "timezone": participant.get("timezone") or "UTC",
+                "busy_slots": busy_by_user.get(user_id, []),
+                "preferred_slots": preferred_by_user.get(user_id, [])
+            })
+
+        return {
+            "event": payload["event"],
+            "participants": participants_data,
+            "participant_count": len(participants_data),
+            "all_busy_slots": busy_slots,
+            "all_preferred_slots": preferred_slots
+        }
     
     def _calculate_free_windows(self, data: Dict[str, Any]) -> List[Tuple[datetime, datetime]]:
         """Calculate time windows when all participants are free."""
-        event = data["event"]
-        all_busy_slots = data["all_busy_slots"]
+        busy_timeline = self._get_availability(data).busy_timeline()
+        candidates = self._iter_candidate_windows(data["event"])
+
+        return list(iter_free_windows(candidates, busy_timeline))
+
+    def _iter_candidate_windows(self, event: Dict[str, Any]) -> Iterator[Tuple[datetime, datetime]]:
+        """Yield 30-minute-aligned candidate windows inside the event's daily hours, in order."""
+        duration = timedelta(minutes=event.get("duration_minutes", 60))
+        step = timedelta(minutes=self.CANDIDATE_STEP_MINUTES)
 
+        for start_of_day, end_of_day in self._iter_day_windows(event):
+            current_time = start_of_day
+            while current_time + duration <= end_of_day:
+                yield current_time, current_time + duration
+                current_time += step
+
+    def _iter_day_windows(self, event: Dict[str, Any]) -> Iterator[Tuple[datetime, datetime]]:
+        """Yield each day's (start, end) of the event's daily hours across its date range."""
         if event.get("earliest_datetime_utc"):
-            earliest_datetime = datetime.fromisoformat(event["earliest_datetime_utc"])
-            if earliest_datetime.tzinfo is None:
-                earliest_datetime = earliest_datetime.replace(tzinfo=tz.utc)
+            earliest_datetime = parse_utc(event["earliest_datetime_utc"])
         else:
             earliest_datetime = datetime.now(tz.utc)
 
         if event.get("latest_datetime_utc"):
-            latest_datetime = datetime.fromisoformat(event["latest_datetime_utc"])
-            if latest_datetime.tzinfo is None:
-                latest_datetime = latest_datetime.replace(tzinfo=tz.utc)
+            latest_datetime = parse_utc(event["latest_datetime_utc"])
         else:
             latest_datetime = earliest_datetime + timedelta(days=30)
 
         earliest_date = earliest_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
         latest_date = latest_datetime.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        earliest_hour_str = earliest_datetime.strftime("%H:%M:%S")
-        latest_hour_str = latest_datetime.strftime("%H:%M:%S")
-
-        duration_minutes = event.get("duration_minutes", 60)
-
-        free_windows = []
         current_date = earliest_date
-
         while current_date <= latest_date:
-            earliest_hour_parts = earliest_hour_str.split(":")
-            latest_hour_parts = latest_hour_str.split(":")
-
             start_of_day = current_date.replace(
-                hour=int(earliest_hour_parts[0]),
-                minute=int(earliest_hour_parts[1]),
-                second=0,
-                microsecond=0
+                hour=earliest_datetime.hour, minute=earliest_datetime.minute
             )
             end_of_day = current_date.replace(
-                hour=int(latest_hour_parts[0]),
-                minute=int(latest_hour_parts[1]),
-                second=0,
-                microsecond=0
+                hour=latest_datetime.hour, minute=latest_datetime.minute
             )
-
-            current_time = start_of_day
-            while current_time + timedelta(minutes=duration_minutes) <= end_of_day:
-                slot_end = current_time + timedelta(minutes=duration_minutes)
-
-                is_free = True
-                for busy_slot in all_busy_slots:
-                    if hasattr(busy_slot, "get_start_time_utc"):
-                        busy_start = busy_slot.get_start_time_utc()
-                        busy_end = busy_slot.get_end_time_utc()
-                    else:
-                        start_str = busy_slot.get("start_time_utc", "")
-                        end_str = busy_slot.get("end_time_utc", "")
-                        busy_start = datetime.fromisoformat(str(start_str).replace("Z", "+00:00"))
-                        busy_end = datetime.fromisoformat(str(end_str).replace("Z", "+00:00"))
-
-                    if current_time < busy_end and slot_end > busy_start:
-                        is_free = False
-                        break
-
-                if is_free:
-                    free_windows.append((current_time, slot_end))
-
-                current_time += timedelta(minutes=30)
+            yield start_of_day, end_of_day
 
             current_date += timedelta(days=1)
-
-        return free_windows
     
-    def _segment_busy_slots_by_participant_count(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Segment busy slots by the number of participants busy during each time period."""
-        all_busy_slots = data["all_busy_slots"]
+    def _get_availability(self, data: Dict[str, Any]) -> AvailabilityMatrix:
+        """Return the request's availability matrix, building it on first use."""
+        if "availability" not in data:
+            data["availability"] = AvailabilityMatrix.from_data(data)
+        return data["availability"]
 
-        if not all_busy_slots:
-            return []
-
-        time_points = set()
-        for slot in all_busy_slots:
-            start = datetime.fromisoformat(slot["start_time_utc"].replace("Z", "+00:00"))
-            end = datetime.fromisoformat(slot["end_time_utc"].replace("Z", "+00:00"))
-            time_points.add(start)
-            time_points.add(end)
-
-        sorted_times = sorted(time_points)
-
-        segments = []
-        for i in range(len(sorted_times) - 1):
-            interval_start = sorted_times[i]
-            interval_end = sorted_times[i + 1]
-
-            busy_user_ids = set()
-            for slot in all_busy_slots:
-                slot_start = datetime.fromisoformat(slot["start_time_utc"].replace("Z", "+00:00"))
-                slot_end = datetime.fromisoformat(slot["end_time_utc"].replace("Z", "+00:00"))
-
-                if slot_start < interval_end and slot_end > interval_start:
-                    busy_user_ids.add(slot["user_id"])
-
-            if busy_user_ids:
-                segments.append({
-                    "start_time": interval_start,
-                    "end_time": interval_end,
-                    "participant_count": len(busy_user_ids)
-                })
-
-        return segments
-    
     def _format_gemini_prompt(self, data: Dict[str, Any], num_suggestions: int) -> str:
         """Format a structured prompt for Gemini API."""
         event = data["event"]
@@ -303,7 +453,23 @@ class TimeProposalService:
         else:
             timezone_info = "UTC (default)"
 
-        busy_segments = self._segment_busy_slots_by_participant_count(data)
+        # One line for all participants, grouped by timezone
+        names_by_tz = defaultdict(list)
+        for p in participants:
+            names_by_tz[p.get("timezone", "UTC")].append(p.get("name", "Unknown"))
+        participant_timezones = "; ".join(
+            f"{participant_tz}: {', '.join(names)}" for participant_tz, names in names_by_tz.items()
+        ) or "none"
+
+        min_start = datetime.now(tz.utc) + timedelta(minutes=self.MIN_BUFFER_MINUTES)
+        availability, slot_minutes = encode_availability(
+            self._get_availability(data),
+            list(self._iter_day_windows(event)),
+            self.CANDIDATE_STEP_MINUTES,
+            not_before=min_start,
+        )
+        if not availability:
+            availability = "(no slots left in the event window)"
 
         has_conflict_free = data.get("has_conflict_free_slots", False)
         free_windows_count = len(data.get("free_windows", []))
@@ -312,7 +478,7 @@ class TimeProposalService:
         latest_dt = event.get('latest_datetime_utc', 'N/A')
 
         current_time_utc = datetime.now(tz.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        min_start_time = (datetime.now(tz.utc) + timedelta(minutes=self.MIN_BUFFER_MINUTES)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        min_start_time = min_start.strftime('%Y-%m-%dT%H:%M:%SZ')
 
         prompt = f"""You are an expert meeting scheduling assistant. Analyze the following data and suggest the best {num_suggestions} meeting times.
 
@@ -331,44 +497,16 @@ EVENT DETAILS:
 - Primary Timezone(s): {timezone_info}
 - Conflict-free slots available: {"Yes" if has_conflict_free else "No"} ({free_windows_count} slots found)
 
-PARTICIPANT TIMEZONES:
+PARTICIPANT TIMEZONES: {participant_timezones}
+
+AVAILABILITY (UTC, {slot_minutes}-minute slots):
+Each line is a date (or date range with identical availability), the first slot's start time, then runs of
+<busy>[/<preferring>]*<slots>: the number of participants busy (and, after "/", preferring the time) for that many
+consecutive slots. A participant counts if busy or preferring at any point in the slot. "0*8" = 8 slots with
+everyone free; "1/2*3" = 3 slots with 1 participant busy and 2 preferring.
+{availability}
 """
-        # Add individual participant timezone info
-        for p in participants:
-            prompt += f"- {p.get('name', 'Unknown')}: {p.get('timezone', 'UTC')}\n"
 
-        prompt += "\nBUSY TIME SLOTS (participants with conflicts):\n"
-        
-        # Add busy slots information
-        if busy_segments:
-            # Limit to first 30 busy segments to avoid token limits
-            for i, segment in enumerate(busy_segments[:30], 1):
-                start_str = segment["start_time"].strftime('%Y-%m-%d %H:%M')
-                end_str = segment["end_time"].strftime('%H:%M')
-                count = segment["participant_count"]
-                participant_text = "participant" if count == 1 else "participants"
-                prompt += f"{i}. {start_str} to {end_str} UTC - {count} {participant_text} busy\n"
-            
-            if len(busy_segments) > 30:
-                prompt += f"... and {len(busy_segments) - 30} more busy time segments\n"
-        else:
-            prompt += "No busy time slots - all participants are available during the event time range\n"
-        
-        prompt += "\n"
-        
-        # Add preferred slots information
-        if data["all_preferred_slots"]:
-            prompt += "PARTICIPANT PREFERENCES:\n"
-            preference_counts = {}
-            for pref in data["all_preferred_slots"]:
-                key = f"{pref['start_time_utc']}|{pref['end_time_utc']}"
-                preference_counts[key] = preference_counts.get(key, 0) + 1
-            
-            for key, count in sorted(preference_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
-                start_time, end_time = key.split("|")
-                start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                prompt += f"- {start_dt.strftime('%Y-%m-%d %H:%M')} UTC: {count}/{len(participants)} participants prefer this time\n"
-        
         prompt += f"""
 REQUIREMENTS:
 1. Suggest EXACTLY {num_suggestions} time slots
@@ -406,37 +544,19 @@ Return ONLY the JSON array, no other text or markdown formatting.
         
         return prompt
     
-    def _call_gemini_api(self, prompt: str) -> str:
-        """Call Gemini API with retry logic."""
-        for attempt in range(self.max_retries):
-            try:
-                print(f"[TIME_PROPOSAL] Calling Gemini API (attempt {attempt + 1}/{self.max_retries})")
-
-                response = self.model.generate_content(prompt)
-
-                if not response or not response.text:
-                    raise Exception("Empty response from Gemini API")
-
-                return response.text
-
-            except Exception as e:
-                error_str = str(e).lower()
-
-                if "quota" in error_str or "rate limit" in error_str:
-                    if attempt < self.max_retries - 1:
-                        wait_time = 2 ** attempt
-                        print(f"[TIME_PROPOSAL] Rate limited, waiting {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-                    raise Exception("Gemini API rate limit exceeded. Please try again later.")
-
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-
-                raise Exception(f"Gemini API error: {str(e)}")
-
-        raise Exception("Failed to get response from Gemini API after all retries")
+    def _call_gemini_api(self, prompt: str, parse: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        Call Gemini with retries, a per-call deadline and hedging; every attempt waits for a
+        slot in the shared quota. Returns ``parse(response_text)`` when a parser is given,
+        so a hedged response that fails to parse does not win over one that succeeds.
+        """
+        client = GeminiClient(
+            self.model,
+            max_retries=self.max_retries,
+            rate_limit_max_wait=self.rate_limit_max_wait,
+            rate_limiter=get_gemini_rate_limiter(),
+        )
+        return client.generate_sync(prompt, parse)
 
     def _parse_gemini_response(self, response_text: str) -> List[Dict[str, Any]]:
         """Parse Gemini response into structured proposals."""
@@ -465,31 +585,6 @@ Return ONLY the JSON array, no other text or markdown formatting.
             print(f"[ERROR] Error parsing response: {str(e)}")
             raise Exception(f"Failed to process AI response: {str(e)}")
     
-    def _calculate_conflicts_for_time(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        all_busy_slots: List[Dict[str, Any]]
-    ) -> int:
-        """Calculate how many participants have conflicts for a given time slot."""
-        conflicting_users = set()
-
-        for busy_slot in all_busy_slots:
-            # all_busy_slots are dicts from DB; support both dict and model
-            if hasattr(busy_slot, "get_start_time_utc"):
-                busy_start = busy_slot.get_start_time_utc()
-                busy_end = busy_slot.get_end_time_utc()
-            else:
-                start_str = busy_slot.get("start_time_utc", "")
-                end_str = busy_slot.get("end_time_utc", "")
-                busy_start = datetime.fromisoformat(str(start_str).replace("Z", "+00:00"))
-                busy_end = datetime.fromisoformat(str(end_str).replace("Z", "+00:00"))
-
-            if start_time < busy_end and end_time > busy_start:
-                conflicting_users.add(busy_slot.get("user_id") or getattr(busy_slot, "user_id", None))
-
-        return len(conflicting_users)
-
     def _validate_proposed_times(
         self,
         proposals: List[Dict[str, Any]],
@@ -535,25 +630,6 @@ Return ONLY the JSON array, no other text or markdown formatting.
 
         return validated
     
-    def _calculate_preferred_count_for_time(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        all_preferred_slots: List[Dict[str, Any]]
-    ) -> int:
-        """Calculate how many participants have marked this time as preferred."""
-        preferring_users = set()
-
-        for pref_slot in all_preferred_slots:
-            pref_start = datetime.fromisoformat(pref_slot["start_time_utc"].replace("Z", "+00:00"))
-            pref_end = datetime.fromisoformat(pref_slot["end_time_utc"].replace("Z", "+00:00"))
-
-            # Check for overlap - if the proposed time overlaps with preferred slot
-            if start_time < pref_end and end_time > pref_start:
-                preferring_users.add(pref_slot["user_id"])
-
-        return len(preferring_users)
-
     def _format_for_frontend(
         self,
         proposals: List[Dict[str, Any]],
@@ -562,8 +638,7 @@ Return ONLY the JSON array, no other text or markdown formatting.
         """Format proposals for frontend consumption."""
         formatted = []
         participant_count = data["participant_count"]
-        all_busy_slots = data["all_busy_slots"]
-        all_preferred_slots = data.get("all_preferred_slots", [])
+        availability = self._get_availability(data)
 
         # Track validation metrics for logging
         total_proposals = len(proposals)
@@ -578,7 +653,7 @@ Return ONLY the JSON array, no other text or markdown formatting.
             ai_conflicts = proposal.get("conflicts", 0)
 
             # Verify AI's conflict count
-            actual_conflicts = self._calculate_conflicts_for_time(start_time, end_time, all_busy_slots)
+            actual_conflicts = availability.conflicts_for_interval(start_time, end_time)
 
             # Validate conflict count doesn't exceed participant count
             if actual_conflicts > participant_count:
@@ -602,13 +677,14 @@ Return ONLY the JSON array, no other text or markdown formatting.
             available_count = participant_count - conflicts
 
             # Calculate preferred count
-            preferred_count = self._calculate_preferred_count_for_time(start_time, end_time, all_preferred_slots)
+            preferred_count = availability.preferred_count_for_interval(start_time, end_time)
 
             # Format time display
             time_display = f"{start_time.strftime('%I:%M %p')} - {end_time.strftime('%I:%M %p')}"
+            source = proposal.get("source", "ai")
 
             formatted.append({
-                "id": f"ai-{i}-{start_time.isoformat()}",
+                "id": f"{source}-{i}-{start_time.isoformat()}",
                 "date": proposal["start_time_utc"],
                 "time": time_display,
                 "start_time_utc": proposal["start_time_utc"],
@@ -617,7 +693,8 @@ Return ONLY the JSON array, no other text or markdown formatting.
                 "conflicts": conflicts,
                 "availableCount": available_count,
                 "preferredCount": preferred_count,
-                "totalParticipants": participant_count
+                "totalParticipants": participant_count,
+                "source": source
             })
 
         # Log validation summary
@@ -701,6 +778,7 @@ Return ONLY the JSON array, no other text or markdown formatting.
                 .execute()
 
             all_preferred_slots = preferred_slots_response.data if preferred_slots_response.data else []
+            availability = AvailabilityMatrix(busy_slots=[], preferred_slots=all_preferred_slots)
 
             # Current time for filtering past proposals
             now_utc = datetime.now(timezone.utc)
@@ -728,7 +806,7 @@ Return ONLY the JSON array, no other text or markdown formatting.
                 available_count = participant_count - conflicts
 
                 # Calculate preferred count
-                preferred_count = self._calculate_preferred_count_for_time(start_time, end_time, all_preferred_slots)
+                preferred_count = availability.preferred_count_for_interval(start_time, end_time)
 
                 # Format time display
                 time_display = f"{start_time.strftime('%I:%M %p')} - {end_time.strftime('%I:%M %p')}"
@@ -770,10 +848,17 @@ Return ONLY the JSON array, no other text or markdown formatting.
                 "filtered_count": 0
             }
     
-    def save_proposals_to_cache(self, event_id: str, proposals: List[Dict[str, Any]]) -> None:
+    def save_proposals_to_cache(
+        self,
+        event_id: str,
+        proposals: List[Dict[str, Any]],
+        fingerprint: Optional[str] = None
+    ) -> None:
         """
         Save generated proposals to database.
-        Replaces any existing proposals for this event.
+        Replaces any existing proposals for this event and records the input
+        fingerprint they were generated from (defaults to the fingerprint of
+        this instance's last propose_times call for the event).
         """
         try:
             print(f"[TIME_PROPOSAL_CACHE] Saving {len(proposals)} proposals for event {event_id}")
@@ -806,11 +891,16 @@ Return ONLY the JSON array, no other text or markdown formatting.
                     .execute()
             
             # Update events table
+            event_update = {
+                "proposals_needs_regeneration": False,
+                "proposals_last_generated_at": datetime.utcnow().isoformat()
+            }
+            fingerprint = fingerprint or self._generated_fingerprints.get(event_id)
+            if fingerprint:
+                event_update["proposals_input_fingerprint"] = fingerprint
+
             self.service_role_client.table("events") \
-                .update({
-                    "proposals_needs_regeneration": False,
-                    "proposals_last_generated_at": datetime.utcnow().isoformat()
-                }) \
+                .update(event_update) \
                 .eq("id", event_id) \
                 .execute()
             
@@ -822,7 +912,11 @@ Return ONLY the JSON array, no other text or markdown formatting.
     
     def mark_proposals_stale(self, event_id: str) -> None:
         """
-        Mark proposals as needing regeneration (for background job).
+        Mark proposals as needing regeneration and schedule a debounced background job.
+
+        Bursts of invalidations (slot drags, participant changes, calendar syncs)
+        collapse into one regeneration that runs after the quiet period and sees
+        the latest inputs.
         """
         try:
             print(f"[TIME_PROPOSAL_CACHE] Marking proposals as stale for event {event_id}")
@@ -837,22 +931,96 @@ Return ONLY the JSON array, no other text or markdown formatting.
         except Exception as e:
             print(f"[TIME_PROPOSAL_CACHE] Error marking proposals as stale: {str(e)}")
             # Don't raise - this is not critical
+            return
+
+        try:
+            from ..background_jobs.job_queue import JobQueue, debounce_proposal_regeneration
+
+            debounce_proposal_regeneration(event_id, queue=JobQueue(self.service_role_client))
+        except Exception as e:
+            print(f"[TIME_PROPOSAL_CACHE] Error scheduling regeneration: {str(e)}")
+            # Don't raise - the periodic sweep still picks up flagged events
     
-    def regenerate_proposals_immediately(self, event_id: str, num_suggestions: int = 5) -> List[Dict[str, Any]]:
+    def prioritize_regeneration(self, event_id: str) -> None:
         """
-        Force immediate regeneration and save to cache.
-        Used for participant join/leave and manual refresh.
+        Move the event's background regeneration to the front of the queue,
+        because a participant is looking at its stale proposals right now.
         """
-        print(f"[TIME_PROPOSAL_CACHE] Force regenerating proposals for event {event_id}")
-        
-        # Generate fresh proposals
-        proposals = self.propose_times(event_id, num_suggestions)
-        
-        # Save to cache
-        self.save_proposals_to_cache(event_id, proposals)
-        
-        return proposals
-    
+        try:
+            from ..background_jobs.job_queue import PRIORITY_INTERACTIVE, JobQueue, enqueue_proposal_regeneration
+
+            enqueue_proposal_regeneration(
+                event_id, priority=PRIORITY_INTERACTIVE, queue=JobQueue(self.service_role_client)
+            )
+        except Exception as e:
+            print(f"[TIME_PROPOSAL_CACHE] Error prioritizing regeneration: {str(e)}")
+            # Don't raise - the periodic sweep still picks the event up
+
+    def regenerate_proposals_immediately(
+        self,
+        event_id: str,
+        num_suggestions: int = 5,
+        force: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Regenerate proposals and save to cache.
+        Used for participant join/leave, background refresh and manual refresh.
+
+        With force=False, regeneration (and the Gemini call) is skipped when
+        the input fingerprint matches the cached proposals; the stale flag is
+        cleared and the cached proposals are returned instead.
+        """
+        for stage, payload in self.stream_regenerated_proposals(event_id, num_suggestions, force):
+            if stage == "final":
+                return payload["proposals"]
+        return []
+
+    def stream_regenerated_proposals(
+        self,
+        event_id: str,
+        num_suggestions: int = 5,
+        force: bool = True,
+        cached: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streaming form of regenerate_proposals_immediately.
+
+        Yields the stages of _iter_proposal_stages as they complete; the
+        "final" proposals are saved to cache before they are yielded. When
+        force=False and inputs are unchanged, only "final" is yielded, with
+        the cached proposals and ``"cached": True``. ``cached`` passes cached
+        proposals the caller already read, so they are not fetched again.
+        Participant data is aggregated and fingerprinted once.
+        """
+        data = self._aggregate_participant_data(event_id)
+
+        if not data:
+            raise Exception("Failed to aggregate event data")
+
+        fingerprint = self.compute_input_fingerprint(data)
+        if not force and fingerprint == data["event"].get("proposals_input_fingerprint"):
+            cached = cached or self.get_cached_proposals(event_id).get("proposals")
+            if cached:
+                print(f"[TIME_PROPOSAL_CACHE] Inputs unchanged for event {event_id}, keeping cached proposals")
+                self._mark_proposals_fresh(event_id)
+                yield "final", {"proposals": cached, "cached": True}
+                return
+
+        print(f"[TIME_PROPOSAL_CACHE] Regenerating proposals for event {event_id}")
+
+        # Generate fresh proposals, saving them to cache before they are reported
+        for stage, payload in self._iter_proposal_stages(data, num_suggestions, fingerprint=fingerprint):
+            if stage == "final":
+                self.save_proposals_to_cache(event_id, payload["proposals"])
+            yield stage, payload
+
+    def _mark_proposals_fresh(self, event_id: str) -> None:
+        """Clear the stale flag without touching the cached proposals."""
+        self.service_role_client.table("events") \
+            .update({"proposals_needs_regeneration": False}) \
+            .eq("id", event_id) \
+            .execute()
+
     def should_regenerate(self, event_id: str) -> Dict[str, Any]:
         """
         Check if proposals need regeneration.
@@ -868,7 +1036,7 @@ Return ONLY the JSON array, no other text or markdown formatting.
         try:
             # Query events table for flags
             response = self.service_role_client.table("events") \
-                .select("proposals_needs_regeneration, proposals_last_generated_at") \
+                .select("proposals_needs_regeneration, proposals_last_generated_at, proposals_input_fingerprint") \
                 .eq("id", event_id) \
                 .execute()
 
@@ -906,9 +1074,14 @@ Return ONLY the JSON array, no other text or markdown formatting.
                 if all_expired:
                     print(f"[TIME_PROPOSAL_CACHE] All proposals for event {event_id} are expired")
 
+            # A stale flag is a false alarm if the proposal inputs did not change
+            flagged = event_data.get("proposals_needs_regeneration", True)
+            if flagged and has_proposals and not all_expired:
+                flagged = not self._inputs_unchanged(event_id, event_data.get("proposals_input_fingerprint"))
+
             # Needs regeneration if flagged, no proposals, or all expired
             needs_regeneration = (
-                event_data.get("proposals_needs_regeneration", True) or
+                flagged or
                 not has_proposals or
                 all_expired
             )
@@ -928,3 +1101,19 @@ Return ONLY the JSON array, no other text or markdown formatting.
                 "all_expired": False,
                 "last_generated_at": None
             }
+
+    def _inputs_unchanged(self, event_id: str, stored_fingerprint: Optional[str]) -> bool:
+        """
+        Compare the stored fingerprint with the current inputs.
+        Clears the stale flag and returns True when they match.
+        """
+        if not stored_fingerprint:
+            return False
+
+        data = self._aggregate_participant_data(event_id)
+        if not data or self.compute_input_fingerprint(data) != stored_fingerprint:
+            return False
+
+        print(f"[TIME_PROPOSAL_CACHE] Inputs unchanged for event {event_id}, clearing stale flag")
+        self._mark_proposals_fresh(event_id)
+        return True
@@ -1,10 +1,7 @@
-import os
 from typing import Any, Dict, List, Optional
 
-from supabase import create_client
-
 from ..utils.email_utils import normalize_email
-from ..utils.supabase_client import get_supabase
+from ..utils.supabase_client import get_service_role_client, get_supabase
 
 
 class UsersService:
@@ -12,14 +9,7 @@ class UsersService:
 
     def __init__(self, access_token: Optional[str] = None):
         self.supabase = get_supabase(access_token)
-
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-        if supabase_url and supabase_service_key:
-            self.service_role_client = create_client(supabase_url, supabase_service_key)
-        else:
-            self.service_role_client = self.supabase
+        self.service_role_client = get_service_role_client() or self.supabase
 
     def create_profile(self, user_id: str, profile_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a profile row for a given authenticated user id."""
@@ -8,7 +8,7 @@ from typing import Any, Dict, Optional, Tuple
 from flask import redirect, request
 
 from ..services.google_calendar import get_auth_url
-from .supabase_client import get_supabase
+from .supabase_client import get_supabase, new_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,7 @@ def login():
 def logout(access_token: str) -> Tuple[bool, Optional[str]]:
     """Log out a user by invalidating their session."""
     try:
-        supabase = get_supabase()
-        supabase.auth.sign_out(access_token)
+        new_supabase_client().auth.sign_out(access_token)
         return True, None
     except Exception as e:
         return False, f"Logout failed: {str(e)}"
@@ -29,8 +28,7 @@ def logout(access_token: str) -> Tuple[bool, Optional[str]]:
 def refresh_session(refresh_token: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """Refresh a user's session using their refresh token."""
     try:
-        supabase = get_supabase()
-        response = supabase.auth.refresh_session({"refresh_token": refresh_token})
+        response = new_supabase_client().auth.refresh_session({"refresh_token": refresh_token})
         session = response.session
         return {
             "access_token": session.access_token,
@@ -8,6 +8,7 @@ from functools import wraps
 from flask import jsonify, make_response, request
 
 from .supabase_client import get_supabase
+from .token_verifier import get_token_verifier
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,8 @@ logger = logging.getLogger(__name__)
 def require_auth(f):
     """
     Decorator to require authentication for a route.
-    Verifies the JWT token with Supabase and adds the user to the request context.
+    Verifies the JWT token (locally when possible, otherwise with Supabase Auth)
+    and adds the user to the request context.
     """
     @wraps(f)
     def decorated(*args, **kwargs):
@@ -39,16 +41,14 @@ def require_auth(f):
             token = auth_header.split(" ")[1]
             logger.info(f"require_auth: Token extracted (length={len(token)})")
 
-            supabase = get_supabase()
-            logger.info("require_auth: Verifying token with Supabase...")
-            user = supabase.auth.get_user(token)
-            logger.info(f"require_auth: Token verified, user_id={user.user.id if user.user else 'None'}")
+            user = get_token_verifier().verify(token, _get_user_from_supabase)
+            logger.info(f"require_auth: Token verified, user_id={user.id if user else 'None'}")
 
-            request.user = user.user
+            request.user = user
             request.access_token = token
             logger.info(f"Authenticated user id: {getattr(request.user, 'id', 'unknown')}")
 
-            return f(*args, user_id=user.user.id, **kwargs)
+            return f(*args, user_id=user.id, **kwargs)
 
         except IndexError:
             logger.error(f"require_auth: Invalid authorization header format: {auth_header[:20]}...")
@@ -70,6 +70,12 @@ def require_auth(f):
     return decorated
 
 
+def _get_user_from_supabase(token: str):
+    """Remote fallback: verify the token with Supabase Auth."""
+    logger.info("require_auth: Verifying token with Supabase...")
+    return get_supabase().auth.get_user(token).user
+
+
 def _handle_cors_preflight():
     """Handle CORS preflight OPTIONS request."""
     origin = request.headers.get("Origin", "*")
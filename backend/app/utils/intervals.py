@@ -0,0 +1,114 @@
+"""
+Interval helpers for availability calculations.
+
+Busy slots arrive from Supabase as ISO strings (or BusySlot models). These
+helpers parse them once into sorted ``(start, end)`` tuples so callers can
+sweep over them instead of re-parsing per candidate time.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Tuple, TypeVar
+
+Interval = Tuple[datetime, datetime]
+T = TypeVar("T")
+
+
+def parse_utc(value: Any) -> datetime:
+    """Parse an ISO string or datetime into a timezone-aware UTC datetime."""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def format_utc(value: datetime) -> str:
+    """Format a datetime as the ``YYYY-MM-DDTHH:MM:SSZ`` strings stored for slots."""
+    return parse_utc(value).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def slot_interval(slot: Any) -> Interval:
+    """Return the (start, end) interval of a busy slot dict or BusySlot model."""
+    if hasattr(slot, "get_start_time_utc"):
+        return parse_utc(slot.get_start_time_utc()), parse_utc(slot.get_end_time_utc())
+    return parse_utc(slot.get("start_time_utc", "")), parse_utc(slot.get("end_time_utc", ""))
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Merge overlapping or touching intervals into a sorted union timeline."""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def iter_free_windows(
+    candidates: Iterable[Interval],
+    busy_timeline: List[Interval],
+) -> Iterator[Interval]:
+    """
+    Yield the candidate windows that do not overlap the busy timeline.
+
+    ``candidates`` must be in ascending order of start and end time and
+    ``busy_timeline`` must be the output of ``merge_intervals``; a single
+    pointer then walks both lists once.
+    """
+    index = 0
+    busy_count = len(busy_timeline)
+
+    for window_start, window_end in candidates:
+        while index < busy_count and busy_timeline[index][1] <= window_start:
+            index += 1
+
+        if index < busy_count and busy_timeline[index][0] < window_end:
+            continue
+
+        yield window_start, window_end
+
+
+def sweep_participant_counts(
+    intervals: Iterable[Tuple[T, T, Hashable]],
+) -> List[Tuple[T, T, int]]:
+    """
+    Split ``(start, end, user_id)`` intervals into segments with a busy-user count.
+
+    Returns ``(start, end, count)`` for every span between consecutive boundary
+    times where at least one user is busy. Users are reference-counted, so
+    overlapping intervals from the same user count once and only stop counting
+    when the user's last interval ends. Works for any ordered time type
+    (datetimes or epoch minutes) in O(n log n).
+    """
+    events = []
+    for start, end, user_id in intervals:
+        if start < end:
+            events.append((start, 1, user_id))
+            events.append((end, -1, user_id))
+
+    events.sort(key=lambda event: (event[0], event[1]))
+
+    segments: List[Tuple[T, T, int]] = []
+    ref_counts: Dict[Hashable, int] = {}
+    active_users = 0
+    prev_time = None
+
+    for event_time, delta, user_id in events:
+        if prev_time is not None and prev_time < event_time and active_users:
+            segments.append((prev_time, event_time, active_users))
+
+        count = ref_counts.get(user_id, 0)
+        if delta == 1 and count == 0:
+            active_users += 1
+        elif delta == -1 and count == 1:
+            active_users -= 1
+        ref_counts[user_id] = count + delta
+
+        prev_time = event_time
+
+    return segments
@@ -0,0 +1,190 @@
+"""
+Token-bucket rate limiting for the Gemini API.
+
+Every Gemini call charges one request against the RPM bucket and its
+estimated token count against the TPM bucket. With
+GEMINI_RATE_LIMIT_BACKEND=postgres (default) the buckets live in
+``rate_limit_buckets`` (migration 016) and are shared by all web and worker
+processes, so the project-wide quota holds however many workers run. With
+``local`` each process keeps its own buckets (development, tests); the
+postgres backend also falls back to them when the RPC is unavailable.
+
+Buckets start full and refill continuously, so bursts up to the per-minute
+quota go out immediately and sustained load is paced at exactly the quota.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from ..config import Config
+from .supabase_client import get_service_role_client
+
+logger = logging.getLogger(__name__)
+
+# After a shared-bucket failure, limit per process for this long before retrying
+SHARED_RETRY_SECONDS = 60
+# Rough prompt size estimate used to reserve TPM before the call
+CHARS_PER_TOKEN = 4
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call cannot get a slot within its wait budget."""
+
+
+@dataclass(frozen=True)
+class Bucket:
+    name: str
+    capacity: float
+    refill_per_second: float
+
+    @classmethod
+    def per_minute(cls, name: str, limit: float) -> "Bucket":
+        return cls(name=name, capacity=float(limit), refill_per_second=limit / 60.0)
+
+
+class LocalBuckets:
+    """In-process token buckets with the same semantics as the acquire_rate_limit RPC."""
+
+    def __init__(self):
+        self._tokens: Dict[str, float] = {}
+        self._updated: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, buckets: List[Bucket], costs: List[float], force: bool = False) -> float:
+        with self._lock:
+            now = time.monotonic()
+            available = []
+            wait = 0.0
+            for bucket, cost in zip(buckets, costs):
+                tokens = self._tokens.get(bucket.name, bucket.capacity)
+                elapsed = now - self._updated.get(bucket.name, now)
+                tokens = min(bucket.capacity, tokens + elapsed * bucket.refill_per_second)
+                available.append(tokens)
+                needed = min(cost, bucket.capacity)
+                if not force and tokens < needed:
+                    wait = max(wait, (needed - tokens) / bucket.refill_per_second)
+
+            if wait > 0:
+                return wait
+
+            for bucket, cost, tokens in zip(buckets, costs, available):
+                self._tokens[bucket.name] = tokens - cost
+                self._updated[bucket.name] = now
+            return 0.0
+
+
+class PostgresBuckets:
+    """Buckets shared across processes through the acquire_rate_limit RPC."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def acquire(self, buckets: List[Bucket], costs: List[float], force: bool = False) -> float:
+        result = self.client.rpc("acquire_rate_limit", {
+            "p_names": [b.name for b in buckets],
+            "p_costs": costs,
+            "p_capacities": [b.capacity for b in buckets],
+            "p_refill_per_second": [b.refill_per_second for b in buckets],
+            "p_force": force,
+        }).execute()
+        return float(result.data or 0)
+
+
+class RateLimiter:
+    """Blocks callers until a request and its tokens fit in the RPM/TPM buckets."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, backend=None, name: str = "gemini"):
+        self.requests = Bucket.per_minute(f"{name}:rpm", requests_per_minute)
+        self.tokens = Bucket.per_minute(f"{name}:tpm", tokens_per_minute)
+        self.local = LocalBuckets()
+        self.backend = backend or self.local
+        self._shared_retry_at = 0.0
+        self._stats_lock = threading.Lock()
+        self.stats = {"acquired": 0, "waits": 0, "wait_seconds": 0.0, "rejected": 0}
+
+    def acquire(self, tokens: float, max_wait_seconds: Optional[float] = None) -> float:
+        """
+        Reserve one request and ``tokens`` tokens, sleeping until they are available.
+
+        Returns the seconds spent waiting. Raises RateLimitExceeded if the wait
+        would exceed ``max_wait_seconds``.
+        """
+        started = time.monotonic()
+        while True:
+            wait = self._take([1.0, float(tokens)])
+            waited = time.monotonic() - started
+            if wait <= 0:
+                self._record(waited=waited)
+                return waited
+
+            if max_wait_seconds is not None and waited + wait > max_wait_seconds:
+                self._record(rejected=True)
+                raise RateLimitExceeded(
+                    f"Gemini API rate limit exceeded (next slot in {wait:.1f}s). Please try again later."
+                )
+            time.sleep(wait)
+
+    def record_usage(self, estimated_tokens: float, actual_tokens: Optional[float]) -> None:
+        """Charge (or refund) the difference between estimated and reported token usage."""
+        if not isinstance(actual_tokens, (int, float)) or actual_tokens == estimated_tokens:
+            return
+        try:
+            self.backend.acquire([self.tokens], [float(actual_tokens - estimated_tokens)], force=True)
+        except Exception as e:
+            logger.warning(f"[RATE_LIMIT] Could not record token usage: {e}")
+
+    def _take(self, costs: List[float]) -> float:
+        buckets = [self.requests, self.tokens]
+        if self.backend is not self.local and time.monotonic() >= self._shared_retry_at:
+            try:
+                return self.backend.acquire(buckets, costs)
+            except Exception as e:
+                # Shared buckets unavailable (e.g. migration 016 not applied): limit this process alone
+                self._shared_retry_at = time.monotonic() + SHARED_RETRY_SECONDS
+                logger.warning(f"[RATE_LIMIT] Shared rate limit unavailable, using per-process buckets: {e}")
+        return self.local.acquire(buckets, costs)
+
+    def _record(self, waited: float = 0.0, rejected: bool = False) -> None:
+        with self._stats_lock:
+            if rejected:
+                self.stats["rejected"] += 1
+                return
+            self.stats["acquired"] += 1
+            if waited > 0:
+                self.stats["waits"] += 1
+                self.stats["wait_seconds"] += waited
+
+
+def estimate_gemini_tokens(prompt: str) -> int:
+    """Tokens to reserve for a call: the prompt plus the expected response."""
+    return len(prompt) // CHARS_PER_TOKEN + Config.GEMINI_OUTPUT_TOKENS_ESTIMATE
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_gemini_rate_limiter() -> RateLimiter:
+    """Return the process-wide Gemini limiter, creating it from Config on first use."""
+    global _limiter
+
+    with _limiter_lock:
+        if _limiter is None:
+            backend = None
+            if Config.GEMINI_RATE_LIMIT_BACKEND == "postgres":
+                client = get_service_role_client()
+                if client is not None:
+                    backend = PostgresBuckets(client)
+            _limiter = RateLimiter(Config.GEMINI_RPM, Config.GEMINI_TPM, backend=backend)
+        return _limiter
+
+
+def reset_gemini_rate_limiter() -> None:
+    """Drop the process-wide limiter (used by tests and after quota changes)."""
+    global _limiter
+
+    with _limiter_lock:
+        _limiter = None
@@ -1,31 +1,97 @@
 """
 Supabase client management.
+
+Clients are cached process-wide in a thread-safe registry keyed by
+(url, key), so the anon and service-role clients are each built once per
+worker process. All of them share a single pooled httpx client (keep-alive,
+HTTP/2 when the ``h2`` package is installed), so PostgREST calls reuse warm
+connections instead of opening a new one per service instance.
 """
 
 import logging
 import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from supabase import Client, ClientOptions, create_client
 
-from supabase import Client, create_client
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
-_supabase_client = None
+_clients: Dict[Tuple[str, str], Client] = {}
+_clients_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
 
 
-def init_supabase(config_name="development") -> None:
-    """Initialize the Supabase client with configuration."""
-    global _supabase_client
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
-    if _supabase_client is not None:
-        return
+def _get_http_client() -> httpx.Client:
+    """Return the shared pooled HTTP client, creating it on first use. Caller holds _clients_lock."""
+    global _http_client
 
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=_http2_available(),
+            follow_redirects=True,
+            timeout=httpx.Timeout(Config.SUPABASE_HTTP_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=Config.SUPABASE_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.SUPABASE_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=Config.SUPABASE_POOL_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _http_client
+
+
+def get_client(url: str, key: str) -> Client:
+    """
+    Get the shared Supabase client for ``url`` and ``key``.
+
+    Shared clients never persist or auto-refresh an auth session, so a
+    session-changing auth call cannot swap the key used by other requests;
+    use ``new_supabase_client`` for those.
+    """
+    with _clients_lock:
+        client = _clients.get((url, key))
+        if client is None:
+            options = ClientOptions(
+                httpx_client=_get_http_client(),
+                auto_refresh_token=False,
+                persist_session=False,
+            )
+            client = create_client(url, key, options=options)
+            _clients[(url, key)] = client
+        return client
+
+
+def reset_clients() -> None:
+    """Drop cached clients and close pooled connections (e.g. after forking a worker)."""
+    global _http_client
+
+    with _clients_lock:
+        _clients.clear()
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def init_supabase(config_name="development") -> None:
+    """Initialize the shared anon Supabase client."""
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_ANON_KEY")
 
     if not url or not key:
         raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY must be set")
 
-    _supabase_client = create_client(url, key)
+    get_client(url, key)
 
 
 def get_supabase(access_token=None) -> Client:
@@ -45,4 +111,30 @@ def get_supabase(access_token=None) -> Client:
     if not url or not key:
         raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (or ANON_KEY) must be set")
 
-    return create_client(url, key)
\ No newline at end of file
+    return get_client(url, key)
+
+
+def get_service_role_client() -> Optional[Client]:
+    """Get the shared service-role client, or None when the service role key is not configured."""
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+
+    if not url or not key:
+        return None
+    return get_client(url, key)
+
+
+def new_supabase_client() -> Client:
+    """
+    Create an unshared client for auth calls that change session state
+    (refresh_session, sign_out). It still uses the pooled connections.
+    """
+    url = os.environ.get("SUPABASE_URL")
+    key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY") or os.environ.get("SUPABASE_ANON_KEY")
+
+    if not url or not key:
+        raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (or ANON_KEY) must be set")
+
+    with _clients_lock:
+        http_client = _get_http_client()
+    return create_client(url, key, options=ClientOptions(httpx_client=http_client, persist_session=False))
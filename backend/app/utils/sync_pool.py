@@ -0,0 +1,77 @@
+"""
+Bounded fan-out for calendar sync.
+
+Calendar syncs are dominated by provider round trips, so independent work
+(participants of an event, calendar sources of a user) runs on a small
+thread pool. Provider calls additionally take a per-provider slot so
+concurrent syncs never exceed the configured Google / Microsoft limits,
+regardless of how many pools are active at once.
+
+Slots are only taken around leaf provider work, never while waiting on a
+pool, so nested fan-out (participants -> sources) cannot deadlock.
+"""
+
+from ..config import Config
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, TypeVar
+
+from flask import current_app, has_app_context
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+_provider_slots_lock = threading.Lock()
+
+
+def _provider_limit(provider: str) -> int:
+    if provider == "microsoft":
+        return Config.CALENDAR_SYNC_MICROSOFT_CONCURRENCY
+    return Config.CALENDAR_SYNC_GOOGLE_CONCURRENCY
+
+
+@contextmanager
+def provider_slot(provider: str) -> Iterator[None]:
+    """Hold one of the provider's concurrent request slots for the block."""
+    with _provider_slots_lock:
+        semaphore = _provider_slots.get(provider)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(_provider_limit(provider), 1))
+            _provider_slots[provider] = semaphore
+
+    with semaphore:
+        yield
+
+
+def run_bounded(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int = 0,
+) -> List[R]:
+    """
+    Apply ``func`` to every item on a bounded thread pool.
+
+    Results are returned in input order. ``func`` is expected to handle its
+    own errors (sync code reports failures as result dicts); an uncaught
+    exception propagates to the caller. Single items run inline, and the
+    Flask app context is pushed in worker threads when one is active.
+    """
+    max_workers = max_workers or Config.CALENDAR_SYNC_MAX_WORKERS
+    workers = min(max_workers, len(items))
+
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    app = current_app._get_current_object() if has_app_context() else None
+
+    def call(item: T) -> R:
+        if app is None:
+            return func(item)
+        with app.app_context():
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="calendar-sync") as executor:
+        return list(executor.map(call, items))
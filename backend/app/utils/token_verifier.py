@@ -0,0 +1,231 @@
+"""
+Local verification of Supabase access tokens.
+
+require_auth used to call Supabase Auth (``auth.get_user``) on every request.
+Tokens are now verified in-process when possible:
+
+- HS256 tokens with the project's JWT secret (SUPABASE_JWT_SECRET)
+- RS256/ES256 tokens with the project's JWKS (SUPABASE_JWKS_URL), fetched at
+  startup and cached by kid
+
+Signature, expiry and audience are checked. A token that fails any check is
+rejected without a network call; a token the verifier cannot decide on (no
+key configured, unknown kid/algorithm) falls back to Supabase Auth. Verified
+users are kept in an LRU cache whose entries never outlive the token's exp.
+
+A revoked session stays accepted until its token expires, which is the same
+guarantee any JWT-based API gives.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import jwt
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+_ASYMMETRIC_ALGORITHMS = {"RS256", "ES256"}
+
+
+@dataclass(frozen=True)
+class VerifiedUser:
+    """User fields carried by a Supabase access token (mirrors the Auth user attributes routes read)."""
+
+    id: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    role: Optional[str] = None
+    aud: Optional[str] = None
+    is_anonymous: bool = False
+    app_metadata: Dict[str, Any] = field(default_factory=dict)
+    user_metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_claims(cls, claims: Dict[str, Any]) -> "VerifiedUser":
+        return cls(
+            id=claims["sub"],
+            email=claims.get("email"),
+            phone=claims.get("phone"),
+            role=claims.get("role"),
+            aud=claims.get("aud"),
+            is_anonymous=bool(claims.get("is_anonymous", False)),
+            app_metadata=claims.get("app_metadata") or {},
+            user_metadata=claims.get("user_metadata") or {},
+        )
+
+
+class TokenCache:
+    """Thread-safe LRU cache of verified users with per-entry expiry."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Any]:
+        key = self.key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user
+
+    def put(self, token: str, user: Any, expires_at: float) -> None:
+        if self.max_size <= 0 or expires_at <= time.time():
+            return
+        key = self.key(token)
+        with self._lock:
+            self._entries[key] = (user, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TokenVerifier:
+    """Verifies access tokens locally, falling back to a remote check when undecidable."""
+
+    def __init__(
+        self,
+        jwt_secret: Optional[str] = None,
+        jwks_url: Optional[str] = None,
+        audience: str = "authenticated",
+        cache_size: int = 2048,
+        cache_ttl_seconds: int = 300,
+    ):
+        self.jwt_secret = jwt_secret
+        self.audience = audience
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache = TokenCache(cache_size)
+        self._jwks_client = jwt.PyJWKClient(jwks_url, cache_keys=True) if jwks_url else None
+
+    @classmethod
+    def from_config(cls) -> "TokenVerifier":
+        return cls(
+            jwt_secret=Config.SUPABASE_JWT_SECRET,
+            jwks_url=Config.SUPABASE_JWKS_URL,
+            audience=Config.SUPABASE_JWT_AUDIENCE,
+            cache_size=Config.AUTH_TOKEN_CACHE_SIZE,
+            cache_ttl_seconds=Config.AUTH_TOKEN_CACHE_TTL_SECONDS,
+        )
+
+    def load_keys(self) -> None:
+        """Fetch the JWKS up front so the first requests don't pay for it."""
+        if self._jwks_client is None:
+            return
+        try:
+            self._jwks_client.get_signing_keys()
+        except jwt.PyJWKClientError as e:
+            logger.warning(f"[AUTH] Could not load JWKS, will retry on demand: {e}")
+
+    def verify(self, token: str, remote_verify: Callable[[str], Any]) -> Any:
+        """
+        Return the user for ``token``.
+
+        Raises jwt.InvalidTokenError when local verification rejects the token;
+        ``remote_verify`` is only called when the token cannot be checked locally.
+        """
+        user = self.cache.get(token)
+        if user is not None:
+            return user
+
+        claims = self.verify_locally(token)
+        if claims is not None:
+            user = VerifiedUser.from_claims(claims)
+            self.cache.put(token, user, self._cache_expiry(claims.get("exp")))
+            return user
+
+        user = remote_verify(token)
+        if user is not None:
+            self.cache.put(token, user, self._cache_expiry(self._unverified_exp(token)))
+        return user
+
+    def verify_locally(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return verified claims, None when no local key applies, or raise if the token is invalid."""
+        header = jwt.get_unverified_header(token)
+        algorithm = header.get("alg")
+
+        if algorithm == "HS256":
+            if not self.jwt_secret:
+                return None
+            key = self.jwt_secret
+        elif algorithm in _ASYMMETRIC_ALGORITHMS:
+            if self._jwks_client is None:
+                return None
+            try:
+                key = self._jwks_client.get_signing_key_from_jwt(token).key
+            except jwt.PyJWKClientError as e:
+                logger.info(f"[AUTH] No local key for token ({e}), verifying remotely")
+                return None
+        else:
+            return None
+
+        return jwt.decode(
+            token,
+            key,
+            algorithms=[algorithm],
+            audience=self.audience,
+            options={"require": ["exp", "sub"]},
+        )
+
+    def _cache_expiry(self, exp: Optional[float]) -> float:
+        expires_at = time.time() + self.cache_ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        return expires_at
+
+    @staticmethod
+    def _unverified_exp(token: str) -> Optional[float]:
+        try:
+            return jwt.decode(token, options={"verify_signature": False}).get("exp")
+        except jwt.InvalidTokenError:
+            return None
+
+
+_verifier: Optional[TokenVerifier] = None
+_verifier_lock = threading.Lock()
+
+
+def get_token_verifier() -> TokenVerifier:
+    """Return the process-wide verifier, creating it from Config on first use."""
+    global _verifier
+
+    with _verifier_lock:
+        if _verifier is None:
+            _verifier = TokenVerifier.from_config()
+        return _verifier
+
+
+def init_token_verifier() -> None:
+    """Create the verifier and load signing keys at app startup."""
+    get_token_verifier().load_keys()
+
+
+def reset_token_verifier() -> None:
+    """Drop the verifier and its cache (used by tests and after key rotation)."""
+    global _verifier
+
+    with _verifier_lock:
+        _verifier = None
@@ -0,0 +1,67 @@
+"""
+API endpoint tests for calendar accounts routes.
+Tests that credentials and incremental sync state never reach clients.
+"""
+
+from unittest.mock import patch
+
+
+def _account():
+    return {
+        "id": "acct-1",
+        "user_id": "user-1",
+        "provider": "google",
+        "credentials": {"token": "secret"},
+        "calendar_sources": [
+            {
+                "id": "src-1",
+                "calendar_name": "Work",
+                "sync_token": "token-1",
+                "sync_window_start": "2025-12-20T00:00:00+00:00",
+                "sync_window_end": "2026-01-03T00:00:00+00:00",
+            },
+        ],
+    }
+
+
+def _assert_no_secrets(account):
+    assert "credentials" not in account
+    for source in account["calendar_sources"]:
+        assert source["calendar_name"] == "Work"
+        assert "sync_token" not in source
+        assert "sync_window_start" not in source
+        assert "sync_window_end" not in source
+
+
+class TestGetAccounts:
+    """Test GET /api/calendar-accounts endpoint."""
+
+    def test_sources_omit_sync_state(self, client, auth_headers):
+        """Test listed accounts hide credentials and their sources' sync tokens and windows."""
+        # Arrange
+        with patch("app.routes.calendar_accounts.CalendarAccountsService") as service_class:
+            service_class.return_value.get_user_accounts.return_value = [_account()]
+
+            # Act
+            response = client.get("/api/calendar-accounts/", headers=auth_headers)
+
+        # Assert
+        assert response.status_code == 200
+        _assert_no_secrets(response.get_json()["accounts"][0])
+
+
+class TestGetAccount:
+    """Test GET /api/calendar-accounts/<account_id> endpoint."""
+
+    def test_sources_omit_sync_state(self, client, auth_headers):
+        """Test a single account hides credentials and its sources' sync tokens and windows."""
+        # Arrange
+        with patch("app.routes.calendar_accounts.CalendarAccountsService") as service_class:
+            service_class.return_value.get_account.return_value = _account()
+
+            # Act
+            response = client.get("/api/calendar-accounts/acct-1", headers=auth_headers)
+
+        # Assert
+        assert response.status_code == 200
+        _assert_no_secrets(response.get_json())
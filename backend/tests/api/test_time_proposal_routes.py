@@ -3,6 +3,8 @@ API endpoint tests for time proposal routes.
 Tests AI-powered time proposal generation with authorization checks.
 """
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -524,6 +526,133 @@ class TestProposeTimes:
             assert "passed" in data["message"].lower()
 
 
+def _sse_events(response):
+    """Parse a text/event-stream body into (event, data) pairs."""
+    events = []
+    for message in response.get_data(as_text=True).strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.split("\n"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def _mock_stream_services(mock_events_service, mock_proposal_service, event):
+    mock_events_instance = MagicMock()
+    mock_events_instance.get_event_by_uid.return_value = event
+    mock_events_instance.is_user_participant.return_value = True
+    mock_events_service.return_value = mock_events_instance
+
+    mock_proposal_instance = MagicMock()
+    mock_proposal_service.return_value = mock_proposal_instance
+    return mock_proposal_instance
+
+
+class TestStreamProposeTimes:
+    """Test POST /api/events/<event_uid>/propose-times/stream endpoint."""
+
+    def test_fresh_cache_streams_cached_then_done(self, client, auth_headers, sample_event):
+        """Test fresh cached proposals are streamed without regenerating."""
+        # Arrange
+        event_uid = "abc123xyz456"
+        mock_event = {**sample_event, "uid": event_uid, "coordinator_id": "other-user", "status": "planning",
+                      "proposals_needs_regeneration": False, "proposals_last_generated_at": "2025-01-15T09:00:00Z"}
+        cached = [{"start_time_utc": "2025-01-15T10:00:00Z", "conflicts": 0}]
+
+        with patch("app.routes.time_proposal.EventsService") as mock_events_service, \
+             patch("app.routes.time_proposal.TimeProposalService") as mock_proposal_service:
+            service = _mock_stream_services(mock_events_service, mock_proposal_service, mock_event)
+            service.get_cached_proposals.return_value = {"proposals": cached}
+
+            # Act
+            response = client.post(f"/api/events/{event_uid}/propose-times/stream", json={}, headers=auth_headers)
+
+            # Assert
+            assert response.status_code == 200
+            assert response.mimetype == "text/event-stream"
+            events = _sse_events(response)
+            assert [name for name, _ in events] == ["cached", "done"]
+            assert events[1][1]["proposals"] == cached
+            assert events[1][1]["needs_update"] is False
+            assert events[1][1]["generated_at"] == "2025-01-15T09:00:00Z"
+            service.stream_regenerated_proposals.assert_not_called()
+            service.should_regenerate.assert_not_called()
+
+    def test_stale_cache_streams_each_stage(self, client, auth_headers, sample_event):
+        """Test stale proposals are sent first, followed by local, AI and final proposals."""
+        # Arrange
+        event_uid = "abc123xyz456"
+        mock_event = {**sample_event, "uid": event_uid, "coordinator_id": "other-user", "status": "planning",
+                      "proposals_needs_regeneration": True, "proposals_last_generated_at": "2025-01-15T09:00:00Z"}
+        local = [{"start_time_utc": "2025-01-15T10:00:00Z", "source": "local"}]
+        ai = [{"start_time_utc": "2025-01-15T14:00:00Z", "source": "ai"}]
+
+        with patch("app.routes.time_proposal.EventsService") as mock_events_service, \
+             patch("app.routes.time_proposal.TimeProposalService") as mock_proposal_service:
+            service = _mock_stream_services(mock_events_service, mock_proposal_service, mock_event)
+            service.get_cached_proposals.return_value = {"proposals": local}
+            service.stream_regenerated_proposals.return_value = iter([
+                ("local", {"free_windows": [], "proposals": local}),
+                ("ai", {"proposals": ai}),
+                ("final", {"proposals": ai + local}),
+            ])
+
+            # Act
+            response = client.post(
+                f"/api/events/{event_uid}/propose-times/stream",
+                json={"num_suggestions": 2},
+                headers=auth_headers
+            )
+
+            # Assert
+            events = _sse_events(response)
+            assert [name for name, _ in events] == ["cached", "local", "ai", "done"]
+            assert events[0][1]["needs_update"] is True
+            assert events[2][1]["proposals"] == ai
+            assert events[3][1]["proposals"] == ai + local
+            assert events[3][1]["cached"] is False
+            service.stream_regenerated_proposals.assert_called_once_with(mock_event["id"], 2, force=False, cached=local)
+            service.should_regenerate.assert_not_called()
+
+    def test_generation_error_is_streamed(self, client, auth_headers, sample_event):
+        """Test failures after the stream has started are reported as an error event."""
+        # Arrange
+        event_uid = "abc123xyz456"
+        mock_event = {**sample_event, "uid": event_uid, "coordinator_id": "other-user", "status": "planning"}
+
+        with patch("app.routes.time_proposal.EventsService") as mock_events_service, \
+             patch("app.routes.time_proposal.TimeProposalService") as mock_proposal_service:
+            service = _mock_stream_services(mock_events_service, mock_proposal_service, mock_event)
+            service.get_cached_proposals.return_value = {"proposals": None}
+            service.stream_regenerated_proposals.side_effect = Exception("Event has no participants")
+
+            # Act
+            response = client.post(f"/api/events/{event_uid}/propose-times/stream", json={}, headers=auth_headers)
+
+            # Assert
+            events = _sse_events(response)
+            assert [name for name, _ in events] == ["error"]
+            assert events[0][1]["error"] == "No participants"
+            assert events[0][1]["status"] == 400
+
+    def test_access_checks_apply_before_streaming(self, client, auth_headers, sample_event):
+        """Test unauthorized callers get a plain JSON error, not a stream."""
+        # Arrange
+        event_uid = "abc123xyz456"
+        mock_event = {**sample_event, "uid": event_uid, "coordinator_id": "other-user", "status": "planning"}
+
+        with patch("app.routes.time_proposal.EventsService") as mock_events_service, \
+             patch("app.routes.time_proposal.TimeProposalService") as mock_proposal_service:
+            _mock_stream_services(mock_events_service, mock_proposal_service, mock_event)
+            mock_events_service.return_value.is_user_participant.return_value = False
+
+            # Act
+            response = client.post(f"/api/events/{event_uid}/propose-times/stream", json={}, headers=auth_headers)
+
+            # Assert
+            assert response.status_code == 403
+            assert response.get_json()["error"] == "Access denied"
+            mock_proposal_service.assert_not_called()
+
+
 class TestProposalTestEndpoint:
     """Test GET /api/events/<event_uid>/propose-times/test endpoint."""
 
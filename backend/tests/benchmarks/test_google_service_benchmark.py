@@ -0,0 +1,49 @@
+"""
+Benchmark for Calendar service creation.
+
+Times the one-off load of the cached discovery document at startup, then
+creating services per call with googleapiclient's build(), which reads and
+parses the bundled discovery document every time, against
+build_calendar_service, which reuses the document parsed at startup.
+
+Run with timings printed:
+    pytest tests/benchmarks/test_google_service_benchmark.py -m slow -s
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from app.services import google_calendar
+
+CALLS = 200
+
+
+def _per_call_ms(create, credentials) -> float:
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        create(credentials)
+    return (time.perf_counter() - started) * 1000 / CALLS
+
+
+@pytest.mark.slow
+def test_cached_discovery_document_removes_build_cost():
+    credentials = Credentials(token="token")
+
+    with patch.object(google_calendar, "_discovery_document", None), \
+         patch.object(google_calendar, "_discovery_document_loaded", False):
+        started = time.perf_counter()
+        google_calendar.build_calendar_service(credentials)
+        startup = (time.perf_counter() - started) * 1000
+
+        build = _per_call_ms(lambda creds: google_calendar.build("calendar", "v3", credentials=creds), credentials)
+        cached = _per_call_ms(google_calendar.build_calendar_service, credentials)
+
+    print(
+        f"[BENCHMARK] startup load {startup:.2f} ms | build() {build:.3f} ms/call | "
+        f"build_calendar_service {cached:.3f} ms/call | {build / cached:.1f}x faster"
+    )
+
+    assert cached * 5 < build
@@ -0,0 +1,53 @@
+"""
+Benchmark for the shared interval sweep.
+
+Generates synthetic busy slots for 20 participants and times
+sweep_participant_counts at increasing sizes up to 50k slots. The sweep is
+O(n log n), so a 10x larger input must cost far less than the 100x a
+quadratic segmentation would.
+
+Run with timings printed:
+    pytest tests/benchmarks -m slow -s
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.utils.intervals import sweep_participant_counts
+
+SIZES = [5_000, 50_000]
+
+
+def _generate_busy_slots(count: int, participants: int = 20):
+    rng = random.Random(count)
+    base = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    slots = []
+    for _ in range(count):
+        start = base + timedelta(minutes=15 * rng.randrange(90 * 24 * 4))
+        end = start + timedelta(minutes=15 * rng.randint(1, 8))
+        slots.append((start, end, f"user-{rng.randrange(participants)}"))
+    return slots
+
+
+def _best_of(runs: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.slow
+def test_sweep_scales_to_50k_busy_slots():
+    timings = {}
+    for size in SIZES:
+        slots = _generate_busy_slots(size)
+        timings[size] = _best_of(3, sweep_participant_counts, slots)
+        print(f"[BENCHMARK] sweep_participant_counts n={size}: {timings[size] * 1000:.1f} ms")
+
+    assert timings[50_000] < 5.0
+    assert timings[50_000] / timings[5_000] < 30
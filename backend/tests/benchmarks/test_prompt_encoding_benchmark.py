@@ -0,0 +1,186 @@
+"""
+Benchmark for the compact Gemini prompt encoding.
+
+Builds proposal data from the fixtures in tests/fixtures/sample_events.py,
+then scales it up to many participants, busy slots and days. For each size
+it prints the availability section size for the legacy per-segment lines,
+untruncated and as previously cut off at 30 lines, and for the compact
+encoding, which must always fit the token budget.
+
+Run with sizes printed:
+    pytest tests/benchmarks/test_prompt_encoding_benchmark.py -m slow -s
+
+Gemini latency per prompt size is measured only when GEMINI_BENCHMARK=1 and
+GEMINI_API_KEY are set, because it spends real quota.
+"""
+
+import os
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.config import Config
+from app.services.availability_encoding import estimate_tokens
+from app.services.availability_matrix import AvailabilityMatrix
+from app.services.time_proposal import TimeProposalService
+from app.utils.intervals import parse_utc, sweep_participant_counts
+from tests.fixtures.sample_events import (
+    SAMPLE_AVAILABILITY_SLOTS,
+    SAMPLE_EVENTS,
+    SAMPLE_PREFERENCES,
+    SAMPLE_USERS,
+)
+
+# (name, fixture event, extra participants, extra busy slots, window days)
+SIZES = [
+    ("fixtures", "planning", 0, 0, None),
+    ("team", "planning", 10, 300, 7),
+    ("department", "confirmed", 40, 3_000, 14),
+    ("organization", "confirmed", 150, 20_000, 30),
+]
+
+
+def _build_data(event_key: str, extra_participants: int, extra_busy: int, days):
+    """Proposal data for a fixture event moved into the future, plus synthetic load."""
+    fixture = SAMPLE_EVENTS[event_key]
+    first_day = datetime.fromisoformat(fixture["earliest_date"])
+    last_day = datetime.fromisoformat(fixture["latest_date"])
+    days = days or (last_day - first_day).days + 1
+    start_hour = int(fixture["earliest_hour"][:2])
+    end_hour = int(fixture["latest_hour"][:2])
+
+    start = (datetime.now(timezone.utc) + timedelta(days=1)).replace(hour=start_hour, minute=0, second=0, microsecond=0)
+    end = (start + timedelta(days=days - 1)).replace(hour=end_hour)
+    shift = start - first_day.replace(hour=start_hour, tzinfo=timezone.utc)
+
+    participants = [
+        {"user_id": user["id"], "name": user["full_name"], "timezone": user["timezone"]}
+        for user in SAMPLE_USERS.values()
+    ]
+    zones = [user["timezone"] for user in SAMPLE_USERS.values()]
+    participants += [
+        {"user_id": f"user-{i}", "name": f"Participant {i}", "timezone": zones[i % len(zones)]}
+        for i in range(extra_participants)
+    ]
+
+    def shifted(slot, start_key, end_key):
+        return {
+            "user_id": slot["user_id"],
+            "start_time_utc": (datetime.fromisoformat(slot[start_key].replace("Z", "+00:00")) + shift).isoformat(),
+            "end_time_utc": (datetime.fromisoformat(slot[end_key].replace("Z", "+00:00")) + shift).isoformat(),
+        }
+
+    busy = [shifted(slot, "start_time_utc", "end_time_utc") for slot in SAMPLE_AVAILABILITY_SLOTS]
+    preferred = [shifted(pref, "preferred_start_time_utc", "preferred_end_time_utc") for pref in SAMPLE_PREFERENCES]
+
+    rng = random.Random(extra_busy)
+    for _ in range(extra_busy):
+        slot_start = start + timedelta(days=rng.randrange(days), minutes=15 * rng.randrange((end_hour - start_hour) * 4))
+        busy.append({
+            "user_id": participants[rng.randrange(len(participants))]["user_id"],
+            "start_time_utc": slot_start.isoformat(),
+            "end_time_utc": (slot_start + timedelta(minutes=15 * rng.randint(1, 8))).isoformat(),
+        })
+    for _ in range(extra_participants // 2):
+        slot_start = start + timedelta(days=rng.randrange(days), hours=rng.randrange(end_hour - start_hour))
+        preferred.append({
+            "user_id": participants[rng.randrange(len(participants))]["user_id"],
+            "start_time_utc": slot_start.isoformat(),
+            "end_time_utc": (slot_start + timedelta(hours=1)).isoformat(),
+        })
+
+    return {
+        "event": {
+            "id": fixture["id"],
+            "name": fixture["name"],
+            "duration_minutes": fixture["duration_minutes"],
+            "earliest_datetime_utc": start.isoformat(),
+            "latest_datetime_utc": end.isoformat(),
+        },
+        "participants": participants,
+        "participant_count": len(participants),
+        "all_busy_slots": busy,
+        "all_preferred_slots": preferred,
+    }
+
+
+def _legacy_availability_lines(data: dict):
+    """The availability lines of the previous prompt format, without its 30/10 line cut-offs."""
+    participant_count = data["participant_count"]
+    segments = sweep_participant_counts(
+        (parse_utc(s["start_time_utc"]), parse_utc(s["end_time_utc"]), s["user_id"])
+        for s in data["all_busy_slots"]
+    )
+    busy = [
+        f"{i}. {start.strftime('%Y-%m-%d %H:%M')} to {end.strftime('%H:%M')} UTC - "
+        f"{count} participant{'' if count == 1 else 's'} busy"
+        for i, (start, end, count) in enumerate(segments, 1)
+    ]
+    preferences = Counter(
+        (parse_utc(s["start_time_utc"]), parse_utc(s["end_time_utc"])) for s in data["all_preferred_slots"]
+    )
+    preferred = [
+        f"- {start.strftime('%Y-%m-%d %H:%M')} UTC: {count}/{participant_count} participants prefer this time"
+        for (start, _), count in preferences.most_common()
+    ]
+    return busy, preferred
+
+
+@pytest.fixture
+def service():
+    with patch("app.services.time_proposal.get_supabase", return_value=MagicMock()), \
+         patch("app.services.time_proposal.get_service_role_client", return_value=MagicMock()):
+        yield TimeProposalService()
+
+
+def _availability_section(prompt: str) -> str:
+    return prompt[prompt.index("AVAILABILITY ("):prompt.index("REQUIREMENTS:")]
+
+
+@pytest.mark.slow
+def test_compact_encoding_fits_budget_at_every_size(service):
+    for name, event_key, extra_participants, extra_busy, days in SIZES:
+        data = _build_data(event_key, extra_participants, extra_busy, days)
+        data["availability"] = AvailabilityMatrix.from_data(data)
+        data["free_windows"] = service._calculate_free_windows(data)
+
+        started = time.perf_counter()
+        prompt = service._format_gemini_prompt(data, 5)
+        elapsed = time.perf_counter() - started
+
+        busy_lines, preferred_lines = _legacy_availability_lines(data)
+        legacy_full = estimate_tokens("\n".join(busy_lines + preferred_lines))
+        legacy_cut = estimate_tokens("\n".join(busy_lines[:30] + preferred_lines[:10]))
+        dropped = max(len(busy_lines) - 30, 0) + max(len(preferred_lines) - 10, 0)
+        compact = estimate_tokens(_availability_section(prompt))
+        print(
+            f"[BENCHMARK] {name}: {data['participant_count']} participants, {len(data['all_busy_slots'])} busy slots | "
+            f"legacy {legacy_full} tokens ({legacy_cut} after cut-off, {dropped} lines dropped) | "
+            f"compact {compact} tokens | prompt {estimate_tokens(prompt)} tokens | {elapsed * 1000:.1f} ms"
+        )
+
+        # The section adds a fixed legend to the encoded lines
+        assert compact <= Config.GEMINI_PROMPT_AVAILABILITY_TOKENS + 150
+        assert elapsed < 2.0
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not (os.getenv("GEMINI_BENCHMARK") == "1" and Config.GEMINI_API_KEY),
+    reason="Set GEMINI_BENCHMARK=1 and GEMINI_API_KEY to measure Gemini latency",
+)
+def test_gemini_latency_by_prompt_size(service):
+    for name, event_key, extra_participants, extra_busy, days in SIZES:
+        data = _build_data(event_key, extra_participants, extra_busy, days)
+        data["availability"] = AvailabilityMatrix.from_data(data)
+        data["free_windows"] = service._calculate_free_windows(data)
+        prompt = service._format_gemini_prompt(data, 5)
+
+        started = time.perf_counter()
+        proposals = service._call_gemini_api(prompt, parse=service._parse_gemini_response)
+        elapsed = time.perf_counter() - started
+        print(f"[BENCHMARK] {name}: prompt {estimate_tokens(prompt)} tokens, Gemini {elapsed:.2f}s, {len(proposals)} proposals")
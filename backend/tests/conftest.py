@@ -42,6 +42,37 @@ def setup_test_environment():
     # Cleanup after all tests
 
 
+@pytest.fixture(autouse=True)
+def reset_token_verifier():
+    """Start every test with an empty access-token cache."""
+    from app.utils.token_verifier import reset_token_verifier as reset
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture(autouse=True)
+def local_gemini_rate_limiter(monkeypatch):
+    """Keep Gemini rate limiting in-process so tests never call the shared-bucket RPC."""
+    from app.config import Config
+    from app.utils.rate_limiter import reset_gemini_rate_limiter
+
+    monkeypatch.setattr(Config, "GEMINI_RATE_LIMIT_BACKEND", "local")
+    reset_gemini_rate_limiter()
+    yield
+    reset_gemini_rate_limiter()
+
+
+@pytest.fixture(autouse=True)
+def background_jobs_off(monkeypatch):
+    """Keep create_app from starting the scheduler and queue consumers, which poll the database."""
+    from app.config import Config
+
+    monkeypatch.setattr(Config, "BACKGROUND_JOBS_MODE", "off")
+    yield
+
+
 # ============================================================================
 # Flask Application Fixtures
 # ============================================================================
@@ -451,7 +482,7 @@ def mock_get_supabase(mock_supabase_client):
 def mock_google_calendar_service(mock_google_calendar):
     """Mock Google Calendar service creation."""
     with patch("app.services.google_calendar.create_flow", return_value=mock_google_calendar["flow"]):
-        with patch("app.services.google_calendar.build", return_value=mock_google_calendar["service"]):
+        with patch("app.services.google_calendar.build_calendar_service", return_value=mock_google_calendar["service"]):
             yield mock_google_calendar
 
 
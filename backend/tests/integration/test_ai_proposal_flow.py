@@ -134,6 +134,7 @@ class TestAIProposalFlow:
                         result = Mock()
                         filtered = [b for b in busy_slots if b.get(field) in values]
                         result.execute.return_value.data = filtered
+                        result.order.return_value = result
                         return result
 
                     query.in_ = in_mock
@@ -265,7 +266,7 @@ class TestAIProposalFlow:
         event_id = "event-123"
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 # Mock Gemini AI
                 mock_model = Mock()
                 mock_response = Mock()
@@ -308,7 +309,7 @@ class TestAIProposalFlow:
         event_id = "event-123"
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 mock_model = Mock()
                 mock_response = Mock()
                 mock_response.text = mock_gemini_response
@@ -339,7 +340,7 @@ class TestAIProposalFlow:
         event_id = "event-123"
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 mock_model = Mock()
                 mock_response = Mock()
                 mock_response.text = mock_gemini_response
@@ -367,7 +368,7 @@ class TestAIProposalFlow:
         event_id = "event-123"
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 service = TimeProposalService()
 
                 # Act - Mark proposals as stale
@@ -400,7 +401,7 @@ class TestAIProposalFlow:
         ])
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 mock_model = Mock()
                 mock_response = Mock()
                 mock_response.text = invalid_gemini_response
@@ -433,7 +434,7 @@ class TestAIProposalFlow:
         ])
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 mock_model = Mock()
                 mock_response = Mock()
                 mock_response.text = wrong_duration_response
@@ -471,7 +472,7 @@ class TestAIProposalFlow:
         }]
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 with patch('app.services.time_proposal.GENAI_AVAILABLE', True):
                     service = TimeProposalService()
                     service.model = Mock()
@@ -493,7 +494,7 @@ class TestAIProposalFlow:
         event_id = "event-123"
 
         with patch('app.services.time_proposal.get_supabase', return_value=mock_supabase_for_proposals):
-            with patch('app.services.time_proposal.create_client', return_value=mock_supabase_for_proposals):
+            with patch('app.services.time_proposal.get_service_role_client', return_value=mock_supabase_for_proposals):
                 mock_model = Mock()
                 mock_response = Mock()
                 mock_response.text = mock_gemini_response
@@ -148,7 +148,7 @@ class TestEventCreationFlow:
         coordinator_id = "user-123"
 
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_event_creation):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_event_creation):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_event_creation):
                 service = EventsService()
 
                 event_data = {
@@ -197,7 +197,7 @@ class TestEventCreationFlow:
         """Test that event creation fails with invalid data."""
         # Arrange
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_event_creation):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_event_creation):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_event_creation):
                 service = EventsService()
 
                 # Missing required fields
@@ -214,7 +214,7 @@ class TestEventCreationFlow:
         """Test that event creation fails with invalid duration."""
         # Arrange
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_event_creation):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_event_creation):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_event_creation):
                 service = EventsService()
 
                 event_data = {
@@ -237,7 +237,7 @@ class TestEventCreationFlow:
         """Test that event creation fails when earliest_date > latest_date."""
         # Arrange
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_event_creation):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_event_creation):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_event_creation):
                 service = EventsService()
 
                 event_data = {
@@ -259,7 +259,7 @@ class TestEventCreationFlow:
         coordinator_id = "user-123"
 
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_event_creation):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_event_creation):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_event_creation):
                 service = EventsService()
 
                 event_data = {
@@ -285,7 +285,7 @@ class TestEventCreationFlow:
         coordinator_id = "user-123"
 
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_event_creation):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_event_creation):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_event_creation):
                 service = EventsService()
 
                 # Create multiple events
@@ -321,7 +321,7 @@ class TestEventCreationFlow:
         participant_id = "user-456"
 
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_event_creation):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_event_creation):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_event_creation):
                 service = EventsService()
 
                 # Create event
@@ -226,11 +226,11 @@ class TestEventFinalizationFlow:
         end_time_utc = (datetime.now(timezone.utc) + timedelta(days=2, hours=15)).isoformat()
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 with patch('app.services.event_finalization.get_stored_credentials', return_value=mock_credentials):
                     with patch('app.services.event_finalization.get_calendar_service', return_value=mock_google_calendar_service):
                         with patch('app.services.notifications.get_supabase', return_value=mock_supabase_for_finalization):
-                            with patch('app.services.notifications.create_client', return_value=mock_supabase_for_finalization):
+                            with patch('app.services.notifications.get_service_role_client', return_value=mock_supabase_for_finalization):
                                 finalization_service = EventFinalizationService()
 
                                 # Act - Finalize event
@@ -276,7 +276,7 @@ class TestEventFinalizationFlow:
         end_time_utc = (datetime.now(timezone.utc) + timedelta(days=2, hours=15)).isoformat()
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 finalization_service = EventFinalizationService()
 
                 # Act & Assert - Should raise exception
@@ -301,7 +301,7 @@ class TestEventFinalizationFlow:
         end_time_utc = (datetime.now(timezone.utc) + timedelta(days=2, hours=15)).isoformat()
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 with patch('app.services.event_finalization.get_stored_credentials', return_value=None):
                     finalization_service = EventFinalizationService()
 
@@ -332,11 +332,11 @@ class TestEventFinalizationFlow:
         end_time_utc = (datetime.now(timezone.utc) + timedelta(days=2, hours=15)).isoformat()
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 with patch('app.services.event_finalization.get_stored_credentials', return_value=mock_credentials):
                     with patch('app.services.event_finalization.get_calendar_service', return_value=mock_google_calendar_service):
                         with patch('app.services.notifications.get_supabase', return_value=mock_supabase_for_finalization):
-                            with patch('app.services.notifications.create_client', return_value=mock_supabase_for_finalization):
+                            with patch('app.services.notifications.get_service_role_client', return_value=mock_supabase_for_finalization):
                                 finalization_service = EventFinalizationService()
 
                                 # Act - Finalize event
@@ -377,11 +377,11 @@ class TestEventFinalizationFlow:
         end_time_utc = (datetime.now(timezone.utc) + timedelta(days=2, hours=15)).isoformat()
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 with patch('app.services.event_finalization.get_stored_credentials', return_value=mock_credentials):
                     with patch('app.services.event_finalization.get_calendar_service', return_value=mock_google_calendar_service):
                         with patch('app.services.notifications.get_supabase', return_value=mock_supabase_for_finalization):
-                            with patch('app.services.notifications.create_client', return_value=mock_supabase_for_finalization):
+                            with patch('app.services.notifications.get_service_role_client', return_value=mock_supabase_for_finalization):
                                 finalization_service = EventFinalizationService()
 
                                 # Act - Finalize with Google Meet
@@ -437,11 +437,11 @@ class TestEventFinalizationFlow:
         mock_service.events.return_value = mock_events
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 with patch('app.services.event_finalization.get_stored_credentials', return_value=mock_credentials):
                     with patch('app.services.event_finalization.get_calendar_service', return_value=mock_service):
                         with patch('app.services.notifications.get_supabase', return_value=mock_supabase_for_finalization):
-                            with patch('app.services.notifications.create_client', return_value=mock_supabase_for_finalization):
+                            with patch('app.services.notifications.get_service_role_client', return_value=mock_supabase_for_finalization):
                                 finalization_service = EventFinalizationService()
 
                                 # Act - Finalize (should retry and succeed)
@@ -473,7 +473,7 @@ class TestEventFinalizationFlow:
         event["status"] = "finalized"
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 finalization_service = EventFinalizationService()
 
                 # Act & Assert - Should raise exception
@@ -503,11 +503,11 @@ class TestEventFinalizationFlow:
         end_time_utc = (datetime.now(timezone.utc) + timedelta(days=2, hours=15)).isoformat()
 
         with patch('app.services.event_finalization.get_supabase', return_value=mock_supabase_for_finalization):
-            with patch('app.services.event_finalization.create_client', return_value=mock_supabase_for_finalization):
+            with patch('app.services.event_finalization.get_service_role_client', return_value=mock_supabase_for_finalization):
                 with patch('app.services.event_finalization.get_stored_credentials', return_value=mock_credentials):
                     with patch('app.services.event_finalization.get_calendar_service', return_value=mock_google_calendar_service):
                         with patch('app.services.notifications.get_supabase', return_value=mock_supabase_for_finalization):
-                            with patch('app.services.notifications.create_client', return_value=mock_supabase_for_finalization):
+                            with patch('app.services.notifications.get_service_role_client', return_value=mock_supabase_for_finalization):
                                 finalization_service = EventFinalizationService()
 
                                 # Act
@@ -239,7 +239,7 @@ class TestGoogleCalendarSync:
                     }
 
                     with patch('app.utils.supabase_client.get_supabase', return_value=mock_supabase_for_calendar):
-                        with patch('supabase.create_client', return_value=mock_supabase_for_calendar):
+                        with patch('app.utils.supabase_client.get_service_role_client', return_value=mock_supabase_for_calendar):
                             # Act - Step 1: Exchange code for credentials
                             credentials = get_credentials_from_code(auth_code)
 
@@ -278,9 +278,9 @@ class TestGoogleCalendarSync:
 
         with patch('app.services.google_calendar.get_stored_credentials', return_value=mock_credentials):
             with patch('app.services.google_calendar.store_credentials'):
-                with patch('app.services.google_calendar.build', return_value=mock_calendar_service):
+                with patch('app.services.google_calendar.build_calendar_service', return_value=mock_calendar_service):
                     with patch('app.utils.supabase_client.get_supabase', return_value=mock_supabase_for_calendar):
-                        with patch('supabase.create_client', return_value=mock_supabase_for_calendar):
+                        with patch('app.utils.supabase_client.get_service_role_client', return_value=mock_supabase_for_calendar):
                             # Act - Get calendar service
                             service = get_calendar_service(mock_credentials, user_id)
 
@@ -317,7 +317,7 @@ class TestGoogleCalendarSync:
         user_id = "user-123"
 
         with patch('app.utils.supabase_client.get_supabase', return_value=mock_supabase_for_calendar):
-            with patch('supabase.create_client', return_value=mock_supabase_for_calendar):
+            with patch('app.utils.supabase_client.get_service_role_client', return_value=mock_supabase_for_calendar):
                 from app.services.busy_slots import BusySlotService
 
                 busy_slots_service = BusySlotService()
@@ -346,7 +346,7 @@ class TestGoogleCalendarSync:
                 mock_credentials.valid = True
 
                 with patch('app.services.google_calendar.store_credentials'):
-                    with patch('app.services.google_calendar.build', return_value=mock_calendar_service):
+                    with patch('app.services.google_calendar.build_calendar_service', return_value=mock_calendar_service):
                         service = get_calendar_service(mock_credentials, user_id)
 
                         events_result = service.events().list(
@@ -408,9 +408,9 @@ class TestGoogleCalendarSync:
         mock_credentials.refresh.side_effect = refresh_mock
 
         with patch('app.utils.supabase_client.get_supabase', return_value=mock_supabase_for_calendar):
-            with patch('supabase.create_client', return_value=mock_supabase_for_calendar):
+            with patch('app.utils.supabase_client.get_service_role_client', return_value=mock_supabase_for_calendar):
                 with patch('app.services.google_calendar.store_credentials'):
-                    with patch('app.services.google_calendar.build', return_value=Mock()):
+                    with patch('app.services.google_calendar.build_calendar_service', return_value=Mock()):
                         # Act - Get calendar service (should trigger refresh)
                         service = get_calendar_service(mock_credentials, user_id)
 
@@ -441,7 +441,7 @@ class TestGoogleCalendarSync:
         mock_credentials.valid = True
 
         with patch('app.services.google_calendar.store_credentials'):
-            with patch('app.services.google_calendar.build', return_value=mock_service):
+            with patch('app.services.google_calendar.build_calendar_service', return_value=mock_service):
                 # Act
                 service = get_calendar_service(mock_credentials, user_id)
                 events_result = service.events().list(
@@ -469,7 +469,7 @@ class TestGoogleCalendarSync:
         user_id = "user-123"
 
         with patch('app.utils.supabase_client.get_supabase', return_value=mock_supabase_for_calendar):
-            with patch('supabase.create_client', return_value=mock_supabase_for_calendar):
+            with patch('app.utils.supabase_client.get_service_role_client', return_value=mock_supabase_for_calendar):
                 # Step 1: Insert initial busy slots
                 initial_slots = [
                     {
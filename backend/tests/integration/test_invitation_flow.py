@@ -288,11 +288,11 @@ class TestInvitationFlow:
         invitee_email = "invitee@example.com"
 
         with patch('app.services.invitations.get_supabase', return_value=mock_supabase_for_invitations):
-            with patch('app.services.invitations.create_client', return_value=mock_supabase_for_invitations):
+            with patch('app.services.invitations.get_service_role_client', return_value=mock_supabase_for_invitations):
                 with patch('app.services.notifications.get_supabase', return_value=mock_supabase_for_invitations):
-                    with patch('app.services.notifications.create_client', return_value=mock_supabase_for_invitations):
+                    with patch('app.services.notifications.get_service_role_client', return_value=mock_supabase_for_invitations):
                         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_invitations):
-                            with patch('app.services.events.create_client', return_value=mock_supabase_for_invitations):
+                            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_invitations):
                                 invitations_service = InvitationsService()
                                 notifications_service = NotificationsService()
                                 events_service = EventsService()
@@ -366,9 +366,9 @@ class TestInvitationFlow:
         invitee_email = "invitee@example.com"
 
         with patch('app.services.invitations.get_supabase', return_value=mock_supabase_for_invitations):
-            with patch('app.services.invitations.create_client', return_value=mock_supabase_for_invitations):
+            with patch('app.services.invitations.get_service_role_client', return_value=mock_supabase_for_invitations):
                 with patch('app.services.events.get_supabase', return_value=mock_supabase_for_invitations):
-                    with patch('app.services.events.create_client', return_value=mock_supabase_for_invitations):
+                    with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_invitations):
                         invitations_service = InvitationsService()
                         events_service = EventsService()
 
@@ -399,7 +399,7 @@ class TestInvitationFlow:
         invitee_id = "invitee-1"
 
         with patch('app.services.invitations.get_supabase', return_value=mock_supabase_for_invitations):
-            with patch('app.services.invitations.create_client', return_value=mock_supabase_for_invitations):
+            with patch('app.services.invitations.get_service_role_client', return_value=mock_supabase_for_invitations):
                 invitations_service = InvitationsService()
 
                 # Create multiple invitations
@@ -430,7 +430,7 @@ class TestInvitationFlow:
         invitee_id = "invitee-1"
 
         with patch('app.services.invitations.get_supabase', return_value=mock_supabase_for_invitations):
-            with patch('app.services.invitations.create_client', return_value=mock_supabase_for_invitations):
+            with patch('app.services.invitations.get_service_role_client', return_value=mock_supabase_for_invitations):
                 invitations_service = InvitationsService()
 
                 # Create invitations with different statuses
@@ -468,7 +468,7 @@ class TestInvitationFlow:
         invitee_id = "invitee-1"
 
         with patch('app.services.events.get_supabase', return_value=mock_supabase_for_invitations):
-            with patch('app.services.events.create_client', return_value=mock_supabase_for_invitations):
+            with patch('app.services.events.get_service_role_client', return_value=mock_supabase_for_invitations):
                 events_service = EventsService()
 
                 # Add participant
@@ -496,7 +496,7 @@ class TestInvitationFlow:
         event_id = "event-123"
 
         with patch('app.services.notifications.get_supabase', return_value=mock_supabase_for_invitations):
-            with patch('app.services.notifications.create_client', return_value=mock_supabase_for_invitations):
+            with patch('app.services.notifications.get_service_role_client', return_value=mock_supabase_for_invitations):
                 notifications_service = NotificationsService()
 
                 # Create notification
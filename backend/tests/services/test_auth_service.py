@@ -90,6 +90,7 @@ def test_refresh_and_logout(monkeypatch):
     mock_sb = Mock()
     mock_sb.auth = mock_auth
     monkeypatch.setattr("app.services.auth.get_supabase", lambda: mock_sb)
+    monkeypatch.setattr("app.services.auth.new_supabase_client", lambda: mock_sb)
     service = AuthService()
     res, err = service.refresh_session("r")
     assert err is None and res == {"ok": True}
@@ -10,8 +10,8 @@ def test_add_participant_uses_service_role_client():
     mock_supabase = MagicMock()
     mock_service_role = MagicMock()
     
-    # Mock the create_client function to return our mocks
-    with patch('app.services.events.create_client', return_value=mock_service_role):
+    # Mock the shared client accessors to return our mocks
+    with patch('app.services.events.get_service_role_client', return_value=mock_service_role):
         with patch('app.services.events.get_supabase', return_value=mock_supabase):
             # Initialize service
             service = EventsService(access_token="fake-token")
@@ -57,7 +57,7 @@ def test_remove_participant_uses_service_role_client():
     mock_supabase = MagicMock()
     mock_service_role = MagicMock()
     
-    with patch('app.services.events.create_client', return_value=mock_service_role):
+    with patch('app.services.events.get_service_role_client', return_value=mock_service_role):
         with patch('app.services.events.get_supabase', return_value=mock_supabase):
             service = EventsService(access_token="fake-token")
             service.service_role_client = mock_service_role
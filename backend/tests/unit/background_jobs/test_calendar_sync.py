@@ -0,0 +1,205 @@
+"""
+Unit tests for the calendar sync background job.
+
+Test coverage:
+- sync_user_calendar_job: consecutive scheduled runs reuse the stored Google sync
+  token and Microsoft deltaLink while the requested window moves forward
+- run_calendar_sync_job: failed syncs fail the queued job, unconnected users complete
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from app.background_jobs import calendar_sync as sync_module
+from app.background_jobs.job_queue import CALENDAR_SYNC, JobQueue, run_claimed_job
+
+
+class _Clock(datetime):
+    """datetime whose now() returns a settable instant."""
+
+    current = datetime(2025, 12, 20, 9, 30, tzinfo=timezone.utc)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+@pytest.fixture
+def stored_sources():
+    """Enabled calendar sources, updated in place like the calendar_sources table."""
+    return [
+        {
+            "id": "src-1",
+            "calendar_id": "work@example.com",
+            "account": {"id": "acct-1", "provider": "google", "credentials": {"token": "tok"}},
+            "sync_token": None,
+        },
+    ]
+
+
+@pytest.fixture
+def accounts_service(stored_sources):
+    def update_source_sync_state(source_id, sync_token, window_start=None, window_end=None):
+        for source in stored_sources:
+            if source["id"] == source_id:
+                source.update(
+                    sync_token=sync_token,
+                    sync_window_start=window_start.isoformat() if window_start else None,
+                    sync_window_end=window_end.isoformat() if window_end else None,
+                )
+
+    service = Mock()
+    service.get_enabled_sources.side_effect = lambda user_id: [dict(source) for source in stored_sources]
+    service.update_source_sync_state.side_effect = update_source_sync_state
+    return service
+
+
+@pytest.fixture
+def run_job(monkeypatch, accounts_service, stored_sources):
+    """Run sync_user_calendar_job at a given instant with the providers and database mocked."""
+    supabase = MagicMock()
+    monkeypatch.setattr("app.services.busy_slots.get_supabase", lambda: supabase)
+    monkeypatch.setattr("app.services.busy_slots.get_service_role_client", lambda: supabase)
+    monkeypatch.setattr(sync_module, "datetime", _Clock)
+    monkeypatch.setattr(sync_module, "_get_earliest_active_event_date", lambda user_id: _Clock.current)
+    monkeypatch.setattr("app.services.calendar_accounts.CalendarAccountsService", lambda: accounts_service)
+    for provider in ("google", "microsoft"):
+        monkeypatch.setattr(
+            f"app.services.{provider}_calendar.get_stored_credentials",
+            lambda user_id, provider=provider: next(
+                (s["account"]["credentials"] for s in stored_sources if s["account"]["provider"] == provider), None
+            ),
+        )
+    monkeypatch.setattr("app.services.microsoft_calendar.refresh_credentials_if_needed", lambda creds: creds)
+    monkeypatch.setattr(
+        "app.services.microsoft_calendar.get_calendar_service", lambda creds, user_id: {"graph_request": Mock()}
+    )
+
+    google_service = Mock()
+    credentials = Mock(token="tok")
+    monkeypatch.setattr("app.services.google_calendar.build_calendar_service", lambda creds: google_service)
+    monkeypatch.setattr("app.services.google_calendar.get_credentials_from_dict", lambda creds: credentials)
+    monkeypatch.setattr("app.services.google_calendar.refresh_credentials_if_needed", lambda creds: credentials)
+
+    def run(now):
+        _Clock.current = now
+        sync_module.sync_user_calendar_job("user-1")
+
+    run.google_service = google_service
+    return run
+
+
+# ============================================================================
+# Tests: sync_user_calendar_job
+# ============================================================================
+
+class TestSyncUserCalendarJob:
+    """Tests for scheduled calendar syncs."""
+
+    def test_consecutive_runs_use_google_sync_token(self, run_job, stored_sources):
+        """Test the second scheduled run lists changes with the token stored by the first."""
+        # Arrange
+        google_list = run_job.google_service.events.return_value.list
+        google_list.return_value.execute.side_effect = [
+            {"items": [], "nextSyncToken": "token-1"},
+            {"items": [], "nextSyncToken": "token-2"},
+        ]
+        first_run = datetime(2025, 12, 20, 9, 30, tzinfo=timezone.utc)
+
+        # Act
+        run_job(first_run)
+        run_job(first_run + timedelta(hours=6))
+
+        # Assert
+        first_call, second_call = google_list.call_args_list
+        assert "syncToken" not in first_call.kwargs
+        assert second_call.kwargs["syncToken"] == "token-1"
+        assert "timeMin" not in second_call.kwargs
+        assert stored_sources[0]["sync_token"] == "token-2"
+
+    def test_consecutive_runs_use_microsoft_delta_link(self, run_job, stored_sources):
+        """Test the second scheduled run, a day later, follows the deltaLink stored by the first."""
+        # Arrange
+        stored_sources[:] = [{
+            "id": "ms-src-1",
+            "calendar_id": "cal-1",
+            "account": {"id": "acct-2", "provider": "microsoft", "credentials": {"access_token": "tok"}},
+            "sync_token": None,
+        }]
+        first_run = datetime(2025, 12, 20, 9, 30, tzinfo=timezone.utc)
+
+        with patch(
+            "app.services.microsoft_calendar.get_calendar_view_delta", side_effect=[([], "link-1"), ([], "link-2")]
+        ) as delta:
+            # Act
+            run_job(first_run)
+            run_job(first_run + timedelta(days=1))
+
+        # Assert
+        first_call, second_call = delta.call_args_list
+        assert "delta_link" not in first_call.kwargs
+        assert second_call.kwargs["delta_link"] == "link-1"
+        assert first_call.args[2:] == second_call.args[2:]
+        assert stored_sources[0]["sync_token"] == "link-2"
+
+
+# ============================================================================
+# Tests: run_calendar_sync_job
+# ============================================================================
+
+class TestRunCalendarSyncJob:
+    """Tests for the calendar_sync queue handler."""
+
+    @pytest.fixture
+    def queue(self):
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = Mock(data=[])
+        return JobQueue(client)
+
+    @staticmethod
+    def _job():
+        return {"id": 7, "kind": CALENDAR_SYNC, "payload": {"user_id": "user-1"}, "attempts": 1, "max_attempts": 5}
+
+    @staticmethod
+    def _rpc_names(queue):
+        return [call.args[0] for call in queue.client.rpc.call_args_list]
+
+    @pytest.mark.parametrize("google_result", [
+        False,
+        {"success": False, "sources": [
+            {"calendar_name": "Work", "status": "success", "error": None},
+            {"calendar_name": "Shared", "status": "error", "error": "HttpError 500"},
+        ]},
+    ])
+    def test_failed_sync_fails_job(self, queue, google_result):
+        """Test a failed provider or source makes the queue retry the job instead of completing it."""
+        # Arrange
+        with patch.object(sync_module.google_calendar, "get_stored_credentials", return_value=Mock()), \
+                patch.object(sync_module.microsoft_calendar, "get_stored_credentials", return_value=None), \
+                patch.object(sync_module, "_get_earliest_active_event_date", return_value=datetime.now(timezone.utc)), \
+                patch.object(sync_module, "BusySlotService") as service_class:
+            service_class.return_value.sync_user_google_calendar.return_value = google_result
+
+            # Act
+            succeeded = run_claimed_job(queue, self._job(), {CALENDAR_SYNC: sync_module.run_calendar_sync_job})
+
+        # Assert
+        assert succeeded is False
+        assert self._rpc_names(queue) == ["fail_job"]
+        service_class.return_value.sync_user_microsoft_calendar.assert_not_called()
+
+    def test_user_without_calendar_completes(self, queue):
+        """Test a user with no connected provider is not an error."""
+        # Arrange
+        with patch.object(sync_module.google_calendar, "get_stored_credentials", return_value=None), \
+                patch.object(sync_module.microsoft_calendar, "get_stored_credentials", return_value=None), \
+                patch.object(sync_module, "BusySlotService") as service_class:
+            # Act
+            succeeded = run_claimed_job(queue, self._job(), {CALENDAR_SYNC: sync_module.run_calendar_sync_job})
+
+        # Assert
+        assert succeeded is True
+        assert self._rpc_names(queue) == ["complete_job"]
+        service_class.assert_not_called()
@@ -0,0 +1,304 @@
+"""
+Unit tests for the Postgres job queue client.
+
+Test coverage:
+- JobQueue: enqueue/claim RPC payloads, retry backoff, dead-lettering, backlog stats
+- QueueConsumer: concurrent consumer threads
+- run_claimed_job: success, handler failure, expired final lease, unknown kind
+- process_job_queue: claim failure, per-job outcomes
+- enqueue helpers: dedup keys, priorities, debounced regeneration
+"""
+
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from app.background_jobs import job_queue as job_queue_module
+from app.background_jobs.job_queue import (
+    CALENDAR_SYNC,
+    PRIORITY_INTERACTIVE,
+    PROPOSAL_REGENERATION,
+    JobQueue,
+    QueueConsumer,
+    debounce_proposal_regeneration,
+    enqueue_calendar_sync,
+    enqueue_proposal_regeneration,
+    process_job_queue,
+    retry_delay_seconds,
+    run_claimed_job,
+)
+from app.config import Config
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = Mock(data=[])
+    return client
+
+
+@pytest.fixture
+def queue(client):
+    return JobQueue(client)
+
+
+def _job(**overrides):
+    job = {"id": 7, "kind": CALENDAR_SYNC, "payload": {"user_id": "user-1"}, "attempts": 1, "max_attempts": 5}
+    job.update(overrides)
+    return job
+
+
+def _rpc_params(client, name):
+    for call in client.rpc.call_args_list:
+        if call.args[0] == name:
+            return call.args[1]
+    raise AssertionError(f"rpc {name} not called")
+
+
+# ============================================================================
+# Tests: JobQueue
+# ============================================================================
+
+class TestJobQueue:
+    """Tests for the job_queue RPC wrapper."""
+
+    def test_requires_service_role_client(self):
+        """Test the queue refuses to run without service-role credentials."""
+        # Arrange / Act / Assert
+        with patch.object(job_queue_module, "get_service_role_client", return_value=None):
+            with pytest.raises(Exception, match="SUPABASE_SERVICE_ROLE_KEY"):
+                JobQueue()
+
+    def test_enqueue_passes_dedup_key_and_priority(self, queue, client):
+        """Test enqueue forwards the job to the enqueue_job RPC."""
+        # Act
+        queue.enqueue(CALENDAR_SYNC, {"user_id": "user-1"}, dedup_key="calendar_sync:user-1", priority=10)
+
+        # Assert
+        params = _rpc_params(client, "enqueue_job")
+        assert params["p_kind"] == CALENDAR_SYNC
+        assert params["p_payload"] == {"user_id": "user-1"}
+        assert params["p_dedup_key"] == "calendar_sync:user-1"
+        assert params["p_priority"] == 10
+        assert params["p_max_attempts"] == Config.JOB_QUEUE_MAX_ATTEMPTS
+
+    def test_claim_leases_jobs_to_this_worker(self, queue, client):
+        """Test claim passes the worker id and lease length and returns the rows."""
+        # Arrange
+        client.rpc.return_value.execute.return_value = Mock(data=[_job()])
+
+        # Act
+        jobs = queue.claim([CALENDAR_SYNC], limit=3)
+
+        # Assert
+        params = _rpc_params(client, "claim_jobs")
+        assert params == {
+            "p_worker": queue.worker_id,
+            "p_kinds": [CALENDAR_SYNC],
+            "p_limit": 3,
+            "p_lease_seconds": Config.JOB_QUEUE_LEASE_SECONDS,
+        }
+        assert jobs == [_job()]
+
+    def test_fail_retries_with_backoff(self, queue, client):
+        """Test a failure with attempts left is rescheduled with exponential backoff."""
+        # Act
+        retried = queue.fail(_job(attempts=3), "boom")
+
+        # Assert
+        assert retried is True
+        assert _rpc_params(client, "fail_job")["p_retry_in_seconds"] == retry_delay_seconds(3)
+
+    def test_fail_dead_letters_last_attempt(self, queue, client):
+        """Test the final failed attempt is dead-lettered."""
+        # Act
+        retried = queue.fail(_job(attempts=5, max_attempts=5), "boom")
+
+        # Assert
+        assert retried is False
+        assert _rpc_params(client, "fail_job")["p_retry_in_seconds"] is None
+
+    def test_stats_groups_backlog_by_kind(self, queue, client):
+        """Test backlog metrics are keyed by job kind."""
+        # Arrange
+        client.rpc.return_value.execute.return_value = Mock(data=[
+            {"kind": PROPOSAL_REGENERATION, "pending": 120, "due": 80, "running": 4, "dead": 1, "oldest_due_seconds": 900.0},
+        ])
+
+        # Act
+        stats = queue.stats()
+
+        # Assert
+        assert stats == {
+            PROPOSAL_REGENERATION: {"pending": 120, "due": 80, "running": 4, "dead": 1, "oldest_due_seconds": 900.0}
+        }
+
+    def test_retry_delay_is_exponential_and_capped(self, monkeypatch):
+        """Test backoff doubles per attempt up to the configured maximum."""
+        # Arrange
+        monkeypatch.setattr(Config, "JOB_QUEUE_RETRY_BASE_SECONDS", 30)
+        monkeypatch.setattr(Config, "JOB_QUEUE_RETRY_MAX_SECONDS", 100)
+
+        # Act / Assert
+        assert [retry_delay_seconds(n) for n in (1, 2, 3, 4)] == [30, 60, 100, 100]
+
+
+# ============================================================================
+# Tests: run_claimed_job / process_job_queue
+# ============================================================================
+
+class TestRunClaimedJob:
+    """Tests for executing leased jobs."""
+
+    def test_success_completes_job(self, queue, client):
+        """Test a successful handler deletes the job."""
+        # Arrange
+        handler = Mock()
+
+        # Act
+        ok = run_claimed_job(queue, _job(), {CALENDAR_SYNC: handler})
+
+        # Assert
+        assert ok is True
+        handler.assert_called_once_with({"user_id": "user-1"})
+        assert _rpc_params(client, "complete_job") == {"p_job_id": 7, "p_worker": queue.worker_id}
+
+    def test_handler_failure_is_recorded(self, queue, client):
+        """Test a raising handler fails the job instead of completing it."""
+        # Arrange
+        handler = Mock(side_effect=Exception("Google API down"))
+
+        # Act
+        ok = run_claimed_job(queue, _job(), {CALENDAR_SYNC: handler})
+
+        # Assert
+        assert ok is False
+        assert _rpc_params(client, "fail_job")["p_error"] == "Google API down"
+        assert all(call.args[0] != "complete_job" for call in client.rpc.call_args_list)
+
+    def test_reclaimed_job_past_max_attempts_is_dead_lettered(self, queue, client):
+        """Test a job whose worker died on the final attempt is not run again."""
+        # Arrange
+        handler = Mock()
+
+        # Act
+        ok = run_claimed_job(queue, _job(attempts=6, max_attempts=5), {CALENDAR_SYNC: handler})
+
+        # Assert
+        assert ok is False
+        handler.assert_not_called()
+        assert _rpc_params(client, "fail_job")["p_retry_in_seconds"] is None
+
+    def test_unknown_kind_fails(self, queue, client):
+        """Test a job without a handler is failed, not completed."""
+        # Act
+        ok = run_claimed_job(queue, _job(kind="unknown"), {})
+
+        # Assert
+        assert ok is False
+        assert "No handler" in _rpc_params(client, "fail_job")["p_error"]
+
+
+class TestProcessJobQueue:
+    """Tests for draining a batch of jobs."""
+
+    def test_counts_outcomes(self, client):
+        """Test each claimed job is run and counted."""
+        # Arrange
+        client.rpc.return_value.execute.return_value = Mock(data=[_job(id=1), _job(id=2)])
+        handler = Mock(side_effect=[None, Exception("boom")])
+
+        # Act
+        with patch.object(job_queue_module, "get_service_role_client", return_value=client), \
+                patch.object(job_queue_module, "_job_handlers", return_value={CALENDAR_SYNC: handler}):
+            counts = process_job_queue([CALENDAR_SYNC], limit=2)
+
+        # Assert
+        assert counts == {"succeeded": 1, "failed": 1}
+
+    def test_claim_failure_returns_empty_counts(self):
+        """Test an unavailable queue is logged, not raised."""
+        # Act
+        with patch.object(job_queue_module, "get_service_role_client", return_value=None):
+            counts = process_job_queue([CALENDAR_SYNC])
+
+        # Assert
+        assert counts == {"succeeded": 0, "failed": 0}
+
+
+class TestQueueConsumer:
+    """Tests for the background consumer threads."""
+
+    def test_runs_jobs_concurrently(self, monkeypatch):
+        """Test each consumer thread claims and runs its own jobs in parallel."""
+        # Arrange
+        barrier = threading.Barrier(3, timeout=2)
+        in_flight_together = threading.Semaphore(0)
+        calls = []
+
+        def fake_process(kinds, limit=None):
+            calls.append((kinds, limit))
+            if len(calls) <= 3:
+                barrier.wait()  # only passes if three jobs are in flight at once
+                in_flight_together.release()
+                return {"succeeded": 1, "failed": 0}
+            return {"succeeded": 0, "failed": 0}
+
+        monkeypatch.setattr(job_queue_module, "process_job_queue", fake_process)
+        consumer = QueueConsumer([PROPOSAL_REGENERATION], poll_seconds=60, concurrency=3, batch_size=1)
+
+        # Act
+        consumer.start()
+        passed = all(in_flight_together.acquire(timeout=3) for _ in range(3))
+        consumer.stop(timeout=2)
+
+        # Assert
+        assert passed
+        assert not consumer.running
+        assert all(call == ([PROPOSAL_REGENERATION], 1) for call in calls)
+
+
+# ============================================================================
+# Tests: enqueue helpers
+# ============================================================================
+
+class TestEnqueueHelpers:
+    """Tests for the producer-side helpers."""
+
+    def test_calendar_sync_is_deduplicated_per_user(self, client):
+        """Test calendar syncs use one dedup key per user and interactive priority."""
+        # Act
+        with patch.object(job_queue_module, "get_service_role_client", return_value=client):
+            enqueue_calendar_sync("user-1")
+
+        # Assert
+        params = _rpc_params(client, "enqueue_job")
+        assert params["p_dedup_key"] == "calendar_sync:user-1"
+        assert params["p_priority"] == PRIORITY_INTERACTIVE
+
+    def test_proposal_regeneration_is_deduplicated_per_event(self, queue, client):
+        """Test regenerations use one dedup key per event."""
+        # Act
+        enqueue_proposal_regeneration("event-1", queue=queue)
+
+        # Assert
+        params = _rpc_params(client, "enqueue_job")
+        assert params["p_kind"] == PROPOSAL_REGENERATION
+        assert params["p_dedup_key"] == "proposal_regeneration:event-1"
+
+    def test_proposal_invalidations_are_debounced(self, queue, client, monkeypatch):
+        """Test invalidations share the per-event dedup key and the configured quiet period."""
+        # Arrange
+        monkeypatch.setattr(Config, "PROPOSAL_INVALIDATION_QUIET_SECONDS", 10)
+        monkeypatch.setattr(Config, "PROPOSAL_INVALIDATION_MAX_DELAY_SECONDS", 60)
+
+        # Act
+        debounce_proposal_regeneration("event-1", queue=queue)
+
+        # Assert
+        params = _rpc_params(client, "debounce_job")
+        assert params["p_kind"] == PROPOSAL_REGENERATION
+        assert params["p_dedup_key"] == "proposal_regeneration:event-1"
+        assert params["p_quiet_seconds"] == 10
+        assert params["p_max_delay_seconds"] == 60
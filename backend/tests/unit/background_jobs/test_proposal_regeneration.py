@@ -0,0 +1,98 @@
+"""
+Unit tests for background proposal regeneration.
+
+Test coverage:
+- run_proposal_regeneration_job: active event, inactive/missing event, missing credentials
+- regenerate_stale_proposals: flagged events are queued, backlog metrics
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from app.background_jobs import proposal_regeneration as regen_module
+from app.config import Config
+
+
+def _events_query(supabase, rows):
+    query = supabase.table.return_value.select.return_value
+    query.eq.return_value.limit.return_value.execute.return_value = Mock(data=rows)
+    query.eq.return_value.in_.return_value.limit.return_value.execute.return_value = Mock(data=rows)
+
+
+# ============================================================================
+# Tests: run_proposal_regeneration_job
+# ============================================================================
+
+class TestRunProposalRegenerationJob:
+    """Tests for the proposal_regeneration queue handler."""
+
+    def test_regenerates_active_event_with_background_wait_budget(self):
+        """Test an active event is regenerated with the background rate limit budget."""
+        # Arrange
+        supabase = MagicMock()
+        event = {"id": "event-1", "uid": "abc", "name": "Sync", "status": "planning"}
+        _events_query(supabase, [event])
+
+        with patch.object(regen_module, "_get_supabase_client", return_value=supabase), \
+                patch.object(regen_module, "TimeProposalService") as service_class, \
+                patch.object(regen_module, "_process_event") as process_event:
+            # Act
+            regen_module.run_proposal_regeneration_job({"event_id": "event-1"})
+
+        # Assert
+        service = service_class.return_value
+        process_event.assert_called_once_with(event, supabase, service)
+        assert service.rate_limit_max_wait == Config.PROPOSAL_REGEN_MAX_WAIT_SECONDS
+
+    @pytest.mark.parametrize("rows", [[], [{"id": "event-1", "status": "finalized"}]])
+    def test_skips_missing_or_inactive_events(self, rows):
+        """Test deleted and finalized events complete without regenerating."""
+        # Arrange
+        supabase = MagicMock()
+        _events_query(supabase, rows)
+
+        with patch.object(regen_module, "_get_supabase_client", return_value=supabase), \
+                patch.object(regen_module, "_process_event") as process_event:
+            # Act
+            regen_module.run_proposal_regeneration_job({"event_id": "event-1"})
+
+        # Assert
+        process_event.assert_not_called()
+
+    def test_missing_credentials_raise_for_retry(self):
+        """Test the job fails (and is retried) when no service-role client is available."""
+        # Arrange / Act / Assert
+        with patch.object(regen_module, "_get_supabase_client", return_value=None):
+            with pytest.raises(Exception, match="credentials"):
+                regen_module.run_proposal_regeneration_job({"event_id": "event-1"})
+
+
+# ============================================================================
+# Tests: regenerate_stale_proposals
+# ============================================================================
+
+class TestRegenerateStaleProposals:
+    """Tests for the periodic stale-proposal sweep."""
+
+    def test_queues_flagged_events_and_logs_backlog(self, caplog):
+        """Test every flagged event gets a deduplicated job and backlog metrics are logged."""
+        # Arrange
+        supabase = MagicMock()
+        _events_query(supabase, [{"id": "event-1"}, {"id": "event-2"}])
+        supabase.rpc.return_value.execute.return_value = Mock(data=[
+            {"kind": "proposal_regeneration", "pending": 2, "due": 2, "running": 0, "dead": 0, "oldest_due_seconds": 0},
+        ])
+
+        with patch.object(regen_module, "_get_supabase_client", return_value=supabase), \
+                caplog.at_level("INFO"):
+            # Act
+            regen_module.regenerate_stale_proposals()
+
+        # Assert
+        enqueued = [call.args[1] for call in supabase.rpc.call_args_list if call.args[0] == "debounce_job"]
+        assert [params["p_dedup_key"] for params in enqueued] == [
+            "proposal_regeneration:event-1",
+            "proposal_regeneration:event-2",
+        ]
+        assert "Backlog proposal_regeneration: pending=2" in caplog.text
@@ -0,0 +1,132 @@
+"""
+Unit tests for the background job scheduler process model.
+
+Test coverage:
+- LeaderLock: exclusive acquisition, release, blocking takeover
+- JobRunner: embedded leader, enqueue-only follower, standby takeover
+"""
+
+import threading
+import time
+
+import pytest
+from apscheduler.schedulers.base import STATE_RUNNING
+
+from app.background_jobs import job_queue as job_queue_module
+from app.background_jobs.scheduler import PROPOSAL_REGEN_JOB_ID, JobRunner, LeaderLock
+
+
+@pytest.fixture(autouse=True)
+def empty_queue(monkeypatch):
+    """Keep queue consumers from calling Supabase."""
+    monkeypatch.setattr(job_queue_module, "process_job_queue", lambda kinds, limit=None: {"succeeded": 0, "failed": 0})
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    return str(tmp_path / "scheduler.lock")
+
+
+@pytest.fixture
+def runners():
+    created = []
+    yield created
+    for runner in created:
+        runner.shutdown()
+
+
+# ============================================================================
+# Tests: LeaderLock
+# ============================================================================
+
+class TestLeaderLock:
+    """Tests for file-lock leader election."""
+
+    def test_only_one_holder(self, lock_path):
+        """Test a second contender cannot take a held lock until it is released."""
+        # Arrange
+        leader, contender = LeaderLock(lock_path), LeaderLock(lock_path)
+
+        # Act / Assert
+        assert leader.acquire() is True
+        assert contender.acquire() is False
+        leader.release()
+        assert contender.acquire() is True
+        contender.release()
+
+    def test_blocking_acquire_waits_for_release(self, lock_path):
+        """Test a standby blocks until the leader releases the lock."""
+        # Arrange
+        leader, standby = LeaderLock(lock_path), LeaderLock(lock_path)
+        leader.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: standby.acquire(blocking=True) and acquired.set())
+
+        # Act
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+        leader.release()
+        thread.join(timeout=2)
+
+        # Assert
+        assert acquired.is_set()
+        standby.release()
+
+
+# ============================================================================
+# Tests: JobRunner
+# ============================================================================
+
+class TestJobRunner:
+    """Tests for leader/follower scheduler roles."""
+
+    def test_embedded_leader_runs_recurring_jobs(self, lock_path, runners):
+        """Test the lock holder runs the scheduler with the recurring jobs and drains the queue."""
+        # Arrange
+        runner = JobRunner("embedded", LeaderLock(lock_path))
+        runners.append(runner)
+
+        # Act
+        runner.start_embedded()
+
+        # Assert
+        assert runner.is_leader
+        assert runner.scheduler.state == STATE_RUNNING
+        assert runner.scheduler.get_job(PROPOSAL_REGEN_JOB_ID) is not None
+        assert all(consumer.running for consumer in runner.consumers)
+
+    def test_follower_only_enqueues(self, lock_path, runners):
+        """Test non-leaders neither run the scheduler nor consume the queue."""
+        # Arrange
+        leader = JobRunner("embedded", LeaderLock(lock_path))
+        follower = JobRunner("embedded", LeaderLock(lock_path))
+        runners.extend([leader, follower])
+        leader.start_embedded()
+
+        # Act
+        follower.start_embedded()
+
+        # Assert
+        assert not follower.is_leader
+        assert not follower.scheduler.running
+        assert not any(consumer.running for consumer in follower.consumers)
+
+    def test_follower_takes_over_when_leader_exits(self, lock_path, runners):
+        """Test the standby thread promotes a follower once the leader releases the lock."""
+        # Arrange
+        leader = JobRunner("embedded", LeaderLock(lock_path))
+        follower = JobRunner("embedded", LeaderLock(lock_path))
+        runners.extend([leader, follower])
+        leader.start_embedded()
+        follower.start_embedded()
+
+        # Act
+        leader.shutdown()
+        follower._standby.join(timeout=2)
+
+        # Assert
+        assert follower.is_leader
+        assert follower.scheduler.state == STATE_RUNNING
+        assert follower.scheduler.get_job(PROPOSAL_REGEN_JOB_ID) is not None
+        assert all(consumer.running for consumer in follower.consumers)
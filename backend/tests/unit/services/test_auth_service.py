@@ -35,6 +35,7 @@ def mock_supabase():
 def auth_service(monkeypatch, mock_supabase):
     """Create AuthService with mocked Supabase client."""
     monkeypatch.setattr("app.services.auth.get_supabase", lambda: mock_supabase)
+    monkeypatch.setattr("app.services.auth.new_supabase_client", lambda: mock_supabase)
     return AuthService()
 
 
@@ -0,0 +1,134 @@
+"""
+Unit tests for the compact prompt availability encoding.
+
+Test coverage:
+- encode_runs: busy/preferred run-length encoding
+- encode_availability: day rows, collapsed day ranges, earliest start, partial last slot,
+  token budget coarsening
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.services.availability_encoding import MAX_SLOT_MINUTES, encode_availability, encode_runs, estimate_tokens
+from app.services.availability_matrix import AvailabilityMatrix
+
+
+def _dt(day, hour, minute=0):
+    return datetime(2025, 12, day, hour, minute, tzinfo=timezone.utc)
+
+
+def _slot(user_id, start, end):
+    return {"user_id": user_id, "start_time_utc": start.isoformat(), "end_time_utc": end.isoformat()}
+
+
+def _days(first_day, count, start_hour=9, end_hour=17):
+    return [(_dt(first_day + i, start_hour), _dt(first_day + i, end_hour)) for i in range(count)]
+
+
+# ============================================================================
+# Tests: encode_runs
+# ============================================================================
+
+class TestEncodeRuns:
+    """Tests for run-length encoding of slot counts."""
+
+    def test_runs_with_preferences(self):
+        """Test runs collapse equal slots and only show preferences when present."""
+        # Act
+        encoded = encode_runs([0, 0, 0, 2, 1, 1], [0, 0, 0, 0, 3, 3])
+
+        # Assert
+        assert encoded == "0*3 2 1/3*2"
+
+    def test_empty(self):
+        """Test no slots encode to an empty string."""
+        # Act / Assert
+        assert encode_runs([], []) == ""
+
+
+# ============================================================================
+# Tests: encode_availability
+# ============================================================================
+
+class TestEncodeAvailability:
+    """Tests for the day rows and the token budget planner."""
+
+    def test_one_row_per_day_and_identical_days_collapse(self):
+        """Test busy days get their own row and identical consecutive days share a range."""
+        # Arrange
+        matrix = AvailabilityMatrix(
+            busy_slots=[_slot("alice", _dt(20, 10), _dt(20, 11)), _slot("bob", _dt(20, 10, 30), _dt(20, 12))],
+            preferred_slots=[_slot("carol", _dt(21, 9), _dt(21, 10))],
+            participant_ids=["alice", "bob", "carol"],
+        )
+
+        # Act
+        text, slot_minutes = encode_availability(matrix, _days(20, 5), 30, token_budget=1000)
+
+        # Assert
+        assert slot_minutes == 30
+        assert text.splitlines() == [
+            "2025-12-20 09:00 0*2 1 2 1*2 0*10",
+            "2025-12-21 09:00 0/1*2 0*14",
+            "2025-12-22..2025-12-24 09:00 0*16",
+        ]
+
+    def test_slots_before_earliest_start_are_skipped(self):
+        """Test days and slots before not_before are left out, keeping the slot grid."""
+        # Arrange
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[])
+
+        # Act
+        text, _ = encode_availability(matrix, _days(20, 2), 30, token_budget=1000, not_before=_dt(20, 18))
+        text_midday, _ = encode_availability(matrix, _days(20, 1), 30, token_budget=1000, not_before=_dt(20, 12, 10))
+
+        # Assert
+        assert text == "2025-12-21 09:00 0*16"
+        assert text_midday == "2025-12-20 12:30 0*9"
+
+    def test_last_slot_ends_at_end_of_day(self):
+        """Test a partial last slot only counts busy time before the day's end."""
+        # Arrange
+        matrix = AvailabilityMatrix(
+            busy_slots=[_slot("alice", _dt(20, 16, 30), _dt(20, 17, 30))],
+            preferred_slots=[],
+            participant_ids=["alice"],
+        )
+
+        # Act
+        text, _ = encode_availability(matrix, [(_dt(20, 9), _dt(20, 16, 30))], 60, token_budget=1000)
+
+        # Assert
+        assert text == "2025-12-20 09:00 0*8"
+
+    def test_coarsens_to_fit_budget_instead_of_truncating(self):
+        """Test a fragmented window is encoded with longer slots but still covers every day."""
+        # Arrange
+        busy = [
+            _slot(f"user-{i % 4}", _dt(1, 9) + timedelta(days=day, minutes=30 * i), _dt(1, 9) + timedelta(days=day, minutes=30 * i + 20))
+            for day in range(28) for i in range(16) if (day + i) % 3
+        ]
+        matrix = AvailabilityMatrix(busy_slots=busy, preferred_slots=[])
+        days = _days(1, 28)
+        full_text, _ = encode_availability(matrix, days, 30, token_budget=10_000)
+
+        # Act
+        text, slot_minutes = encode_availability(matrix, days, 30, token_budget=estimate_tokens(full_text) // 2)
+
+        # Assert
+        assert slot_minutes > 30
+        assert estimate_tokens(text) <= estimate_tokens(full_text) // 2
+        assert text.startswith("2025-12-01")
+        assert text.splitlines()[-1].split(" ")[0].endswith("2025-12-28")
+
+    def test_stops_at_coarsest_slot(self):
+        """Test an unreachable budget returns the coarsest encoding rather than looping."""
+        # Arrange
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[])
+
+        # Act
+        text, slot_minutes = encode_availability(matrix, _days(1, 3), 30, token_budget=1)
+
+        # Assert
+        assert slot_minutes == MAX_SLOT_MINUTES
+        assert text == "2025-12-01..2025-12-03 09:00 0"
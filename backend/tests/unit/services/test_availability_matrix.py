@@ -0,0 +1,134 @@
+"""
+Unit tests for AvailabilityMatrix.
+
+Test coverage:
+- conflicts_for_interval: unique users, touching slots, overlapping slots per user
+- preferred_count_for_interval: unique users
+- busy_timeline: merged union of busy time
+- slot_counts: fixed-size slot grid
+"""
+
+from datetime import datetime, timezone
+
+from app.services.availability_matrix import AvailabilityMatrix
+
+
+def _iso(hour, minute=0):
+    return f"2025-12-20T{hour:02d}:{minute:02d}:00Z"
+
+
+def _dt(hour, minute=0):
+    return datetime(2025, 12, 20, hour, minute, tzinfo=timezone.utc)
+
+
+def _slot(user_id, start_hour, end_hour, start_minute=0, end_minute=0):
+    return {
+        "user_id": user_id,
+        "start_time_utc": _iso(start_hour, start_minute),
+        "end_time_utc": _iso(end_hour, end_minute),
+    }
+
+
+class TestConflictsForInterval:
+    """Tests for conflicts_for_interval."""
+
+    def test_counts_unique_users(self):
+        matrix = AvailabilityMatrix(
+            busy_slots=[
+                _slot("alice", 9, 10),
+                _slot("alice", 9, 11),
+                _slot("alice", 10, 12),
+                _slot("bob", 10, 11),
+            ],
+            preferred_slots=[],
+            participant_ids=["alice", "bob", "carol"],
+        )
+
+        assert matrix.conflicts_for_interval(_dt(9), _dt(10)) == 1
+        assert matrix.conflicts_for_interval(_dt(10), _dt(11)) == 2
+        assert matrix.conflicts_for_interval(_dt(11, 30), _dt(12, 30)) == 1
+        assert matrix.conflicts_for_interval(_dt(12), _dt(13)) == 0
+
+    def test_touching_slots_do_not_conflict(self):
+        matrix = AvailabilityMatrix(busy_slots=[_slot("alice", 9, 10)], preferred_slots=[])
+
+        assert matrix.conflicts_for_interval(_dt(10), _dt(11)) == 0
+        assert matrix.conflicts_for_interval(_dt(8), _dt(9)) == 0
+        assert matrix.conflicts_for_interval(_dt(8), _dt(9, 1)) == 1
+
+    def test_interval_spanning_all_slots(self):
+        matrix = AvailabilityMatrix(
+            busy_slots=[_slot("alice", 9, 10), _slot("bob", 14, 15)],
+            preferred_slots=[],
+        )
+
+        assert matrix.conflicts_for_interval(_dt(0), _dt(23)) == 2
+
+    def test_no_slots(self):
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[], participant_ids=["alice"])
+
+        assert matrix.conflicts_for_interval(_dt(9), _dt(10)) == 0
+        assert matrix.busy_timeline() == []
+
+
+class TestPreferredCountForInterval:
+    """Tests for preferred_count_for_interval."""
+
+    def test_counts_unique_preferring_users(self):
+        matrix = AvailabilityMatrix(
+            busy_slots=[_slot("alice", 9, 10)],
+            preferred_slots=[
+                _slot("alice", 14, 15),
+                _slot("alice", 14, 16),
+                _slot("bob", 15, 16),
+            ],
+        )
+
+        assert matrix.preferred_count_for_interval(_dt(14), _dt(15)) == 1
+        assert matrix.preferred_count_for_interval(_dt(14, 30), _dt(15, 30)) == 2
+        assert matrix.preferred_count_for_interval(_dt(9), _dt(10)) == 0
+
+
+class TestBusyTimeline:
+    """Tests for busy_timeline."""
+
+    def test_busy_timeline_merges_overlapping_and_touching(self):
+        matrix = AvailabilityMatrix(
+            busy_slots=[
+                _slot("alice", 9, 10),
+                _slot("bob", 9, 11, start_minute=30),
+                _slot("carol", 11, 12),
+                _slot("alice", 14, 15),
+            ],
+            preferred_slots=[_slot("alice", 12, 14)],
+        )
+
+        assert matrix.busy_timeline() == [(_dt(9), _dt(12)), (_dt(14), _dt(15))]
+
+
+class TestSlotCounts:
+    """Tests for slot_counts."""
+
+    def test_matches_per_interval_counts(self):
+        matrix = AvailabilityMatrix(
+            busy_slots=[_slot("alice", 9, 10, end_minute=15), _slot("bob", 9, 11, start_minute=45), _slot("alice", 10, 11)],
+            preferred_slots=[_slot("carol", 10, 12)],
+            participant_ids=["alice", "bob", "carol"],
+        )
+
+        busy, preferred = matrix.slot_counts(_dt(8), 30, 8)
+
+        assert busy.tolist() == [0, 0, 1, 2, 2, 2, 0, 0]
+        assert preferred.tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+        assert busy.tolist() == [
+            matrix.conflicts_for_interval(_dt(8 + i // 2, 30 * (i % 2)), _dt(8 + (i + 1) // 2, 30 * ((i + 1) % 2)))
+            for i in range(8)
+        ]
+
+    def test_no_slots(self):
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[], participant_ids=["alice"])
+
+        busy, preferred = matrix.slot_counts(_dt(9), 30, 3)
+
+        assert busy.tolist() == [0, 0, 0]
+        assert preferred.tolist() == [0, 0, 0]
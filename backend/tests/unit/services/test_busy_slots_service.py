@@ -5,10 +5,18 @@ Test coverage:
 - get_busy_slots: success, date filtering, empty results
 - get_user_busy_slots: success, user filtering
 - store_busy_slot: success, database errors
-- upsert_busy_slot: insert new, update existing, errors
+- upsert_busy_slot: insert new, update existing, constraint upsert, errors
 - bulk_store_busy_slots: success, empty list
 - sync_user_google_calendar: differential sync logic, no credentials
+- _sync_single_source: incremental syncToken deltas, 410 full resync, pagination
+- _sync_single_source: batched streaming upserts of paged listings, batch retry
+- _sync_single_source: content hash classification (moved, unchanged, unhashed rows)
+- _sync_single_microsoft_source: Graph delta links, 410 full resync
+- _sync_multi_calendar: concurrent per-source results
+- _sync_google_account_batch: batched first pages, per-source errors, batch failure
+- free/busy sync mode: one freebusy.query / getSchedule per account, mixed modes
 - get_merged_busy_slots_for_event: RPC call, fallback to Python
+- fetch_busy_slots_in_window: range filters, column projection
 - delete_user_busy_slots_in_range: success, errors
 - validate_busy_slot_data: valid, invalid times, missing fields
 """
@@ -16,7 +24,8 @@ Test coverage:
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, MagicMock
-from app.services.busy_slots import BusySlotService
+from app.services.busy_slots import BusySlotService, fetch_busy_slots_in_window
+from app.config import Config
 from app.models.busy_slot import BusySlot
 
 
@@ -280,6 +289,28 @@ class TestUpsertBusySlot:
         # Assert
         assert result is not None
 
+    def test_upsert_busy_slot_with_source_uses_constraint(self, busy_slot_service, mock_supabase):
+        """Test a slot with a calendar source is upserted in one round trip on the unique constraint."""
+        # Arrange
+        busy_slot = BusySlot(
+            user_id="user-123",
+            start_time_utc=datetime(2025, 12, 20, 14, 0, tzinfo=timezone.utc),
+            end_time_utc=datetime(2025, 12, 20, 15, 0, tzinfo=timezone.utc),
+            provider_event_id="gcal-123",
+            calendar_source_id="src-1"
+        )
+        mock_supabase.table.return_value.upsert.return_value.execute.return_value = Mock(data=[{"provider_event_id": "gcal-123"}])
+
+        # Act
+        result = busy_slot_service.upsert_busy_slot(busy_slot)
+
+        # Assert
+        assert result["provider_event_id"] == "gcal-123"
+        row = mock_supabase.table.return_value.upsert.call_args.args[0]
+        assert "id" not in row
+        assert mock_supabase.table.return_value.upsert.call_args.kwargs["on_conflict"] == "user_id,provider_event_id,calendar_source_id"
+        mock_supabase.table.return_value.select.assert_not_called()
+
 
 # ============================================================================
 # Tests: delete_user_busy_slots_in_range
@@ -422,6 +453,622 @@ class TestSyncUserGoogleCalendar:
                 assert result is True
 
 
+# ============================================================================
+# Tests: _sync_single_source (Google syncToken)
+# ============================================================================
+
+class TestSyncSingleSourceIncremental:
+    """Tests for incremental Google sync with stored sync tokens."""
+
+    @pytest.fixture
+    def google_source(self, sample_date_range):
+        return {
+            "id": "src-1",
+            "calendar_id": "work@example.com",
+            "account": {"id": "acct-1", "provider": "google", "credentials": {"token": "tok"}},
+            "sync_token": "token-1",
+            "sync_window_start": (sample_date_range["start"] - timedelta(days=1)).isoformat(),
+            "sync_window_end": (sample_date_range["end"] + timedelta(days=1)).isoformat(),
+        }
+
+    @pytest.fixture
+    def google_patches(self):
+        mock_service = Mock()
+        mock_accounts = Mock()
+        credentials = Mock(token="tok")
+        with patch("app.services.google_calendar.build_calendar_service", return_value=mock_service), \
+             patch("app.services.google_calendar.get_credentials_from_dict", return_value=credentials), \
+             patch("app.services.google_calendar.refresh_credentials_if_needed", return_value=credentials), \
+             patch("app.services.calendar_accounts.CalendarAccountsService", return_value=mock_accounts):
+            yield mock_service, mock_accounts
+
+    def test_incremental_sync_applies_only_changes(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test a covering sync token lists deltas, upserts live events and deletes cancelled ones."""
+        # Arrange
+        mock_service, mock_accounts = google_patches
+        mock_service.events.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"id": "moved", "status": "confirmed",
+                 "start": {"dateTime": "2025-12-20T16:00:00Z"}, "end": {"dateTime": "2025-12-20T17:00:00Z"}},
+                {"id": "new", "status": "confirmed",
+                 "start": {"dateTime": "2025-12-21T09:00:00Z"}, "end": {"dateTime": "2025-12-21T10:00:00Z"}},
+                {"id": "gone", "status": "cancelled"}
+            ],
+            "nextSyncToken": "token-2"
+        }
+        stored_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.in_.return_value
+        stored_chain.execute.return_value = Mock(data=[{"provider_event_id": "moved"}])
+        delete_chain = mock_supabase.table.return_value.delete.return_value.eq.return_value.eq.return_value.in_.return_value
+        delete_chain.execute.return_value = Mock(data=[{"provider_event_id": "gone"}])
+
+        # Act
+        added, deleted = busy_slot_service._sync_single_source(
+            "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+        )
+
+        # Assert
+        list_kwargs = mock_service.events.return_value.list.call_args.kwargs
+        assert list_kwargs["syncToken"] == "token-1"
+        assert "timeMin" not in list_kwargs
+        mock_supabase.table.return_value.delete.return_value.eq.return_value.eq.return_value.in_.assert_called_once_with(
+            "provider_event_id", ["gone"]
+        )
+        upsert_call = mock_supabase.table.return_value.upsert.call_args
+        assert sorted(row["provider_event_id"] for row in upsert_call.args[0]) == ["moved", "new"]
+        assert upsert_call.kwargs["on_conflict"] == "user_id,provider_event_id,calendar_source_id"
+        assert all("id" not in row and "created_at" not in row for row in upsert_call.args[0])
+        mock_supabase.table.return_value.insert.assert_not_called()
+        assert (added, deleted) == (1, 1)
+        sync_state_args = mock_accounts.update_source_sync_state.call_args[0]
+        assert sync_state_args[:2] == ("src-1", "token-2")
+
+    def test_expired_token_falls_back_to_full_resync(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test a 410 Gone response triggers a full window listing and stores a new token."""
+        # Arrange
+        from googleapiclient.errors import HttpError
+
+        mock_service, mock_accounts = google_patches
+        gone = HttpError(Mock(status=410, reason="Gone"), b"Sync token is no longer valid")
+        full_listing = {
+            "items": [{"id": "evt-1", "start": {"dateTime": "2025-12-20T14:00:00Z"}, "end": {"dateTime": "2025-12-20T15:00:00Z"}}],
+            "nextSyncToken": "fresh-token"
+        }
+        mock_service.events.return_value.list.return_value.execute.side_effect = [gone, full_listing]
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+
+        # Act
+        added, deleted = busy_slot_service._sync_single_source(
+            "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+        )
+
+        # Assert
+        full_kwargs = mock_service.events.return_value.list.call_args.kwargs
+        assert full_kwargs["timeMin"] == sample_date_range["start"].isoformat()
+        assert "syncToken" not in full_kwargs
+        assert (added, deleted) == (1, 0)
+        # The stored window ends on the next 7-day grid line after the requested end
+        mock_accounts.update_source_sync_state.assert_called_once_with(
+            "src-1", "fresh-token", sample_date_range["start"], datetime(2026, 1, 1, tzinfo=timezone.utc)
+        )
+
+    def test_window_outside_token_runs_full_sync(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test a requested window the token does not cover skips the incremental path."""
+        # Arrange
+        mock_service, _ = google_patches
+        google_source["sync_window_end"] = sample_date_range["start"].isoformat()
+        mock_service.events.return_value.list.return_value.execute.return_value = {"items": [], "nextSyncToken": "t"}
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+
+        # Act
+        busy_slot_service._sync_single_source(
+            "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+        )
+
+        # Assert
+        assert "syncToken" not in mock_service.events.return_value.list.call_args.kwargs
+
+    def test_full_sync_window_covers_later_runs(self, busy_slot_service, mock_supabase, google_source, google_patches):
+        """Test the window stored by a full sync still covers a run whose end moved forward a day."""
+        # Arrange
+        mock_service, mock_accounts = google_patches
+        google_source["sync_token"] = None
+        mock_service.events.return_value.list.return_value.execute.return_value = {"items": [], "nextSyncToken": "t"}
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+        first_start = datetime(2025, 12, 20, 9, 30, tzinfo=timezone.utc)
+        first_end = first_start + timedelta(days=90)
+
+        # Act
+        busy_slot_service._sync_single_source("user-123", first_start, first_end, google_source)
+
+        # Assert
+        _, token, window_start, window_end = mock_accounts.update_source_sync_state.call_args[0]
+        assert window_start == datetime(2025, 12, 20, tzinfo=timezone.utc)
+        assert (window_end - datetime(1970, 1, 1, tzinfo=timezone.utc)).days % Config.CALENDAR_SYNC_WINDOW_STEP_DAYS == 0
+        list_kwargs = mock_service.events.return_value.list.call_args.kwargs
+        assert (list_kwargs["timeMin"], list_kwargs["timeMax"]) == (window_start.isoformat(), window_end.isoformat())
+        stored = {"sync_token": token, "sync_window_start": window_start.isoformat(), "sync_window_end": window_end.isoformat()}
+        next_start = first_start + timedelta(days=1)
+        assert BusySlotService._stored_sync_window(stored, next_start, first_end + timedelta(days=1)) == (window_start, window_end)
+
+    def test_full_sync_follows_pages(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test every page is read and the token comes from the last page."""
+        # Arrange
+        mock_service, mock_accounts = google_patches
+        google_source["sync_token"] = None
+        mock_service.events.return_value.list.return_value.execute.side_effect = [
+            {"items": [{"id": "a", "start": {"dateTime": "2025-12-20T14:00:00Z"}, "end": {"dateTime": "2025-12-20T15:00:00Z"}}],
+             "nextPageToken": "page-2"},
+            {"items": [{"id": "b", "start": {"dateTime": "2025-12-21T14:00:00Z"}, "end": {"dateTime": "2025-12-21T15:00:00Z"}}],
+             "nextSyncToken": "token-after-pages"}
+        ]
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+
+        # Act
+        added, _ = busy_slot_service._sync_single_source(
+            "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+        )
+
+        # Assert
+        assert added == 2
+        assert mock_service.events.return_value.list.call_args.kwargs["pageToken"] == "page-2"
+        assert mock_accounts.update_source_sync_state.call_args[0][1] == "token-after-pages"
+
+    def test_full_sync_streams_upserts_in_batches(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test new slots are upserted in fixed-size batches and unchanged stored rows are skipped."""
+        # Arrange
+        mock_service, _ = google_patches
+        google_source["sync_token"] = None
+        events = [
+            {"id": f"evt-{i}", "start": {"dateTime": f"2025-12-2{i}T14:00:00Z"}, "end": {"dateTime": f"2025-12-2{i}T15:00:00Z"}}
+            for i in range(5)
+        ]
+        mock_service.events.return_value.list.return_value.execute.return_value = {"items": events, "nextSyncToken": "t"}
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[
+            {"provider_event_id": "evt-0", "content_hash": BusySlot.from_google_event("user-123", events[0]).content_hash},
+            {"provider_event_id": "stale", "content_hash": "old-hash"},
+        ])
+        delete_chain = mock_supabase.table.return_value.delete.return_value.eq.return_value.eq.return_value.in_.return_value
+        delete_chain.execute.return_value = Mock(data=[{"provider_event_id": "stale"}])
+
+        with patch.object(Config, "CALENDAR_SYNC_BATCH_SIZE", 2):
+            # Act
+            added, deleted = busy_slot_service._sync_single_source(
+                "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+            )
+
+        # Assert
+        assert (added, deleted) == (4, 1)
+        upserts = mock_supabase.table.return_value.upsert.call_args_list
+        assert [len(call.args[0]) for call in upserts] == [2, 2]
+        deleted_ids = mock_supabase.table.return_value.delete.return_value.eq.return_value.eq.return_value.in_.call_args.args[1]
+        assert deleted_ids == ["stale"]
+
+    def test_full_sync_updates_moved_events(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test a stored event whose content hash changed upstream is upserted with the new times."""
+        # Arrange
+        mock_service, _ = google_patches
+        google_source["sync_token"] = None
+        mock_service.events.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "evt-1", "start": {"dateTime": "2025-12-20T16:00:00Z"}, "end": {"dateTime": "2025-12-20T17:00:00Z"}}],
+            "nextSyncToken": "t"
+        }
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[
+            {"provider_event_id": "evt-1", "content_hash": BusySlot.compute_content_hash(
+                datetime(2025, 12, 20, 14, tzinfo=timezone.utc), datetime(2025, 12, 20, 15, tzinfo=timezone.utc), "opaque"
+            )},
+        ])
+
+        # Act
+        added, deleted = busy_slot_service._sync_single_source(
+            "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+        )
+
+        # Assert
+        assert (added, deleted) == (0, 0)
+        [row] = mock_supabase.table.return_value.upsert.call_args.args[0]
+        assert row["provider_event_id"] == "evt-1"
+        assert row["start_time_utc"].startswith("2025-12-20T16:00:00")
+        mock_supabase.table.return_value.delete.assert_not_called()
+
+    def test_incremental_sync_skips_unchanged_events(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test events reported for fields that do not affect availability are not written."""
+        # Arrange
+        mock_service, _ = google_patches
+        renamed = {"id": "renamed", "summary": "New title",
+                   "start": {"dateTime": "2025-12-20T14:00:00Z"}, "end": {"dateTime": "2025-12-20T15:00:00Z"}}
+        freed = {"id": "freed", "transparency": "transparent",
+                 "start": {"dateTime": "2025-12-21T14:00:00Z"}, "end": {"dateTime": "2025-12-21T15:00:00Z"}}
+        mock_service.events.return_value.list.return_value.execute.return_value = {"items": [renamed, freed], "nextSyncToken": "t"}
+        stored_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.in_.return_value
+        stored_chain.execute.return_value = Mock(data=[
+            {"provider_event_id": "renamed", "content_hash": BusySlot.from_google_event("user-123", renamed).content_hash},
+            {"provider_event_id": "freed", "content_hash": BusySlot.from_google_event("user-123", {**freed, "transparency": "opaque"}).content_hash},
+        ])
+
+        # Act
+        added, deleted = busy_slot_service._sync_single_source(
+            "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+        )
+
+        # Assert
+        assert (added, deleted) == (0, 0)
+        [row] = mock_supabase.table.return_value.upsert.call_args.args[0]
+        assert row["provider_event_id"] == "freed"
+        mock_supabase.table.return_value.delete.assert_not_called()
+
+    def test_rows_without_hash_are_rewritten(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test rows synced before content hashes existed count as changed."""
+        # Arrange
+        mock_service, _ = google_patches
+        google_source["sync_token"] = None
+        mock_service.events.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "evt-1", "start": {"dateTime": "2025-12-20T14:00:00Z"}, "end": {"dateTime": "2025-12-20T15:00:00Z"}}],
+            "nextSyncToken": "t"
+        }
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[
+            {"provider_event_id": "evt-1", "content_hash": None},
+        ])
+
+        # Act
+        added, _ = busy_slot_service._sync_single_source(
+            "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+        )
+
+        # Assert
+        assert added == 0
+        [row] = mock_supabase.table.return_value.upsert.call_args.args[0]
+        assert row["content_hash"] is not None
+
+    def test_failed_batch_is_retried(self, busy_slot_service, mock_supabase, sample_date_range, google_source, google_patches):
+        """Test a batch that fails transiently is retried with backoff instead of failing the sync."""
+        # Arrange
+        mock_service, _ = google_patches
+        google_source["sync_token"] = None
+        mock_service.events.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "evt-1", "start": {"dateTime": "2025-12-20T14:00:00Z"}, "end": {"dateTime": "2025-12-20T15:00:00Z"}}],
+            "nextSyncToken": "t"
+        }
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+        mock_supabase.table.return_value.upsert.return_value.execute.side_effect = [Exception("connection reset"), Mock(data=[])]
+
+        with patch("app.services.busy_slots.time.sleep") as mock_sleep:
+            # Act
+            added, _ = busy_slot_service._sync_single_source(
+                "user-123", sample_date_range["start"], sample_date_range["end"], google_source
+            )
+
+        # Assert
+        assert added == 1
+        assert mock_supabase.table.return_value.upsert.return_value.execute.call_count == 2
+        mock_sleep.assert_called_once()
+
+
+# ============================================================================
+# Tests: _sync_single_microsoft_source (Graph delta)
+# ============================================================================
+
+class TestSyncSingleMicrosoftSource:
+    """Tests for Microsoft calendarView delta sync."""
+
+    @pytest.fixture
+    def microsoft_source(self, sample_date_range):
+        return {
+            "id": "ms-src-1",
+            "calendar_id": "cal-1",
+            "account": {"id": "acct-2", "provider": "microsoft", "credentials": {"access_token": "tok"}},
+            "sync_token": "https://graph.microsoft.com/v1.0/delta?$deltatoken=old",
+            "sync_window_start": sample_date_range["start"].isoformat(),
+            "sync_window_end": sample_date_range["end"].isoformat(),
+        }
+
+    @pytest.fixture
+    def accounts_service(self):
+        mock_accounts = Mock()
+        with patch("app.services.microsoft_calendar.refresh_credentials_if_needed", return_value={"access_token": "tok"}), \
+             patch("app.services.microsoft_calendar.get_calendar_service", return_value={"graph_request": Mock()}), \
+             patch("app.services.calendar_accounts.CalendarAccountsService", return_value=mock_accounts):
+            yield mock_accounts
+
+    def test_delta_link_applies_removed_and_changed_events(self, busy_slot_service, mock_supabase, sample_date_range, microsoft_source, accounts_service):
+        """Test a stored deltaLink fetches changes and removes @removed events."""
+        # Arrange
+        changes = [
+            {"id": "evt-1", "start": {"dateTime": "2025-12-20T14:00:00.0000000"}, "end": {"dateTime": "2025-12-20T15:00:00.0000000"}},
+            {"id": "evt-2", "@removed": {"reason": "deleted"}}
+        ]
+        stored_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.in_.return_value
+        stored_chain.execute.return_value = Mock(data=[])
+        delete_chain = mock_supabase.table.return_value.delete.return_value.eq.return_value.eq.return_value.in_.return_value
+        delete_chain.execute.return_value = Mock(data=[{"provider_event_id": "evt-2"}])
+
+        with patch("app.services.microsoft_calendar.get_calendar_view_delta", return_value=(changes, "new-link")) as mock_delta:
+            # Act
+            added, deleted = busy_slot_service._sync_single_microsoft_source(
+                "user-123", sample_date_range["start"], sample_date_range["end"], microsoft_source
+            )
+
+        # Assert
+        assert mock_delta.call_args.kwargs["delta_link"] == microsoft_source["sync_token"]
+        assert (added, deleted) == (1, 1)
+        assert accounts_service.update_source_sync_state.call_args[0][:2] == ("ms-src-1", "new-link")
+
+    def test_expired_delta_link_runs_fresh_delta_round(self, busy_slot_service, mock_supabase, sample_date_range, microsoft_source, accounts_service):
+        """Test a 410 response restarts delta tracking with a full window listing."""
+        # Arrange
+        from requests import HTTPError
+
+        gone = HTTPError(response=Mock(status_code=410))
+        full_round = ([{"id": "evt-1", "start": {"dateTime": "2025-12-20T14:00:00.0000000"}, "end": {"dateTime": "2025-12-20T15:00:00.0000000"}}], "fresh-link")
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[{"provider_event_id": "stale"}])
+        delete_chain = mock_supabase.table.return_value.delete.return_value.eq.return_value.eq.return_value.in_.return_value
+        delete_chain.execute.return_value = Mock(data=[{"provider_event_id": "stale"}])
+
+        with patch("app.services.microsoft_calendar.get_calendar_view_delta", side_effect=[gone, full_round]) as mock_delta:
+            # Act
+            added, deleted = busy_slot_service._sync_single_microsoft_source(
+                "user-123", sample_date_range["start"], sample_date_range["end"], microsoft_source
+            )
+
+        # Assert
+        assert "delta_link" not in mock_delta.call_args.kwargs
+        assert (added, deleted) == (1, 1)
+        accounts_service.update_source_sync_state.assert_called_once_with(
+            "ms-src-1", "fresh-link", sample_date_range["start"], datetime(2026, 1, 1, tzinfo=timezone.utc)
+        )
+
+
+# ============================================================================
+# Tests: _sync_multi_calendar
+# ============================================================================
+
+class TestSyncMultiCalendar:
+    """Tests for _sync_multi_calendar."""
+
+    def test_sync_multi_calendar_aggregates_sources_in_order(self, busy_slot_service, sample_date_range):
+        """Test concurrent per-source results keep source order and totals."""
+        # Arrange
+        sources = [
+            {"id": "src-1", "calendar_name": "Work", "account": {"provider": "google"}},
+            {"id": "src-2", "calendar_name": "Outlook", "account": {"provider": "microsoft"}},
+            {"id": "src-3", "calendar_name": "Broken", "account": {"provider": "google"}},
+        ]
+
+        def google_sync(user_id, start, end, source):
+            if source["id"] == "src-3":
+                raise Exception("invalid_grant")
+            return 3, 1
+
+        busy_slot_service._sync_single_source = Mock(side_effect=google_sync)
+        busy_slot_service._sync_single_microsoft_source = Mock(return_value=(2, 0))
+
+        # Act
+        result = busy_slot_service._sync_multi_calendar(
+            "user-123", sample_date_range["start"], sample_date_range["end"], sources
+        )
+
+        # Assert
+        assert [s["source_id"] for s in result["sources"]] == ["src-1", "src-2", "src-3"]
+        assert [s["status"] for s in result["sources"]] == ["success", "success", "error"]
+        assert result["sources"][2]["error"] == "invalid_grant"
+        assert result["success"] is False
+        assert result["total_added"] == 5
+        assert result["total_deleted"] == 1
+
+
+# ============================================================================
+# Tests: _sync_google_account_batch
+# ============================================================================
+
+class TestSyncGoogleAccountBatch:
+    """Tests for batched first pages across one account's Google calendars."""
+
+    @pytest.fixture
+    def google_patches(self):
+        credentials = Mock(token="tok")
+        mock_service = Mock()
+        mock_accounts = Mock()
+        with patch("app.services.google_calendar.build_calendar_service", return_value=mock_service) as mock_build, \
+             patch("app.services.google_calendar.get_credentials_from_dict", return_value=credentials), \
+             patch("app.services.google_calendar.refresh_credentials_if_needed", return_value=credentials), \
+             patch("app.services.calendar_accounts.CalendarAccountsService", return_value=mock_accounts):
+            yield mock_service, mock_build, mock_accounts
+
+    @staticmethod
+    def _sources(sample_date_range):
+        account = {"id": "acct-1", "provider": "google", "credentials": {"token": "tok"}}
+        return [
+            {"id": "src-1", "calendar_id": "work", "account": account},
+            {"id": "src-2", "calendar_id": "gone", "account": account},
+            {"id": "src-3", "calendar_id": "team", "account": account, "sync_token": "old",
+             "sync_window_start": sample_date_range["start"].isoformat(),
+             "sync_window_end": sample_date_range["end"].isoformat()},
+        ]
+
+    def test_batched_first_pages_map_back_to_sources(self, busy_slot_service, mock_supabase, sample_date_range, google_patches):
+        """Test one service serves every source and sub-request errors stay per source."""
+        # Arrange
+        from googleapiclient.errors import HttpError
+
+        mock_service, mock_build, _ = google_patches
+        sources = self._sources(sample_date_range)
+        first_pages = {
+            "src-1": ({"items": [{"id": "evt-1", "start": {"dateTime": "2025-12-20T14:00:00Z"},
+                                  "end": {"dateTime": "2025-12-20T15:00:00Z"}}], "nextSyncToken": "t1"}, None),
+            "src-2": (None, HttpError(Mock(status=404, reason="Not Found"), b"notFound")),
+            "src-3": (None, HttpError(Mock(status=410, reason="Gone"), b"Sync token is no longer valid")),
+        }
+        mock_service.events.return_value.list.return_value.execute.return_value = {"items": [], "nextSyncToken": "t3"}
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+
+        with patch("app.services.google_calendar.execute_batch", return_value=first_pages) as mock_batch:
+            # Act
+            result = busy_slot_service._sync_multi_calendar(
+                "user-123", sample_date_range["start"], sample_date_range["end"], sources
+            )
+
+        # Assert
+        mock_build.assert_called_once()
+        assert set(mock_batch.call_args.args[1]) == {"src-1", "src-2", "src-3"}
+        assert [(s["source_id"], s["status"], s["added"]) for s in result["sources"]] == [
+            ("src-1", "success", 1), ("src-2", "error", 0), ("src-3", "success", 0)
+        ]
+        # Only the expired token is re-listed, as a full window listing
+        assert mock_service.events.return_value.list.return_value.execute.call_count == 1
+        relisted = mock_service.events.return_value.list.call_args.kwargs
+        assert (relisted["calendarId"], "timeMin" in relisted) == ("team", True)
+
+    def test_failed_batch_falls_back_to_per_calendar_listing(self, busy_slot_service, mock_supabase, sample_date_range, google_patches):
+        """Test a batch call that fails as a whole lists each calendar on its own."""
+        # Arrange
+        mock_service, _, _ = google_patches
+        sources = self._sources(sample_date_range)[:2]
+        mock_service.events.return_value.list.return_value.execute.return_value = {"items": [], "nextSyncToken": "t"}
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+
+        with patch("app.services.google_calendar.execute_batch", side_effect=Exception("batch failed")):
+            # Act
+            result = busy_slot_service._sync_multi_calendar(
+                "user-123", sample_date_range["start"], sample_date_range["end"], sources
+            )
+
+        # Assert
+        assert result["success"] is True
+        assert mock_service.events.return_value.list.return_value.execute.call_count == 2
+
+
+# ============================================================================
+# Tests: free/busy sync mode
+# ============================================================================
+
+class TestSyncFreeBusy:
+    """Tests for accounts synced from provider free/busy blocks."""
+
+    @pytest.fixture
+    def accounts_service(self):
+        mock_accounts = Mock()
+        with patch("app.services.calendar_accounts.CalendarAccountsService", return_value=mock_accounts):
+            yield mock_accounts
+
+    @staticmethod
+    def _source(source_id, calendar_id, provider="google", sync_mode="freebusy", **extra):
+        account = {"id": f"acct-{provider}", "provider": provider, "provider_email": "me@example.com",
+                   "credentials": {"token": "tok", "access_token": "tok"}, "sync_mode": sync_mode}
+        return {"id": source_id, "calendar_id": calendar_id, "calendar_name": calendar_id, "account": account, **extra}
+
+    def test_google_account_uses_one_free_busy_query(self, busy_slot_service, mock_supabase, sample_date_range, accounts_service):
+        """Test all sources of a free/busy account share one query and store their blocks."""
+        # Arrange
+        sources = [self._source("src-1", "work"), self._source("src-2", "shared", sync_token="old-token"),
+                   self._source("src-3", "private")]
+        calendars = {
+            "work": {"busy": [{"start": "2025-12-20T14:00:00Z", "end": "2025-12-20T15:00:00Z"}]},
+            "shared": {"busy": []},
+            "private": {"errors": [{"domain": "global", "reason": "notFound"}]},
+        }
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+        credentials = Mock(token="tok")
+
+        with patch("app.services.google_calendar.build_calendar_service"), \
+             patch("app.services.google_calendar.get_credentials_from_dict", return_value=credentials), \
+             patch("app.services.google_calendar.refresh_credentials_if_needed", return_value=credentials), \
+             patch("app.services.google_calendar.query_free_busy", return_value=calendars) as mock_query:
+            # Act
+            result = busy_slot_service._sync_multi_calendar(
+                "user-123", sample_date_range["start"], sample_date_range["end"], sources
+            )
+
+        # Assert
+        mock_query.assert_called_once()
+        assert mock_query.call_args.args[1] == ["work", "shared", "private"]
+        assert [s["status"] for s in result["sources"]] == ["success", "success", "error"]
+        assert "notFound" in result["sources"][2]["error"]
+        assert result["total_added"] == 1
+        [row] = mock_supabase.table.return_value.upsert.call_args.args[0]
+        assert row["provider_event_id"] == "freebusy:2025-12-20T14:00:00Z/2025-12-20T15:00:00Z"
+        assert row["calendar_source_id"] == "src-1"
+        accounts_service.update_source_sync_state.assert_called_once_with("src-2", None)
+
+    def test_events_mode_sources_are_unchanged(self, busy_slot_service, sample_date_range):
+        """Test event-mode sources keep their per-source sync next to free/busy accounts."""
+        # Arrange
+        sources = [self._source("src-1", "work", sync_mode="events"), self._source("src-2", "team")]
+        busy_slot_service._sync_single_source = Mock(return_value=(3, 1))
+        busy_slot_service._sync_free_busy_account = Mock(return_value=[
+            {"source_id": "src-2", "calendar_name": "team", "status": "success", "added": 2, "deleted": 0, "error": None}
+        ])
+
+        # Act
+        result = busy_slot_service._sync_multi_calendar(
+            "user-123", sample_date_range["start"], sample_date_range["end"], sources
+        )
+
+        # Assert
+        busy_slot_service._sync_single_source.assert_called_once()
+        assert busy_slot_service._sync_free_busy_account.call_args.args[3] == [sources[1]]
+        assert [s["source_id"] for s in result["sources"]] == ["src-1", "src-2"]
+        assert result["total_added"] == 5
+
+    def test_microsoft_schedule_is_stored_for_write_calendar(self, busy_slot_service, mock_supabase, sample_date_range, accounts_service):
+        """Test getSchedule blocks go to the write calendar and other calendars sync from events."""
+        # Arrange
+        sources = [self._source("ms-1", "default", provider="microsoft", is_write_calendar=True),
+                   self._source("ms-2", "birthdays", provider="microsoft")]
+        schedule = {"scheduleId": "me@example.com", "scheduleItems": [
+            {"status": "busy", "start": {"dateTime": "2025-12-20T14:00:00.0000000", "timeZone": "UTC"},
+             "end": {"dateTime": "2025-12-20T15:00:00.0000000", "timeZone": "UTC"}},
+            {"status": "free", "start": {"dateTime": "2025-12-20T16:00:00.0000000", "timeZone": "UTC"},
+             "end": {"dateTime": "2025-12-20T17:00:00.0000000", "timeZone": "UTC"}},
+        ]}
+        db_chain = mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        db_chain.lt.return_value.gt.return_value.not_.is_.return_value.execute.return_value = Mock(data=[])
+        busy_slot_service._sync_single_microsoft_source = Mock(return_value=(4, 0))
+
+        with patch("app.services.microsoft_calendar.refresh_credentials_if_needed", return_value={"access_token": "tok"}), \
+             patch("app.services.microsoft_calendar.get_calendar_service", return_value={"graph_request": Mock()}), \
+             patch("app.services.microsoft_calendar.get_schedule", return_value=[schedule]) as mock_schedule:
+            # Act
+            result = busy_slot_service._sync_multi_calendar(
+                "user-123", sample_date_range["start"], sample_date_range["end"], sources
+            )
+
+        # Assert
+        assert mock_schedule.call_args.args[1] == ["me@example.com"]
+        [row] = mock_supabase.table.return_value.upsert.call_args.args[0]
+        assert row["calendar_source_id"] == "ms-1"
+        assert busy_slot_service._sync_single_microsoft_source.call_args.args[3] is sources[1]
+        assert [(s["source_id"], s["added"]) for s in result["sources"]] == [("ms-1", 1), ("ms-2", 4)]
+
+    def test_empty_microsoft_schedule_is_a_source_error(self, busy_slot_service, sample_date_range, accounts_service):
+        """Test a getSchedule response without schedule information fails only the write calendar."""
+        # Arrange
+        sources = [self._source("ms-1", "default", provider="microsoft", is_write_calendar=True)]
+
+        with patch("app.services.microsoft_calendar.refresh_credentials_if_needed", return_value={"access_token": "tok"}), \
+             patch("app.services.microsoft_calendar.get_calendar_service", return_value={"graph_request": Mock()}), \
+             patch("app.services.microsoft_calendar.get_schedule", return_value=[]):
+            # Act
+            result = busy_slot_service._sync_multi_calendar(
+                "user-123", sample_date_range["start"], sample_date_range["end"], sources
+            )
+
+        # Assert
+        [source_result] = result["sources"]
+        assert source_result["status"] == "error"
+        assert "no schedule returned" in source_result["error"]
+
+
 # ============================================================================
 # Tests: get_merged_busy_slots_for_event
 # ============================================================================
@@ -477,7 +1124,7 @@ class TestGetMergedBusySlotsForEvent:
 
         # For busy slots query
         mock_table2 = Mock()
-        mock_table2.select.return_value.in_.return_value.lte.return_value.gte.return_value.order.return_value.execute.return_value = busy_slots_result
+        mock_table2.select.return_value.in_.return_value.lt.return_value.gt.return_value.order.return_value.execute.return_value = busy_slots_result
 
         def table_selector(table_name):
             if table_name == "event_participants":
@@ -491,6 +1138,83 @@ class TestGetMergedBusySlotsForEvent:
 
         # Assert
         assert isinstance(result, list)
+        assert [s["busy_participants_count"] for s in result] == [1]
+
+    def test_merge_python_keeps_user_busy_until_last_overlapping_slot_ends(self, busy_slot_service):
+        """Test a user's overlapping slots are reference-counted rather than dropped at the first end."""
+        # Arrange
+        busy_slots = [
+            {"user_id": "user-1", "start_time_utc": datetime(2025, 12, 20, 9), "end_time_utc": datetime(2025, 12, 20, 11)},
+            {"user_id": "user-1", "start_time_utc": datetime(2025, 12, 20, 9, 30), "end_time_utc": datetime(2025, 12, 20, 10)},
+            {"user_id": "user-2", "start_time_utc": datetime(2025, 12, 20, 10, 30), "end_time_utc": datetime(2025, 12, 20, 12)},
+        ]
+
+        # Act
+        result = busy_slot_service._merge_overlapping_slots_python(busy_slots)
+
+        # Assert
+        assert [(s["start_time"], s["end_time"], s["busy_participants_count"]) for s in result] == [
+            ("2025-12-20T09:00:00", "2025-12-20T09:30:00", 1),
+            ("2025-12-20T09:30:00", "2025-12-20T10:00:00", 1),
+            ("2025-12-20T10:00:00", "2025-12-20T10:30:00", 1),
+            ("2025-12-20T10:30:00", "2025-12-20T11:00:00", 2),
+            ("2025-12-20T11:00:00", "2025-12-20T12:00:00", 1),
+        ]
+
+
+# ============================================================================
+# Tests: fetch_busy_slots_in_window
+# ============================================================================
+
+class TestFetchBusySlotsInWindow:
+    """Tests for the window-bounded busy slot query."""
+
+    def test_fetch_applies_range_filters_and_projection(self, mock_supabase, sample_date_range):
+        """Test the query projects columns and bounds slots to the window."""
+        # Arrange
+        query = mock_supabase.table.return_value.select.return_value.in_.return_value
+        query.lt.return_value = query
+        query.gt.return_value = query
+        query.order.return_value.execute.return_value = Mock(data=[{"user_id": "user-1"}])
+
+        # Act
+        result = fetch_busy_slots_in_window(
+            mock_supabase, ["user-1", "user-2"], sample_date_range["start"], sample_date_range["end"]
+        )
+
+        # Assert
+        assert result == [{"user_id": "user-1"}]
+        mock_supabase.table.assert_called_once_with("busy_slots")
+        mock_supabase.table.return_value.select.assert_called_once_with(
+            "id, user_id, start_time_utc, end_time_utc, calendar_source_id"
+        )
+        mock_supabase.table.return_value.select.return_value.in_.assert_called_once_with("user_id", ["user-1", "user-2"])
+        query.lt.assert_called_once_with("start_time_utc", sample_date_range["end"].isoformat())
+        query.gt.assert_called_once_with("end_time_utc", sample_date_range["start"].isoformat())
+        query.order.assert_called_once_with("start_time_utc")
+
+    def test_fetch_leaves_missing_bound_open(self, mock_supabase, sample_date_range):
+        """Test only the known side of the window is filtered."""
+        # Arrange
+        query = mock_supabase.table.return_value.select.return_value.in_.return_value
+        query.gt.return_value = query
+        query.order.return_value.execute.return_value = Mock(data=[])
+
+        # Act
+        fetch_busy_slots_in_window(mock_supabase, ["user-1"], sample_date_range["start"], None)
+
+        # Assert
+        query.lt.assert_not_called()
+        query.gt.assert_called_once_with("end_time_utc", sample_date_range["start"].isoformat())
+
+    def test_fetch_no_users_skips_query(self, mock_supabase, sample_date_range):
+        """Test an empty participant list does not hit the database."""
+        # Act
+        result = fetch_busy_slots_in_window(mock_supabase, [], sample_date_range["start"], sample_date_range["end"])
+
+        # Assert
+        assert result == []
+        mock_supabase.table.assert_not_called()
 
 
 # ============================================================================
@@ -0,0 +1,296 @@
+"""
+Unit tests for the asynchronous Gemini client.
+
+Test coverage:
+- LatencyTracker: minimum samples, percentiles
+- GeminiClient.generate: async model, parse errors, deadline, rate limiter budget,
+  concurrent quota waits
+- Hedging: second request after the percentile, first success wins, no free slot,
+  slot check off the event loop
+- generate_sync: background event loop wrapper
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.gemini_client import GeminiClient, GeminiTimeout, LatencyTracker
+from app.utils.rate_limiter import RateLimitExceeded
+
+
+class FakeModel:
+    """Async model returning scripted (delay, text) responses in call order."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_content_async(self, prompt):
+        delay, text = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(text, Exception):
+            raise text
+        return Mock(text=text, usage_metadata=Mock(total_token_count=100))
+
+
+@pytest.fixture
+def limiter():
+    limiter = Mock()
+    limiter.acquire.return_value = 0.0
+    return limiter
+
+
+def _warm_tracker(latency: float) -> LatencyTracker:
+    tracker = LatencyTracker(min_samples=5)
+    for _ in range(5):
+        tracker.record(latency)
+    return tracker
+
+
+def _client(model, limiter, **kwargs):
+    kwargs.setdefault("hedge_percentile", 0)
+    kwargs.setdefault("latency", LatencyTracker())
+    return GeminiClient(model, rate_limiter=limiter, **kwargs)
+
+
+# ============================================================================
+# Tests: LatencyTracker
+# ============================================================================
+
+class TestLatencyTracker:
+    """Tests for the latency percentile window."""
+
+    def test_no_percentile_until_min_samples(self):
+        """Test hedging stays off until enough latencies are known."""
+        # Arrange
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record(1.0)
+        tracker.record(2.0)
+
+        # Act / Assert
+        assert tracker.percentile(95) is None
+
+    def test_percentile_of_window(self):
+        """Test percentiles are taken over the recorded samples."""
+        # Arrange
+        tracker = LatencyTracker(min_samples=1)
+        for seconds in range(1, 101):
+            tracker.record(float(seconds))
+
+        # Act / Assert
+        assert tracker.percentile(50) == 51.0
+        assert tracker.percentile(95) == 95.0
+        assert tracker.percentile(100) == 100.0
+
+
+# ============================================================================
+# Tests: GeminiClient.generate
+# ============================================================================
+
+class TestGenerate:
+    """Tests for single-request calls."""
+
+    def test_returns_parsed_response_and_records_usage(self, limiter):
+        """Test the parsed response is returned and actual token usage is reported."""
+        # Arrange
+        model = FakeModel((0, '["slot"]'))
+        client = _client(model, limiter)
+
+        # Act
+        result = asyncio.run(client.generate("prompt", parse=lambda text: text.upper()))
+
+        # Assert
+        assert result == '["SLOT"]'
+        estimated = limiter.acquire.call_args.args[0]
+        limiter.record_usage.assert_called_once_with(estimated, 100)
+        assert len(client.latency._samples) == 1
+
+    def test_parse_failure_is_retried(self, limiter, monkeypatch):
+        """Test a response that fails to parse is retried like an API error."""
+        # Arrange
+        monkeypatch.setattr("app.services.gemini_client._backoff", _no_backoff)
+        model = FakeModel((0, "not json"), (0, "ok"))
+
+        def parse(text):
+            if text != "ok":
+                raise ValueError("bad json")
+            return text
+
+        # Act
+        result = asyncio.run(_client(model, limiter).generate("prompt", parse=parse))
+
+        # Assert
+        assert result == "ok"
+        assert model.calls == 2
+
+    def test_deadline_cancels_slow_request(self, limiter):
+        """Test a request still running at the deadline is cancelled."""
+        # Arrange
+        model = FakeModel((5, "late"))
+        client = _client(model, limiter, deadline_seconds=0.05)
+
+        # Act / Assert
+        with pytest.raises(GeminiTimeout):
+            asyncio.run(client.generate("prompt"))
+        assert model.cancelled == 1
+
+    def test_quota_wait_does_not_count_against_deadline(self, limiter):
+        """Test time spent waiting for the rate limiter extends the deadline."""
+        # Arrange
+        limiter.acquire.side_effect = lambda tokens, max_wait_seconds=None: _sleep_and_return(0.1)
+        model = FakeModel((0, "ok"))
+        client = _client(model, limiter, deadline_seconds=0.05, rate_limit_max_wait=5)
+
+        # Act
+        result = asyncio.run(client.generate("prompt"))
+
+        # Assert
+        assert result == "ok"
+        assert limiter.acquire.call_args.kwargs["max_wait_seconds"] == 5
+
+    def test_quota_waits_do_not_queue_behind_each_other(self, limiter):
+        """Test more callers than the default executor's threads can all wait for quota at once."""
+        # Arrange
+        callers = 40
+        barrier = threading.Barrier(callers, timeout=5)
+        limiter.acquire.side_effect = lambda tokens, max_wait_seconds=None: barrier.wait() and 0.0
+        client = _client(FakeModel((0, "ok")), limiter, rate_limit_max_wait=300)
+
+        async def generate_all():
+            return await asyncio.gather(*(client.generate("prompt") for _ in range(callers)))
+
+        # Act
+        results = asyncio.run(generate_all())
+
+        # Assert
+        assert results == ["ok"] * callers
+
+    def test_rate_limit_errors_keep_message(self, limiter, monkeypatch):
+        """Test exhausted retries on quota errors surface the rate limit message."""
+        # Arrange
+        monkeypatch.setattr("app.services.gemini_client._backoff", _no_backoff)
+        model = FakeModel((0, Exception("429 quota exceeded")))
+
+        # Act / Assert
+        with pytest.raises(Exception, match="rate limit exceeded"):
+            asyncio.run(_client(model, limiter, max_retries=2).generate("prompt"))
+        assert model.calls == 2
+
+
+# ============================================================================
+# Tests: hedging
+# ============================================================================
+
+class TestHedging:
+    """Tests for hedged second requests."""
+
+    def test_hedge_wins_and_primary_is_cancelled(self, limiter):
+        """Test a slow primary is hedged after the percentile and cancelled once the hedge answers."""
+        # Arrange
+        model = FakeModel((5, "primary"), (0, "hedge"))
+        client = _client(model, limiter, hedge_percentile=95, latency=_warm_tracker(0.02))
+        acquire_threads = []
+        limiter.acquire.side_effect = lambda tokens, max_wait_seconds=None: acquire_threads.append(
+            threading.current_thread()
+        )
+
+        # Act
+        result = asyncio.run(client.generate("prompt"))
+
+        # Assert
+        assert result == "hedge"
+        assert model.calls == 2
+        assert model.cancelled == 1
+        assert limiter.acquire.call_args_list[-1].kwargs["max_wait_seconds"] == 0
+        assert threading.main_thread() not in acquire_threads
+
+    def test_hedge_parse_failure_falls_back_to_primary(self, limiter):
+        """Test the primary response still wins when the faster hedge fails to parse."""
+        # Arrange
+        model = FakeModel((0.1, "good"), (0, "bad"))
+        client = _client(model, limiter, hedge_percentile=95, latency=_warm_tracker(0.02))
+
+        def parse(text):
+            if text == "bad":
+                raise ValueError("bad json")
+            return text
+
+        # Act
+        result = asyncio.run(client.generate("prompt", parse=parse))
+
+        # Assert
+        assert result == "good"
+        assert model.calls == 2
+
+    def test_no_hedge_without_free_slot(self, limiter):
+        """Test hedging never waits for quota: no free slot means no second request."""
+        # Arrange
+        def acquire(tokens, max_wait_seconds=None):
+            if max_wait_seconds == 0:
+                raise RateLimitExceeded("no slot")
+            return 0.0
+
+        limiter.acquire.side_effect = acquire
+        model = FakeModel((0.1, "primary"))
+        client = _client(model, limiter, hedge_percentile=95, latency=_warm_tracker(0.02))
+
+        # Act
+        result = asyncio.run(client.generate("prompt"))
+
+        # Assert
+        assert result == "primary"
+        assert model.calls == 1
+
+    def test_fast_primary_is_not_hedged(self, limiter):
+        """Test requests faster than the percentile send a single request."""
+        # Arrange
+        model = FakeModel((0, "primary"))
+        client = _client(model, limiter, hedge_percentile=95, latency=_warm_tracker(1.0))
+
+        # Act
+        asyncio.run(client.generate("prompt"))
+
+        # Assert
+        assert model.calls == 1
+        assert limiter.acquire.call_count == 1
+
+
+# ============================================================================
+# Tests: generate_sync
+# ============================================================================
+
+class TestGenerateSync:
+    """Tests for the synchronous wrapper."""
+
+    def test_sync_models_run_on_background_loop(self, limiter):
+        """Test models without an async API are called through the executor."""
+        # Arrange
+        model = Mock(spec=["generate_content"])
+        model.generate_content.return_value = Mock(text="ok")
+        client = _client(model, limiter)
+
+        # Act
+        first = client.generate_sync("prompt")
+        second = client.generate_sync("prompt", parse=len)
+
+        # Assert
+        assert (first, second) == ("ok", 2)
+        assert model.generate_content.call_count == 2
+
+
+async def _no_backoff(seconds):
+    return None
+
+
+def _sleep_and_return(seconds):
+    time.sleep(seconds)
+    return seconds
@@ -10,7 +10,11 @@ Test coverage:
 - refresh_credentials_if_needed: expired, not expired
 - validate_credentials: valid, expired, refreshable
 - get_calendar_service: success, token refresh
+- build_calendar_service: document loaded once, same requests as build, fallback
 - revoke_credentials: success
+- EventStream: field mask, page size, pagination, sync token, prefetched first page
+- execute_batch: batch size, per-request errors
+- query_free_busy: window, calendar chunking
 """
 
 import pytest
@@ -163,7 +167,7 @@ class TestStoreCredentials:
         mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = check_result
         mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = update_result
 
-        with patch("supabase.create_client", return_value=mock_supabase):
+        with patch("app.utils.supabase_client.get_service_role_client", return_value=mock_supabase):
             # Act - Should not raise
             gc.store_credentials("user-123", sample_credentials)
 
@@ -175,7 +179,7 @@ class TestStoreCredentials:
         check_result.data = []
         mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = check_result
 
-        with patch("supabase.create_client", return_value=mock_supabase):
+        with patch("app.utils.supabase_client.get_service_role_client", return_value=mock_supabase):
             # Act - Should return without error
             gc.store_credentials("user-999", sample_credentials)
 
@@ -203,7 +207,7 @@ class TestGetStoredCredentials:
         mock_result.data = [{"google_auth_token": stored_creds}]
         mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_result
 
-        with patch("supabase.create_client", return_value=mock_supabase):
+        with patch("app.utils.supabase_client.get_service_role_client", return_value=mock_supabase):
             # Act
             result = gc.get_stored_credentials("user-123")
 
@@ -218,7 +222,7 @@ class TestGetStoredCredentials:
         mock_result.data = []
         mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_result
 
-        with patch("supabase.create_client", return_value=mock_supabase):
+        with patch("app.utils.supabase_client.get_service_role_client", return_value=mock_supabase):
             # Act
             result = gc.get_stored_credentials("user-999")
 
@@ -321,12 +325,12 @@ class TestGetCalendarService:
         # Arrange
         with patch("app.services.google_calendar.refresh_credentials_if_needed", return_value=sample_credentials):
             with patch("app.services.google_calendar.store_credentials"):
-                with patch("app.services.google_calendar.build") as mock_build:
+                with patch("app.services.google_calendar.build_calendar_service") as mock_build:
                     # Act
                     result = gc.get_calendar_service(sample_credentials, "user-123")
 
                     # Assert
-                    mock_build.assert_called_once_with("calendar", "v3", credentials=sample_credentials)
+                    mock_build.assert_called_once_with(sample_credentials)
 
     def test_get_calendar_service_refreshes_token(self):
         """Test calendar service refreshes expired token."""
@@ -339,7 +343,7 @@ class TestGetCalendarService:
 
         with patch("app.services.google_calendar.refresh_credentials_if_needed", return_value=refreshed_credentials) as mock_refresh:
             with patch("app.services.google_calendar.store_credentials") as mock_store:
-                with patch("app.services.google_calendar.build"):
+                with patch("app.services.google_calendar.build_calendar_service"):
                     # Act
                     gc.get_calendar_service(mock_credentials, "user-123")
 
@@ -348,6 +352,60 @@ class TestGetCalendarService:
                     mock_store.assert_called_once()
 
 
+# ============================================================================
+# Tests: build_calendar_service
+# ============================================================================
+
+class TestBuildCalendarService:
+    """Tests for the cached discovery document and service factory."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_document(self):
+        with patch.object(gc, "_discovery_document", None), \
+             patch.object(gc, "_discovery_document_loaded", False):
+            yield
+
+    def test_discovery_document_is_loaded_once(self, sample_credentials):
+        """Test the bundled document is read and parsed once for many services."""
+        # Arrange
+        with patch("app.services.google_calendar.get_static_doc", wraps=gc.get_static_doc) as mock_static:
+            # Act
+            first = gc.build_calendar_service(sample_credentials)
+            second = gc.build_calendar_service(sample_credentials)
+
+        # Assert
+        mock_static.assert_called_once_with("calendar", "v3")
+        assert first is not second
+        assert first._rootDesc is second._rootDesc
+        assert first._http.credentials is sample_credentials
+
+    def test_service_requests_match_build(self, sample_credentials):
+        """Test services from the cached document build the same requests as build()."""
+        # Arrange
+        built = gc.build("calendar", "v3", credentials=sample_credentials)
+        cached = gc.build_calendar_service(sample_credentials)
+
+        # Act
+        expected = built.events().list(calendarId="primary", maxResults=10)
+        actual = cached.events().list(calendarId="primary", maxResults=10)
+
+        # Assert
+        assert actual.uri == expected.uri
+        assert actual.method == expected.method
+
+    def test_falls_back_to_build_without_bundled_document(self, sample_credentials):
+        """Test build() is used when the library does not bundle the document."""
+        # Arrange
+        with patch("app.services.google_calendar.get_static_doc", return_value=None), \
+             patch("app.services.google_calendar.build") as mock_build:
+            # Act
+            result = gc.build_calendar_service(sample_credentials)
+
+        # Assert
+        mock_build.assert_called_once_with("calendar", "v3", credentials=sample_credentials)
+        assert result is mock_build.return_value
+
+
 # ============================================================================
 # Tests: revoke_credentials
 # ============================================================================
@@ -381,3 +439,146 @@ class TestRevokeCredentials:
 
                 # Assert - Update should still be called to clear the field
                 mock_supabase.table.assert_called()
+
+
+# ============================================================================
+# Tests: EventStream
+# ============================================================================
+
+class TestEventStream:
+    """Tests for the paged events.list iterator."""
+
+    def test_requests_field_mask_and_max_page_size(self):
+        """Test every page is requested with the busy-slot field mask and page size."""
+        # Arrange
+        service = Mock()
+        service.events.return_value.list.return_value.execute.return_value = {"items": [{"id": "a"}]}
+
+        # Act
+        events = list(gc.EventStream(service, calendarId="primary", singleEvents=True))
+
+        # Assert
+        assert events == [{"id": "a"}]
+        kwargs = service.events.return_value.list.call_args.kwargs
+        assert kwargs["fields"] == gc.BUSY_EVENT_FIELDS
+        assert kwargs["maxResults"] == gc.EVENTS_PAGE_SIZE
+        assert kwargs["calendarId"] == "primary"
+
+    def test_pages_lazily_and_exposes_sync_token(self):
+        """Test pages are fetched on demand and the token is read from the last page."""
+        # Arrange
+        service = Mock()
+        execute = service.events.return_value.list.return_value.execute
+        execute.side_effect = [
+            {"items": [{"id": "a"}], "nextPageToken": "page-2"},
+            {"items": [{"id": "b"}], "nextSyncToken": "sync-1"},
+        ]
+        stream = gc.EventStream(service, calendarId="primary")
+
+        # Act
+        iterator = iter(stream)
+        first = next(iterator)
+
+        # Assert
+        assert first == {"id": "a"}
+        assert execute.call_count == 1
+        assert stream.next_sync_token is None
+
+        assert list(iterator) == [{"id": "b"}]
+        assert service.events.return_value.list.call_args.kwargs["pageToken"] == "page-2"
+        assert stream.next_sync_token == "sync-1"
+        assert stream.pages == 2
+
+
+class TestEventStreamFirstPage:
+    """Tests for streams starting from a prefetched page."""
+
+    def test_prefetched_page_is_not_requested_again(self):
+        """Test a first page from a batch is used as-is and later pages are requested."""
+        # Arrange
+        service = Mock()
+        service.events.return_value.list.return_value.execute.return_value = {"items": [{"id": "b"}], "nextSyncToken": "sync-1"}
+        first_page = {"items": [{"id": "a"}], "nextPageToken": "page-2"}
+
+        # Act
+        stream = gc.EventStream(service, first_page=first_page, calendarId="primary")
+        events = list(stream)
+
+        # Assert
+        assert [event["id"] for event in events] == ["a", "b"]
+        service.events.return_value.list.assert_called_once()
+        assert service.events.return_value.list.call_args.kwargs["pageToken"] == "page-2"
+        assert stream.pages == 2
+        assert stream.next_sync_token == "sync-1"
+
+
+# ============================================================================
+# Tests: execute_batch
+# ============================================================================
+
+class TestExecuteBatch:
+    """Tests for batch HTTP execution."""
+
+    def test_maps_sub_request_results_and_errors(self):
+        """Test requests are split into batches and each id gets its response or error."""
+        # Arrange
+        service = Mock()
+        batches = []
+
+        def new_batch(callback):
+            batch = Mock()
+            added = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+
+            def execute():
+                for request_id in added:
+                    if request_id == "bad":
+                        callback(request_id, None, Exception("notFound"))
+                    else:
+                        callback(request_id, {"items": [], "id": request_id}, None)
+
+            batch.execute.side_effect = execute
+            batches.append(added)
+            return batch
+
+        service.new_batch_http_request.side_effect = new_batch
+
+        # Act
+        results = gc.execute_batch(service, {"a": Mock(), "bad": Mock(), "c": Mock()}, batch_size=2)
+
+        # Assert
+        assert batches == [["a", "bad"], ["c"]]
+        assert results["a"] == ({"items": [], "id": "a"}, None)
+        assert results["bad"][0] is None
+        assert str(results["bad"][1]) == "notFound"
+
+
+# ============================================================================
+# Tests: query_free_busy
+# ============================================================================
+
+class TestQueryFreeBusy:
+    """Tests for query_free_busy."""
+
+    def test_chunks_calendars_per_request(self):
+        """Test calendars are queried in chunks of FREEBUSY_MAX_CALENDARS and merged."""
+        # Arrange
+        from datetime import datetime, timezone
+
+        service = Mock()
+        calendar_ids = [f"cal-{i}" for i in range(gc.FREEBUSY_MAX_CALENDARS + 1)]
+        service.freebusy.return_value.query.return_value.execute.side_effect = [
+            {"calendars": {"cal-0": {"busy": [{"start": "2025-12-20T14:00:00Z", "end": "2025-12-20T15:00:00Z"}]}}},
+            {"calendars": {calendar_ids[-1]: {"busy": []}}},
+        ]
+        start = datetime(2025, 12, 20, tzinfo=timezone.utc)
+        end = datetime(2025, 12, 27, tzinfo=timezone.utc)
+
+        # Act
+        calendars = gc.query_free_busy(service, calendar_ids, start, end)
+
+        # Assert
+        bodies = [call.kwargs["body"] for call in service.freebusy.return_value.query.call_args_list]
+        assert [len(body["items"]) for body in bodies] == [gc.FREEBUSY_MAX_CALENDARS, 1]
+        assert bodies[0]["timeMin"] == start.isoformat()
+        assert set(calendars) == {"cal-0", calendar_ids[-1]}
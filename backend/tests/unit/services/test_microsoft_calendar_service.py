@@ -0,0 +1,204 @@
+"""
+Unit tests for Microsoft Calendar Graph helpers.
+
+Test coverage:
+- list_graph_pages: nextLink pagination, deltaLink, HTTP errors
+- list_calendar_view: window params, page size
+- get_calendar_view_delta: initial round, incremental round
+- get_schedule: UTC window, schedule information, windows over 62 days split per request
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from requests import HTTPError
+
+from app.services import microsoft_calendar as mc
+
+
+def _graph_response(payload, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError(response=response)
+    return response
+
+
+@pytest.fixture
+def window():
+    return (
+        datetime(2025, 12, 20, tzinfo=timezone.utc),
+        datetime(2025, 12, 27, tzinfo=timezone.utc),
+    )
+
+
+# ============================================================================
+# Tests: list_graph_pages
+# ============================================================================
+
+class TestListGraphPages:
+    """Tests for list_graph_pages."""
+
+    def test_follows_next_links_until_last_page(self):
+        """Test every page is requested and items are concatenated."""
+        # Arrange
+        next_link = "https://graph.microsoft.com/v1.0/me/calendarView?$skip=500"
+        graph_request = Mock(side_effect=[
+            _graph_response({"value": [{"id": "a"}], "@odata.nextLink": next_link}),
+            _graph_response({"value": [{"id": "b"}]}),
+        ])
+
+        # Act
+        items, delta_link = mc.list_graph_pages(graph_request, "/me/calendarView", params={"$top": 500})
+
+        # Assert
+        assert [item["id"] for item in items] == ["a", "b"]
+        assert delta_link is None
+        first, second = graph_request.call_args_list
+        assert first.args == ("GET", "/me/calendarView")
+        assert first.kwargs["params"] == {"$top": 500}
+        assert second.args == ("GET", next_link)
+        assert second.kwargs["params"] is None
+
+    def test_returns_delta_link_from_last_page(self):
+        """Test the deltaLink of the final page is returned."""
+        # Arrange
+        graph_request = Mock(return_value=_graph_response({
+            "value": [],
+            "@odata.deltaLink": "https://graph.microsoft.com/v1.0/delta?$deltatoken=abc"
+        }))
+
+        # Act
+        _, delta_link = mc.list_graph_pages(graph_request, "/me/calendars/cal/calendarView/delta")
+
+        # Assert
+        assert delta_link.endswith("$deltatoken=abc")
+
+    def test_raises_on_http_error(self):
+        """Test HTTP errors (e.g. 410 for an expired delta link) propagate."""
+        # Arrange
+        graph_request = Mock(return_value=_graph_response({}, status_code=410))
+
+        # Act / Assert
+        with pytest.raises(HTTPError) as error:
+            mc.list_graph_pages(graph_request, "https://graph.microsoft.com/v1.0/delta?$deltatoken=old")
+        assert error.value.response.status_code == 410
+
+
+# ============================================================================
+# Tests: list_calendar_view / get_calendar_view_delta
+# ============================================================================
+
+class TestCalendarView:
+    """Tests for calendarView listing and delta rounds."""
+
+    def test_list_calendar_view_sends_window_and_page_size(self, window):
+        """Test the window and page size are passed on the first request."""
+        # Arrange
+        graph_request = Mock(return_value=_graph_response({"value": [{"id": "a"}]}))
+
+        # Act
+        items = mc.list_calendar_view(graph_request, "/me/calendarView", *window)
+
+        # Assert
+        assert items == [{"id": "a"}]
+        assert graph_request.call_args.kwargs["params"] == {
+            "startDateTime": window[0].isoformat(),
+            "endDateTime": window[1].isoformat(),
+            "$top": mc.GRAPH_PAGE_SIZE,
+        }
+
+    def test_initial_delta_round_lists_window(self, window):
+        """Test the first delta round targets the calendar's calendarView/delta."""
+        # Arrange
+        graph_request = Mock(return_value=_graph_response({"value": [], "@odata.deltaLink": "link-1"}))
+
+        # Act
+        _, delta_link = mc.get_calendar_view_delta(graph_request, "cal-1", *window)
+
+        # Assert
+        assert delta_link == "link-1"
+        call = graph_request.call_args
+        assert call.args == ("GET", "/me/calendars/cal-1/calendarView/delta")
+        assert call.kwargs["params"]["startDateTime"] == window[0].isoformat()
+        assert call.kwargs["headers"] == {"Prefer": f"odata.maxpagesize={mc.GRAPH_PAGE_SIZE}"}
+
+    def test_incremental_delta_round_uses_stored_link(self, window):
+        """Test a stored deltaLink is requested as-is."""
+        # Arrange
+        graph_request = Mock(return_value=_graph_response({
+            "value": [{"id": "gone", "@removed": {"reason": "deleted"}}],
+            "@odata.deltaLink": "link-2"
+        }))
+
+        # Act
+        events, delta_link = mc.get_calendar_view_delta(graph_request, "cal-1", *window, delta_link="link-1")
+
+        # Assert
+        assert events[0]["@removed"] == {"reason": "deleted"}
+        assert delta_link == "link-2"
+        assert graph_request.call_args.args == ("GET", "link-1")
+        assert graph_request.call_args.kwargs["params"] is None
+
+
+# ============================================================================
+# Tests: get_schedule
+# ============================================================================
+
+class TestGetSchedule:
+    """Tests for getSchedule free/busy lookups."""
+
+    def test_posts_mailboxes_and_utc_window(self, window):
+        """Test one POST covers every mailbox with the window in UTC."""
+        # Arrange
+        schedule = {"scheduleId": "me@example.com", "scheduleItems": [{"status": "busy"}]}
+        graph_request = Mock(return_value=_graph_response({"value": [schedule]}))
+
+        # Act
+        result = mc.get_schedule(graph_request, ["me@example.com"], *window)
+
+        # Assert
+        assert result == [schedule]
+        call = graph_request.call_args
+        assert call.args == ("POST", "/me/calendar/getSchedule")
+        assert call.kwargs["json"]["schedules"] == ["me@example.com"]
+        assert call.kwargs["json"]["startTime"] == {"dateTime": "2025-12-20T00:00:00", "timeZone": "UTC"}
+        assert call.kwargs["headers"] == {"Prefer": 'outlook.timezone="UTC"'}
+
+    def test_long_window_is_split_into_62_day_requests(self):
+        """Test a 90-day window takes two requests whose schedule items are concatenated."""
+        # Arrange
+        start = datetime(2025, 12, 20, tzinfo=timezone.utc)
+        first = {"scheduleId": "me@example.com", "scheduleItems": [{"status": "busy", "subject": "a"}]}
+        second = {"scheduleId": "me@example.com", "scheduleItems": [{"status": "oof", "subject": "b"}]}
+        graph_request = Mock(side_effect=[
+            _graph_response({"value": [first]}), _graph_response({"value": [second]})
+        ])
+
+        # Act
+        [schedule] = mc.get_schedule(graph_request, ["me@example.com"], start, start + timedelta(days=90))
+
+        # Assert
+        assert [item["subject"] for item in schedule["scheduleItems"]] == ["a", "b"]
+        windows = [(call.kwargs["json"]["startTime"]["dateTime"], call.kwargs["json"]["endTime"]["dateTime"])
+                   for call in graph_request.call_args_list]
+        assert windows == [
+            ("2025-12-20T00:00:00", "2026-02-20T00:00:00"),
+            ("2026-02-20T00:00:00", "2026-03-20T00:00:00"),
+        ]
+
+    def test_error_in_any_request_marks_mailbox(self):
+        """Test a mailbox that fails in a later request carries the error."""
+        # Arrange
+        start = datetime(2025, 12, 20, tzinfo=timezone.utc)
+        graph_request = Mock(side_effect=[
+            _graph_response({"value": [{"scheduleId": "me@example.com", "scheduleItems": []}]}),
+            _graph_response({"value": [{"scheduleId": "me@example.com", "error": {"message": "denied"}}]}),
+        ])
+
+        # Act
+        [schedule] = mc.get_schedule(graph_request, ["me@example.com"], start, start + timedelta(days=90))
+
+        # Assert
+        assert schedule["error"] == {"message": "denied"}
@@ -0,0 +1,124 @@
+"""
+Unit tests for ProposalSolver.
+
+Test coverage:
+- rank: conflict ordering, preferences, day spread, non-overlapping picks, min_start
+- business hours: participant timezones, unknown timezones
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.services.availability_matrix import AvailabilityMatrix
+from app.services.proposal_solver import ProposalSolver
+
+
+def _dt(day, hour, minute=0):
+    return datetime(2025, 12, day, hour, minute, tzinfo=timezone.utc)
+
+
+def _slot(user_id, start, end):
+    return {"user_id": user_id, "start_time_utc": start.isoformat(), "end_time_utc": end.isoformat()}
+
+
+def _candidates(days, start_hour=9, end_hour=17, duration=60):
+    result = []
+    for day in days:
+        current = _dt(day, start_hour)
+        window_end = _dt(day, 0) + timedelta(hours=end_hour)
+        while current + timedelta(minutes=duration) <= window_end:
+            result.append((current, current + timedelta(minutes=duration)))
+            current += timedelta(minutes=30)
+    return result
+
+
+PARTICIPANTS = [
+    {"user_id": "alice", "timezone": "UTC"},
+    {"user_id": "bob", "timezone": "UTC"},
+]
+
+
+class TestRank:
+    """Tests for ProposalSolver.rank."""
+
+    def test_prefers_conflict_free_then_preferred_slots(self):
+        matrix = AvailabilityMatrix(
+            busy_slots=[_slot("alice", _dt(20, 9), _dt(20, 12))],
+            preferred_slots=[_slot("bob", _dt(20, 14), _dt(20, 16))],
+            participant_ids=["alice", "bob"],
+        )
+        solver = ProposalSolver(matrix, PARTICIPANTS)
+
+        result = solver.rank(_candidates([20]), num_suggestions=1)
+
+        # 13:30 only partially overlaps the preferred slot but still counts; 14:00 does too,
+        # so earliest-start breaks the tie
+        assert result[0]["start_time_utc"] == "2025-12-20T13:30:00Z"
+        assert result[0]["conflicts"] == 0
+        assert "1 marked this time as preferred" in result[0]["reasoning"]
+
+    def test_falls_back_to_slots_with_fewest_conflicts(self):
+        matrix = AvailabilityMatrix(
+            busy_slots=[
+                _slot("alice", _dt(20, 9), _dt(20, 17)),
+                _slot("bob", _dt(20, 9), _dt(20, 13)),
+            ],
+            preferred_slots=[],
+            participant_ids=["alice", "bob"],
+        )
+        solver = ProposalSolver(matrix, PARTICIPANTS)
+
+        result = solver.rank(_candidates([20]), num_suggestions=2)
+
+        assert [p["conflicts"] for p in result] == [1, 1]
+        assert result[0]["start_time_utc"] == "2025-12-20T13:00:00Z"
+        assert "1/2 participants are available (1 conflict)" in result[0]["reasoning"]
+
+    def test_spreads_picks_across_days_without_overlap(self):
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[], participant_ids=["alice", "bob"])
+        solver = ProposalSolver(matrix, PARTICIPANTS)
+
+        result = solver.rank(_candidates([20, 21, 22]), num_suggestions=4)
+
+        days = [p["start_time_utc"][:10] for p in result]
+        assert days == ["2025-12-20", "2025-12-21", "2025-12-22", "2025-12-20"]
+        assert result[3]["start_time_utc"] == "2025-12-20T10:00:00Z"
+
+    def test_respects_min_start(self):
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[], participant_ids=["alice"])
+        solver = ProposalSolver(matrix, PARTICIPANTS[:1])
+
+        result = solver.rank(_candidates([20]), num_suggestions=1, min_start=_dt(20, 15))
+
+        assert result[0]["start_time_utc"] == "2025-12-20T15:00:00Z"
+
+    def test_no_candidates(self):
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[])
+
+        assert ProposalSolver(matrix, PARTICIPANTS).rank([], num_suggestions=3) == []
+
+
+class TestBusinessHours:
+    """Tests for local business hours scoring."""
+
+    def test_prefers_hours_inside_every_participants_business_day(self):
+        participants = [
+            {"user_id": "alice", "timezone": "America/New_York"},
+            {"user_id": "bob", "timezone": "Europe/London"},
+        ]
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[], participant_ids=["alice", "bob"])
+        solver = ProposalSolver(matrix, participants)
+
+        result = solver.rank(_candidates([20], start_hour=0, end_hour=24), num_suggestions=1)
+
+        # 14:00-15:00 UTC is 09:00 in New York (EST) and 14:00 in London
+        assert result[0]["start_time_utc"] == "2025-12-20T14:00:00Z"
+        assert "within business hours for 2/2 participants" in result[0]["reasoning"]
+
+    def test_unknown_timezone_is_treated_as_utc(self):
+        participants = [{"user_id": "alice", "timezone": "Mars/Olympus_Mons"}]
+        matrix = AvailabilityMatrix(busy_slots=[], preferred_slots=[], participant_ids=["alice"])
+        solver = ProposalSolver(matrix, participants)
+
+        result = solver.rank(_candidates([20], start_hour=0, end_hour=24), num_suggestions=1)
+
+        assert result[0]["start_time_utc"] == "2025-12-20T09:00:00Z"
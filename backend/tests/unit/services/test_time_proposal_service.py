@@ -2,16 +2,19 @@
 Comprehensive unit tests for TimeProposalService.
 
 Test coverage:
-- propose_times: success, Gemini API integration, validation
+- propose_times: success, Gemini API integration, validation, local solver fallback
 - get_cached_proposals: cache hit, cache miss
 - save_proposals_to_cache: success, replace existing
-- regenerate_proposals_immediately: force regeneration
-- should_regenerate: various scenarios
-- mark_proposals_stale: success
-- _aggregate_participant_data: success, no participants
+- regenerate_proposals_immediately: force regeneration, unchanged fingerprint, streamed stages,
+  one aggregation and fingerprint per stream
+- compute_input_fingerprint: stability, relevant and irrelevant changes
+- should_regenerate: various scenarios, unchanged fingerprint
+- mark_proposals_stale: success, debounced regeneration job
+- _aggregate_participant_data: RPC payload grouping, table fallback, no participants
 - _calculate_free_windows: conflict-free slots, all busy
 - _format_gemini_prompt: proper formatting
-- _call_gemini_api: success, rate limit, retry logic
+- _call_gemini_api: success, rate limit, retry logic, shared quota wait budget
+- prioritize_regeneration: interactive-priority queue job
 - _parse_gemini_response: JSON parsing, markdown cleanup
 - _validate_proposed_times: valid, duration mismatch
 """
@@ -19,8 +22,9 @@ Test coverage:
 import pytest
 import json
 from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from app.services.time_proposal import TimeProposalService
+from app.utils.rate_limiter import RateLimitExceeded
 
 
 # ============================================================================
@@ -81,6 +85,52 @@ def sample_event():
     }
 
 
+@pytest.fixture
+def future_event():
+    """Event whose window starts two days from now, 09:00-17:00 UTC daily."""
+    earliest = (datetime.now(timezone.utc) + timedelta(days=2)).replace(hour=9, minute=0, second=0, microsecond=0)
+    latest = (earliest + timedelta(days=2)).replace(hour=17)
+    return {
+        "id": "event-123",
+        "name": "Team Meeting",
+        "duration_minutes": 60,
+        "earliest_datetime_utc": earliest.isoformat(),
+        "latest_datetime_utc": latest.isoformat(),
+        "coordinator_id": "user-coordinator"
+    }
+
+
+def _mock_event_tables(mock_supabase, event, participants, busy_slots=None, preferred_slots=None, cached_proposals=None):
+    """Route mock table() calls for _aggregate_participant_data and the proposal cache."""
+    results = {
+        "events": Mock(data=[event]),
+        "event_participants": Mock(data=[{"user_id": p["id"]} for p in participants]),
+        "profiles": Mock(data=participants),
+        "busy_slots": Mock(data=busy_slots or []),
+        "preferred_slots": Mock(data=preferred_slots or []),
+        "proposed_times": Mock(data=cached_proposals or []),
+    }
+    chains = {}
+
+    def mock_table_chain(table_name):
+        if table_name not in chains:
+            mock_chain = Mock()
+            result = results[table_name]
+            mock_chain.select.return_value.eq.return_value.execute.return_value = result
+            mock_chain.select.return_value.eq.return_value.order.return_value.execute.return_value = result
+            mock_chain.select.return_value.in_.return_value.execute.return_value = result
+            # Window-bounded busy slot query: in_().lt().gt().order()
+            filtered = mock_chain.select.return_value.in_.return_value
+            filtered.lt.return_value = filtered
+            filtered.gt.return_value = filtered
+            filtered.order.return_value = filtered
+            chains[table_name] = mock_chain
+        return chains[table_name]
+
+    mock_supabase.table.side_effect = mock_table_chain
+    return chains
+
+
 @pytest.fixture
 def sample_participants():
     """Sample participants data."""
@@ -163,7 +213,7 @@ class TestProposeTimes:
             elif table_name == "profiles":
                 mock_chain.select.return_value.in_.return_value.execute.return_value = profiles_result
             elif table_name == "busy_slots":
-                mock_chain.select.return_value.in_.return_value.execute.return_value = busy_slots_result
+                mock_chain.select.return_value.in_.return_value.order.return_value.execute.return_value = busy_slots_result
             elif table_name == "preferred_slots":
                 mock_chain.select.return_value.eq.return_value.execute.return_value = preferred_slots_result
 
@@ -185,8 +235,8 @@ class TestProposeTimes:
         assert "start_time_utc" in result[0]
         assert "preferredCount" in result[0]
 
-    def test_propose_times_no_gemini_available(self, monkeypatch, mock_supabase):
-        """Test propose_times fails when Gemini is not available."""
+    def test_propose_times_no_gemini_available(self, monkeypatch, mock_supabase, future_event, sample_participants):
+        """Test propose_times falls back to the local solver when Gemini is not available."""
         # Arrange
         monkeypatch.setattr("app.services.time_proposal.GENAI_AVAILABLE", False)
         monkeypatch.setattr("app.services.time_proposal.get_supabase", lambda access_token=None: mock_supabase)
@@ -195,10 +245,52 @@ class TestProposeTimes:
 
         service = TimeProposalService()
         service.service_role_client = mock_supabase
+        _mock_event_tables(mock_supabase, future_event, sample_participants)
 
-        # Act & Assert
-        with pytest.raises(Exception, match="Gemini AI library not installed"):
-            service.propose_times("event-123")
+        # Act
+        result = service.propose_times("event-123", num_suggestions=3)
+
+        # Assert
+        assert len(result) == 3
+        assert all(p["source"] == "local" for p in result)
+        assert all(p["conflicts"] == 0 for p in result)
+
+    def test_propose_times_gemini_failure_degrades_to_local(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test a failing Gemini call still returns locally ranked proposals."""
+        # Arrange
+        _mock_event_tables(mock_supabase, future_event, sample_participants)
+        time_proposal_service.max_retries = 1
+        time_proposal_service.model.generate_content.side_effect = Exception("Deadline exceeded")
+
+        # Act
+        result = time_proposal_service.propose_times("event-123", num_suggestions=2)
+
+        # Assert
+        assert len(result) == 2
+        assert all(p["source"] == "local" for p in result)
+
+    def test_propose_times_merges_ai_and_local_proposals(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test validated AI proposals come first and local proposals fill the remaining slots."""
+        # Arrange
+        _mock_event_tables(mock_supabase, future_event, sample_participants)
+        ai_start = datetime.fromisoformat(future_event["earliest_datetime_utc"]) + timedelta(hours=5)
+        mock_response = Mock()
+        mock_response.text = json.dumps([{
+            "start_time_utc": ai_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "end_time_utc": (ai_start + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "conflicts": 0,
+            "reasoning": "Late afternoon works for everyone"
+        }])
+        time_proposal_service.model.generate_content.return_value = mock_response
+
+        # Act
+        with patch("app.services.gemini_client._backoff", new=AsyncMock()):
+            result = time_proposal_service.propose_times("event-123", num_suggestions=3)
+
+        # Assert
+        assert len(result) == 3
+        assert [p["source"] for p in result].count("ai") == 1
+        assert result[0]["reasoning"] == "Late afternoon works for everyone"
 
     def test_propose_times_no_participants(self, time_proposal_service, mock_supabase, sample_event):
         """Test propose_times fails when event has no participants."""
@@ -262,7 +354,7 @@ class TestCallGeminiApi:
             mock_response
         ]
 
-        with patch("time.sleep"):  # Mock sleep to speed up test
+        with patch("app.services.gemini_client._backoff", new=AsyncMock()):  # Skip backoff to speed up test
             # Act
             result = time_proposal_service._call_gemini_api(prompt)
 
@@ -275,11 +367,43 @@ class TestCallGeminiApi:
         prompt = "Test prompt"
         time_proposal_service.model.generate_content.side_effect = Exception("quota exceeded")
 
-        with patch("time.sleep"):
+        with patch("app.services.gemini_client._backoff", new=AsyncMock()):
             # Act & Assert
             with pytest.raises(Exception, match="rate limit exceeded"):
                 time_proposal_service._call_gemini_api(prompt)
 
+    def test_call_gemini_api_respects_shared_quota(self, time_proposal_service):
+        """Test no Gemini call is made when the quota has no slot within the wait budget."""
+        # Arrange
+        limiter = Mock()
+        limiter.acquire.side_effect = RateLimitExceeded("Gemini API rate limit exceeded")
+        time_proposal_service.rate_limit_max_wait = 5
+
+        with patch("app.services.time_proposal.get_gemini_rate_limiter", return_value=limiter):
+            # Act & Assert
+            with pytest.raises(RateLimitExceeded):
+                time_proposal_service._call_gemini_api("Test prompt")
+
+        assert limiter.acquire.call_args.kwargs["max_wait_seconds"] == 5
+        time_proposal_service.model.generate_content.assert_not_called()
+
+    def test_call_gemini_api_records_reported_usage(self, time_proposal_service):
+        """Test the reported token count corrects the reservation."""
+        # Arrange
+        limiter = Mock()
+        limiter.acquire.return_value = 0
+        mock_response = Mock(text="ok")
+        mock_response.usage_metadata.total_token_count = 1234
+        time_proposal_service.model.generate_content.return_value = mock_response
+
+        with patch("app.services.time_proposal.get_gemini_rate_limiter", return_value=limiter):
+            # Act
+            time_proposal_service._call_gemini_api("Test prompt")
+
+        # Assert
+        estimated = limiter.acquire.call_args.args[0]
+        limiter.record_usage.assert_called_once_with(estimated, 1234)
+
 
 # ============================================================================
 # Tests: _parse_gemini_response
@@ -734,6 +858,246 @@ class TestShouldRegenerate:
         assert result["all_expired"] is True
 
 
+    def test_should_regenerate_clears_flag_when_inputs_unchanged(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test a stale flag is cleared when the input fingerprint still matches."""
+        # Arrange
+        future_date = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+        chains = _mock_event_tables(
+            mock_supabase, future_event, sample_participants,
+            cached_proposals=[{"id": "proposal-1", "start_time_utc": future_date}]
+        )
+        data = time_proposal_service._aggregate_participant_data("event-123")
+        future_event.update({
+            "proposals_needs_regeneration": True,
+            "proposals_last_generated_at": "2025-12-18T10:00:00Z",
+            "proposals_input_fingerprint": time_proposal_service.compute_input_fingerprint(data)
+        })
+
+        # Act
+        result = time_proposal_service.should_regenerate("event-123")
+
+        # Assert
+        assert result["needs_regeneration"] is False
+        chains["events"].update.assert_called_once_with({"proposals_needs_regeneration": False})
+
+    def test_should_regenerate_true_when_inputs_changed(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test a stale flag stands when the input fingerprint differs."""
+        # Arrange
+        future_date = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+        chains = _mock_event_tables(
+            mock_supabase, future_event, sample_participants,
+            cached_proposals=[{"id": "proposal-1", "start_time_utc": future_date}]
+        )
+        future_event.update({
+            "proposals_needs_regeneration": True,
+            "proposals_input_fingerprint": "0" * 64
+        })
+
+        # Act
+        result = time_proposal_service.should_regenerate("event-123")
+
+        # Assert
+        assert result["needs_regeneration"] is True
+        chains["events"].update.assert_not_called()
+
+
+# ============================================================================
+# Tests: compute_input_fingerprint
+# ============================================================================
+
+class TestComputeInputFingerprint:
+    """Tests for compute_input_fingerprint method."""
+
+    @pytest.fixture
+    def fingerprint_data(self, future_event):
+        start = datetime.fromisoformat(future_event["earliest_datetime_utc"])
+        return {
+            "event": future_event,
+            "participants": [
+                {"user_id": "user-1", "timezone": "America/New_York"},
+                {"user_id": "user-2", "timezone": "UTC"}
+            ],
+            "all_busy_slots": [
+                {"id": "a", "user_id": "user-1", "start_time_utc": start.isoformat(),
+                 "end_time_utc": (start + timedelta(hours=1)).isoformat()},
+                {"id": "b", "user_id": "user-2", "start_time_utc": (start + timedelta(hours=2)).isoformat(),
+                 "end_time_utc": (start + timedelta(hours=3)).isoformat()}
+            ],
+            "all_preferred_slots": []
+        }
+
+    def test_fingerprint_ignores_row_order_and_ids(self, time_proposal_service, fingerprint_data):
+        """Test reordered rows with new ids and Z suffixes hash identically."""
+        # Arrange
+        original = time_proposal_service.compute_input_fingerprint(fingerprint_data)
+        reordered = dict(fingerprint_data)
+        reordered["all_busy_slots"] = [
+            {**slot, "id": "new-" + slot["id"],
+             "start_time_utc": slot["start_time_utc"].replace("+00:00", "Z"),
+             "end_time_utc": slot["end_time_utc"].replace("+00:00", "Z")}
+            for slot in reversed(fingerprint_data["all_busy_slots"])
+        ]
+        reordered["participants"] = list(reversed(fingerprint_data["participants"]))
+
+        # Act
+        result = time_proposal_service.compute_input_fingerprint(reordered)
+
+        # Assert
+        assert result == original
+        assert len(result) == 64
+
+    def test_fingerprint_ignores_busy_slots_outside_window(self, time_proposal_service, fingerprint_data, future_event):
+        """Test busy slots that do not intersect the event window are ignored."""
+        # Arrange
+        original = time_proposal_service.compute_input_fingerprint(fingerprint_data)
+        far_future = datetime.fromisoformat(future_event["latest_datetime_utc"]) + timedelta(days=10)
+        fingerprint_data["all_busy_slots"].append({
+            "user_id": "user-1",
+            "start_time_utc": far_future.isoformat(),
+            "end_time_utc": (far_future + timedelta(hours=1)).isoformat()
+        })
+
+        # Act
+        result = time_proposal_service.compute_input_fingerprint(fingerprint_data)
+
+        # Assert
+        assert result == original
+
+    def test_fingerprint_changes_with_relevant_inputs(self, time_proposal_service, fingerprint_data, future_event):
+        """Test busy, preferred, participant and duration changes alter the fingerprint."""
+        # Arrange
+        original = time_proposal_service.compute_input_fingerprint(fingerprint_data)
+        start = datetime.fromisoformat(future_event["earliest_datetime_utc"])
+        slot = {
+            "user_id": "user-2",
+            "start_time_utc": (start + timedelta(hours=4)).isoformat(),
+            "end_time_utc": (start + timedelta(hours=5)).isoformat()
+        }
+
+        # Act
+        with_busy = time_proposal_service.compute_input_fingerprint(
+            {**fingerprint_data, "all_busy_slots": fingerprint_data["all_busy_slots"] + [slot]}
+        )
+        with_preferred = time_proposal_service.compute_input_fingerprint(
+            {**fingerprint_data, "all_preferred_slots": [slot]}
+        )
+        with_participant = time_proposal_service.compute_input_fingerprint(
+            {**fingerprint_data, "participants": fingerprint_data["participants"] + [{"user_id": "user-3"}]}
+        )
+        with_duration = time_proposal_service.compute_input_fingerprint(
+            {**fingerprint_data, "event": {**future_event, "duration_minutes": 30}}
+        )
+
+        # Assert
+        assert len({original, with_busy, with_preferred, with_participant, with_duration}) == 5
+
+
+# ============================================================================
+# Tests: regenerate_proposals_immediately
+# ============================================================================
+
+class TestRegenerateProposalsImmediately:
+    """Tests for regenerate_proposals_immediately method."""
+
+    def test_skips_generation_when_fingerprint_unchanged(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test unchanged inputs return cached proposals without calling Gemini."""
+        # Arrange
+        start = datetime.fromisoformat(future_event["earliest_datetime_utc"])
+        cached_row = {
+            "start_time_utc": start.isoformat(),
+            "end_time_utc": (start + timedelta(hours=1)).isoformat(),
+            "conflicts": 0,
+            "reasoning": "Cached",
+            "rank": 0
+        }
+        chains = _mock_event_tables(mock_supabase, future_event, sample_participants, cached_proposals=[cached_row])
+        data = time_proposal_service._aggregate_participant_data("event-123")
+        future_event["proposals_input_fingerprint"] = time_proposal_service.compute_input_fingerprint(data)
+
+        # Act
+        result = time_proposal_service.regenerate_proposals_immediately("event-123", force=False)
+
+        # Assert
+        assert [p["reasoning"] for p in result] == ["Cached"]
+        time_proposal_service.model.generate_content.assert_not_called()
+        chains["proposed_times"].insert.assert_not_called()
+        chains["events"].update.assert_called_once_with({"proposals_needs_regeneration": False})
+
+    def test_regenerates_and_stores_fingerprint_when_inputs_changed(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test changed inputs regenerate proposals and persist the new fingerprint."""
+        # Arrange
+        future_event["proposals_input_fingerprint"] = "0" * 64
+        chains = _mock_event_tables(mock_supabase, future_event, sample_participants)
+        time_proposal_service.model.generate_content.return_value = Mock(text="[]")
+
+        # Act
+        with patch("app.services.gemini_client._backoff", new=AsyncMock()):
+            result = time_proposal_service.regenerate_proposals_immediately("event-123", num_suggestions=2, force=False)
+
+        # Assert
+        assert len(result) == 2
+        chains["proposed_times"].insert.assert_called_once()
+        event_update = chains["events"].update.call_args[0][0]
+        assert event_update["proposals_needs_regeneration"] is False
+        assert event_update["proposals_input_fingerprint"] not in (None, "0" * 64)
+
+    def test_stream_yields_stages_and_caches_before_final(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test local proposals are yielded before the Gemini call and final ones after caching."""
+        # Arrange
+        chains = _mock_event_tables(mock_supabase, future_event, sample_participants)
+        time_proposal_service.model.generate_content.return_value = Mock(text="[]")
+
+        # Act
+        stages = time_proposal_service.stream_regenerated_proposals("event-123", num_suggestions=2)
+        first_stage, local = next(stages)
+        gemini_called_before_local = time_proposal_service.model.generate_content.called
+        rest = list(stages)
+
+        # Assert
+        assert first_stage == "local"
+        assert not gemini_called_before_local
+        assert len(local["proposals"]) == 2
+        assert local["free_windows"] and local["free_windows"][0]["start_time_utc"].endswith("Z")
+        assert [stage for stage, _ in rest] == ["ai", "final"]
+        assert rest[0][1]["proposals"] == []
+        assert rest[1][1]["proposals"] == local["proposals"]
+        chains["proposed_times"].insert.assert_called_once()
+
+    def test_stream_aggregates_once_and_reuses_given_cache(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test unchanged inputs aggregate and fingerprint once and return the caller's cached proposals."""
+        # Arrange
+        _mock_event_tables(mock_supabase, future_event, sample_participants)
+        data = time_proposal_service._aggregate_participant_data("event-123")
+        future_event["proposals_input_fingerprint"] = time_proposal_service.compute_input_fingerprint(data)
+        cached = [{"reasoning": "Cached"}]
+
+        with patch.object(time_proposal_service, "_aggregate_participant_data", wraps=time_proposal_service._aggregate_participant_data) as aggregate, \
+             patch.object(time_proposal_service, "compute_input_fingerprint", wraps=time_proposal_service.compute_input_fingerprint) as fingerprint, \
+             patch.object(time_proposal_service, "get_cached_proposals") as get_cached:
+            # Act
+            stages = list(time_proposal_service.stream_regenerated_proposals("event-123", force=False, cached=cached))
+
+        # Assert
+        assert stages == [("final", {"proposals": cached, "cached": True})]
+        assert aggregate.call_count == 1
+        assert fingerprint.call_count == 1
+        get_cached.assert_not_called()
+
+    def test_stream_fingerprints_changed_inputs_once(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test regeneration reuses the fingerprint computed for the unchanged-inputs check."""
+        # Arrange
+        future_event["proposals_input_fingerprint"] = "0" * 64
+        _mock_event_tables(mock_supabase, future_event, sample_participants)
+        time_proposal_service.model.generate_content.return_value = Mock(text="[]")
+
+        with patch.object(time_proposal_service, "compute_input_fingerprint", wraps=time_proposal_service.compute_input_fingerprint) as fingerprint:
+            # Act
+            list(time_proposal_service.stream_regenerated_proposals("event-123", num_suggestions=2, force=False))
+
+        # Assert
+        assert fingerprint.call_count == 1
+
+
 # ============================================================================
 # Tests: mark_proposals_stale
 # ============================================================================
@@ -751,6 +1115,18 @@ class TestMarkProposalsStale:
 
         # Assert - No exception means success
 
+    def test_mark_proposals_stale_schedules_one_debounced_regeneration(self, time_proposal_service, mock_supabase):
+        """Test repeated invalidations of an event target the same debounced job."""
+        # Act
+        for _ in range(5):
+            time_proposal_service.mark_proposals_stale("event-123")
+
+        # Assert
+        calls = [call.args for call in mock_supabase.rpc.call_args_list]
+        assert len(calls) == 5
+        assert {name for name, _ in calls} == {"debounce_job"}
+        assert {params["p_dedup_key"] for _, params in calls} == {"proposal_regeneration:event-123"}
+
     def test_mark_proposals_stale_database_error(self, time_proposal_service, mock_supabase):
         """Test mark_proposals_stale handles database errors gracefully."""
         # Arrange
@@ -761,6 +1137,130 @@ class TestMarkProposalsStale:
 
         # Assert - No exception raised
 
+    def test_prioritize_regeneration_enqueues_interactive_job(self, time_proposal_service, mock_supabase):
+        """Test a viewed stale event is queued ahead of the background backlog."""
+        # Arrange
+        mock_supabase.rpc.return_value.execute.return_value = Mock(data={})
+
+        # Act
+        time_proposal_service.prioritize_regeneration("event-123")
+
+        # Assert
+        name, params = mock_supabase.rpc.call_args.args
+        assert name == "enqueue_job"
+        assert params["p_dedup_key"] == "proposal_regeneration:event-123"
+        assert params["p_priority"] == 10
+
+
+# ============================================================================
+# Tests: _aggregate_participant_data
+# ============================================================================
+
+class TestAggregateParticipantData:
+    """Tests for _aggregate_participant_data method."""
+
+    def test_aggregate_uses_rpc_payload(self, time_proposal_service, mock_supabase, future_event):
+        """Test the RPC payload is grouped per participant without table queries."""
+        # Arrange
+        busy = [
+            {"user_id": "user-1", "start_time_utc": "2025-12-20T09:00:00+00:00", "end_time_utc": "2025-12-20T10:00:00+00:00"},
+            {"user_id": "user-2", "start_time_utc": "2025-12-20T11:00:00+00:00", "end_time_utc": "2025-12-20T12:00:00+00:00"},
+            {"user_id": "user-1", "start_time_utc": "2025-12-20T13:00:00+00:00", "end_time_utc": "2025-12-20T14:00:00+00:00"}
+        ]
+        preferred = [
+            {"user_id": "user-2", "start_time_utc": "2025-12-20T15:00:00+00:00", "end_time_utc": "2025-12-20T16:00:00+00:00"}
+        ]
+        mock_supabase.rpc.return_value.execute.return_value = Mock(data={
+            "event": future_event,
+            "participants": [
+                {"user_id": "user-1", "full_name": "Alice", "email_address": "alice@example.com", "timezone": "Europe/London"},
+                {"user_id": "user-2", "full_name": None, "email_address": None, "timezone": None}
+            ],
+            "busy_slots": busy,
+            "preferred_slots": preferred
+        })
+
+        # Act
+        result = time_proposal_service._aggregate_participant_data("event-123")
+
+        # Assert
+        mock_supabase.rpc.assert_called_once_with("get_event_proposal_data", {"event_uuid": "event-123"})
+        mock_supabase.table.assert_not_called()
+        assert result["participant_count"] == 2
+        alice, bob = result["participants"]
+        assert alice["name"] == "Alice"
+        assert alice["timezone"] == "Europe/London"
+        assert alice["busy_slots"] == [busy[0], busy[2]]
+        assert alice["preferred_slots"] == []
+        assert bob["name"] == "Unknown"
+        assert bob["timezone"] == "UTC"
+        assert bob["busy_slots"] == [busy[1]]
+        assert bob["preferred_slots"] == preferred
+        assert result["all_busy_slots"] == busy
+
+    def test_aggregate_falls_back_to_tables_when_rpc_missing(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test table queries are used when the RPC function is not installed."""
+        # Arrange
+        mock_supabase.rpc.side_effect = Exception("Could not find the function public.get_event_proposal_data")
+        busy = [{"user_id": "user-2", "start_time_utc": "2025-12-20T11:00:00+00:00", "end_time_utc": "2025-12-20T12:00:00+00:00"}]
+        _mock_event_tables(mock_supabase, future_event, sample_participants, busy_slots=busy)
+
+        # Act
+        result = time_proposal_service._aggregate_participant_data("event-123")
+
+        # Assert
+        assert [p["user_id"] for p in result["participants"]] == ["user-1", "user-2"]
+        assert result["participants"][0]["name"] == "Alice"
+        assert result["participants"][0]["busy_slots"] == []
+        assert result["participants"][1]["busy_slots"] == busy
+
+    def test_aggregate_fallback_bounds_busy_slots_to_event_window(self, time_proposal_service, mock_supabase, future_event, sample_participants):
+        """Test the fallback busy slot query is filtered to the event window."""
+        # Arrange
+        mock_supabase.rpc.side_effect = Exception("RPC missing")
+        chains = _mock_event_tables(mock_supabase, future_event, sample_participants)
+
+        # Act
+        time_proposal_service._aggregate_participant_data("event-123")
+
+        # Assert
+        busy_query = chains["busy_slots"].select.return_value.in_.return_value
+        chains["busy_slots"].select.assert_called_once_with("id, user_id, start_time_utc, end_time_utc, calendar_source_id")
+        busy_query.lt.assert_called_once_with(
+            "start_time_utc", datetime.fromisoformat(future_event["latest_datetime_utc"]).isoformat()
+        )
+        busy_query.gt.assert_called_once_with(
+            "end_time_utc", datetime.fromisoformat(future_event["earliest_datetime_utc"]).isoformat()
+        )
+
+    def test_aggregate_event_not_found(self, time_proposal_service, mock_supabase):
+        """Test a null RPC payload means the event does not exist."""
+        # Arrange
+        mock_supabase.rpc.return_value.execute.return_value = Mock(data=None)
+
+        # Act
+        result = time_proposal_service._aggregate_participant_data("missing-event")
+
+        # Assert
+        assert result is None
+        mock_supabase.table.assert_not_called()
+
+    def test_aggregate_no_participants(self, time_proposal_service, mock_supabase, future_event):
+        """Test an event without participants returns None."""
+        # Arrange
+        mock_supabase.rpc.return_value.execute.return_value = Mock(data={
+            "event": future_event,
+            "participants": [],
+            "busy_slots": [],
+            "preferred_slots": []
+        })
+
+        # Act
+        result = time_proposal_service._aggregate_participant_data("event-123")
+
+        # Assert
+        assert result is None
+
 
 # ============================================================================
 # Tests: _calculate_free_windows
@@ -805,6 +1305,48 @@ class TestCalculateFreeWindows:
         # Assert
         assert len(result) == 0  # No free windows
 
+    def test_calculate_free_windows_matches_brute_force_scan(self, time_proposal_service):
+        """Test the sweep returns exactly what a per-candidate scan of every busy slot returns."""
+        # Arrange
+        event = {
+            "earliest_datetime_utc": "2025-12-20T09:00:00Z",
+            "latest_datetime_utc": "2025-12-27T17:00:00+00:00",
+            "duration_minutes": 45
+        }
+        base = datetime(2025, 12, 20, 8, 0, tzinfo=timezone.utc)
+        busy_slots = []
+        for i in range(60):
+            start = base + timedelta(minutes=(i * 197) % (8 * 24 * 60))
+            end = start + timedelta(minutes=15 + (i * 37) % 120)
+            busy_slots.append({
+                "user_id": f"user-{i % 4}",
+                "start_time_utc": start.isoformat().replace("+00:00", "Z"),
+                "end_time_utc": end.isoformat()
+            })
+        data = {"event": event, "participants": [], "all_busy_slots": busy_slots}
+
+        expected = []
+        day = datetime(2025, 12, 20, tzinfo=timezone.utc)
+        while day <= datetime(2025, 12, 27, 23, 59, tzinfo=timezone.utc):
+            current = day.replace(hour=9)
+            while current + timedelta(minutes=45) <= day.replace(hour=17):
+                end = current + timedelta(minutes=45)
+                if not any(
+                    current < datetime.fromisoformat(s["end_time_utc"].replace("Z", "+00:00"))
+                    and end > datetime.fromisoformat(s["start_time_utc"].replace("Z", "+00:00"))
+                    for s in busy_slots
+                ):
+                    expected.append((current, end))
+                current += timedelta(minutes=30)
+            day += timedelta(days=1)
+
+        # Act
+        result = time_proposal_service._calculate_free_windows(data)
+
+        # Assert
+        assert 0 < len(result) < 8 * 16
+        assert result == expected
+
 
 # ============================================================================
 # Tests: _format_gemini_prompt
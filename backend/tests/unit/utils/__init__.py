@@ -0,0 +1,3 @@
+"""
+Utility unit tests.
+"""
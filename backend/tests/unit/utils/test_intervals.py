@@ -0,0 +1,128 @@
+"""
+Unit tests for interval helpers.
+
+Test coverage:
+- parse_utc: Z suffix, naive datetimes, offsets
+- merge_intervals: overlapping, touching, unsorted input
+- iter_free_windows: candidates against a merged busy timeline
+- sweep_participant_counts: per-user reference counting, boundaries
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.models.busy_slot import BusySlot
+from app.utils.intervals import (
+    iter_free_windows,
+    merge_intervals,
+    parse_utc,
+    slot_interval,
+    sweep_participant_counts,
+)
+
+
+def _dt(hour, minute=0):
+    return datetime(2025, 12, 20, hour, minute, tzinfo=timezone.utc)
+
+
+class TestParseUtc:
+    """Tests for parse_utc."""
+
+    def test_parse_z_suffix(self):
+        assert parse_utc("2025-12-20T09:00:00Z") == _dt(9)
+
+    def test_parse_naive_assumes_utc(self):
+        assert parse_utc("2025-12-20T09:00:00") == _dt(9)
+        assert parse_utc(datetime(2025, 12, 20, 9)) == _dt(9)
+
+    def test_parse_keeps_offset(self):
+        result = parse_utc("2025-12-20T11:00:00+02:00")
+        assert result == _dt(9)
+        assert result.utcoffset() == timedelta(hours=2)
+
+    def test_slot_interval_supports_models(self):
+        slot = BusySlot(user_id="user-1", start_time_utc=_dt(9), end_time_utc=_dt(10))
+        assert slot_interval(slot) == (_dt(9), _dt(10))
+
+
+class TestMergeIntervals:
+    """Tests for merge_intervals."""
+
+    def test_merge_overlapping_and_touching(self):
+        result = merge_intervals([
+            (_dt(13), _dt(14)),
+            (_dt(9), _dt(10)),
+            (_dt(9, 30), _dt(11)),
+            (_dt(11), _dt(12)),
+        ])
+
+        assert result == [(_dt(9), _dt(12)), (_dt(13), _dt(14))]
+
+    def test_merge_contained_interval(self):
+        assert merge_intervals([(_dt(9), _dt(17)), (_dt(10), _dt(11))]) == [(_dt(9), _dt(17))]
+
+    def test_merge_empty(self):
+        assert merge_intervals([]) == []
+
+
+class TestIterFreeWindows:
+    """Tests for iter_free_windows."""
+
+    def test_skips_overlapping_candidates(self):
+        candidates = [(_dt(h), _dt(h + 1)) for h in range(9, 16)]
+        busy = merge_intervals([(_dt(10, 30), _dt(11)), (_dt(13), _dt(14, 15))])
+
+        result = list(iter_free_windows(candidates, busy))
+
+        assert result == [
+            (_dt(9), _dt(10)),
+            (_dt(11), _dt(12)),
+            (_dt(12), _dt(13)),
+            (_dt(15), _dt(16)),
+        ]
+
+    def test_touching_busy_slot_is_not_a_conflict(self):
+        candidates = [(_dt(9), _dt(10))]
+        busy = [(_dt(8), _dt(9)), (_dt(10), _dt(11))]
+
+        assert list(iter_free_windows(candidates, busy)) == candidates
+
+
+class TestSweepParticipantCounts:
+    """Tests for sweep_participant_counts."""
+
+    def test_counts_users_per_segment(self):
+        result = sweep_participant_counts([
+            (_dt(9), _dt(11), "alice"),
+            (_dt(10), _dt(12), "bob"),
+            (_dt(13), _dt(14), "alice"),
+        ])
+
+        assert result == [
+            (_dt(9), _dt(10), 1),
+            (_dt(10), _dt(11), 2),
+            (_dt(11), _dt(12), 1),
+            (_dt(13), _dt(14), 1),
+        ]
+
+    def test_same_user_overlap_is_reference_counted(self):
+        result = sweep_participant_counts([
+            (_dt(9), _dt(12), "alice"),
+            (_dt(10), _dt(11), "alice"),
+            (_dt(10), _dt(13), "bob"),
+        ])
+
+        assert result == [
+            (_dt(9), _dt(10), 1),
+            (_dt(10), _dt(11), 2),
+            (_dt(11), _dt(12), 2),
+            (_dt(12), _dt(13), 1),
+        ]
+
+    def test_touching_intervals_split_without_gap(self):
+        result = sweep_participant_counts([(9, 10, "alice"), (10, 11, "alice")])
+
+        assert result == [(9, 10, 1), (10, 11, 1)]
+
+    def test_ignores_empty_intervals(self):
+        assert sweep_participant_counts([(10, 10, "alice")]) == []
+        assert sweep_participant_counts([]) == []
@@ -0,0 +1,207 @@
+"""
+Unit tests for Gemini token-bucket rate limiting.
+
+Test coverage:
+- LocalBuckets: burst up to capacity, all-or-nothing charging, refill
+- RateLimiter.acquire: waiting, wait budget, TPM limits, shared-backend fallback
+- RateLimiter.record_usage: post-hoc token correction
+- PostgresBuckets: RPC payload
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from app.utils import rate_limiter as rate_limiter_module
+from app.utils.rate_limiter import Bucket, LocalBuckets, PostgresBuckets, RateLimiter, RateLimitExceeded
+
+
+class FakeClock:
+    """Monotonic clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", fake.sleep)
+    return fake
+
+
+# ============================================================================
+# Tests: LocalBuckets
+# ============================================================================
+
+class TestLocalBuckets:
+    """Tests for in-process token buckets."""
+
+    def test_allows_burst_up_to_capacity(self, clock):
+        """Test a full bucket serves its capacity immediately, then asks the caller to wait."""
+        # Arrange
+        buckets = LocalBuckets()
+        rpm = Bucket.per_minute("rpm", 3)
+
+        # Act
+        waits = [buckets.acquire([rpm], [1]) for _ in range(4)]
+
+        # Assert
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(20.0)
+
+    def test_charges_all_buckets_or_none(self, clock):
+        """Test a request that fits RPM but not TPM does not consume a request slot."""
+        # Arrange
+        buckets = LocalBuckets()
+        rpm, tpm = Bucket.per_minute("rpm", 10), Bucket.per_minute("tpm", 100)
+        buckets.acquire([rpm, tpm], [1, 90])
+
+        # Act
+        wait = buckets.acquire([rpm, tpm], [1, 50])
+
+        # Assert
+        assert wait == pytest.approx(24.0)
+        assert buckets._tokens["rpm"] == pytest.approx(9)
+
+    def test_refills_over_time(self, clock):
+        """Test tokens come back at the per-minute rate."""
+        # Arrange
+        buckets = LocalBuckets()
+        rpm = Bucket.per_minute("rpm", 60)
+        for _ in range(60):
+            buckets.acquire([rpm], [1])
+
+        # Act
+        clock.now += 2
+        waits = [buckets.acquire([rpm], [1]) for _ in range(3)]
+
+        # Assert
+        assert waits[:2] == [0, 0]
+        assert waits[2] > 0
+
+
+# ============================================================================
+# Tests: RateLimiter
+# ============================================================================
+
+class TestRateLimiter:
+    """Tests for the blocking RPM/TPM limiter."""
+
+    def test_acquire_waits_for_next_slot(self, clock):
+        """Test acquire sleeps until a slot frees up and records the wait."""
+        # Arrange
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1_000_000)
+        limiter.acquire(10)
+        limiter.acquire(10)
+
+        # Act
+        waited = limiter.acquire(10)
+
+        # Assert
+        assert waited == pytest.approx(30.0)
+        assert limiter.stats["acquired"] == 3
+        assert limiter.stats["waits"] == 1
+
+    def test_token_quota_paces_large_prompts(self, clock):
+        """Test TPM limits requests even when RPM has room."""
+        # Arrange
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=6000)
+        limiter.acquire(6000)
+
+        # Act
+        waited = limiter.acquire(3000)
+
+        # Assert
+        assert waited == pytest.approx(30.0)
+
+    def test_rejects_when_wait_exceeds_budget(self, clock):
+        """Test a caller with a short wait budget gets RateLimitExceeded instead of blocking."""
+        # Arrange
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=1_000_000)
+        limiter.acquire(10)
+
+        # Act / Assert
+        with pytest.raises(RateLimitExceeded, match="rate limit"):
+            limiter.acquire(10, max_wait_seconds=5)
+        assert clock.sleeps == []
+        assert limiter.stats["rejected"] == 1
+
+    def test_record_usage_charges_the_difference(self, clock):
+        """Test reported usage above the estimate is charged to the token bucket."""
+        # Arrange
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+        limiter.acquire(100)
+
+        # Act
+        limiter.record_usage(100, 400)
+        limiter.record_usage(100, Mock())
+
+        # Assert
+        assert limiter.local._tokens[limiter.tokens.name] == pytest.approx(600)
+
+    def test_falls_back_to_local_buckets_when_shared_backend_fails(self, clock):
+        """Test an unavailable shared backend still limits this process, and is retried later."""
+        # Arrange
+        backend = Mock()
+        backend.acquire.side_effect = Exception("function acquire_rate_limit does not exist")
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=1_000_000, backend=backend)
+
+        # Act
+        first = limiter.acquire(10)
+        second = limiter.acquire(10)
+
+        # Assert
+        assert first == 0
+        assert second == pytest.approx(60.0)
+        assert backend.acquire.call_count == 2
+
+
+# ============================================================================
+# Tests: PostgresBuckets
+# ============================================================================
+
+class TestPostgresBuckets:
+    """Tests for the shared-bucket RPC backend."""
+
+    def test_passes_bucket_definitions(self):
+        """Test bucket names, costs, capacities and refill rates are sent to the RPC."""
+        # Arrange
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = Mock(data=2.5)
+        backend = PostgresBuckets(client)
+
+        # Act
+        wait = backend.acquire([Bucket.per_minute("gemini:rpm", 60), Bucket.per_minute("gemini:tpm", 6000)], [1, 500])
+
+        # Assert
+        assert wait == 2.5
+        client.rpc.assert_called_once_with("acquire_rate_limit", {
+            "p_names": ["gemini:rpm", "gemini:tpm"],
+            "p_costs": [1, 500],
+            "p_capacities": [60.0, 6000.0],
+            "p_refill_per_second": [1.0, 100.0],
+            "p_force": False,
+        })
+
+    def test_shared_backend_used_when_configured(self, monkeypatch):
+        """Test the process-wide limiter uses the shared buckets with the postgres backend."""
+        # Arrange
+        monkeypatch.setattr(rate_limiter_module.Config, "GEMINI_RATE_LIMIT_BACKEND", "postgres")
+        rate_limiter_module.reset_gemini_rate_limiter()
+
+        # Act
+        with patch.object(rate_limiter_module, "get_service_role_client", return_value=MagicMock()):
+            limiter = rate_limiter_module.get_gemini_rate_limiter()
+
+        # Assert
+        assert isinstance(limiter.backend, PostgresBuckets)
@@ -0,0 +1,159 @@
+"""
+Unit tests for the shared Supabase client registry.
+
+Test coverage:
+- get_client: one client per (url, key), shared pooled HTTP client, thread safety
+- get_supabase / get_service_role_client: key selection, missing configuration
+- new_supabase_client: unshared client on the pooled connections
+- reset_clients: closes pooled connections
+"""
+
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from app.utils import supabase_client
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_ANON_KEY", "anon-key")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service-key")
+    supabase_client.reset_clients()
+    yield
+    supabase_client.reset_clients()
+
+
+@pytest.fixture
+def mock_create_client():
+    with patch("app.utils.supabase_client.create_client", side_effect=lambda url, key, options: object()) as mock:
+        yield mock
+
+
+# ============================================================================
+# Tests: get_client
+# ============================================================================
+
+class TestGetClient:
+    """Tests for the process-wide client registry."""
+
+    def test_reuses_client_per_credentials(self, mock_create_client):
+        """Test each (url, key) pair is built once and reused."""
+        # Act
+        first = supabase_client.get_client("https://test.supabase.co", "service-key")
+        second = supabase_client.get_client("https://test.supabase.co", "service-key")
+        anon = supabase_client.get_client("https://test.supabase.co", "anon-key")
+
+        # Assert
+        assert first is second
+        assert anon is not first
+        assert mock_create_client.call_count == 2
+
+    def test_clients_share_pooled_http_client(self, mock_create_client):
+        """Test anon and service-role clients use the same pooled HTTP client without session persistence."""
+        # Act
+        supabase_client.get_client("https://test.supabase.co", "service-key")
+        supabase_client.get_client("https://test.supabase.co", "anon-key")
+
+        # Assert
+        options = [call.kwargs["options"] for call in mock_create_client.call_args_list]
+        assert options[0].httpx_client is options[1].httpx_client
+        assert options[0].httpx_client is not None
+        assert all(not o.persist_session and not o.auto_refresh_token for o in options)
+
+    def test_concurrent_first_use_builds_one_client(self, mock_create_client):
+        """Test threads racing on first use all get the same client."""
+        # Arrange
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(supabase_client.get_client("https://test.supabase.co", "service-key"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len({id(client) for client in results}) == 1
+        assert mock_create_client.call_count == 1
+
+
+# ============================================================================
+# Tests: get_supabase / get_service_role_client / new_supabase_client
+# ============================================================================
+
+class TestClientAccessors:
+    """Tests for the key selection of the public accessors."""
+
+    def test_get_supabase_uses_service_role_key(self, mock_create_client):
+        """Test get_supabase returns the shared service-role client."""
+        # Act
+        client = supabase_client.get_supabase()
+
+        # Assert
+        assert client is supabase_client.get_service_role_client()
+        assert mock_create_client.call_args.args == ("https://test.supabase.co", "service-key")
+
+    def test_get_supabase_falls_back_to_anon_key(self, monkeypatch, mock_create_client):
+        """Test the anon key is used when no service role key is configured."""
+        # Arrange
+        monkeypatch.delenv("SUPABASE_SERVICE_ROLE_KEY")
+
+        # Act
+        supabase_client.get_supabase()
+
+        # Assert
+        assert mock_create_client.call_args.args == ("https://test.supabase.co", "anon-key")
+        assert supabase_client.get_service_role_client() is None
+
+    def test_get_supabase_requires_url(self, monkeypatch, mock_create_client):
+        """Test a missing Supabase URL raises."""
+        # Arrange
+        monkeypatch.delenv("SUPABASE_URL")
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            supabase_client.get_supabase()
+
+    def test_new_client_is_not_shared(self, mock_create_client):
+        """Test session-changing auth calls get a fresh client on the pooled connections."""
+        # Act
+        shared = supabase_client.get_supabase()
+        first = supabase_client.new_supabase_client()
+        second = supabase_client.new_supabase_client()
+
+        # Assert
+        assert len({id(shared), id(first), id(second)}) == 3
+        options = [call.kwargs["options"] for call in mock_create_client.call_args_list]
+        assert options[1].httpx_client is options[0].httpx_client
+
+
+# ============================================================================
+# Tests: reset_clients
+# ============================================================================
+
+class TestResetClients:
+    """Tests for reset_clients."""
+
+    def test_reset_closes_pool_and_rebuilds(self, mock_create_client):
+        """Test reset closes pooled connections and the next call builds new clients."""
+        # Arrange
+        first = supabase_client.get_supabase()
+        http_client = mock_create_client.call_args.kwargs["options"].httpx_client
+
+        # Act
+        supabase_client.reset_clients()
+        second = supabase_client.get_supabase()
+
+        # Assert
+        assert http_client.is_closed
+        assert first is not second
+        assert mock_create_client.call_args.kwargs["options"].httpx_client is not http_client
@@ -0,0 +1,108 @@
+"""
+Unit tests for the calendar sync pool.
+
+Test coverage:
+- run_bounded: input order, worker bound, inline single item, app context
+- provider_slot: per-provider concurrency limits
+"""
+
+import threading
+import time
+
+import pytest
+from flask import Flask, current_app
+
+from app.utils import sync_pool
+from app.utils.sync_pool import provider_slot, run_bounded
+
+
+class _ConcurrencyProbe:
+    """Records the peak number of callers inside ``track`` at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def track(self, delay=0.02):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(delay)
+        with self.lock:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def reset_provider_slots(monkeypatch):
+    monkeypatch.setattr(sync_pool, "_provider_slots", {})
+
+
+class TestRunBounded:
+    """Tests for run_bounded."""
+
+    def test_results_keep_input_order(self):
+        # Later items finish first
+        result = run_bounded(lambda n: time.sleep((5 - n) * 0.005) or n * 10, [1, 2, 3, 4], max_workers=4)
+
+        assert result == [10, 20, 30, 40]
+
+    def test_concurrency_is_bounded_by_max_workers(self):
+        probe = _ConcurrencyProbe()
+
+        run_bounded(lambda _: probe.track(), range(8), max_workers=3)
+
+        assert 1 < probe.peak <= 3
+
+    def test_single_item_runs_inline(self):
+        caller = threading.current_thread()
+
+        result = run_bounded(lambda _: threading.current_thread(), ["only"], max_workers=4)
+
+        assert result == [caller]
+
+    def test_exceptions_propagate(self):
+        def fail(n):
+            if n == 2:
+                raise ValueError("boom")
+            return n
+
+        with pytest.raises(ValueError, match="boom"):
+            run_bounded(fail, [1, 2, 3], max_workers=3)
+
+    def test_app_context_is_available_in_workers(self):
+        app = Flask("sync-pool-test")
+
+        with app.app_context():
+            result = run_bounded(lambda _: current_app.name, [1, 2, 3], max_workers=3)
+
+        assert result == ["sync-pool-test"] * 3
+
+
+class TestProviderSlot:
+    """Tests for provider_slot."""
+
+    def test_limits_concurrent_calls_per_provider(self, monkeypatch):
+        monkeypatch.setattr(sync_pool.Config, "CALENDAR_SYNC_GOOGLE_CONCURRENCY", 2)
+        probe = _ConcurrencyProbe()
+
+        def sync(_):
+            with provider_slot("google"):
+                probe.track()
+
+        run_bounded(sync, range(6), max_workers=6)
+
+        assert probe.peak == 2
+
+    def test_providers_have_independent_limits(self, monkeypatch):
+        monkeypatch.setattr(sync_pool.Config, "CALENDAR_SYNC_GOOGLE_CONCURRENCY", 1)
+        monkeypatch.setattr(sync_pool.Config, "CALENDAR_SYNC_MICROSOFT_CONCURRENCY", 1)
+        probe = _ConcurrencyProbe()
+
+        def sync(provider):
+            with provider_slot(provider):
+                probe.track()
+
+        run_bounded(sync, ["google", "microsoft"], max_workers=2)
+
+        assert probe.peak == 2
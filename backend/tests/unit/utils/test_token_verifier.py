@@ -0,0 +1,193 @@
+"""
+Unit tests for local access-token verification.
+
+Test coverage:
+- TokenVerifier.verify: HS256 local verification, rejection without remote call,
+  remote fallback, JWKS (RS256) verification, unknown kid fallback
+- TokenCache: hits, expiry bounded by token exp, LRU eviction
+"""
+
+import time
+from unittest.mock import Mock
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.utils.token_verifier import TokenCache, TokenVerifier, VerifiedUser
+
+SECRET = "supabase-jwt-secret"
+
+
+def _token(secret=SECRET, algorithm="HS256", headers=None, **overrides):
+    now = int(time.time())
+    claims = {
+        "sub": "user-1",
+        "email": "alice@example.com",
+        "aud": "authenticated",
+        "role": "authenticated",
+        "exp": now + 3600,
+        "iat": now,
+        "user_metadata": {"avatar_url": "https://example.com/a.png"},
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, secret, algorithm=algorithm, headers=headers)
+
+
+@pytest.fixture
+def remote_user():
+    user = Mock()
+    user.id = "remote-user"
+    return user
+
+
+# ============================================================================
+# Tests: TokenVerifier.verify
+# ============================================================================
+
+class TestTokenVerifier:
+    """Tests for TokenVerifier.verify."""
+
+    def test_verifies_hs256_locally(self):
+        """Test a valid token is verified without calling Supabase Auth."""
+        # Arrange
+        verifier = TokenVerifier(jwt_secret=SECRET)
+        remote = Mock()
+
+        # Act
+        user = verifier.verify(_token(), remote)
+
+        # Assert
+        assert isinstance(user, VerifiedUser)
+        assert user.id == "user-1"
+        assert user.email == "alice@example.com"
+        assert user.user_metadata == {"avatar_url": "https://example.com/a.png"}
+        remote.assert_not_called()
+
+    def test_repeated_token_is_served_from_cache(self):
+        """Test a verified token is not decoded again."""
+        # Arrange
+        verifier = TokenVerifier(jwt_secret=SECRET)
+        token = _token()
+        first = verifier.verify(token, Mock())
+        verifier.verify_locally = Mock()
+
+        # Act
+        second = verifier.verify(token, Mock())
+
+        # Assert
+        assert second is first
+        verifier.verify_locally.assert_not_called()
+
+    @pytest.mark.parametrize("token, error", [
+        (_token(exp=int(time.time()) - 60), jwt.ExpiredSignatureError),
+        (_token(aud="anon"), jwt.InvalidAudienceError),
+        (_token(secret="other-secret"), jwt.InvalidSignatureError),
+    ])
+    def test_rejects_invalid_tokens_without_remote_call(self, token, error):
+        """Test expired, wrong-audience and forged tokens are rejected locally."""
+        # Arrange
+        verifier = TokenVerifier(jwt_secret=SECRET)
+        remote = Mock()
+
+        # Act / Assert
+        with pytest.raises(error):
+            verifier.verify(token, remote)
+        remote.assert_not_called()
+        assert len(verifier.cache) == 0
+
+    def test_falls_back_to_remote_without_secret(self, remote_user):
+        """Test Supabase Auth is used when no local key is configured, and the result is cached."""
+        # Arrange
+        verifier = TokenVerifier()
+        remote = Mock(return_value=remote_user)
+        token = _token()
+
+        # Act
+        first = verifier.verify(token, remote)
+        second = verifier.verify(token, remote)
+
+        # Assert
+        assert first is remote_user
+        assert second is remote_user
+        remote.assert_called_once_with(token)
+
+    def test_verifies_rs256_with_jwks(self):
+        """Test asymmetric tokens are verified with the JWKS signing key."""
+        # Arrange
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        verifier = TokenVerifier()
+        verifier._jwks_client = Mock()
+        verifier._jwks_client.get_signing_key_from_jwt.return_value = Mock(key=private_key.public_key())
+        remote = Mock()
+
+        # Act
+        user = verifier.verify(_token(secret=private_key, algorithm="RS256", headers={"kid": "k1"}), remote)
+
+        # Assert
+        assert user.id == "user-1"
+        remote.assert_not_called()
+
+    def test_unknown_kid_falls_back_to_remote(self, remote_user):
+        """Test a kid missing from the JWKS is checked remotely instead of rejected."""
+        # Arrange
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        verifier = TokenVerifier()
+        verifier._jwks_client = Mock()
+        verifier._jwks_client.get_signing_key_from_jwt.side_effect = jwt.PyJWKClientError("Unable to find a signing key")
+        remote = Mock(return_value=remote_user)
+
+        # Act
+        user = verifier.verify(_token(secret=private_key, algorithm="RS256", headers={"kid": "new"}), remote)
+
+        # Assert
+        assert user is remote_user
+
+
+# ============================================================================
+# Tests: TokenCache
+# ============================================================================
+
+class TestTokenCache:
+    """Tests for the verified-token cache."""
+
+    def test_entry_never_outlives_token_expiry(self):
+        """Test the cache TTL is capped by the token's exp claim."""
+        # Arrange
+        verifier = TokenVerifier(jwt_secret=SECRET, cache_ttl_seconds=300)
+        exp = int(time.time()) + 5
+
+        # Act
+        verifier.verify(_token(exp=exp), Mock())
+
+        # Assert
+        (_, expires_at), = verifier.cache._entries.values()
+        assert expires_at == exp
+
+    def test_expired_entries_are_dropped(self):
+        """Test an expired entry is a miss."""
+        # Arrange
+        cache = TokenCache(max_size=4)
+        cache.put("token", "user", time.time() + 60)
+        cache._entries[cache.key("token")] = ("user", time.time() - 1)
+
+        # Act / Assert
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted at capacity."""
+        # Arrange
+        cache = TokenCache(max_size=2)
+        expires_at = time.time() + 60
+        cache.put("a", "user-a", expires_at)
+        cache.put("b", "user-b", expires_at)
+        cache.get("a")
+
+        # Act
+        cache.put("c", "user-c", expires_at)
+
+        # Assert
+        assert cache.get("a") == "user-a"
+        assert cache.get("b") is None
+        assert cache.get("c") == "user-c"
@@ -0,0 +1,25 @@
+"""
+Background job worker (Docker/Production).
+
+Drains the Postgres job queue and, on the process holding the scheduler lock,
+runs the recurring jobs, so web workers only enqueue. Start the web app with
+BACKGROUND_JOBS_MODE=worker; run as many worker processes as needed.
+"""
+
+import logging
+import os
+
+# The worker owns the scheduler; keep create_app from starting another one
+os.environ["BACKGROUND_JOBS_MODE"] = "off"
+
+from app import create_app
+from app.background_jobs.scheduler import run_worker
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s:%(name)s:%(funcName)s: %(message)s",
+    )
+    # Validates configuration and initializes shared clients like the web app
+    create_app(os.getenv("FLASK_ENV", "production"))
+    run_worker()
@@ -0,0 +1,8 @@
+-- Migration: proposals_input_fingerprint
+-- Content-addressed cache key for proposed_times
+-- Depends on: events
+
+-- SHA-256 of the proposal inputs (event window, participants, busy slots
+-- intersecting the window, preferred slots) the cached proposals were built from.
+-- When it still matches, a stale flag is cleared without regenerating.
+ALTER TABLE events ADD COLUMN IF NOT EXISTS proposals_input_fingerprint VARCHAR(64);
@@ -0,0 +1,74 @@
+-- Function: get_event_proposal_data
+-- Returns everything time proposals need for one event in a single round trip:
+-- the event row, participants with profiles, busy slots intersecting the event
+-- window and the event's preferred slots, as one JSONB payload.
+-- Returns NULL when the event does not exist.
+-- Depends on: events, event_participants, profiles, busy_slots, preferred_slots
+
+CREATE OR REPLACE FUNCTION get_event_proposal_data(event_uuid UUID)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    WITH target_event AS (
+        SELECT * FROM events WHERE id = event_uuid
+    ),
+    participants AS (
+        SELECT ep.user_id, ep.joined_at, p.full_name, p.email_address, p.timezone
+        FROM event_participants ep
+        LEFT JOIN profiles p ON p.id = ep.user_id
+        WHERE ep.event_id = event_uuid
+    )
+    SELECT jsonb_build_object(
+        'event', to_jsonb(e),
+        'participants', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'user_id', pt.user_id,
+                    'full_name', pt.full_name,
+                    'email_address', pt.email_address,
+                    'timezone', pt.timezone
+                )
+                ORDER BY pt.joined_at, pt.user_id
+            )
+            FROM participants pt
+        ), '[]'::jsonb),
+        'busy_slots', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'id', bs.id,
+                    'user_id', bs.user_id,
+                    'start_time_utc', bs.start_time_utc,
+                    'end_time_utc', bs.end_time_utc,
+                    'calendar_source_id', bs.calendar_source_id
+                )
+                ORDER BY bs.start_time_utc
+            )
+            FROM busy_slots bs
+            WHERE bs.user_id IN (SELECT user_id FROM participants)
+              AND bs.start_time_utc < e.latest_datetime_utc
+              AND bs.end_time_utc > e.earliest_datetime_utc
+        ), '[]'::jsonb),
+        'preferred_slots', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'id', ps.id,
+                    'user_id', ps.user_id,
+                    'event_id', ps.event_id,
+                    'start_time_utc', ps.start_time_utc,
+                    'end_time_utc', ps.end_time_utc
+                )
+                ORDER BY ps.start_time_utc
+            )
+            FROM preferred_slots ps
+            WHERE ps.event_id = event_uuid
+        ), '[]'::jsonb)
+    )
+    FROM target_event e;
+$$;
+
+-- Exposes every participant's busy slots, so only the backend's service role
+-- may call it.
+REVOKE ALL ON FUNCTION get_event_proposal_data(UUID) FROM PUBLIC;
+REVOKE ALL ON FUNCTION get_event_proposal_data(UUID) FROM anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_event_proposal_data(UUID) TO service_role;
@@ -0,0 +1,12 @@
+-- Migration: calendar_sources sync state
+-- Incremental provider sync: Google syncToken (and later provider delta links)
+-- Depends on: calendar_sources
+
+-- Provider token returned by the last full or incremental sync of this source.
+-- NULL forces a full resync of the window.
+ALTER TABLE calendar_sources ADD COLUMN IF NOT EXISTS sync_token TEXT;
+
+-- Time window the token's initial full sync covered. Deltas are applied within
+-- this window; a sync request outside it triggers a full resync.
+ALTER TABLE calendar_sources ADD COLUMN IF NOT EXISTS sync_window_start TIMESTAMPTZ;
+ALTER TABLE calendar_sources ADD COLUMN IF NOT EXISTS sync_window_end TIMESTAMPTZ;
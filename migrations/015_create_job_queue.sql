@@ -0,0 +1,172 @@
+-- Table: job_queue
+-- Durable background job queue (calendar syncs, proposal regeneration).
+-- Workers claim jobs with FOR UPDATE SKIP LOCKED, so any number of worker
+-- processes can drain it without running a job twice.
+-- Depends on: nothing
+
+CREATE TABLE IF NOT EXISTS job_queue (
+    id BIGSERIAL PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    -- Lower runs first
+    priority SMALLINT NOT NULL DEFAULT 100,
+    -- At most one pending job per key (e.g. one sync per user, one regeneration per event)
+    dedup_key TEXT,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'running', 'dead')),
+    run_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    locked_by TEXT,
+    locked_until TIMESTAMPTZ,
+    last_error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_job_queue_pending_dedup
+    ON job_queue(dedup_key) WHERE status = 'pending' AND dedup_key IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_job_queue_claimable
+    ON job_queue(kind, priority, run_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_job_queue_running_lease
+    ON job_queue(locked_until) WHERE status = 'running';
+
+-- Backend-only table: RLS on with no policies, so only the service role can use it
+ALTER TABLE job_queue ENABLE ROW LEVEL SECURITY;
+
+
+-- Function: enqueue_job
+-- Inserts a job, or merges it into the pending job with the same dedup key
+-- (keeping the earliest run_at and the most urgent priority). Returns the row.
+CREATE OR REPLACE FUNCTION enqueue_job(
+    p_kind TEXT,
+    p_payload JSONB DEFAULT '{}'::jsonb,
+    p_dedup_key TEXT DEFAULT NULL,
+    p_priority SMALLINT DEFAULT 100,
+    p_run_at TIMESTAMPTZ DEFAULT NOW(),
+    p_max_attempts INTEGER DEFAULT 5
+)
+RETURNS job_queue
+LANGUAGE sql
+AS $$
+    INSERT INTO job_queue (kind, payload, dedup_key, priority, run_at, max_attempts)
+    VALUES (p_kind, p_payload, p_dedup_key, p_priority, p_run_at, p_max_attempts)
+    ON CONFLICT (dedup_key) WHERE status = 'pending' AND dedup_key IS NOT NULL
+    DO UPDATE SET
+        payload = EXCLUDED.payload,
+        priority = LEAST(job_queue.priority, EXCLUDED.priority),
+        run_at = LEAST(job_queue.run_at, EXCLUDED.run_at),
+        updated_at = NOW()
+    RETURNING *;
+$$;
+
+
+-- Function: claim_jobs
+-- Leases up to p_limit due jobs of the given kinds to p_worker, most urgent
+-- first. Jobs whose lease expired (crashed worker) are claimable again.
+CREATE OR REPLACE FUNCTION claim_jobs(
+    p_worker TEXT,
+    p_kinds TEXT[],
+    p_limit INTEGER DEFAULT 10,
+    p_lease_seconds INTEGER DEFAULT 300
+)
+RETURNS SETOF job_queue
+LANGUAGE sql
+AS $$
+    UPDATE job_queue q
+    SET status = 'running',
+        locked_by = p_worker,
+        locked_until = NOW() + make_interval(secs => p_lease_seconds),
+        attempts = q.attempts + 1,
+        updated_at = NOW()
+    WHERE q.id IN (
+        SELECT id
+        FROM job_queue
+        WHERE kind = ANY(p_kinds)
+          AND (
+              (status = 'pending' AND run_at <= NOW())
+              OR (status = 'running' AND locked_until < NOW())
+          )
+        ORDER BY priority, run_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING q.*;
+$$;
+
+
+-- Function: complete_job
+-- Removes a finished job; only the worker holding the lease may complete it.
+CREATE OR REPLACE FUNCTION complete_job(p_job_id BIGINT, p_worker TEXT)
+RETURNS BOOLEAN
+LANGUAGE sql
+AS $$
+    WITH done AS (
+        DELETE FROM job_queue
+        WHERE id = p_job_id AND status = 'running' AND locked_by = p_worker
+        RETURNING id
+    )
+    SELECT EXISTS (SELECT 1 FROM done);
+$$;
+
+
+-- Function: fail_job
+-- Records a failure. With p_retry_in_seconds the job is rescheduled (unless a
+-- newer pending job with the same dedup key already supersedes it);
+-- with NULL it is dead-lettered.
+CREATE OR REPLACE FUNCTION fail_job(
+    p_job_id BIGINT,
+    p_worker TEXT,
+    p_error TEXT,
+    p_retry_in_seconds INTEGER DEFAULT NULL
+)
+RETURNS job_queue
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    failed job_queue;
+BEGIN
+    SELECT * INTO failed
+    FROM job_queue
+    WHERE id = p_job_id AND status = 'running' AND locked_by = p_worker
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    IF p_retry_in_seconds IS NOT NULL
+       AND failed.dedup_key IS NOT NULL
+       AND EXISTS (
+           SELECT 1 FROM job_queue
+           WHERE dedup_key = failed.dedup_key AND status = 'pending'
+       ) THEN
+        DELETE FROM job_queue WHERE id = p_job_id;
+        RETURN NULL;
+    END IF;
+
+    UPDATE job_queue
+    SET status = CASE WHEN p_retry_in_seconds IS NULL THEN 'dead' ELSE 'pending' END,
+        run_at = CASE
+            WHEN p_retry_in_seconds IS NULL THEN run_at
+            ELSE NOW() + make_interval(secs => p_retry_in_seconds)
+        END,
+        last_error = p_error,
+        locked_by = NULL,
+        locked_until = NULL,
+        updated_at = NOW()
+    WHERE id = p_job_id
+    RETURNING * INTO failed;
+
+    RETURN failed;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION enqueue_job(TEXT, JSONB, TEXT, SMALLINT, TIMESTAMPTZ, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION claim_jobs(TEXT, TEXT[], INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION complete_job(BIGINT, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION fail_job(BIGINT, TEXT, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION enqueue_job(TEXT, JSONB, TEXT, SMALLINT, TIMESTAMPTZ, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION claim_jobs(TEXT, TEXT[], INTEGER, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION complete_job(BIGINT, TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION fail_job(BIGINT, TEXT, TEXT, INTEGER) TO service_role;
@@ -0,0 +1,112 @@
+-- Table: rate_limit_buckets
+-- Token buckets shared by every worker process (e.g. the Gemini RPM and TPM
+-- quotas), so N workers together never exceed the provider's limits.
+-- Also adds job_queue_stats() for queue backlog metrics.
+-- Depends on: job_queue
+
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    name TEXT PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Backend-only table: RLS on with no policies, so only the service role can use it
+ALTER TABLE rate_limit_buckets ENABLE ROW LEVEL SECURITY;
+
+
+-- Function: acquire_rate_limit
+-- Atomically takes p_costs[i] tokens from each bucket p_names[i] (capacity
+-- p_capacities[i], refilled continuously at p_refill_per_second[i]).
+-- Either every bucket is charged and 0 is returned, or nothing is charged and
+-- the number of seconds until all buckets can cover the cost is returned.
+-- With p_force the cost is charged unconditionally (post-hoc usage correction),
+-- which may leave a bucket negative so later callers wait for the debt.
+CREATE OR REPLACE FUNCTION acquire_rate_limit(
+    p_names TEXT[],
+    p_costs DOUBLE PRECISION[],
+    p_capacities DOUBLE PRECISION[],
+    p_refill_per_second DOUBLE PRECISION[],
+    p_force BOOLEAN DEFAULT FALSE
+)
+RETURNS DOUBLE PRECISION
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    i INTEGER;
+    n INTEGER := array_length(p_names, 1);
+    available DOUBLE PRECISION[] := '{}';
+    current_tokens DOUBLE PRECISION;
+    last_refill TIMESTAMPTZ;
+    wait_seconds DOUBLE PRECISION := 0;
+BEGIN
+    -- Create missing buckets full, then lock them in a stable order to avoid deadlocks
+    INSERT INTO rate_limit_buckets (name, tokens)
+    SELECT name, capacity
+    FROM unnest(p_names, p_capacities) AS b(name, capacity)
+    ON CONFLICT (name) DO NOTHING;
+
+    PERFORM 1 FROM rate_limit_buckets WHERE name = ANY(p_names) ORDER BY name FOR UPDATE;
+
+    FOR i IN 1..n LOOP
+        SELECT tokens, updated_at INTO current_tokens, last_refill
+        FROM rate_limit_buckets WHERE name = p_names[i];
+
+        current_tokens := LEAST(
+            p_capacities[i],
+            current_tokens + EXTRACT(EPOCH FROM clock_timestamp() - last_refill) * p_refill_per_second[i]
+        );
+        available := available || current_tokens;
+
+        IF NOT p_force AND current_tokens < LEAST(p_costs[i], p_capacities[i]) THEN
+            wait_seconds := GREATEST(
+                wait_seconds,
+                (LEAST(p_costs[i], p_capacities[i]) - current_tokens) / p_refill_per_second[i]
+            );
+        END IF;
+    END LOOP;
+
+    IF wait_seconds > 0 THEN
+        RETURN wait_seconds;
+    END IF;
+
+    FOR i IN 1..n LOOP
+        UPDATE rate_limit_buckets
+        SET tokens = available[i] - p_costs[i],
+            updated_at = clock_timestamp()
+        WHERE name = p_names[i];
+    END LOOP;
+
+    RETURN 0;
+END;
+$$;
+
+
+-- Function: job_queue_stats
+-- Backlog metrics per job kind.
+CREATE OR REPLACE FUNCTION job_queue_stats()
+RETURNS TABLE (
+    kind VARCHAR(50),
+    pending BIGINT,
+    due BIGINT,
+    running BIGINT,
+    dead BIGINT,
+    oldest_due_seconds DOUBLE PRECISION
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        kind,
+        COUNT(*) FILTER (WHERE status = 'pending'),
+        COUNT(*) FILTER (WHERE status = 'pending' AND run_at <= NOW()),
+        COUNT(*) FILTER (WHERE status = 'running'),
+        COUNT(*) FILTER (WHERE status = 'dead'),
+        COALESCE(EXTRACT(EPOCH FROM NOW() - MIN(run_at) FILTER (WHERE status = 'pending' AND run_at <= NOW())), 0)
+    FROM job_queue
+    GROUP BY kind;
+$$;
+
+REVOKE ALL ON FUNCTION acquire_rate_limit(TEXT[], DOUBLE PRECISION[], DOUBLE PRECISION[], DOUBLE PRECISION[], BOOLEAN) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION job_queue_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION acquire_rate_limit(TEXT[], DOUBLE PRECISION[], DOUBLE PRECISION[], DOUBLE PRECISION[], BOOLEAN) TO service_role;
+GRANT EXECUTE ON FUNCTION job_queue_stats() TO service_role;
@@ -0,0 +1,41 @@
+-- Function: debounce_job
+-- Coalesces bursts of requests for the same work into one job (e.g. five
+-- preferred-slot edits -> one proposal regeneration). Each call moves the
+-- pending job with the same dedup key to NOW() + p_quiet_seconds, but never
+-- later than p_max_delay_seconds after that job was first requested, so a
+-- steady stream of changes cannot postpone it forever.
+-- A call made while the job is running creates a new pending job, so the
+-- last change is always picked up by a run that starts after it.
+-- Depends on: job_queue
+
+CREATE OR REPLACE FUNCTION debounce_job(
+    p_kind TEXT,
+    p_payload JSONB,
+    p_dedup_key TEXT,
+    p_quiet_seconds INTEGER,
+    p_max_delay_seconds INTEGER,
+    p_priority SMALLINT DEFAULT 100,
+    p_max_attempts INTEGER DEFAULT 5
+)
+RETURNS job_queue
+LANGUAGE sql
+AS $$
+    INSERT INTO job_queue (kind, payload, dedup_key, priority, run_at, max_attempts)
+    VALUES (
+        p_kind, p_payload, p_dedup_key, p_priority,
+        NOW() + make_interval(secs => p_quiet_seconds), p_max_attempts
+    )
+    ON CONFLICT (dedup_key) WHERE status = 'pending' AND dedup_key IS NOT NULL
+    DO UPDATE SET
+        payload = EXCLUDED.payload,
+        priority = LEAST(job_queue.priority, EXCLUDED.priority),
+        run_at = LEAST(
+            EXCLUDED.run_at,
+            job_queue.created_at + make_interval(secs => p_max_delay_seconds)
+        ),
+        updated_at = NOW()
+    RETURNING *;
+$$;
+
+REVOKE ALL ON FUNCTION debounce_job(TEXT, JSONB, TEXT, INTEGER, INTEGER, SMALLINT, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION debounce_job(TEXT, JSONB, TEXT, INTEGER, INTEGER, SMALLINT, INTEGER) TO service_role;
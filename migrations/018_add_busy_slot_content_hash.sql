@@ -0,0 +1,9 @@
+-- Column: busy_slots.content_hash
+-- Hash of the fields that decide a slot's availability (start, end and the
+-- provider's transparency / showAs), written by calendar sync. Repeat syncs
+-- compare it to classify events as added / changed / unchanged / deleted and
+-- only write the changed ones. Rows synced before this migration have NULL
+-- and are rewritten once on their next sync.
+-- Depends on: busy_slots
+
+ALTER TABLE busy_slots ADD COLUMN IF NOT EXISTS content_hash TEXT;
@@ -0,0 +1,14 @@
+-- Migration: calendar_accounts sync mode
+-- How calendar sync reads an account's enabled calendars
+-- Depends on: calendar_accounts
+
+-- 'events':   list every event (events.list / calendarView delta) and store one
+--             busy slot per event, with incremental sync tokens.
+-- 'freebusy': one freebusy.query (Google) or getSchedule (Microsoft) call per
+--             account returning merged busy blocks, stored one slot per block.
+--             Needs only free/busy access and far fewer, smaller requests.
+ALTER TABLE calendar_accounts ADD COLUMN IF NOT EXISTS sync_mode TEXT NOT NULL DEFAULT 'events';
+
+ALTER TABLE calendar_accounts DROP CONSTRAINT IF EXISTS calendar_accounts_sync_mode_check;
+ALTER TABLE calendar_accounts ADD CONSTRAINT calendar_accounts_sync_mode_check
+    CHECK (sync_mode IN ('events', 'freebusy'));